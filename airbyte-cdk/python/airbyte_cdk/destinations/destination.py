@@ -10,6 +10,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Iterable, List, Mapping
 
 from airbyte_cdk.connector import Connector
+from airbyte_cdk.destinations.message_parser import parse_messages_lazily
 from airbyte_cdk.exception_handler import init_uncaught_exception_handler
 from airbyte_cdk.models import AirbyteMessage, ConfiguredAirbyteCatalog, Type
 from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_or_exit
@@ -21,6 +22,9 @@ logger = logging.getLogger("airbyte")
 
 class Destination(Connector, ABC):
     VALID_CMDS = {"spec", "check", "write"}
+    # When enabled, stdin is read in large binary chunks and RECORD messages are handed to `write` as lightweight objects exposing the
+    # same attributes as AirbyteMessage/AirbyteRecordMessage, skipping pydantic validation. Other messages are still full AirbyteMessages.
+    lazy_input_parsing: bool = False
 
     @abstractmethod
     def write(
@@ -34,6 +38,9 @@ class Destination(Connector, ABC):
 
     def _parse_input_stream(self, input_stream: io.TextIOWrapper) -> Iterable[AirbyteMessage]:
         """Reads from stdin, converting to Airbyte messages"""
+        if self.lazy_input_parsing:
+            yield from parse_messages_lazily(input_stream.buffer)
+            return
         for line in input_stream:
             try:
                 yield AirbyteMessage.parse_raw(line)
@@ -0,0 +1,145 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import logging
+from typing import Any, BinaryIO, Iterable, Iterator, List, Mapping, Optional, Union
+
+from airbyte_cdk.models import AirbyteMessage, Type
+from pydantic import ValidationError
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, the stdlib decoder is used when it is not installed
+    orjson = None
+
+logger = logging.getLogger("airbyte")
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_RECORD_FIELDS = frozenset(("namespace", "stream", "data", "emitted_at"))
+_RECORD_MESSAGE_FIELDS = frozenset(("type", "record"))
+
+
+class LightweightRecordMessage:
+    """Exposes the same attributes as AirbyteRecordMessage without the pydantic validation and memory overhead"""
+
+    __slots__ = ("stream", "data", "emitted_at", "namespace")
+
+    def __init__(self, stream: str, data: Mapping[str, Any], emitted_at: int, namespace: Optional[str] = None):
+        self.stream = stream
+        self.data = data
+        self.emitted_at = emitted_at
+        self.namespace = namespace
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, LightweightRecordMessage)
+            and self.stream == other.stream
+            and self.data == other.data
+            and self.emitted_at == other.emitted_at
+            and self.namespace == other.namespace
+        )
+
+    def __repr__(self) -> str:
+        return f"LightweightRecordMessage(stream={self.stream!r}, namespace={self.namespace!r}, emitted_at={self.emitted_at!r})"
+
+
+class LightweightAirbyteMessage:
+    """
+    Stands in for an AirbyteMessage of type RECORD. All the other message fields are always None, like on a RECORD AirbyteMessage.
+    """
+
+    __slots__ = ("record",)
+
+    type = Type.RECORD
+    log = None
+    spec = None
+    connectionStatus = None
+    catalog = None
+    state = None
+    trace = None
+    control = None
+
+    def __init__(self, record: LightweightRecordMessage):
+        self.record = record
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, LightweightAirbyteMessage) and self.record == other.record
+
+    def __repr__(self) -> str:
+        return f"LightweightAirbyteMessage(record={self.record!r})"
+
+
+def _loads(line: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _as_lightweight_record(message: Mapping[str, Any]) -> Optional[LightweightAirbyteMessage]:
+    """
+    Returns a lightweight message if the parsed JSON is a well-formed RECORD message without extra fields, None otherwise so the caller
+    can fall back to the pydantic model.
+    """
+    record = message.get("record")
+    if message.keys() != _RECORD_MESSAGE_FIELDS or not isinstance(record, dict) or not record.keys() <= _RECORD_FIELDS:
+        return None
+    stream, data, emitted_at, namespace = record.get("stream"), record.get("data"), record.get("emitted_at"), record.get("namespace")
+    if (
+        not isinstance(stream, str)
+        or not isinstance(data, dict)
+        or not isinstance(emitted_at, int)
+        or isinstance(emitted_at, bool)
+        or not (namespace is None or isinstance(namespace, str))
+    ):
+        return None
+    return LightweightAirbyteMessage(LightweightRecordMessage(stream=stream, data=data, emitted_at=emitted_at, namespace=namespace))
+
+
+def read_lines(input_stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Reads a binary stream in chunks of chunk_size bytes and yields the lines it contains, without their line ending"""
+    pending: List[bytes] = []
+    while True:
+        chunk = input_stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = chunk.split(b"\n")
+        if pending:
+            pending.append(lines[0])
+            lines[0] = b"".join(pending)
+            pending = []
+        # the last element is either empty or a line which continues in the next chunk
+        pending.append(lines.pop())
+        yield from lines
+    last_line = b"".join(pending)
+    if last_line:
+        yield last_line
+
+
+def parse_messages_lazily(
+    input_stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterable[Union[AirbyteMessage, LightweightAirbyteMessage]]:
+    """
+    Parses Airbyte messages from a binary stream, reading it in chunks of chunk_size bytes.
+
+    RECORD messages are returned as LightweightAirbyteMessage objects, skipping pydantic validation. Every other message type (STATE,
+    LOG, ...) is parsed into a full AirbyteMessage. Input which can't be deserialized as an Airbyte message is logged and ignored.
+    """
+    for line in read_lines(input_stream, chunk_size):
+        if not line.strip():
+            continue
+        try:
+            message = _loads(line)
+            if not isinstance(message, dict):
+                raise ValueError("Airbyte messages are JSON objects")
+            if message.get("type") == Type.RECORD.value:
+                lightweight_message = _as_lightweight_record(message)
+                if lightweight_message is not None:
+                    yield lightweight_message
+                    continue
+            yield AirbyteMessage.parse_obj(message)
+        except (ValueError, ValidationError):
+            # orjson and json decoding errors are both subclasses of ValueError
+            logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line.decode('utf-8', errors='replace')}")
@@ -4,8 +4,14 @@
 
 import json
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from queue import Full, Queue
+from typing import Any, Callable, ContextManager, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import (
     AirbyteCatalog,
@@ -24,13 +30,23 @@ from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.streams.http.async_http import AsyncHttpStream
 from airbyte_cdk.sources.streams.http.http import HttpStream
+from airbyte_cdk.sources.utils.event_loop import EventLoopThread
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
-from airbyte_cdk.utils.event_timing import create_timer
+from airbyte_cdk.utils.event_timing import EventTimer, create_timer
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 
+@dataclass
+class _StreamReadCompleted:
+    """Marks the end of a stream read concurrently, with the exception that stopped it if any"""
+
+    stream_name: str
+    exception: Optional[BaseException] = None
+
+
 class AbstractSource(Source, ABC):
     """
     Abstract base class for an Airbyte Source. Consumers should implement any abstract methods
@@ -38,6 +54,13 @@ class AbstractSource(Source, ABC):
     """
 
     SLICE_LOG_PREFIX = "slice:"
+    # Maximum number of messages buffered between the threads reading streams and the caller when streams are read concurrently
+    CONCURRENT_READ_QUEUE_SIZE = 1000
+    _checkpoint_lock = threading.Lock()
+    # Per thread reading a stream when streams are read concurrently: the function enqueuing its messages and its last state message
+    _concurrent_read_output = threading.local()
+    # Event loop on which the slices of AsyncHttpStreams are read, running while the source reads async streams
+    _event_loop: Optional[EventLoopThread] = None
 
     @abstractmethod
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
@@ -103,46 +126,199 @@ class AbstractSource(Source, ABC):
         stream_instances = {s.name: s for s in self.streams(config)}
         state_manager = ConnectorStateManager(stream_instance_map=stream_instances, state=state)
         self._stream_to_instance_map = stream_instances
-        with create_timer(self.name) as timer:
-            for configured_stream in catalog.streams:
-                stream_instance = stream_instances.get(configured_stream.stream.name)
-                if not stream_instance:
-                    raise KeyError(
-                        f"The requested stream {configured_stream.stream.name} was not found in the source."
-                        f" Available streams: {stream_instances.keys()}"
-                    )
-                stream_is_available, error = stream_instance.check_availability(logger, self)
-                if not stream_is_available:
-                    logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. Error: {error}")
-                    continue
-                try:
-                    timer.start_event(f"Syncing stream {configured_stream.stream.name}")
-                    yield from self._read_stream(
-                        logger=logger,
-                        stream_instance=stream_instance,
-                        configured_stream=configured_stream,
-                        state_manager=state_manager,
-                        internal_config=internal_config,
-                    )
-                except AirbyteTracedException as e:
-                    raise e
-                except Exception as e:
-                    logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
-                    display_message = stream_instance.get_error_display_message(e)
-                    if display_message:
-                        raise AirbyteTracedException.from_exception(e, message=display_message) from e
-                    raise e
-                finally:
-                    timer.finish_event()
-                    logger.info(f"Finished syncing {configured_stream.stream.name}")
-                    logger.info(timer.report())
-
+        configured_streams = []
+        for configured_stream in catalog.streams:
+            stream_instance = stream_instances.get(configured_stream.stream.name)
+            if not stream_instance:
+                raise KeyError(
+                    f"The requested stream {configured_stream.stream.name} was not found in the source."
+                    f" Available streams: {stream_instances.keys()}"
+                )
+            configured_streams.append((configured_stream, stream_instance))
+
+        # one timer per stream, so that the spans of each stream are profiled separately
+        timers: List[EventTimer] = []
+        with self._async_event_loop([stream_instance for _, stream_instance in configured_streams]):
+            if self.max_concurrent_streams > 1:
+                yield from self._read_streams_concurrently(logger, configured_streams, state_manager, internal_config, timers)
+            else:
+                for configured_stream, stream_instance in configured_streams:
+                    with create_timer(f"{self.name}.{configured_stream.stream.name}") as timer:
+                        timers.append(timer)
+                        yield from self._read_configured_stream(
+                            logger, configured_stream, stream_instance, state_manager, internal_config, timer
+                        )
+
+        if internal_config.profile:
+            profile_message = self._profile_message(timers)
+            if profile_message:
+                yield profile_message
+        self._log_connection_stats(logger, [stream_instance for _, stream_instance in configured_streams])
         logger.info(f"Finished syncing {self.name}")
 
+    @contextmanager
+    def _async_event_loop(self, stream_instances: List[Stream]) -> Iterator[None]:
+        """
+        Runs the event loop shared by the AsyncHttpStreams to read, if any, while they are read, whether they are read one after the other
+        or concurrently, then closes their connections.
+        """
+        async_streams = [stream_instance for stream_instance in stream_instances if isinstance(stream_instance, AsyncHttpStream)]
+        if not async_streams:
+            yield
+            return
+        self._event_loop = EventLoopThread(name=f"{self.name}-event-loop")
+        try:
+            yield
+        finally:
+            for stream_instance in async_streams:
+                self._event_loop.submit(stream_instance.close_async_session()).result()
+            self._event_loop.stop()
+            self._event_loop = None
+
+    @staticmethod
+    def _profile_message(timers: List[EventTimer]) -> Optional[AirbyteMessage]:
+        """
+        Summary of the spans of the streams read, count, total and p50/p99 durations in seconds per span path, e.g.
+        {"profile": {"source.stream": {"slice": {...}, "slice/request": {...}}}}, emitted as a TRACE level log message at the end of
+        the sync when the "_profile" internal config is set. The same figures are logged at the end of every stream in the report of
+        its timer.
+        """
+        profile = {timer.name: timer.summary() for timer in timers if timer.spans}
+        if not profile:
+            return None
+        return AirbyteMessage(type=MessageType.LOG, log=AirbyteLogMessage(level=Level.TRACE, message=json.dumps({"profile": profile})))
+
+    @staticmethod
+    def _span(stream_instance: Stream, name: str) -> ContextManager:
+        timer = stream_instance.event_timer
+        return timer.span(name) if timer else nullcontext()
+
+    @staticmethod
+    def _log_connection_stats(logger: logging.Logger, stream_instances: List[Stream]):
+        session_registries = []
+        for stream_instance in stream_instances:
+            session_registry = getattr(stream_instance, "session_registry", None)
+            if session_registry and not any(session_registry is registry for registry in session_registries):
+                session_registries.append(session_registry)
+        for session_registry in session_registries:
+            session_registry.log_connection_stats(logger)
+
     @property
     def per_stream_state_enabled(self) -> bool:
         return True
 
+    @property
+    def max_concurrent_streams(self) -> int:
+        """
+        Maximum number of streams read at the same time. Streams are read one after the other by default; sources whose streams can be
+        read from separate threads can override this to read them concurrently on a bounded thread pool. Messages of each stream keep
+        their order, state checkpoints are serialized through the ConnectorStateManager and each stream still applies its own backoff.
+        """
+        return 1
+
+    def _read_configured_stream(
+        self,
+        logger: logging.Logger,
+        configured_stream: ConfiguredAirbyteStream,
+        stream_instance: Stream,
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        stream_is_available, error = stream_instance.check_availability(logger, self)
+        if not stream_is_available:
+            logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. Error: {error}")
+            return
+        try:
+            timer.start_event(f"Syncing stream {configured_stream.stream.name}")
+            if internal_config.profile:
+                # spans are only recorded when profiling, so that reading records and sending requests doesn't pay for them otherwise
+                stream_instance.event_timer = timer
+            yield from self._read_stream(
+                logger=logger,
+                stream_instance=stream_instance,
+                configured_stream=configured_stream,
+                state_manager=state_manager,
+                internal_config=internal_config,
+            )
+        except AirbyteTracedException as e:
+            raise e
+        except Exception as e:
+            logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
+            display_message = stream_instance.get_error_display_message(e)
+            if display_message:
+                raise AirbyteTracedException.from_exception(e, message=display_message) from e
+            raise e
+        finally:
+            stream_instance.event_timer = None
+            timer.finish_event()
+            logger.info(f"Finished syncing {configured_stream.stream.name}")
+            logger.info(timer.report())
+
+    def _read_streams_concurrently(
+        self,
+        logger: logging.Logger,
+        configured_streams: List[Tuple[ConfiguredAirbyteStream, Stream]],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timers: List[EventTimer],
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Read the streams on a pool of max_concurrent_streams threads. Each thread pushes the messages of its stream to a bounded queue
+        which is drained in order by the calling thread. The first stream failing stops the other ones and its error is raised.
+        """
+        output_queue: Queue = Queue(maxsize=self.CONCURRENT_READ_QUEUE_SIZE)
+        stop_reading = threading.Event()
+
+        def put(item: Union[AirbyteMessage, _StreamReadCompleted]) -> bool:
+            # give up once reading is stopped so that threads never stay blocked on a full queue
+            while not stop_reading.is_set():
+                try:
+                    output_queue.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def read_stream(configured_stream: ConfiguredAirbyteStream, stream_instance: Stream):
+            exception: Optional[BaseException] = None
+            # state messages are enqueued by _checkpoint_state itself, see there
+            self._concurrent_read_output.put = put
+            try:
+                with create_timer(f"{self.name}.{configured_stream.stream.name}") as timer:
+                    timers.append(timer)
+                    for message in self._read_configured_stream(
+                        logger, configured_stream, stream_instance, state_manager, internal_config, timer
+                    ):
+                        if message is getattr(self._concurrent_read_output, "checkpoint", None):
+                            continue
+                        if not put(message):
+                            return
+            except BaseException as e:
+                exception = e
+            finally:
+                self._concurrent_read_output.put = None
+                self._concurrent_read_output.checkpoint = None
+                # always signal the end of the stream, or the calling thread would wait for it forever
+                put(_StreamReadCompleted(configured_stream.stream.name, exception))
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrent_streams, thread_name_prefix=f"{self.name}-stream-reader")
+        try:
+            for configured_stream, stream_instance in configured_streams:
+                executor.submit(read_stream, configured_stream, stream_instance)
+            remaining_streams = len(configured_streams)
+            while remaining_streams:
+                item = output_queue.get()
+                if isinstance(item, _StreamReadCompleted):
+                    remaining_streams -= 1
+                    if item.exception:
+                        raise item.exception
+                else:
+                    yield item
+        finally:
+            stop_reading.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _read_stream(
         self,
         logger: logging.Logger,
@@ -186,10 +362,18 @@ class AbstractSource(Source, ABC):
         record_counter = 0
         stream_name = configured_stream.stream.name
         logger.info(f"Syncing stream: {stream_name} ")
+        timer = stream_instance.event_timer
         for record in record_iterator:
             if record.type == MessageType.RECORD:
                 record_counter += 1
+            if timer is None:
+                yield record
+                continue
+            # time spent by the consumer of the message before resuming the iteration: serializing and writing it when streams are read
+            # one after the other, handing it over to the queue of the messages read concurrently otherwise
+            emitted = time.perf_counter_ns()
             yield record
+            timer.add_span("consume", time.perf_counter_ns() - emitted)
 
         logger.info(f"Read {record_counter} records from {stream_name} stream")
 
@@ -237,6 +421,17 @@ class AbstractSource(Source, ABC):
         )
         logger.debug(f"Processing stream slices for {stream_name} (sync_mode: incremental)", extra={"stream_slices": slices})
 
+        if isinstance(stream_instance, HttpStream) and stream_instance.max_concurrent_slices > 1:
+            if "state" in dir(stream_instance):
+                logger.warning(
+                    f"Reading slices of {stream_name} one at a time: concurrent slices are not supported with the state property"
+                )
+            else:
+                yield from self._read_incremental_slices_concurrently(
+                    logger, stream_instance, configured_stream, state_manager, internal_config, slices, stream_state
+                )
+                return
+
         total_records_counter = 0
         has_slices = False
         for _slice in slices:
@@ -252,24 +447,25 @@ class AbstractSource(Source, ABC):
                 cursor_field=configured_stream.cursor_field or None,
             )
             record_counter = 0
-            for message_counter, record_data_or_message in enumerate(records, start=1):
-                message = self._get_message(record_data_or_message, stream_instance)
-                yield message
-                if message.type == MessageType.RECORD:
-                    record = message.record
-                    stream_state = stream_instance.get_updated_state(stream_state, record.data)
-                    checkpoint_interval = stream_instance.state_checkpoint_interval
-                    record_counter += 1
-                    if checkpoint_interval and record_counter % checkpoint_interval == 0:
-                        yield self._checkpoint_state(stream_instance, stream_state, state_manager)
-
-                    total_records_counter += 1
-                    # This functionality should ideally live outside of this method
-                    # but since state is managed inside this method, we keep track
-                    # of it here.
-                    if self._limit_reached(internal_config, total_records_counter):
-                        # Break from slice loop to save state and exit from _read_incremental function.
-                        break
+            with self._span(stream_instance, "slice"):
+                for message_counter, record_data_or_message in enumerate(records, start=1):
+                    message = self._get_message(record_data_or_message, stream_instance)
+                    yield message
+                    if message.type == MessageType.RECORD:
+                        record = message.record
+                        stream_state = stream_instance.get_updated_state(stream_state, record.data)
+                        checkpoint_interval = stream_instance.state_checkpoint_interval
+                        record_counter += 1
+                        if checkpoint_interval and record_counter % checkpoint_interval == 0:
+                            yield self._checkpoint_state(stream_instance, stream_state, state_manager)
+
+                        total_records_counter += 1
+                        # This functionality should ideally live outside of this method
+                        # but since state is managed inside this method, we keep track
+                        # of it here.
+                        if self._limit_reached(internal_config, total_records_counter):
+                            # Break from slice loop to save state and exit from _read_incremental function.
+                            break
 
             yield self._checkpoint_state(stream_instance, stream_state, state_manager)
             if self._limit_reached(internal_config, total_records_counter):
@@ -280,6 +476,87 @@ class AbstractSource(Source, ABC):
             checkpoint = self._checkpoint_state(stream_instance, stream_state, state_manager)
             yield checkpoint
 
+    def _read_incremental_slices_concurrently(
+        self,
+        logger: logging.Logger,
+        stream_instance: HttpStream,
+        configured_stream: ConfiguredAirbyteStream,
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        slices: Iterable[Optional[Mapping[str, Any]]],
+        stream_state: Mapping[str, Any],
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Read up to max_concurrent_slices slices at the same time and emit the messages of each slice as soon as it is fully read.
+
+        Since slices can complete out of order, the state only advances over the longest sequence of fully read slices from the first
+        one: the records of a slice are folded into the state with get_updated_state, in slice order, once every previous slice is
+        read. New slices are only started within max_concurrent_slices of the first slice not folded into the state yet, which bounds
+        the number of slices held in memory.
+        """
+        max_concurrent_slices = stream_instance.max_concurrent_slices
+        checkpoint_interval = stream_instance.state_checkpoint_interval
+        slice_iterator = iter(slices)
+        slices_exhausted = False
+        has_slices = False
+        # index of the next slice to start and of the first slice whose records are not folded into the state yet
+        next_slice_index = 0
+        next_state_index = 0
+        reading: Dict[int, Future] = {}
+        # slice index -> data of the records emitted for a slice which is read but not folded into the state yet
+        read_slices: Dict[int, List[Mapping[str, Any]]] = {}
+        total_records_counter = 0
+        state_records_counter = 0
+        with self._slice_reader(stream_instance, SyncMode.incremental, configured_stream.cursor_field or None) as read_slice:
+            while True:
+                while not slices_exhausted and next_slice_index < next_state_index + max_concurrent_slices:
+                    try:
+                        _slice = next(slice_iterator)
+                    except StopIteration:
+                        slices_exhausted = True
+                        break
+                    has_slices = True
+                    if logger.isEnabledFor(logging.DEBUG):
+                        yield AirbyteMessage(
+                            type=MessageType.LOG,
+                            log=AirbyteLogMessage(level=Level.INFO, message=f"{self.SLICE_LOG_PREFIX}{json.dumps(_slice)}"),
+                        )
+                    reading[next_slice_index] = read_slice(_slice, stream_state)
+                    next_slice_index += 1
+                if not reading:
+                    break
+
+                done, _ = wait(reading.values(), return_when=FIRST_COMPLETED)
+                limit_reached = False
+                for slice_index in sorted(index for index, future in reading.items() if future in done):
+                    records_data = read_slices[slice_index] = []
+                    for record_data_or_message in reading.pop(slice_index).result():
+                        message = self._get_message(record_data_or_message, stream_instance)
+                        yield message
+                        if message.type == MessageType.RECORD:
+                            records_data.append(message.record.data)
+                            total_records_counter += 1
+                            if self._limit_reached(internal_config, total_records_counter):
+                                limit_reached = True
+                                break
+                    if limit_reached:
+                        break
+
+                while next_state_index in read_slices:
+                    for record_data in read_slices.pop(next_state_index):
+                        stream_state = stream_instance.get_updated_state(stream_state, record_data)
+                        state_records_counter += 1
+                        if checkpoint_interval and state_records_counter % checkpoint_interval == 0:
+                            yield self._checkpoint_state(stream_instance, stream_state, state_manager)
+                    yield self._checkpoint_state(stream_instance, stream_state, state_manager)
+                    next_state_index += 1
+                if limit_reached:
+                    return
+
+        if not has_slices:
+            # Safety net to ensure we always emit at least one state message even if there are no slices
+            yield self._checkpoint_state(stream_instance, stream_state, state_manager)
+
     def _read_full_refresh(
         self,
         logger: logging.Logger,
@@ -291,6 +568,10 @@ class AbstractSource(Source, ABC):
         logger.debug(
             f"Processing stream slices for {configured_stream.stream.name} (sync_mode: full_refresh)", extra={"stream_slices": slices}
         )
+        if isinstance(stream_instance, HttpStream) and stream_instance.max_concurrent_slices > 1:
+            yield from self._read_full_refresh_slices_concurrently(logger, stream_instance, configured_stream, internal_config, slices)
+            return
+
         total_records_counter = 0
         for _slice in slices:
             if logger.isEnabledFor(logging.DEBUG):
@@ -302,24 +583,127 @@ class AbstractSource(Source, ABC):
                 sync_mode=SyncMode.full_refresh,
                 cursor_field=configured_stream.cursor_field,
             )
-            for record_data_or_message in record_data_or_messages:
-                message = self._get_message(record_data_or_message, stream_instance)
-                yield message
-                if message.type == MessageType.RECORD:
-                    total_records_counter += 1
-                    if self._limit_reached(internal_config, total_records_counter):
-                        return
+            with self._span(stream_instance, "slice"):
+                for record_data_or_message in record_data_or_messages:
+                    message = self._get_message(record_data_or_message, stream_instance)
+                    yield message
+                    if message.type == MessageType.RECORD:
+                        total_records_counter += 1
+                        if self._limit_reached(internal_config, total_records_counter):
+                            return
+
+    def _read_full_refresh_slices_concurrently(
+        self,
+        logger: logging.Logger,
+        stream_instance: HttpStream,
+        configured_stream: ConfiguredAirbyteStream,
+        internal_config: InternalConfig,
+        slices: Iterable[Optional[Mapping[str, Any]]],
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Read up to max_concurrent_slices slices at the same time and emit the messages of each slice as soon as it is fully read.
+        """
+        max_concurrent_slices = stream_instance.max_concurrent_slices
+        slice_iterator = iter(slices)
+        slices_exhausted = False
+        next_slice_index = 0
+        reading: Dict[int, Future] = {}
+        total_records_counter = 0
+        with self._slice_reader(stream_instance, SyncMode.full_refresh, configured_stream.cursor_field) as read_slice:
+            while True:
+                while not slices_exhausted and len(reading) < max_concurrent_slices:
+                    try:
+                        _slice = next(slice_iterator)
+                    except StopIteration:
+                        slices_exhausted = True
+                        break
+                    if logger.isEnabledFor(logging.DEBUG):
+                        yield AirbyteMessage(
+                            type=MessageType.LOG,
+                            log=AirbyteLogMessage(level=Level.INFO, message=f"{self.SLICE_LOG_PREFIX}{json.dumps(_slice)}"),
+                        )
+                    reading[next_slice_index] = read_slice(_slice, None)
+                    next_slice_index += 1
+                if not reading:
+                    return
+
+                done, _ = wait(reading.values(), return_when=FIRST_COMPLETED)
+                for slice_index in sorted(index for index, future in reading.items() if future in done):
+                    for record_data_or_message in reading.pop(slice_index).result():
+                        message = self._get_message(record_data_or_message, stream_instance)
+                        yield message
+                        if message.type == MessageType.RECORD:
+                            total_records_counter += 1
+                            if self._limit_reached(internal_config, total_records_counter):
+                                return
+
+    @contextmanager
+    def _slice_reader(
+        self, stream_instance: HttpStream, sync_mode: SyncMode, cursor_field: Optional[List[str]]
+    ) -> Iterator[Callable[[Optional[Mapping[str, Any]], Optional[Mapping[str, Any]]], Future]]:
+        """
+        Provides a function starting to read a slice with a given state and returning the future list of its records. The slices of an
+        AsyncHttpStream are read on the event loop of the source, the slices of other streams on a pool of max_concurrent_slices threads.
+        The slices still being read are cancelled on exit.
+        """
+        if isinstance(stream_instance, AsyncHttpStream):
+            event_loop = self._event_loop
+            reading = set()
 
-    def _checkpoint_state(self, stream: Stream, stream_state, state_manager: ConnectorStateManager):
-        # First attempt to retrieve the current state using the stream's state property. We receive an AttributeError if the state
-        # property is not implemented by the stream instance and as a fallback, use the stream_state retrieved from the stream
-        # instance's deprecated get_updated_state() method.
-        try:
-            state_manager.update_state_for_stream(stream.name, stream.namespace, stream.state)
+            async def read_records_async(_slice: Optional[Mapping[str, Any]], slice_state: Optional[Mapping[str, Any]]) -> List[StreamData]:
+                records = stream_instance.read_records_async(
+                    sync_mode=sync_mode, stream_slice=_slice, stream_state=slice_state, cursor_field=cursor_field
+                )
+                return [record_data_or_message async for record_data_or_message in records]
+
+            def read_slice(_slice: Optional[Mapping[str, Any]], slice_state: Optional[Mapping[str, Any]]) -> Future:
+                future = event_loop.submit(read_records_async(_slice, slice_state))
+                reading.add(future)
+                future.add_done_callback(reading.discard)
+                return future
+
+            try:
+                yield read_slice
+            finally:
+                for future in list(reading):
+                    future.cancel()
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=stream_instance.max_concurrent_slices, thread_name_prefix=f"{stream_instance.name}-slice-reader"
+            )
 
-        except AttributeError:
-            state_manager.update_state_for_stream(stream.name, stream.namespace, stream_state)
-        return state_manager.create_state_message(stream.name, stream.namespace, send_per_stream_state=self.per_stream_state_enabled)
+            def read_records(_slice: Optional[Mapping[str, Any]], slice_state: Optional[Mapping[str, Any]]) -> List[StreamData]:
+                with self._span(stream_instance, "slice"):
+                    return list(
+                        stream_instance.read_records(
+                            sync_mode=sync_mode, stream_slice=_slice, stream_state=slice_state, cursor_field=cursor_field
+                        )
+                    )
+
+            try:
+                yield lambda _slice, slice_state: executor.submit(read_records, _slice, slice_state)
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _checkpoint_state(self, stream: Stream, stream_state, state_manager: ConnectorStateManager):
+        # Streams read concurrently share the state manager, updating it and creating the state message must not interleave
+        with self._checkpoint_lock:
+            # First attempt to retrieve the current state using the stream's state property. We receive an AttributeError if the state
+            # property is not implemented by the stream instance and as a fallback, use the stream_state retrieved from the stream
+            # instance's deprecated get_updated_state() method.
+            try:
+                state_manager.update_state_for_stream(stream.name, stream.namespace, stream.state)
+
+            except AttributeError:
+                state_manager.update_state_for_stream(stream.name, stream.namespace, stream_state)
+            message = state_manager.create_state_message(stream.name, stream.namespace, send_per_stream_state=self.per_stream_state_enabled)
+            # When streams are read concurrently, the state message is enqueued before releasing the lock so that state messages are
+            # output in the order the state manager was updated
+            put = getattr(self._concurrent_read_output, "put", None)
+            if put:
+                put(message)
+                self._concurrent_read_output.checkpoint = message
+            return message
 
     @staticmethod
     def _apply_log_level_to_stream_logger(logger: logging.Logger, stream_instance: Stream):
@@ -336,5 +720,10 @@ class AbstractSource(Source, ABC):
         """
         if isinstance(record_data_or_message, AirbyteMessage):
             return record_data_or_message
-        else:
+        timer = stream.event_timer
+        if timer is None:
             return stream_data_to_airbyte_message(stream.name, record_data_or_message, stream.transformer, stream.get_json_schema())
+        start = time.perf_counter_ns()
+        message = stream_data_to_airbyte_message(stream.name, record_data_or_message, stream.transformer, stream.get_json_schema())
+        timer.add_span("transform", time.perf_counter_ns() - start)
+        return message
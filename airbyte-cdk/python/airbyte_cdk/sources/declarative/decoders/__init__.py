@@ -4,5 +4,6 @@
 
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 
-__all__ = ["Decoder", "JsonDecoder"]
+__all__ = ["Decoder", "JsonDecoder", "StreamingJsonDecoder"]
@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import io
+from dataclasses import InitVar, dataclass
+from typing import Any, BinaryIO, Iterator, List, Mapping, Tuple
+
+import ijson
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from dataclasses_jsonschema import JsonSchemaMixin
+
+_CONTAINER_END_EVENTS = {"start_map": "end_map", "start_array": "end_array"}
+
+
+@dataclass
+class StreamingJsonDecoder(JsonDecoder, JsonSchemaMixin):
+    """
+    Decoder strategy which parses the json-encoded content of a response incrementally, while it is downloaded.
+
+    When used as the decoder of a DpathExtractor, the request is sent with stream=True and the records are parsed one at a time from the
+    array at the extractor's field pointer, so that the memory needed to read a page is bounded by the size of a record instead of the
+    size of the page. Since the content of the response is then only read once, the pagination must not rely on the response body: use
+    the headers or an offset/page increment pagination strategy. A SimpleRetriever with a paginator reading the response body is rejected,
+    and reading the content of a streamed response afterwards raises an error.
+
+    decode still returns the whole json-encoded content of a response which was not streamed.
+    """
+
+    options: InitVar[Mapping[str, Any]]
+
+    def decode_items(self, response: requests.Response, path: List[str]) -> Iterator[Any]:
+        """
+        Parses the value at the given path of the json-encoded content of a response, without decoding the rest of the response.
+
+        If the value is an array, its items are yielded one at a time as they are parsed. Otherwise, the value is yielded on its own if it
+        is not empty. Nothing is yielded if the path does not exist.
+
+        :param response: the response to decode
+        :param path: the keys leading to the value, an empty path points to the whole content. Keys can't contain a "."
+        :return: the items of the value
+        """
+        if any("." in key for key in path):
+            # ijson joins the keys of a prefix with "." without escaping them
+            raise ValueError(f"Keys containing a '.' are not supported by the StreamingJsonDecoder, got path {path}")
+        prefix = ".".join(path)
+        has_items = False
+        try:
+            events = ijson.parse(self._content_stream(response), use_float=True)
+            for current_path, event, value in events:
+                if current_path != prefix or event == "map_key":
+                    continue
+                if event == "start_array":
+                    for item in self._build_array_items(events, prefix, f"{prefix}.item" if prefix else "item"):
+                        has_items = True
+                        yield item
+                elif event == "start_map":
+                    mapping = self._build_value(events, prefix, event, value)
+                    if mapping:
+                        yield mapping
+                elif value:
+                    yield value
+                return
+        except ijson.JSONError:
+            if has_items:
+                # Some items were already returned, the response can't be ignored
+                raise
+            # Same as JsonDecoder which decodes invalid json to an empty mapping
+            return
+        finally:
+            response.close()
+
+    @staticmethod
+    def _content_stream(response: requests.Response) -> BinaryIO:
+        if response._content_consumed or response._content is not False:
+            # The content was already downloaded, for instance by an error handler reading the response
+            return io.BytesIO(response.content)
+        response.raw.decode_content = True
+        # requests raises an error instead of returning an empty content if the content is read again, e.g. by a paginator
+        response._content_consumed = True
+        return response.raw
+
+    def _build_array_items(self, events: Iterator[Tuple[str, str, Any]], prefix: str, item_prefix: str) -> Iterator[Any]:
+        for current_path, event, value in events:
+            if current_path == prefix and event == "end_array":
+                return
+            yield self._build_value(events, item_prefix, event, value)
+
+    @staticmethod
+    def _build_value(events: Iterator[Tuple[str, str, Any]], prefix: str, event: str, value: Any) -> Any:
+        end_event = _CONTAINER_END_EVENTS.get(event)
+        if end_event is None:
+            return value
+        builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        for current_path, event, value in events:
+            builder.event(event, value)
+            if current_path == prefix and event == end_event:
+                return builder.value
+        raise ijson.IncompleteJSONError(f"Incomplete JSON content at {prefix}")
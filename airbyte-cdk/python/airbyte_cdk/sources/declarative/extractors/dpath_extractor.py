@@ -3,12 +3,13 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Union
+from typing import Any, Iterable, List, Mapping, Union
 
 import dpath.util
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.types import Config, Record
@@ -48,6 +49,17 @@ class DpathExtractor(RecordExtractor, JsonSchemaMixin):
         field_pointer: []
     ```
 
+    With a StreamingJsonDecoder, the records are lazily parsed one at a time from the response, unless the field pointer contains a
+    wildcard which requires the whole response to be decoded.
+    ```
+      extractor:
+        type: DpathExtractor
+        field_pointer:
+          - "data"
+        decoder:
+          type: StreamingJsonDecoder
+    ```
+
     Attributes:
         transform (Union[InterpolatedString, str]): Pointer to the field that should be extracted
         config (Config): The user-provided configuration as specified by the source's spec
@@ -64,12 +76,14 @@ class DpathExtractor(RecordExtractor, JsonSchemaMixin):
             if isinstance(self.field_pointer[pointer_index], str):
                 self.field_pointer[pointer_index] = InterpolatedString.create(self.field_pointer[pointer_index], options=options)
 
-    def extract_records(self, response: requests.Response) -> List[Record]:
+    def extract_records(self, response: requests.Response) -> Iterable[Record]:
+        pointer = [pointer.eval(self.config) for pointer in self.field_pointer]
+        if isinstance(self.decoder, StreamingJsonDecoder) and "*" not in pointer:
+            return self.decoder.decode_items(response, pointer)
         response_body = self.decoder.decode(response)
         if len(self.field_pointer) == 0:
             extracted = response_body
         else:
-            pointer = [pointer.eval(self.config) for pointer in self.field_pointer]
             if "*" in pointer:
                 extracted = dpath.util.values(response_body, pointer)
             else:
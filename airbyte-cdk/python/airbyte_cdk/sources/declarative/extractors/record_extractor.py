@@ -4,7 +4,7 @@
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable
 
 import requests
 from airbyte_cdk.sources.declarative.types import Record
@@ -21,10 +21,10 @@ class RecordExtractor(JsonSchemaMixin):
     def extract_records(
         self,
         response: requests.Response,
-    ) -> List[Record]:
+    ) -> Iterable[Record]:
         """
         Selects records from the response
         :param response: The response to extract the records from
-        :return: List of Records extracted from the response
+        :return: Records extracted from the response, either as a list or lazily
         """
         pass
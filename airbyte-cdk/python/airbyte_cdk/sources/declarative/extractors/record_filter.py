@@ -34,4 +34,5 @@ class RecordFilter(JsonSchemaMixin):
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> List[Record]:
         kwargs = {"stream_state": stream_state, "stream_slice": stream_slice, "next_page_token": next_page_token}
-        return [record for record in records if self._filter_interpolator.eval(self.config, record=record, **kwargs)]
+        selected = self._filter_interpolator.eval_records(self.config, records, **kwargs)
+        return [record for record, is_selected in zip(records, selected) if is_selected]
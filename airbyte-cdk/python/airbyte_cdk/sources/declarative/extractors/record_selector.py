@@ -3,7 +3,8 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Optional
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping, Optional
 
 import requests
 from airbyte_cdk.sources.declarative.extractors.http_selector import HttpSelector
@@ -24,6 +25,9 @@ class RecordSelector(HttpSelector, JsonSchemaMixin):
         record_filter (RecordFilter): The record filter responsible for filtering extracted records
     """
 
+    # Number of records filtered at once when the extractor returns the records lazily
+    FILTER_BATCH_SIZE = 1000
+
     extractor: RecordExtractor
     options: InitVar[Mapping[str, Any]]
     record_filter: RecordFilter = None
@@ -37,10 +41,28 @@ class RecordSelector(HttpSelector, JsonSchemaMixin):
         stream_state: StreamState,
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
-    ) -> List[Record]:
+    ) -> Iterable[Record]:
         all_records = self.extractor.extract_records(response)
         if self.record_filter:
+            if not isinstance(all_records, list):
+                return self._filter_lazily(all_records, stream_state, stream_slice, next_page_token)
             return self.record_filter.filter_records(
                 all_records, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token
             )
         return all_records
+
+    def _filter_lazily(
+        self,
+        records: Iterable[Record],
+        stream_state: StreamState,
+        stream_slice: Optional[StreamSlice],
+        next_page_token: Optional[Mapping[str, Any]],
+    ) -> Iterator[Record]:
+        records = iter(records)
+        while True:
+            batch = list(islice(records, self.FILTER_BATCH_SIZE))
+            if not batch:
+                return
+            yield from self.record_filter.filter_records(
+                batch, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token
+            )
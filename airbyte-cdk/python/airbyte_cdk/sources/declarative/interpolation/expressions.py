@@ -0,0 +1,135 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import operator
+from typing import Any, Callable, Mapping, Optional
+
+from jinja2 import nodes
+
+Context = Mapping[str, Any]
+Expression = Callable[[Context], Any]
+
+_COMPARISONS: Mapping[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "in": lambda left, right: left in right,
+    "notin": lambda left, right: left not in right,
+}
+
+
+class ExpressionNotEvaluated(Exception):
+    """Raised when an expression can't be evaluated without jinja for a given context"""
+
+
+class _UnsupportedExpression(Exception):
+    """Raised when a template can't be compiled to a python expression"""
+
+
+def compile_expression(template: nodes.Template) -> Optional[Expression]:
+    """
+    Compiles a template made of a single simple expression, like "{{ record['id'] > stream_state['id'] }}", to a python function
+    rendering the template for a context without going through jinja.
+
+    Field lookups (record.field, record['field'], records[0]), constants, comparisons and boolean operators are supported. Any lookup
+    which is not a plain key or index access (missing keys, attributes, undefined names...) or any error raises ExpressionNotEvaluated so
+    that the template is rendered with jinja instead, which keeps the jinja semantics for those cases.
+
+    :param template: The template parsed by jinja
+    :return: A function returning the rendered template, or None if the template is not a single simple expression
+    """
+    if len(template.body) != 1 or not isinstance(template.body[0], nodes.Output) or len(template.body[0].nodes) != 1:
+        return None
+    try:
+        expression = _compile(template.body[0].nodes[0])
+    except _UnsupportedExpression:
+        return None
+
+    def render(context: Context) -> str:
+        try:
+            return str(expression(context))
+        except ExpressionNotEvaluated:
+            raise
+        except Exception as error:
+            raise ExpressionNotEvaluated(str(error)) from error
+
+    return render
+
+
+def _compile(node: nodes.Node) -> Expression:
+    if isinstance(node, nodes.Const):
+        value = node.value
+        return lambda context: value
+    if isinstance(node, (nodes.List, nodes.Tuple)):
+        items = [_compile(item) for item in node.items]
+        container = list if isinstance(node, nodes.List) else tuple
+        return lambda context: container(item(context) for item in items)
+    if isinstance(node, nodes.Name):
+        return _compile_name(node.name)
+    if isinstance(node, nodes.Getattr):
+        if hasattr(dict, node.attr):
+            # jinja resolves attributes before keys so record.items is the dict method, not the "items" field
+            raise _UnsupportedExpression(node.attr)
+        return _compile_getattr(_compile(node.node), node.attr)
+    if isinstance(node, nodes.Getitem) and isinstance(node.arg, nodes.Const):
+        return _compile_getitem(_compile(node.node), node.arg.value)
+    if isinstance(node, nodes.Compare):
+        return _compile_comparison(_compile(node.expr), [(_COMPARISONS[operand.op], _compile(operand.expr)) for operand in node.ops])
+    if isinstance(node, nodes.And):
+        left, right = _compile(node.left), _compile(node.right)
+        return lambda context: left(context) and right(context)
+    if isinstance(node, nodes.Or):
+        left, right = _compile(node.left), _compile(node.right)
+        return lambda context: left(context) or right(context)
+    if isinstance(node, nodes.Not):
+        operand = _compile(node.node)
+        return lambda context: not operand(context)
+    raise _UnsupportedExpression(type(node).__name__)
+
+
+def _compile_name(name: str) -> Expression:
+    def lookup(context: Context) -> Any:
+        try:
+            return context[name]
+        except KeyError:
+            raise ExpressionNotEvaluated(name)
+
+    return lookup
+
+
+def _compile_getattr(obj: Expression, attr: str) -> Expression:
+    def lookup(context: Context) -> Any:
+        value = obj(context)
+        # objects other than plain dicts can have attributes which jinja would return instead of their items
+        if type(value) is dict and attr in value:
+            return value[attr]
+        raise ExpressionNotEvaluated(attr)
+
+    return lookup
+
+
+def _compile_getitem(obj: Expression, key: Any) -> Expression:
+    def lookup(context: Context) -> Any:
+        try:
+            return obj(context)[key]
+        except (AttributeError, TypeError, LookupError):
+            raise ExpressionNotEvaluated(key)
+
+    return lookup
+
+
+def _compile_comparison(first: Expression, comparisons) -> Expression:
+    def compare(context: Context) -> bool:
+        left = first(context)
+        for comparison, operand in comparisons:
+            right = operand(context)
+            if not comparison(left, right):
+                return False
+            left = right
+        return True
+
+    return compare
@@ -3,10 +3,10 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, Final, List, Mapping
+from typing import Any, Final, List, Mapping, Sequence
 
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
-from airbyte_cdk.sources.declarative.types import Config
+from airbyte_cdk.sources.declarative.types import Config, Record
 from dataclasses_jsonschema import JsonSchemaMixin
 
 FALSE_VALUES: Final[List[Any]] = ["False", "false", "{}", "[]", "()", "", "0", "0.0", {}, False, [], (), set()]
@@ -45,3 +45,19 @@ class InterpolatedBoolean(JsonSchemaMixin):
                 return False
             # The presence of a value is generally regarded as truthy, so we treat it as such
             return True
+
+    def eval_records(self, config: Config, records: Sequence[Record], **additional_options) -> List[bool]:
+        """
+        Interpolates the predicate condition string for each record of a page.
+
+        :param config: The user-provided configuration as specified by the source's spec
+        :param records: The records to evaluate the condition for, each one is passed as the record parameter
+        :param additional_options: Optional parameters used for interpolation
+        :return: The value of the condition for each record
+        """
+        if isinstance(self.condition, bool):
+            return [self.condition] * len(records)
+        evaluated = self._interpolation.eval_records(
+            self.condition, config, records, self._default, options=self._options, **additional_options
+        )
+        return [value not in FALSE_VALUES for value in evaluated]
@@ -3,10 +3,10 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, Mapping, Optional, Union
+from typing import Any, Iterable, List, Mapping, Optional, Union
 
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
-from airbyte_cdk.sources.declarative.types import Config
+from airbyte_cdk.sources.declarative.types import Config, Record
 from dataclasses_jsonschema import JsonSchemaMixin
 
 
@@ -40,6 +40,17 @@ class InterpolatedString(JsonSchemaMixin):
         """
         return self._interpolation.eval(self.string, config, self.default, options=self._options, **kwargs)
 
+    def eval_records(self, config: Config, records: Iterable[Record], **kwargs) -> List[Any]:
+        """
+        Interpolates the input string for each record of a page.
+
+        :param config: The user-provided configuration as specified by the source's spec
+        :param records: The records to interpolate the string for, each one is passed as the record parameter
+        :param kwargs: Optional parameters used for interpolation
+        :return: The interpolated values, in the order of the records
+        """
+        return self._interpolation.eval_records(self.string, config, records, self.default, options=self._options, **kwargs)
+
     def __eq__(self, other):
         if not isinstance(other, InterpolatedString):
             return False
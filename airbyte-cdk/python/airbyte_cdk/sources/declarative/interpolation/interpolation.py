@@ -3,9 +3,9 @@
 #
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Iterable, List, Optional
 
-from airbyte_cdk.sources.declarative.types import Config
+from airbyte_cdk.sources.declarative.types import Config, Record
 
 
 class Interpolation(ABC):
@@ -25,3 +25,18 @@ class Interpolation(ABC):
         :return: The interpolated string
         """
         pass
+
+    def eval_records(
+        self, input_str: str, config: Config, records: Iterable[Record], default: Optional[str] = None, **additional_options
+    ) -> List[Any]:
+        """
+        Interpolates the input string for each record of a page, passing the record as the record parameter.
+
+        :param input_str: The string to interpolate
+        :param config: The user-provided configuration as specified by the source's spec
+        :param records: The records to interpolate the string for
+        :param default: Default value to return if the evaluation returns an empty string
+        :param additional_options: Optional parameters used for interpolation
+        :return: The interpolated values, in the order of the records
+        """
+        return [self.eval(input_str, config, default, record=record, **additional_options) for record in records]
@@ -3,16 +3,41 @@
 #
 
 import ast
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Iterable, List, Mapping, NamedTuple, Optional, Set
 
+from airbyte_cdk.sources.declarative.interpolation.expressions import Expression, ExpressionNotEvaluated, compile_expression
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
-from airbyte_cdk.sources.declarative.types import Config
-from jinja2 import Environment
+from airbyte_cdk.sources.declarative.types import Config, Record
+from jinja2 import Environment, Template, meta
 from jinja2.exceptions import UndefinedError
 
 
+class TemplateCacheInfo(NamedTuple):
+    """Lookups of the compiled template cache of a JinjaInterpolation. Static strings are cached as well, so they count as hits too"""
+
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _CompiledTemplate(NamedTuple):
+    template: Template
+    # evaluates the template in python when it is a simple expression, None otherwise
+    expression: Optional[Expression]
+
+
+# ast.literal_eval results of the most common rendered values
+_LITERAL_CONSTANTS: Mapping[str, Any] = {"True": True, "False": False, "None": None}
+
+
 class JinjaInterpolation(Interpolation):
     """
     Interpolation strategy using the Jinja2 template engine.
@@ -29,15 +54,68 @@ class JinjaInterpolation(Interpolation):
     "{{ max(2, 3) }}" will return 3
 
     Additional information on jinja templating can be found at https://jinja.palletsprojects.com/en/3.1.x/templates/#
+
+    Templates are compiled once and cached by their string, and strings without any jinja delimiter are detected as static values so
+    that they are returned without going through jinja at all. The cache lookups are reported by cache_info(). Templates made of a single
+    comparison or field lookup, like "{{ record['updated_at'] > stream_state['updated_at'] }}", are evaluated directly in python.
     """
 
+    # Maximum number of compiled templates kept by an interpolation, the least recently used ones are evicted first
+    TEMPLATE_CACHE_SIZE = 1024
+
     def __init__(self):
         self._environment = Environment()
         self._environment.filters.update(**filters)
         self._environment.globals.update(**macros)
+        self._delimiters = (
+            self._environment.block_start_string,
+            self._environment.variable_start_string,
+            self._environment.comment_start_string,
+        )
+        self._get_template = lru_cache(maxsize=self.TEMPLATE_CACHE_SIZE)(self._compile)
+
+    def cache_info(self) -> TemplateCacheInfo:
+        info = self._get_template.cache_info()
+        return TemplateCacheInfo(hits=info.hits, misses=info.misses, size=info.currsize)
 
     def eval(self, input_str: str, config: Config, default: Optional[str] = None, **additional_options):
         context = {"config": config, **additional_options}
+        return self._eval_with_context(input_str, context, default)
+
+    def variables(self, input_str: str) -> Set[str]:
+        """
+        Returns the names of the context variables the input string refers to, e.g. {"config", "response"} for
+        "{{ response[config['cursor_key']] }}". Macros are not included.
+
+        :param input_str: The string to interpolate
+        :return: The names of the variables
+        """
+        if not isinstance(input_str, str) or self._get_template(input_str) is None:
+            return set()
+        return meta.find_undeclared_variables(self._environment.parse(input_str)) - set(self._environment.globals)
+
+    def eval_records(
+        self, input_str: str, config: Config, records: Iterable[Record], default: Optional[str] = None, **additional_options
+    ) -> List[Any]:
+        """
+        Interpolates the input string for each record of a page. This is equivalent to calling eval with record=record for each record,
+        but the template is looked up once and the interpolation context is shared between the records.
+
+        :param input_str: The string to interpolate
+        :param config: The user-provided configuration as specified by the source's spec
+        :param records: The records to interpolate the string for
+        :param default: Default value to return if the evaluation returns an empty string
+        :param additional_options: Optional parameters used for interpolation
+        :return: The interpolated values, in the order of the records
+        """
+        context = {"config": config, **additional_options}
+        values = []
+        for record in records:
+            context["record"] = record
+            values.append(self._eval_with_context(input_str, context, default))
+        return values
+
+    def _eval_with_context(self, input_str: str, context: Mapping[str, Any], default: Optional[str]):
         try:
             if isinstance(input_str, str):
                 result = self._eval(input_str, context)
@@ -52,15 +130,37 @@ class JinjaInterpolation(Interpolation):
         return self._literal_eval(self._eval(default, context))
 
     def _literal_eval(self, result):
+        if isinstance(result, str) and result in _LITERAL_CONSTANTS:
+            return _LITERAL_CONSTANTS[result]
         try:
             return ast.literal_eval(result)
         except (ValueError, SyntaxError):
             return result
 
     def _eval(self, s: str, context):
-        try:
-            return self._environment.from_string(s).render(context)
-        except TypeError:
+        if not isinstance(s, str):
+            # The value is not a jinja template
+            # It can be returned as is
+            return s
+        compiled = self._get_template(s)
+        if compiled is None:
             # The string is a static value, not a jinja template
             # It can be returned as is
             return s
+        if compiled.expression is not None:
+            try:
+                return compiled.expression(context)
+            except ExpressionNotEvaluated:
+                pass
+        try:
+            return compiled.template.render(context)
+        except TypeError:
+            return s
+
+    def _compile(self, s: str) -> Optional[_CompiledTemplate]:
+        """Returns the compiled template of s, or None if s is a static string which renders to itself"""
+        # jinja normalizes line endings and removes a single trailing newline, so such strings must still be rendered
+        if any(delimiter in s for delimiter in self._delimiters) or "\r" in s or s.endswith("\n"):
+            template = self._environment.from_string(s)
+            return _CompiledTemplate(template, compile_expression(self._environment.parse(s)))
+        return None
@@ -324,6 +324,10 @@ class Spec(BaseModel):
     documentation_url: Optional[str] = None
 
 
+class StreamingJsonDecoder(BaseModel):
+    type: Literal["StreamingJsonDecoder"]
+
+
 class WaitTimeFromHeader(BaseModel):
     type: Literal["WaitTimeFromHeader"]
     header: str
@@ -395,7 +399,7 @@ class DefaultPaginator(BaseModel):
 class DpathExtractor(BaseModel):
     type: Literal["DpathExtractor"]
     field_pointer: List[str]
-    decoder: Optional[JsonDecoder] = None
+    decoder: Optional[Union[JsonDecoder, StreamingJsonDecoder]] = None
     options: Optional[Dict[str, Any]] = Field(None, alias="$options")
 
 
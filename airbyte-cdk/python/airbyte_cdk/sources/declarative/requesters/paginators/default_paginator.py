@@ -105,6 +105,10 @@ class DefaultPaginator(Paginator, JsonSchemaMixin):
         else:
             return None
 
+    @property
+    def reads_response_body(self) -> bool:
+        return self.pagination_strategy.reads_response_body
+
     def path(self):
         if self._token and self.page_token_option and self.page_token_option.inject_into == RequestOptionType.path:
             # Replace url base to only return the path
@@ -184,6 +188,10 @@ class PaginatorTestReadDecorator(Paginator):
         self._page_count += 1
         return self._decorated.next_page_token(response, last_records)
 
+    @property
+    def reads_response_body(self) -> bool:
+        return self._decorated.reads_response_body
+
     def path(self):
         return self._decorated.path()
 
@@ -37,6 +37,14 @@ class Paginator(ABC, RequestOptionsProvider, JsonSchemaMixin):
         """
         pass
 
+    @property
+    def reads_response_body(self) -> bool:
+        """
+        Whether next_page_token reads the content of the response. It can't when the records are parsed lazily with a
+        StreamingJsonDecoder, which consumes the content of the response.
+        """
+        return False
+
     @abstractmethod
     def path(self) -> Optional[str]:
         """
@@ -10,6 +10,7 @@ from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
 from airbyte_cdk.sources.declarative.interpolation.interpolated_boolean import InterpolatedBoolean
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.pagination_strategy import PaginationStrategy
 from airbyte_cdk.sources.declarative.types import Config
 from dataclasses_jsonschema import JsonSchemaMixin
@@ -40,9 +41,19 @@ class CursorPaginationStrategy(PaginationStrategy, JsonSchemaMixin):
             self.cursor_value = InterpolatedString.create(self.cursor_value, options=options)
         if isinstance(self.stop_condition, str):
             self.stop_condition = InterpolatedBoolean(condition=self.stop_condition, options=options)
+        interpolation = JinjaInterpolation()
+        templates = [self.cursor_value.string, self.cursor_value.default]
+        if self.stop_condition:
+            templates.append(self.stop_condition.condition)
+        self._reads_response_body = any("response" in interpolation.variables(template) for template in templates)
+
+    @property
+    def reads_response_body(self) -> bool:
+        return self._reads_response_body
 
     def next_page_token(self, response: requests.Response, last_records: List[Mapping[str, Any]]) -> Optional[Any]:
-        decoded_response = self.decoder.decode(response)
+        # The content is only decoded if needed, it may have been consumed by a StreamingJsonDecoder
+        decoded_response = self.decoder.decode(response) if self._reads_response_body else {}
 
         # The default way that link is presented in requests.Response is a string of various links (last, next, etc). This
         # is not indexable or useful for parsing the cursor, so we replace it with the link dictionary from response.links
@@ -25,6 +25,13 @@ class PaginationStrategy(JsonSchemaMixin):
         """
         pass
 
+    @property
+    def reads_response_body(self) -> bool:
+        """
+        :return: whether next_page_token reads the content of the response
+        """
+        return False
+
     @abstractmethod
     def reset(self):
         """
@@ -7,11 +7,12 @@ import logging
 from dataclasses import InitVar, dataclass, field
 from itertools import islice
 from json import JSONDecodeError
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
 
 import requests
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.exceptions import ReadException
 from airbyte_cdk.sources.declarative.extractors.http_selector import HttpSelector
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -29,6 +30,32 @@ from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets
 from dataclasses_jsonschema import JsonSchemaMixin
 
 
+class _StreamedRecords:
+    """
+    Stands in for the list of records of a page which was parsed lazily, without keeping the records in memory. Only the number of
+    records and the last record are known, which is what paginators need to compute the next page token.
+    """
+
+    def __init__(self):
+        self._count = 0
+        self._last_record = None
+
+    def append(self, record: Record):
+        self._count += 1
+        self._last_record = record
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Record:
+        if self._count and index in (-1, self._count - 1):
+            return self._last_record
+        raise IndexError("Only the last record of a streamed page is kept")
+
+    def __iter__(self) -> Iterator[Record]:
+        raise TypeError("The records of a streamed page are not kept")
+
+
 @dataclass
 class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
     """
@@ -70,6 +97,11 @@ class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
         self._last_records = None
         self._options = options
         self.name = InterpolatedString(self._name, options=options)
+        if self._parses_responses_lazily() and self.paginator.reads_response_body:
+            raise ValueError(
+                f"The paginator of stream {self.name} reads the content of the responses, which can't be used with a StreamingJsonDecoder: "
+                "use the headers or an offset/page increment pagination strategy, or a JsonDecoder"
+            )
 
     @property
     def name(self) -> str:
@@ -270,7 +302,14 @@ class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
         this method. Note that these options do not conflict with request-level options such as headers, request params, etc..
         """
         # Warning: use self.state instead of the stream_state passed as argument!
-        return self.requester.request_kwargs(stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token)
+        request_kwargs = self.requester.request_kwargs(stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token)
+        if self._parses_responses_lazily():
+            return {**request_kwargs, "stream": True}
+        return request_kwargs
+
+    def _parses_responses_lazily(self) -> bool:
+        extractor = getattr(self.record_selector, "extractor", None)
+        return isinstance(getattr(extractor, "decoder", None), StreamingJsonDecoder)
 
     def path(
         self,
@@ -335,9 +374,18 @@ class SimpleRetriever(Retriever, HttpStream, JsonSchemaMixin):
         records = self.record_selector.select_records(
             response=response, stream_state=self.state, stream_slice=stream_slice, next_page_token=next_page_token
         )
+        if not isinstance(records, list):
+            self._last_records = _StreamedRecords()
+            return self._track_streamed_records(records, self._last_records)
         self._last_records = records
         return records
 
+    @staticmethod
+    def _track_streamed_records(records: Iterable[Record], streamed_records: _StreamedRecords) -> Iterator[Record]:
+        for record in records:
+            streamed_records.append(record)
+            yield record
+
     @property
     def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
         """The stream's primary key"""
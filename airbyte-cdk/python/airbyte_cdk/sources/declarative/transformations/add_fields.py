@@ -117,5 +117,21 @@ class AddFields(RecordTransformation, JsonSchemaMixin):
 
         return record
 
+    def transform_records(
+        self,
+        records: List[Record],
+        config: Optional[Config] = None,
+        stream_state: Optional[StreamState] = None,
+        stream_slice: Optional[StreamSlice] = None,
+    ) -> List[Record]:
+        # Each field is evaluated over the whole page before the next one. A field can only refer to its own record, so this adds the
+        # same values as transforming the records one at a time.
+        for parsed_field in self._parsed_fields:
+            values = parsed_field.value.eval_records(config, records, stream_state=stream_state, stream_slice=stream_slice)
+            for record, value in zip(records, values):
+                dpath.util.new(record, parsed_field.path, value)
+
+        return records
+
     def __eq__(self, other):
         return self.__dict__ == other.__dict__
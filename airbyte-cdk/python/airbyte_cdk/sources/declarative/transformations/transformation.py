@@ -4,7 +4,7 @@
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
 from dataclasses_jsonschema import JsonSchemaMixin
@@ -34,5 +34,25 @@ class RecordTransformation(JsonSchemaMixin):
         :return: The transformed record
         """
 
+    def transform_records(
+        self,
+        records: List[Record],
+        config: Optional[Config] = None,
+        stream_state: Optional[StreamState] = None,
+        stream_slice: Optional[StreamSlice] = None,
+    ) -> List[Record]:
+        """
+        Transform a page of records. Override to transform the whole page at once instead of one record at a time.
+        DeclarativeStream reads call transform() on each record once it updated the cursor, so that the state is computed from the
+        records as they were read.
+
+        :param records: The input records to be transformed
+        :param config: The user-provided configuration as specified by the source's spec
+        :param stream_state: The stream state
+        :param stream_slice: The stream slice
+        :return: The transformed records
+        """
+        return [self.transform(record, config=config, stream_state=stream_state, stream_slice=stream_slice) for record in records]
+
     def __eq__(self, other):
         return other.__dict__ == self.__dict__
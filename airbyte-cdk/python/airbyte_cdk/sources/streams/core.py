@@ -16,6 +16,7 @@ from airbyte_cdk.models import AirbyteLogMessage, AirbyteStream, AirbyteTraceMes
 # list of all possible HTTP methods which can be used for sending of request bodies
 from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from airbyte_cdk.utils.event_timing import EventTimer
 from deprecated.classic import deprecated
 
 if typing.TYPE_CHECKING:
@@ -83,6 +84,9 @@ class Stream(ABC):
     # TypeTransformer object to perform output data transformation
     transformer: TypeTransformer = TypeTransformer(TransformConfig.NoTransform)
 
+    # Timer profiling the spans of the stream (slices, requests...) while a source reads it
+    event_timer: Optional[EventTimer] = None
+
     @property
     def name(self) -> str:
         """
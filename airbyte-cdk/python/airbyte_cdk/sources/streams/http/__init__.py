@@ -3,7 +3,17 @@
 #
 
 # Initialize Streams Package
+from .async_http import AsyncHttpStream
 from .exceptions import UserDefinedBackoffException
 from .http import HttpStream, HttpSubStream
+from .session_registry import ConnectionStats, HttpSessionRegistry, SessionPoolConfig
 
-__all__ = ["HttpStream", "HttpSubStream", "UserDefinedBackoffException"]
+__all__ = [
+    "AsyncHttpStream",
+    "ConnectionStats",
+    "HttpSessionRegistry",
+    "HttpStream",
+    "HttpSubStream",
+    "SessionPoolConfig",
+    "UserDefinedBackoffException",
+]
@@ -0,0 +1,159 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+from abc import ABC
+from typing import Any, AsyncIterator, List, Mapping, Optional
+
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.core import StreamData
+from requests import codes
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .exceptions import DefaultBackoffException, UserDefinedBackoffException
+from .http import HttpStream
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+TRANSIENT_EXCEPTIONS = (DefaultBackoffException, asyncio.TimeoutError) + (
+    (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) if aiohttp else ()
+)
+
+
+class AsyncHttpStream(HttpStream, ABC):
+    """
+    HttpStream whose requests are sent with aiohttp on the event loop of the source, so that many slices of the stream, and many such
+    streams, are read at the same time on a single thread while they wait for the API.
+
+    Async streams are implemented exactly like HttpStream: path, request_params, request_headers, parse_response, next_page_token,
+    should_retry, backoff_time... keep the same signatures, and parse_response and next_page_token receive a requests.Response holding the
+    downloaded content. The source reads max_concurrent_slices slices of the stream at the same time with read_records_async, whereas
+    read_records still sends the requests with requests, e.g. when the stream is the parent of a HttpSubStream.
+
+    Responses read asynchronously are not cached when use_cache is set. Requires the aiohttp package, installed with the "async" extra.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._async_session: Optional["aiohttp.ClientSession"] = None
+
+    @property
+    def max_concurrent_slices(self) -> int:
+        """
+        Override if needed. Number of slices read at the same time on the event loop of the source.
+        """
+        return 10
+
+    async def read_records_async(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> AsyncIterator[StreamData]:
+        """
+        Same as read_records, the pages of the slice are fetched without blocking the event loop.
+        """
+        stream_state = stream_state or {}
+        next_page_token = None
+        while True:
+            request, request_kwargs = self._create_next_page_request(stream_slice, stream_state, next_page_token)
+            response = await self._send_request_async(request, request_kwargs)
+            for record in self.parse_response(response, stream_slice=stream_slice, stream_state=stream_state):
+                yield record
+
+            next_page_token = self.next_page_token(response)
+            if not next_page_token:
+                break
+
+    async def close_async_session(self):
+        """
+        Closes the connections opened by read_records_async. Called by the source on its event loop once the sync is over.
+        """
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    def _get_async_session(self) -> "aiohttp.ClientSession":
+        if aiohttp is None:
+            raise ImportError(f"aiohttp is required to read the {self.name} stream asynchronously, install airbyte-cdk[async]")
+        if self._async_session is None:
+            # The session is bound to the running event loop, it is created by the first request sent on it
+            self._async_session = aiohttp.ClientSession()
+        return self._async_session
+
+    async def _send_request_async(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        """
+        Retries _send_async with the same policy as the backoff handlers of _send_request: the user defined backoff time of
+        UserDefinedBackoffException, or an exponential backoff with retry_factor for other transient errors.
+        """
+        # max_retries is the number of retries after the first attempt, None means there is no limit
+        max_tries = None if self.max_retries is None else max(0, self.max_retries) + 1
+        tries = 0
+        while True:
+            tries += 1
+            try:
+                return await self._send_async(request, request_kwargs)
+            except UserDefinedBackoffException as exc:
+                if max_tries is not None and tries >= max_tries:
+                    self.logger.error(f"Max retry limit reached. Request: {exc.request}, Response: {exc.response}")
+                    raise
+                self.logger.info(f"Retrying. Sleeping for {exc.backoff} seconds")
+                await asyncio.sleep(exc.backoff + 1)  # extra second to cover any fractions of second
+            except TRANSIENT_EXCEPTIONS as exc:
+                response = getattr(exc, "response", None)
+                if response is not None and response.status_code != codes.too_many_requests and 400 <= response.status_code < 500:
+                    # A non-rate-limiting related 4XX error is unexpected and probably consistent, so we don't back off
+                    self.logger.info(f"Giving up for returned HTTP status: {response.status_code}")
+                    raise
+                if max_tries is not None and tries >= max_tries:
+                    raise
+                wait = self.retry_factor * 2 ** (tries - 1)
+                self.logger.info(f"Caught retryable error '{str(exc)}' after {tries} tries. Waiting {wait} seconds then retrying...")
+                await asyncio.sleep(wait)
+
+    async def _send_async(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        """
+        Sends the request with aiohttp and handles its response like _send.
+        """
+        self.logger.debug(
+            "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
+        )
+        async with self._get_async_session().request(
+            request.method, request.url, headers=dict(request.headers), data=request.body, **self._aiohttp_request_kwargs(request_kwargs)
+        ) as aiohttp_response:
+            content = await aiohttp_response.read()
+
+        response = requests.Response()
+        response.status_code = aiohttp_response.status
+        response.reason = aiohttp_response.reason
+        response.headers = CaseInsensitiveDict(aiohttp_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(aiohttp_response.url)
+        response.request = request
+        response._content = content
+        return self._handle_response(request, response)
+
+    @staticmethod
+    def _aiohttp_request_kwargs(request_kwargs: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Translates the requests options returned by request_kwargs to aiohttp, only timeout, verify and allow_redirects are supported.
+        """
+        aiohttp_kwargs = {}
+        timeout = request_kwargs.get("timeout")
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            aiohttp_kwargs["timeout"] = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        elif timeout is not None:
+            aiohttp_kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        if request_kwargs.get("verify") is False:
+            aiohttp_kwargs["ssl"] = False
+        if "allow_redirects" in request_kwargs:
+            aiohttp_kwargs["allow_redirects"] = request_kwargs["allow_redirects"]
+        return aiohttp_kwargs
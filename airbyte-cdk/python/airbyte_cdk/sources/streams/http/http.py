@@ -20,6 +20,7 @@ from requests_cache.session import CachedSession
 from .auth.core import HttpAuthenticator, NoAuth
 from .exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from .session_registry import HttpSessionRegistry
 
 # list of all possible HTTP methods which can be used for sending of request bodies
 BODY_REQUEST_METHODS = ("GET", "POST", "PUT", "PATCH")
@@ -32,6 +33,8 @@ class HttpStream(Stream, ABC):
 
     source_defined_cursor = True  # Most HTTP streams use a source defined cursor (i.e: the user can't configure it like on a SQL table)
     page_size: Optional[int] = None  # Use this variable to define page size for API http requests with pagination support
+    # Set a registry shared by the streams of a source, including sub-streams, to share their connection pools
+    session_registry: Optional[HttpSessionRegistry] = None
 
     # TODO: remove legacy HttpAuthenticator authenticator references
     def __init__(self, authenticator: Union[AuthBase, HttpAuthenticator] = None):
@@ -39,6 +42,8 @@ class HttpStream(Stream, ABC):
             self._session = self.request_cache()
         else:
             self._session = requests.Session()
+        if self.session_registry:
+            self.session_registry.mount(self._session)
 
         self._authenticator: HttpAuthenticator = NoAuth()
         if isinstance(authenticator, AuthBase):
@@ -109,6 +114,16 @@ class HttpStream(Stream, ABC):
         """
         return 5
 
+    @property
+    def max_concurrent_slices(self) -> int:
+        """
+        Override if needed. Number of slices fetched at the same time. The records of a slice are emitted once the whole slice is read.
+        During incremental reads, the state is only checkpointed up to the last slice preceded by fully read slices, so that an
+        interrupted sync resumes without losing data. Only applies to incremental streams updating their state with get_updated_state,
+        streams implementing the state property are read one slice at a time.
+        """
+        return 1
+
     @property
     def authenticator(self) -> HttpAuthenticator:
         return self._authenticator
@@ -296,7 +311,12 @@ class HttpStream(Stream, ABC):
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
         response: requests.Response = self._session.send(request, **request_kwargs)
+        return self._handle_response(request, response)
 
+    def _handle_response(self, request: requests.PreparedRequest, response: requests.Response) -> requests.Response:
+        """
+        Raises the exceptions triggering a backoff for a response which should be retried, or the HTTP error of a failed response
+        """
         # Evaluation of response.text can be heavy, for example, if streaming a large response
         # Do it only in debug mode
         if self.logger.isEnabledFor(logging.DEBUG):
@@ -425,9 +445,15 @@ class HttpStream(Stream, ABC):
         stream_state = stream_state or {}
         pagination_complete = False
         next_page_token = None
+        timer = self.event_timer
         while not pagination_complete:
-            request, response = self._fetch_next_page(stream_slice, stream_state, next_page_token)
-            yield from records_generator_fn(request, response, stream_state, stream_slice)
+            if timer is None:
+                request, response = self._fetch_next_page(stream_slice, stream_state, next_page_token)
+                yield from records_generator_fn(request, response, stream_state, stream_slice)
+            else:
+                with timer.span("request"):
+                    request, response = self._fetch_next_page(stream_slice, stream_state, next_page_token)
+                yield from timer.timed("parse", records_generator_fn(request, response, stream_state, stream_slice))
 
             next_page_token = self.next_page_token(response)
             if not next_page_token:
@@ -439,6 +465,13 @@ class HttpStream(Stream, ABC):
     def _fetch_next_page(
         self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
     ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        request, request_kwargs = self._create_next_page_request(stream_slice, stream_state, next_page_token)
+        response = self._send_request(request, request_kwargs)
+        return request, response
+
+    def _create_next_page_request(
+        self, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Tuple[requests.PreparedRequest, Mapping[str, Any]]:
         request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
         request = self._create_prepared_request(
             path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
@@ -448,9 +481,7 @@ class HttpStream(Stream, ABC):
             data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
         )
         request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
-
-        response = self._send_request(request, request_kwargs)
-        return request, response
+        return request, request_kwargs
 
 
 class HttpSubStream(HttpStream, ABC):
@@ -0,0 +1,134 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Type
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+@dataclass(frozen=True)
+class SessionPoolConfig:
+    """
+    Connection pool settings of the sessions created by a HttpSessionRegistry.
+
+    pool_connections: number of hosts whose connection pool is kept open
+    pool_maxsize: number of connections kept open, and reused, for each host
+    max_connections_per_host: if set, requests wait for a connection to a host to be available instead of opening more than this number
+        of connections to the host at the same time. It overrides pool_maxsize.
+    """
+
+    pool_connections: int = DEFAULT_POOLSIZE
+    pool_maxsize: int = DEFAULT_POOLSIZE
+    max_connections_per_host: Optional[int] = None
+
+
+@dataclass
+class ConnectionStats:
+    """Number of requests sent to a host and number of new connections opened to send them, the other requests reused a connection"""
+
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        return max(self.requests - self.new_connections, 0)
+
+
+class _ConnectionStatsRecorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, ConnectionStats] = {}
+
+    def record_request(self, host: str):
+        with self._lock:
+            self._stats.setdefault(host, ConnectionStats()).requests += 1
+
+    def record_new_connection(self, host: str):
+        with self._lock:
+            self._stats.setdefault(host, ConnectionStats()).new_connections += 1
+
+    def snapshot(self) -> Mapping[str, ConnectionStats]:
+        with self._lock:
+            return {host: ConnectionStats(stats.requests, stats.new_connections) for host, stats in self._stats.items()}
+
+
+def _counting_pool_class(pool_class: Type[HTTPConnectionPool], recorder: _ConnectionStatsRecorder) -> Type[HTTPConnectionPool]:
+    class CountingConnectionPool(pool_class):
+        def _new_conn(self):
+            recorder.record_new_connection(self.host)
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class _SharedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter counting the requests it sends and the connections its pools open"""
+
+    def __init__(self, recorder: _ConnectionStatsRecorder, **kwargs):
+        self._recorder = recorder
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self._recorder),
+            "https": _counting_pool_class(HTTPSConnectionPool, self._recorder),
+        }
+
+    def send(self, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:
+        self._recorder.record_request(urlparse(request.url).hostname)
+        return super().send(request, *args, **kwargs)
+
+
+class HttpSessionRegistry:
+    """
+    Shares connection pools between the sessions of several streams, e.g. all the streams of a source and their sub-streams, so that
+    connections to a host are kept alive and reused across streams instead of every stream opening its own connections.
+
+    Each session keeps its own authentication, headers and cookies, only the connection pools are shared. The registry counts the
+    requests sent to each host and the new connections opened for them, to measure the connection and TLS handshakes overhead of a sync.
+
+    Usage: set the session_registry attribute of the base stream class of a source
+    ```
+    class GithubStream(HttpStream):
+        session_registry = HttpSessionRegistry(SessionPoolConfig(pool_maxsize=20))
+    ```
+    """
+
+    def __init__(self, pool_config: SessionPoolConfig = SessionPoolConfig()):
+        self.pool_config = pool_config
+        self._recorder = _ConnectionStatsRecorder()
+        if pool_config.max_connections_per_host:
+            pool_maxsize, pool_block = pool_config.max_connections_per_host, True
+        else:
+            pool_maxsize, pool_block = pool_config.pool_maxsize, DEFAULT_POOLBLOCK
+        self._adapter = _SharedHTTPAdapter(
+            self._recorder, pool_connections=pool_config.pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """Makes the session send its HTTP and HTTPS requests through the shared connection pools"""
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        return session
+
+    def create_session(self) -> requests.Session:
+        return self.mount(requests.Session())
+
+    def connection_stats(self) -> Mapping[str, ConnectionStats]:
+        """:return: the connection statistics of each host requests were sent to"""
+        return self._recorder.snapshot()
+
+    def log_connection_stats(self, logger: logging.Logger):
+        for host, stats in sorted(self.connection_stats().items()):
+            logger.info(
+                f"Sent {stats.requests} requests to {host}: {stats.new_connections} new connections, "
+                f"{stats.reused_connections} reused connections"
+            )
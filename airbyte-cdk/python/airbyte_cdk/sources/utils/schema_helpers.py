@@ -166,9 +166,10 @@ def check_config_against_spec_or_exit(config: Mapping[str, Any], spec: Connector
 
 
 class InternalConfig(BaseModel):
-    KEYWORDS: ClassVar[set] = {"_limit", "_page_size"}
+    KEYWORDS: ClassVar[set] = {"_limit", "_page_size", "_profile"}
     limit: int = Field(None, alias="_limit")
     page_size: int = Field(None, alias="_page_size")
+    profile: bool = Field(False, alias="_profile")
 
     def dict(self, *args, **kwargs):
         kwargs["by_alias"] = True
@@ -2,16 +2,28 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import logging
+import numbers
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
-from jsonschema import Draft7Validator, ValidationError, validators
+from jsonschema import Draft7Validator, RefResolutionError, RefResolver, ValidationError, validators
 
 json_to_python_simple = {"string": str, "number": float, "integer": int, "boolean": bool, "null": type(None)}
 json_to_python = json_to_python_simple | {"object": dict, "array": list}
 python_to_json = {v: k for k, v in json_to_python.items()}
+# Python types accepted for each json type by the type checker of the jsonschema based normalizer, booleans are only accepted as "boolean"
+json_type_checks = {
+    "array": (list,),
+    "boolean": (bool,),
+    "integer": (int,),
+    "null": (type(None),),
+    "number": (numbers.Number,),
+    "object": (dict,),
+    "string": (str,),
+}
 
 logger = logging.getLogger("airbyte")
 
@@ -33,6 +45,93 @@ class TransformConfig(Flag):
     # with DefaultSchemaNormalization. In this case default type casting would
     # be applied before custom one.
     CustomSchemaNormalization = auto()
+    # Compile each json schema once into a per-field conversion plan, with
+    # $ref resolved and type converters selected ahead of time, instead of
+    # walking every record with jsonschema validators. Output and warnings
+    # are the same as without this flag. Meant to be combined with
+    # DefaultSchemaNormalization and/or CustomSchemaNormalization.
+    CompiledSchemaNormalization = auto()
+
+
+class _UnsupportedSchema(Exception):
+    """Raised while compiling a schema using constructs the compiled plan does not handle, jsonschema is used for it instead"""
+
+
+class _CompiledSchema:
+    """
+    Conversion plan for a (sub)schema: the steps jsonschema would run for the "type", "properties", "items" and "$ref" keywords of
+    the schema, in the schema's key order.
+    """
+
+    __slots__ = ("steps",)
+
+    def __init__(self):
+        self.steps: List[Callable[[Any, Tuple], None]] = []
+
+    def apply(self, instance: Any, path: Tuple):
+        for step in self.steps:
+            step(instance, path)
+
+
+# Builders of the conversion default_convert applies to values of a json type, called with the type, the subschema and whether it is
+# nullable, see TypeTransformer._compile_default_converter
+
+
+def _build_cast_converter(target_type: str, subschema: Mapping[str, Any], nullable: bool) -> Optional[Callable[[Any], Any]]:
+    cast = json_to_python_simple[target_type]
+
+    def convert(original_item: Any) -> Any:
+        if original_item is None and nullable:
+            return None
+        try:
+            return cast(original_item)
+        except (ValueError, TypeError):
+            return original_item
+
+    return convert
+
+
+def _build_boolean_converter(target_type: str, subschema: Mapping[str, Any], nullable: bool) -> Optional[Callable[[Any], Any]]:
+    def convert(original_item: Any) -> Any:
+        if original_item is None and nullable:
+            return None
+        try:
+            if isinstance(original_item, str):
+                return strtobool(original_item) == 1
+            return bool(original_item)
+        except (ValueError, TypeError):
+            return original_item
+
+    return convert
+
+
+def _build_array_converter(target_type: str, subschema: Mapping[str, Any], nullable: bool) -> Optional[Callable[[Any], Any]]:
+    try:
+        item_types = set(subschema.get("items", {}).get("type", set()))
+        wrap_simple_values = item_types.issubset(json_to_python_simple)
+    except (ValueError, TypeError):
+        wrap_simple_values = False
+    if not wrap_simple_values:
+        return None
+    simple_types = tuple(json_to_python_simple.values())
+
+    def convert(original_item: Any) -> Any:
+        if original_item is None and nullable:
+            return None
+        if type(original_item) in simple_types:
+            return [original_item]
+        return original_item
+
+    return convert
+
+
+_default_converter_builders: Dict[str, Callable[[str, Mapping[str, Any], bool], Optional[Callable[[Any], Any]]]] = {
+    "string": _build_cast_converter,
+    "number": _build_cast_converter,
+    "integer": _build_cast_converter,
+    "boolean": _build_boolean_converter,
+    "array": _build_array_converter,
+}
 
 
 class TypeTransformer:
@@ -41,6 +140,8 @@ class TypeTransformer:
     """
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
+    # number of compiled schemas kept by a transformer when TransformConfig.CompiledSchemaNormalization is set
+    MAX_COMPILED_SCHEMAS = 64
 
     def __init__(self, config: TransformConfig):
         """
@@ -57,6 +158,11 @@ class TypeTransformer:
             if key in ["type", "array", "$ref", "properties", "items"]
         }
         self._normalizer = validators.create(meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators)
+        # schema content (or id when it can't be serialized) -> (schema, compiled plan or None if the schema can't be compiled).
+        # Streams usually load a new but equal schema for every record, so plans are looked up by content. The schema is kept so
+        # that its id can't be reused.
+        self._compiled_schemas: Dict[Union[str, int], Tuple[Mapping[str, Any], Optional[_CompiledSchema]]] = {}
+        self._last_compiled_schema: Optional[Tuple[Mapping[str, Any], Optional[_CompiledSchema]]] = None
 
     def registerCustomTransform(self, normalization_callback: Callable[[Any, Dict[str, Any]], Any]) -> Callable:
         """
@@ -180,6 +286,11 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        if TransformConfig.CompiledSchemaNormalization in self._config:
+            compiled_schema = self._get_compiled_schema(schema)
+            if compiled_schema is not None:
+                compiled_schema.apply(record, ())
+                return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -188,6 +299,181 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    @staticmethod
+    def _get_schema_key(schema: Mapping[str, Any]) -> Union[str, int]:
+        try:
+            return json.dumps(schema, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            # e.g. a schema with recursive references resolved in place
+            return id(schema)
+
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[_CompiledSchema]:
+        last_compiled_schema = self._last_compiled_schema
+        if last_compiled_schema is not None and last_compiled_schema[0] is schema:
+            return last_compiled_schema[1]
+        key = self._get_schema_key(schema)
+        cached = self._compiled_schemas.get(key)
+        if cached is None or (isinstance(key, int) and cached[0] is not schema):
+            try:
+                compiled_schema = self._compile_schema(schema, RefResolver.from_schema(schema, id_of=self._normalizer.ID_OF), {})
+            except Exception as e:
+                # The jsonschema based normalization handles (or fails on) this schema exactly like it would without the compiled mode
+                logger.debug(f"Schema can't be compiled for normalization, falling back to jsonschema: {e!r}")
+                compiled_schema = None
+            if len(self._compiled_schemas) >= self.MAX_COMPILED_SCHEMAS:
+                self._compiled_schemas.clear()
+            cached = self._compiled_schemas[key] = (schema, compiled_schema)
+        self._last_compiled_schema = (schema, cached[1])
+        return cached[1]
+
+    def _compile_schema(self, schema: Any, resolver: RefResolver, memo: Dict[Tuple[int, str], _CompiledSchema]) -> _CompiledSchema:
+        """
+        Compile the steps jsonschema runs when the normalizer descends into schema. Plans are memoized per schema and resolution scope
+        so recursive schemas compile to cyclic plans.
+        """
+        if not isinstance(schema, Mapping) or self._normalizer.ID_OF(schema):
+            raise _UnsupportedSchema(f"unsupported schema {schema!r}")
+        key = (id(schema), resolver.resolution_scope)
+        if key in memo:
+            return memo[key]
+        compiled_schema = memo[key] = _CompiledSchema()
+
+        ref = schema.get("$ref")
+        if ref is not None:
+            # like jsonschema, ignore the other keywords of a schema with a $ref
+            try:
+                scope, resolved = resolver.resolve(ref)
+            except RefResolutionError as error:
+                # jsonschema only fails once a record reaches the unresolvable reference
+                compiled_schema.steps.append(self._raise_on_apply(error))
+                return compiled_schema
+            resolver.push_scope(scope)
+            try:
+                compiled_schema.steps.append(self._compile_schema(resolved, resolver, memo).apply)
+            finally:
+                resolver.pop_scope()
+            return compiled_schema
+
+        for keyword, value in schema.items():
+            if keyword == "type":
+                compiled_schema.steps.append(self._compile_type_check(value))
+            elif keyword == "properties":
+                compiled_schema.steps.append(self._compile_properties(value, resolver, memo))
+            elif keyword == "items":
+                compiled_schema.steps.append(self._compile_items(value, resolver, memo))
+        return compiled_schema
+
+    def _compile_type_check(self, types: Any) -> Callable[[Any, Tuple], None]:
+        type_names = [types] if isinstance(types, str) else types
+        if not isinstance(type_names, list) or not all(isinstance(type_name, str) for type_name in type_names):
+            raise _UnsupportedSchema(f"unsupported type {types!r}")
+        unknown_types = set(type_names) - json_type_checks.keys()
+        if unknown_types:
+            raise _UnsupportedSchema(f"unknown types {unknown_types}")
+        accepted_types = tuple(python_type for type_name in type_names for python_type in json_type_checks[type_name])
+        accepts_bool = "boolean" in type_names
+
+        def check_type(instance: Any, path: Tuple):
+            if not isinstance(instance, accepted_types) or (not accepts_bool and isinstance(instance, bool)):
+                error = ValidationError("", validator="type", validator_value=types, instance=instance, path=path)
+                logger.warning(self.get_error_message(error))
+
+        return check_type
+
+    def _compile_properties(
+        self, properties: Mapping[str, Any], resolver: RefResolver, memo: Dict[Tuple[int, str], _CompiledSchema]
+    ) -> Callable[[Any, Tuple], None]:
+        compiled_properties = [
+            (name, self._compile_resolved_converter(subschema, resolver), self._compile_schema(subschema, resolver, memo))
+            for name, subschema in properties.items()
+        ]
+        converted_properties = [(name, converter) for name, converter, _ in compiled_properties if converter is not None]
+
+        def normalize_properties(instance: Any, path: Tuple):
+            if not isinstance(instance, dict):
+                return
+            for name, converter in converted_properties:
+                if name in instance:
+                    instance[name] = converter(instance[name])
+            for name, _, compiled_subschema in compiled_properties:
+                if name in instance:
+                    compiled_subschema.apply(instance[name], path + (name,))
+
+        return normalize_properties
+
+    def _compile_items(
+        self, items: Any, resolver: RefResolver, memo: Dict[Tuple[int, str], _CompiledSchema]
+    ) -> Callable[[Any, Tuple], None]:
+        if not isinstance(items, Mapping):
+            raise _UnsupportedSchema(f"unsupported items {items!r}")
+        converter = self._compile_resolved_converter(items, resolver)
+        compiled_items = self._compile_schema(items, resolver, memo)
+
+        def normalize_items(instance: Any, path: Tuple):
+            if not isinstance(instance, list):
+                return
+            if converter is not None:
+                for index, item in enumerate(instance):
+                    instance[index] = converter(item)
+            for index, item in enumerate(instance):
+                compiled_items.apply(item, path + (index,))
+
+        return normalize_items
+
+    @staticmethod
+    def _raise_on_apply(error: Exception) -> Callable[..., Any]:
+        def raise_error(*args):
+            raise error
+
+        return raise_error
+
+    def _compile_resolved_converter(self, subschema: Mapping[str, Any], resolver: RefResolver) -> Optional[Callable[[Any], Any]]:
+        """
+        The jsonschema based normalization resolves a single level of $ref before converting a value, even when no conversion is
+        configured, and fails at that point for unresolvable references.
+        """
+        if "$ref" in subschema:
+            try:
+                _, subschema = resolver.resolve(subschema["$ref"])
+            except RefResolutionError as error:
+                return self._raise_on_apply(error)
+        return self._compile_converter(subschema)
+
+    def _compile_converter(self, subschema: Mapping[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """
+        Returns the function applying the same conversions as __normalize for values of subschema, or None if values are left as is.
+        """
+        default_converter = (
+            self._compile_default_converter(subschema) if TransformConfig.DefaultSchemaNormalization in self._config else None
+        )
+        if TransformConfig.CustomSchemaNormalization not in self._config:
+            return default_converter
+
+        def convert(original_item: Any) -> Any:
+            if default_converter is not None:
+                original_item = default_converter(original_item)
+            if self._custom_normalizer:
+                original_item = self._custom_normalizer(original_item, subschema)
+            return original_item
+
+        return convert
+
+    @staticmethod
+    def _compile_default_converter(subschema: Mapping[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """
+        Select ahead of time the conversion default_convert would apply to values of subschema.
+        """
+        target_type = subschema.get("type", [])
+        nullable = "null" in target_type
+        if isinstance(target_type, list):
+            target_type = [t for t in target_type if t != "null"]
+            if len(target_type) != 1:
+                return None
+            target_type = target_type[0]
+
+        build_converter = _default_converter_builders.get(target_type)
+        return build_converter(target_type, subschema, nullable) if build_converter else None
+
     def get_error_message(self, e: ValidationError) -> str:
         instance_json_type = python_to_json[type(e.instance)]
         key_path = "." + ".".join(map(str, e.path))
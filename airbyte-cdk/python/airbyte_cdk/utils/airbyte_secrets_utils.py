@@ -2,7 +2,7 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, List, Mapping
+from typing import Any, List, Mapping, Tuple
 
 import dpath.util
 
@@ -54,19 +54,41 @@ def get_secrets(connection_specification: Mapping[str, Any], config: Mapping[str
 
 
 __SECRETS_FROM_CONFIG: List[str] = []
+# the distinct non empty secrets as strings, computed once by update_secrets rather than every time a string is filtered
+__SECRET_STRINGS: Tuple[str, ...] = ()
 
 
 def update_secrets(secrets: List[str]):
     """Update the list of secrets to be replaced"""
-    global __SECRETS_FROM_CONFIG
+    global __SECRETS_FROM_CONFIG, __SECRET_STRINGS
     __SECRETS_FROM_CONFIG = secrets
+    __SECRET_STRINGS = tuple(dict.fromkeys(str(secret) for secret in secrets if secret))
 
 
 def filter_secrets(string: str) -> str:
-    """Filter secrets from a string by replacing them with ****"""
-    # TODO this should perform a maximal match for each secret. if "x" and "xk" are both secret values, and this method is called twice on
-    #  the input "xk", then depending on call order it might only obfuscate "*k". This is a bug.
-    for secret in __SECRETS_FROM_CONFIG:
-        if secret:
-            string = string.replace(str(secret), "****")
-    return string
+    """
+    Filter secrets from a string by replacing them with ****, in a single pass over the string once the secrets are found.
+
+    The occurrences of secrets overlapping each other are masked together, e.g. "xk" is fully masked when "x" and "xk" are both secrets,
+    so that no part of a secret is left whatever the order of the secrets.
+    """
+    occurrences = []
+    for secret in __SECRET_STRINGS:
+        start = string.find(secret)
+        while start != -1:
+            occurrences.append((start, start + len(secret)))
+            start = string.find(secret, start + 1)
+    if not occurrences:
+        return string
+    occurrences.sort()
+    parts = []
+    masked_until = 0
+    for start, end in occurrences:
+        if start < masked_until:
+            masked_until = max(masked_until, end)
+        else:
+            parts.append(string[masked_until:start])
+            parts.append("****")
+            masked_until = end
+    parts.append(string[masked_until:])
+    return "".join(parts)
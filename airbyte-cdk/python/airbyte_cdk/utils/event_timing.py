@@ -4,18 +4,82 @@
 
 import datetime
 import logging
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, TypeVar
 
 logger = logging.getLogger("airbyte")
 
+T = TypeVar("T")
+
+
+class SpanStats:
+    """Count, total and distribution of the durations of the spans of a type.
+
+    Durations are counted in buckets whose width is a quarter of their power of two, so that the memory used is bounded
+    whatever the number of spans and the percentiles are estimated within 12.5%.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, duration_ns: int):
+        bits = duration_ns.bit_length()
+        bucket = bits << 2 | (duration_ns >> max(bits - 3, 0)) & 3
+        with self._lock:
+            self.count += 1
+            self.total_ns += duration_ns
+            if duration_ns > self.max_ns:
+                self.max_ns = duration_ns
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def percentile(self, percentile: float) -> float:
+        """
+        :param percentile: between 0 and 100
+        :return: estimated duration in seconds below which the given percentage of the spans fall
+        """
+        rank = percentile / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                bits, quarter = bucket >> 2, bucket & 3
+                if bits <= 3:
+                    # small durations are counted exactly
+                    return min(quarter if bits < 3 else 4 + quarter, self.max_ns) / 1e9
+                low = (4 + quarter) << (bits - 3)
+                return min(low + (1 << (bits - 4)), self.max_ns) / 1e9
+        return self.max_ns / 1e9
+
+    def summary(self) -> Mapping[str, Any]:
+        return {
+            "count": self.count,
+            "total_seconds": self.total_ns / 1e9,
+            "p50_seconds": self.percentile(50),
+            "p99_seconds": self.percentile(99),
+        }
+
+    def __str__(self):
+        return (
+            f"count={self.count} total={datetime.timedelta(seconds=self.total_ns / 1e9)} "
+            f"p50={datetime.timedelta(seconds=self.percentile(50))} p99={datetime.timedelta(seconds=self.percentile(99))}"
+        )
+
 
 class EventTimer:
     """Simple nanosecond resolution event timer for debugging, initially intended to be used to record streams execution
     time for a source.
        Event nesting follows a LIFO pattern, so finish will apply to the last started event.
+
+       Spans profile the work done many times, e.g. the slices, requests and records of a stream: rather than being kept one by one
+    as events, their durations are aggregated per type into SpanStats. Spans nest per thread, a span being aggregated under the path of
+    the spans it was started in, e.g. "slice/request".
     """
 
     def __init__(self, name):
@@ -23,6 +87,9 @@ class EventTimer:
         self.events = {}
         self.count = 0
         self.stack = []
+        self.spans: Dict[str, SpanStats] = {}
+        self._spans_lock = threading.Lock()
+        self._local = threading.local()
 
     def start_event(self, name):
         """
@@ -30,7 +97,7 @@ class EventTimer:
         """
         self.events[name] = Event(name=name)
         self.count += 1
-        self.stack.insert(0, self.events[name])
+        self.stack.append(self.events[name])
 
     def finish_event(self):
         """
@@ -38,11 +105,85 @@ class EventTimer:
         """
 
         if self.stack:
-            event = self.stack.pop(0)
+            event = self.stack.pop()
             event.finish()
         else:
             logger.warning(f"{self.name} finish_event called without start_event")
 
+    def _span_stack(self) -> List[Tuple[str, int]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def start_span(self, name: str):
+        """
+        Start a new span nested in the current span of the thread.
+        """
+        stack = self._span_stack()
+        path = f"{stack[-1][0]}/{name}" if stack else name
+        stack.append((path, time.perf_counter_ns()))
+
+    def finish_span(self):
+        """
+        Finish the current span of the thread and aggregate its duration.
+        """
+        stack = self._span_stack()
+        if stack:
+            path, start = stack.pop()
+            self._span_stats(path).add(time.perf_counter_ns() - start)
+        else:
+            logger.warning(f"{self.name} finish_span called without start_span")
+
+    @contextmanager
+    def span(self, name: str):
+        self.start_span(name)
+        try:
+            yield
+        finally:
+            self.finish_span()
+
+    def add_span(self, name: str, duration_ns: int):
+        """
+        Aggregate a span measured by the caller, nested in the current span of the thread,
+        e.g. when starting and finishing a span is too costly to be done for every record.
+        """
+        stack = self._span_stack()
+        self._span_stats(f"{stack[-1][0]}/{name}" if stack else name).add(duration_ns)
+
+    def timed(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """
+        Yield the items of the iterable, aggregating the time spent producing them as one span, excluding the time spent by the caller
+        on each item.
+        """
+        iterator = iter(iterable)
+        elapsed = 0
+        try:
+            while True:
+                start = time.perf_counter_ns()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter_ns() - start
+                yield item
+        finally:
+            self.add_span(name, elapsed)
+
+    def _span_stats(self, path: str) -> SpanStats:
+        stats = self.spans.get(path)
+        if stats is None:
+            with self._spans_lock:
+                stats = self.spans.setdefault(path, SpanStats())
+        return stats
+
+    def summary(self) -> Mapping[str, Mapping[str, Any]]:
+        """
+        :return: count, total and p50/p99 durations in seconds of the spans per path
+        """
+        return {path: self.spans[path].summary() for path in sorted(self.spans)}
+
     def report(self, order_by="name"):
         """
         :param order_by: 'name' or 'duration'
@@ -53,6 +194,9 @@ class EventTimer:
             events = sorted(self.events.values(), key=lambda event: event.duration)
         text = f"{self.name} runtimes:\n"
         text += "\n".join(str(event) for event in events)
+        if self.spans:
+            text += f"\n{self.name} spans:\n"
+            text += "\n".join(f"{path} {self.spans[path]}" for path in sorted(self.spans))
         return text
 
 
@@ -0,0 +1,146 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import logging
+import sys
+import threading
+import time
+from typing import Any, List, Optional, TextIO, Union
+
+from airbyte_cdk.models import AirbyteMessage, Type
+from pydantic.json import pydantic_encoder
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup, the stdlib encoder is used when it is not installed
+    orjson = None
+
+# Fields of AirbyteRecordMessage in declaration order, which is the order pydantic uses when serializing the model
+_RECORD_FIELDS = ("namespace", "stream", "data", "emitted_at")
+_RECORD_FIELDS_SET = frozenset(_RECORD_FIELDS)
+_RECORD_MESSAGE_FIELDS_SET = frozenset(("type", "record"))
+# "type" is the first field of AirbyteMessage, the prefixes of RECORD messages serialized with and without whitespace
+_RECORD_PREFIXES = ('{"type": "RECORD"', '{"type":"RECORD"')
+
+
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=pydantic_encoder).decode("utf-8")
+        except TypeError:
+            # orjson rejects a few inputs the stdlib accepts (e.g. non-string keys, integers larger than 64 bits)
+            pass
+    return json.dumps(obj, default=pydantic_encoder)
+
+
+class SerializedMessages(str):
+    """
+    One or more messages already serialized to JSON, one per line, e.g. the records of a whole chunk of a file serialized at once.
+
+    Sources may yield them from read() alongside AirbyteMessage objects, they are written as is by the entrypoint. It's up to the source
+    to produce valid messages: each line must be equivalent to message.json(exclude_unset=True) and there must be no trailing newline.
+    """
+
+
+def serialize_message(message: Union[AirbyteMessage, SerializedMessages]) -> str:
+    """
+    Serialize an AirbyteMessage to a JSON string, equivalent to message.json(exclude_unset=True). SerializedMessages are returned as is.
+
+    RECORD messages are serialized straight from the AirbyteRecordMessage fields, skipping the pydantic model export which dominates
+    the CPU time of high volume syncs. orjson is used when it is installed. Any other message, or a record carrying extra fields,
+    goes through pydantic as before.
+    """
+    if isinstance(message, SerializedMessages):
+        return message
+    record = message.record
+    if (
+        message.type == Type.RECORD
+        and record is not None
+        and message.__fields_set__ == _RECORD_MESSAGE_FIELDS_SET
+        and record.__fields_set__ <= _RECORD_FIELDS_SET
+    ):
+        fields_set = record.__fields_set__
+        record_dict = {name: getattr(record, name) for name in _RECORD_FIELDS if name in fields_set}
+        return _dumps({"type": Type.RECORD.value, "record": record_dict})
+    return message.json(exclude_unset=True)
+
+
+class BufferedMessageWriter:
+    """
+    Writes serialized messages to a text stream, one per line, in batches instead of one write call per message.
+
+    Only RECORD messages are held in the buffer: any other message (e.g. STATE, LOG or TRACE) is written along with the records
+    preceding it right away. The buffer is also flushed once it holds more than max_buffer_size characters, when more than
+    max_flush_interval seconds elapsed since the previous flush, and when the writer is closed.
+
+    While the writer is open, the buffer is flushed before any record of the logging handlers is emitted, and a background thread
+    flushes it every max_flush_interval seconds if no message was written meanwhile. Log messages written to the same stream
+    therefore cannot overtake the messages written before them.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, max_buffer_size: int = 64 * 1024, max_flush_interval: float = 1.0):
+        self._stream = stream
+        self.max_buffer_size = max_buffer_size
+        self.max_flush_interval = max_flush_interval
+        self._buffer: List[str] = []
+        self._buffer_size = 0
+        self._last_flush = time.monotonic()
+        # Messages may be written by the main thread while a log record is emitted, or the buffer flushed, by another thread
+        self._lock = threading.RLock()
+        self._closed = threading.Event()
+        self._flushing_thread: Optional[threading.Thread] = None
+
+    @property
+    def stream(self) -> TextIO:
+        # Resolved lazily so that a stream swapped in after the writer was created (e.g. by pytest's capsys) is honored
+        return self._stream if self._stream is not None else sys.stdout
+
+    def write(self, message: str):
+        with self._lock:
+            self._buffer.append(message)
+            self._buffer.append("\n")
+            self._buffer_size += len(message) + 1
+            if (
+                not message.startswith(_RECORD_PREFIXES)
+                or self._buffer_size >= self.max_buffer_size
+                or time.monotonic() - self._last_flush >= self.max_flush_interval
+            ):
+                self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._buffer:
+                self.stream.write("".join(self._buffer))
+                self._buffer = []
+                self._buffer_size = 0
+            self.stream.flush()
+            self._last_flush = time.monotonic()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Logging filter flushing the buffer before a log record is emitted, so that it doesn't overtake the buffered messages."""
+        self.flush()
+        return True
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.max_flush_interval):
+            with self._lock:
+                if time.monotonic() - self._last_flush >= self.max_flush_interval:
+                    self.flush()
+
+    def __enter__(self) -> "BufferedMessageWriter":
+        for handler in logging.getLogger().handlers:
+            handler.addFilter(self)
+        if self.max_flush_interval > 0:
+            self._flushing_thread = threading.Thread(target=self._flush_periodically, name="message-writer-flush", daemon=True)
+            self._flushing_thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._closed.set()
+        if self._flushing_thread is not None:
+            self._flushing_thread.join()
+        for handler in logging.getLogger().handlers:
+            handler.removeFilter(self)
+        self.flush()
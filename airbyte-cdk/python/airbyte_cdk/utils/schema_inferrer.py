@@ -2,8 +2,9 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import random
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Set, Union
 
 from airbyte_cdk.models import AirbyteRecordMessage
 from genson import SchemaBuilder
@@ -30,6 +31,78 @@ class NoRequiredSchemaBuilder(SchemaBuilder):
 InferredSchema = Dict[str, Union[str, Any, List, List[Dict[str, Union[Any, List]]]]]
 
 
+# types of the values which are not containers in records deserialized from JSON
+SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def record_shape(value: Any) -> Hashable:
+    """
+    Structure of a value as seen by genson: the type of scalars, the keys and shapes of the values of objects, the distinct shapes of the
+    items of arrays. Values of the same shape add the same schema to a SchemaBuilder. Objects holding the same keys in a different order
+    have different shapes, which only costs adding both to the builder.
+    """
+    value_type = value.__class__
+    if value_type in SCALAR_TYPES:
+        return value_type
+    if isinstance(value, dict):
+        return dict, tuple([(key, item.__class__ if item.__class__ in SCALAR_TYPES else record_shape(item)) for key, item in value.items()])
+    if isinstance(value, (list, tuple)):
+        return list, frozenset([item.__class__ if item.__class__ in SCALAR_TYPES else record_shape(item) for item in value])
+    return value_type
+
+
+class StreamSchemaInferrer:
+    """
+    Infers the schema of the records of a single stream, see SchemaInferrer
+    """
+
+    def __init__(self, sample_size: Optional[int] = None, max_shapes: int = 10_000, rng: random.Random = None):
+        # records of new shapes when not sampling, and schemas merged from other inferrers
+        self.builder = NoRequiredSchemaBuilder()
+        self.is_empty = True
+        self.sample_size = sample_size
+        self.max_shapes = max_shapes
+        self.shapes: Set[Hashable] = set()
+        # uniform sample of the records of new shapes, and the number of such records seen so far
+        self.reservoir: List[Mapping[str, Any]] = []
+        self.candidates = 0
+        self._rng = rng or random.Random()
+
+    def add_object(self, data: Mapping[str, Any]):
+        shape = record_shape(data)
+        if shape in self.shapes:
+            return
+        if len(self.shapes) >= self.max_shapes:
+            # forgetting the shapes only costs adding records whose shape was already added again
+            self.shapes.clear()
+        self.shapes.add(shape)
+        if self.sample_size is None:
+            self.builder.add_object(data)
+            self.is_empty = False
+            return
+        self.candidates += 1
+        if len(self.reservoir) < self.sample_size:
+            self.reservoir.append(data)
+        else:
+            index = self._rng.randrange(self.candidates)
+            if index < self.sample_size:
+                self.reservoir[index] = data
+
+    def add_schema(self, schema: InferredSchema):
+        self.builder.add_schema(schema)
+        self.is_empty = False
+
+    def to_schema(self) -> InferredSchema:
+        if not self.reservoir:
+            return self.builder.to_schema()
+        builder = NoRequiredSchemaBuilder()
+        if not self.is_empty:
+            builder.add_schema(self.builder.to_schema())
+        for data in self.reservoir:
+            builder.add_object(data)
+        return builder.to_schema()
+
+
 class SchemaInferrer:
     """
     This class is used to infer a JSON schema which fits all the records passed into it
@@ -38,17 +111,38 @@ class SchemaInferrer:
     Instances of this class are stateful, meaning they build their inferred schemas
     from every record passed into the accumulate method.
 
+    Records whose shape (keys, nesting and value types, see record_shape) was already seen for their stream are skipped, as they would
+    not change the schema, so that inferring the schema of millions of records of a few shapes costs little more than reading them.
+    When sample_size is set, the schema of each stream is inferred from a uniform sample of at most sample_size of the records of new
+    shapes instead, which bounds the memory and the time spent in genson for streams whose records have many different shapes.
+
+    Inferrers fed by parallel workers are combined with merge, or merge_schemas for schemas sent by workers running in other processes.
     """
 
-    stream_to_builder: Dict[str, SchemaBuilder]
+    stream_to_builder: Dict[str, StreamSchemaInferrer]
 
-    def __init__(self):
-        self.stream_to_builder = defaultdict(NoRequiredSchemaBuilder)
+    def __init__(self, sample_size: Optional[int] = None, max_shapes: int = 10_000, seed: Optional[int] = None):
+        """
+        :param sample_size: maximum number of records of each stream the schema is inferred from, every record is used by default
+        :param max_shapes: number of shapes remembered for each stream to skip records, older shapes are forgotten past that number
+        :param seed: seed of the sampling of the records, for reproducible schemas
+        """
+        rng = random.Random(seed)
+        self.stream_to_builder = defaultdict(lambda: StreamSchemaInferrer(sample_size, max_shapes, rng))
 
     def accumulate(self, record: AirbyteRecordMessage):
         """Uses the input record to add to the inferred schemas maintained by this object"""
         self.stream_to_builder[record.stream].add_object(record.data)
 
+    def merge(self, other: "SchemaInferrer"):
+        """Adds the schemas inferred by another inferrer, e.g. one fed by a parallel worker, to the schemas of this one"""
+        self.merge_schemas(other.get_inferred_schemas())
+
+    def merge_schemas(self, schemas: Mapping[str, InferredSchema]):
+        """Adds schemas inferred elsewhere, by stream name, to the schemas of this inferrer"""
+        for stream_name, schema in schemas.items():
+            self.stream_to_builder[stream_name].add_schema(schema)
+
     def get_inferred_schemas(self) -> Dict[str, InferredSchema]:
         """
         Returns the JSON schemas for all encountered streams inferred by inspecting all records
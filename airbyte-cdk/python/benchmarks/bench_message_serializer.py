@@ -0,0 +1,77 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares the entrypoint output path for RECORD messages before and after the fast-path serializer:
+
+* pydantic: message.json(exclude_unset=True) followed by one print() call per message
+* fast path: serialize_message(message) written through a BufferedMessageWriter
+
+Usage: python benchmarks/bench_message_serializer.py [--records 200000] [--fields 20]
+"""
+
+import argparse
+import os
+import time
+from typing import Callable, List
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+from airbyte_cdk.utils import message_serializer
+from airbyte_cdk.utils.message_serializer import BufferedMessageWriter, serialize_message
+
+
+def build_messages(records: int, fields: int) -> List[AirbyteMessage]:
+    messages = []
+    for i in range(records):
+        data = {
+            f"field_{j}": (i * j if j % 3 == 0 else f"value {i} {j}" if j % 3 == 1 else {"nested": [i, j, None]}) for j in range(fields)
+        }
+        record = AirbyteRecordMessage(stream="benchmark", data=data, emitted_at=1666000000000 + i)
+        messages.append(AirbyteMessage(type=Type.RECORD, record=record))
+    return messages
+
+
+def pydantic_path(messages: List[AirbyteMessage], out) -> int:
+    written = 0
+    for message in messages:
+        line = message.json(exclude_unset=True)
+        print(line, file=out)
+        written += len(line) + 1
+    return written
+
+
+def fast_path(messages: List[AirbyteMessage], out) -> int:
+    written = 0
+    with BufferedMessageWriter(out) as writer:
+        for message in messages:
+            line = serialize_message(message)
+            writer.write(line)
+            written += len(line) + 1
+    return written
+
+
+def run(name: str, path: Callable, messages: List[AirbyteMessage]):
+    with open(os.devnull, "w") as out:
+        start = time.perf_counter()
+        written = path(messages, out)
+        elapsed = time.perf_counter() - start
+    print(f"{name:<24} {len(messages) / elapsed:>14,.0f} records/s {written / elapsed / 1024 / 1024:>10,.1f} MiB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--fields", type=int, default=20)
+    args = parser.parse_args()
+
+    messages = build_messages(args.records, args.fields)
+    run("pydantic + print", pydantic_path, messages)
+    if message_serializer.orjson is not None:
+        run("fast path (orjson)", fast_path, messages)
+        message_serializer.orjson = None
+    run("fast path (stdlib json)", fast_path, messages)
+
+
+if __name__ == "__main__":
+    main()
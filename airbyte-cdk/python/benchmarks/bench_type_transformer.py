@@ -0,0 +1,83 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares TypeTransformer records/s with DefaultSchemaNormalization, with and without CompiledSchemaNormalization, on the deep nested
+stream schemas of source-github and source-shopify.
+
+Records are generated from each schema with values of the "wrong" type (numbers as strings, scalars instead of arrays...) so that
+every field goes through a conversion. Like AbstractSource, which calls stream.get_json_schema() for every record, each record is
+transformed with a new copy of the schema.
+
+Usage: python benchmarks/bench_type_transformer.py [--records 2000] [schema.json ...]
+"""
+
+import argparse
+import copy
+import json
+import os
+import time
+from typing import Any, List, Mapping
+
+import jsonref
+from airbyte_cdk.sources.utils.schema_helpers import JsonFileLoader, resolve_ref_links
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+
+CONNECTORS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "airbyte-integrations", "connectors")
+DEFAULT_SCHEMAS = [
+    "source-github/source_github/schemas/pull_requests.json",
+    "source-github/source_github/schemas/workflow_runs.json",
+    "source-shopify/source_shopify/schemas/orders.json",
+    "source-shopify/source_shopify/schemas/abandoned_checkouts.json",
+]
+
+
+def load_schema(path: str) -> Mapping[str, Any]:
+    """Loads a schema the way ResourceSchemaLoader does, resolving the references to the shared/ directory"""
+    base = os.path.dirname(os.path.abspath(path)) + "/"
+    with open(path) as schema_file:
+        raw_schema = json.load(schema_file)
+    return resolve_ref_links(jsonref.JsonRef.replace_refs(raw_schema, loader=JsonFileLoader(base, "shared"), base_uri=base))
+
+
+def generate_value(schema: Mapping[str, Any], depth: int = 0) -> Any:
+    types = schema.get("type", [])
+    types = [types] if isinstance(types, str) else [t for t in types if t != "null"]
+    target_type = types[0] if types else None
+    if target_type == "object":
+        properties = schema.get("properties", {}) if depth < 8 else {}
+        return {name: generate_value(subschema, depth + 1) for name, subschema in properties.items()}
+    if target_type == "array":
+        return [generate_value(schema.get("items", {}), depth + 1) for _ in range(3 if depth < 8 else 0)]
+    return {"string": 12345, "integer": "42", "number": "1.5", "boolean": "true"}.get(target_type, "value")
+
+
+def run(name: str, config: TransformConfig, schema: Mapping[str, Any], records: List[Mapping[str, Any]]):
+    transformer = TypeTransformer(config)
+    records = copy.deepcopy(records)
+    schemas = [copy.deepcopy(schema) for _ in records]
+    start = time.perf_counter()
+    for record, record_schema in zip(records, schemas):
+        transformer.transform(record, record_schema)
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<12} {len(records) / elapsed:>12,.0f} records/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("schemas", nargs="*", default=[os.path.join(CONNECTORS_DIR, schema) for schema in DEFAULT_SCHEMAS])
+    args = parser.parse_args()
+
+    for schema_path in args.schemas:
+        schema = load_schema(schema_path)
+        record = generate_value(schema)
+        records = [copy.deepcopy(record) for _ in range(args.records)]
+        print(f"{os.path.relpath(schema_path, CONNECTORS_DIR)} ({len(json.dumps(record))} bytes per record)")
+        run("jsonschema", TransformConfig.DefaultSchemaNormalization, schema, records)
+        run("compiled", TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization, schema, records)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,7 @@ README = (HERE / "README.md").read_text()
 
 setup(
     name="airbyte-cdk",
-    version="0.25.0",
+    version="0.26.0",
     description="A framework for writing Airbyte Connectors.",
     long_description=README,
     long_description_content_type="text/markdown",
@@ -61,6 +61,7 @@ setup(
         "Deprecated~=1.2",
         "Jinja2~=3.1.2",
         "cachetools",
+        "ijson~=3.1",
     ],
     python_requires=">=3.9",
     extras_require={
@@ -72,6 +73,10 @@ setup(
             "pytest-mock",
             "requests-mock",
             "pytest-httpserver",
+            "aiohttp~=3.8",
+        ],
+        "async": [
+            "aiohttp~=3.8",
         ],
         "sphinx-docs": [
             "Sphinx~=4.2",
@@ -12,6 +12,7 @@ from unittest.mock import ANY
 import pytest
 from airbyte_cdk.destinations import Destination
 from airbyte_cdk.destinations import destination as destination_module
+from airbyte_cdk.destinations.message_parser import LightweightAirbyteMessage
 from airbyte_cdk.models import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
@@ -237,6 +238,25 @@ class TestRun:
         # verify output was correct
         assert expected_write_result == returned_write_result
 
+    def test_parse_input_stream_lazily(self, destination: Destination):
+        destination.lazy_input_parsing = True
+        input_messages = [_wrapped(_record("s1", {"k1": "v1"})), _wrapped(_state({"k1": "v1"}))]
+        input_string = "\n".join([message.json(exclude_unset=True) for message in input_messages])
+        input_string += "\n add this non-serializable string to verify the destination does not break on malformed input"
+        input_stream = io.TextIOWrapper(io.BytesIO(bytes(input_string, "utf-8")))
+
+        parsed_messages = list(destination._parse_input_stream(input_stream))
+
+        assert len(parsed_messages) == 2
+        record_message, state_message = parsed_messages
+        assert isinstance(record_message, LightweightAirbyteMessage)
+        assert record_message.type == Type.RECORD
+        assert record_message.record.stream == "s1"
+        assert record_message.record.data == {"k1": "v1"}
+        assert record_message.record.emitted_at == input_messages[0].record.emitted_at
+        assert record_message.state is None
+        assert state_message == input_messages[1]
+
     @pytest.mark.parametrize("args", [{}, {"command": "fake"}])
     def test_run_cmd_with_incorrect_args_fails(self, args, destination: Destination):
         with pytest.raises(Exception):
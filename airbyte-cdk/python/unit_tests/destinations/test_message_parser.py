@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import json
+
+import pytest
+from airbyte_cdk.destinations import message_parser
+from airbyte_cdk.destinations.message_parser import (
+    LightweightAirbyteMessage,
+    LightweightRecordMessage,
+    parse_messages_lazily,
+    read_lines,
+)
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+
+
+@pytest.fixture(params=["stdlib", "orjson"], autouse=True)
+def decoder(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(message_parser, "orjson", None)
+    elif message_parser.orjson is None:
+        pytest.skip("orjson is not installed")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+def test_read_lines_across_chunk_boundaries(chunk_size):
+    content = b'{"a": 1}\n{"bb": 22}\n\n{"ccc": 333}'
+    assert list(read_lines(io.BytesIO(content), chunk_size)) == [b'{"a": 1}', b'{"bb": 22}', b"", b'{"ccc": 333}']
+
+
+def test_read_lines_with_trailing_newline():
+    assert list(read_lines(io.BytesIO(b"first\nsecond\n"), 4)) == [b"first", b"second"]
+
+
+@pytest.mark.parametrize(
+    "message, expected_record",
+    [
+        pytest.param(
+            {"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1}},
+            LightweightRecordMessage(stream="users", data={"id": 1}, emitted_at=1),
+            id="test_record",
+        ),
+        pytest.param(
+            {"type": "RECORD", "record": {"stream": "users", "namespace": "public", "data": {"id": 1}, "emitted_at": 1}},
+            LightweightRecordMessage(stream="users", namespace="public", data={"id": 1}, emitted_at=1),
+            id="test_record_with_namespace",
+        ),
+    ],
+)
+def test_records_are_parsed_as_lightweight_messages(message, expected_record):
+    parsed = list(parse_messages_lazily(io.BytesIO(json.dumps(message).encode("utf-8"))))
+    assert parsed == [LightweightAirbyteMessage(expected_record)]
+    assert parsed[0].type == Type.RECORD
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param({"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1, "extra": 1}}, id="test_extra_field"),
+        pytest.param({"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": "1"}}, id="test_coercible_field"),
+        pytest.param({"type": "STATE", "state": {"data": {"cursor": 1}}}, id="test_state"),
+        pytest.param({"type": "LOG", "log": {"level": "INFO", "message": "hello"}}, id="test_log"),
+    ],
+)
+def test_other_messages_are_parsed_with_pydantic(message):
+    parsed = list(parse_messages_lazily(io.BytesIO(json.dumps(message).encode("utf-8"))))
+    assert parsed == [AirbyteMessage.parse_obj(message)]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        pytest.param(b"not json", id="test_not_json"),
+        pytest.param(b"[1, 2]", id="test_not_an_object"),
+        pytest.param(b'{"type": "RECORD", "record": {"stream": "users"}}', id="test_invalid_record"),
+        pytest.param(b'{"type": "UNKNOWN"}', id="test_unknown_type"),
+    ],
+)
+def test_invalid_input_is_ignored(line):
+    record = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1}, emitted_at=1))
+    content = line + b"\n" + record.json(exclude_unset=True).encode("utf-8")
+    assert list(parse_messages_lazily(io.BytesIO(content))) == [
+        LightweightAirbyteMessage(LightweightRecordMessage(stream="users", data={"id": 1}, emitted_at=1))
+    ]
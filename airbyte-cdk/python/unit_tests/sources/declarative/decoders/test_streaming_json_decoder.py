@@ -0,0 +1,66 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import ijson
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
+
+
+@pytest.mark.parametrize(
+    "test_name, response_body, path, expected_items",
+    [
+        ("test_array", '{"data": [{"id": 1}, {"id": 2.5}]}', ["data"], [{"id": 1}, {"id": 2.5}]),
+        ("test_nested_array", '{"data": {"records": [[1, 2], {"a": []}]}}', ["data", "records"], [[1, 2], {"a": []}]),
+        ("test_object", '{"data": {"id": 1, "nested": {"data": [1]}}}', ["data"], [{"id": 1, "nested": {"data": [1]}}]),
+        ("test_empty_object", '{"data": {}}', ["data"], []),
+        ("test_scalar", '{"data": "value"}', ["data"], ["value"]),
+        ("test_root", '[{"id": 1}]', [], [{"id": 1}]),
+        ("test_missing_path", '{"other": [{"id": 1}], "nested": {"data": [1]}}', ["data"], []),
+        ("test_invalid_json", "not json", ["data"], []),
+        ("test_empty_response", "", ["data"], []),
+    ],
+)
+def test_decode_items(requests_mock, test_name, response_body, path, expected_items):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text=response_body)
+    response = requests.get("https://airbyte.io/", stream=True)
+
+    assert list(StreamingJsonDecoder(options={}).decode_items(response, path)) == expected_items
+
+
+def test_decode_items_of_a_response_which_was_already_read(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"data": [{"id": 1}]}')
+    response = requests.get("https://airbyte.io/")
+    assert response.json() == {"data": [{"id": 1}]}
+
+    assert list(StreamingJsonDecoder(options={}).decode_items(response, ["data"])) == [{"id": 1}]
+
+
+def test_truncated_response_raises_once_items_were_returned(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"data": [{"id": 1}, {"id": ')
+    response = requests.get("https://airbyte.io/", stream=True)
+
+    items = StreamingJsonDecoder(options={}).decode_items(response, ["data"])
+    assert next(items) == {"id": 1}
+    with pytest.raises(ijson.JSONError):
+        next(items)
+
+
+def test_decode_items_rejects_keys_containing_a_dot(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"data.records": [{"id": 1}]}')
+    response = requests.get("https://airbyte.io/", stream=True)
+
+    with pytest.raises(ValueError):
+        list(StreamingJsonDecoder(options={}).decode_items(response, ["data.records"]))
+
+
+def test_streamed_response_can_not_be_decoded_again(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"data": [{"id": 1}], "next": "cursor"}')
+    response = requests.get("https://airbyte.io/", stream=True)
+    assert list(StreamingJsonDecoder(options={}).decode_items(response, ["data"])) == [{"id": 1}]
+
+    # e.g. a paginator reading the next page token from the body must not silently get an empty content
+    with pytest.raises(RuntimeError):
+        JsonDecoder(options={}).decode(response)
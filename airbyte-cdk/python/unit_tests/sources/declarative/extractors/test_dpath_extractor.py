@@ -2,19 +2,23 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import json
 
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 
 config = {"field": "record_array"}
 options = {"options_field": "record_array"}
 
 decoder = JsonDecoder(options={})
+streaming_decoder = StreamingJsonDecoder(options={})
 
 
+@pytest.mark.parametrize("decoder", [decoder, streaming_decoder], ids=["json_decoder", "streaming_json_decoder"])
 @pytest.mark.parametrize(
     "test_name, field_pointer, body, expected_records",
     [
@@ -30,16 +34,32 @@ decoder = JsonDecoder(options={})
         ("test_complex_nested_list", ['data', '*', 'list', 'data2', '*'], {"data": [{"list": {"data2": [{"id": 1}, {"id": 2}]}},{"list": {"data2": [{"id": 3}, {"id": 4}]}}]}, [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}])
     ],
 )
-def test_dpath_extractor(test_name, field_pointer, body, expected_records):
+def test_dpath_extractor(test_name, field_pointer, body, expected_records, decoder):
     extractor = DpathExtractor(field_pointer=field_pointer, config=config, decoder=decoder, options=options)
 
-    response = create_response(body)
-    actual_records = extractor.extract_records(response)
+    response = create_response(body) if decoder is not streaming_decoder else create_streamed_response(body)
+    actual_records = list(extractor.extract_records(response))
 
     assert actual_records == expected_records
 
 
+def test_streaming_extractor_parses_records_lazily():
+    extractor = DpathExtractor(field_pointer=["data"], config=config, decoder=streaming_decoder, options=options)
+    response = create_streamed_response({"data": [{"id": i} for i in range(100000)]})
+
+    records = extractor.extract_records(response)
+
+    assert next(records) == {"id": 0}
+    assert 0 < response.raw.tell() < len(response.raw.getvalue())
+
+
 def create_response(body):
     response = requests.Response()
     response._content = json.dumps(body).encode("utf-8")
     return response
+
+
+def create_streamed_response(body):
+    response = requests.Response()
+    response.raw = io.BytesIO(json.dumps(body).encode("utf-8"))
+    return response
@@ -33,6 +33,12 @@ from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilte
             [{"id": 11}, {"id": 12}, {"id": 13}, {"id": 14}, {"id": 15}],
             [],
         ),
+        (
+            "test_records_missing_the_filter_field",
+            "{{ record.status in ['active', 'pending'] and record['id'] != 2 }}",
+            [{"id": 1, "status": "active"}, {"id": 2, "status": "active"}, {"id": 3}, {"id": 4, "status": "pending"}],
+            [{"id": 1, "status": "active"}, {"id": 4, "status": "pending"}],
+        ),
         (
             "test_using_options_filter",
             "{{ record['created_at'] > options['created_at'] }}",
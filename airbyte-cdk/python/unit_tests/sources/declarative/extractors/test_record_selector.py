@@ -2,11 +2,13 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import json
 
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.streaming_json_decoder import StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilter
 from airbyte_cdk.sources.declarative.extractors.record_selector import RecordSelector
@@ -81,6 +83,19 @@ def test_record_filter(test_name, field_pointer, filter_template, body, expected
     assert actual_records == expected_records
 
 
+def test_lazily_extracted_records_are_filtered_in_batches(monkeypatch):
+    monkeypatch.setattr(RecordSelector, "FILTER_BATCH_SIZE", 2)
+    response = requests.Response()
+    response.raw = io.BytesIO(json.dumps({"data": [{"id": i} for i in range(7)]}).encode("utf-8"))
+    extractor = DpathExtractor(field_pointer=["data"], decoder=StreamingJsonDecoder(options={}), config={}, options={})
+    record_filter = RecordFilter(config={}, condition="{{ record['id'] % 2 == 0 }}", options={})
+    record_selector = RecordSelector(extractor=extractor, record_filter=record_filter, options={})
+
+    actual_records = record_selector.select_records(response=response, stream_state={})
+
+    assert list(actual_records) == [{"id": 0}, {"id": 2}, {"id": 4}, {"id": 6}]
+
+
 def create_response(body):
     response = requests.Response()
     response._content = json.dumps(body).encode("utf-8")
@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+from airbyte_cdk.sources.declarative.interpolation.expressions import ExpressionNotEvaluated, compile_expression
+from jinja2 import Environment
+
+environment = Environment()
+
+CONTEXT = {
+    "record": {"id": 2, "name": "airbyte", "tags": ["a", "b"], "nested": {"updated_at": "2022-01-02"}, "empty": None},
+    "stream_state": {"updated_at": "2022-01-01"},
+    "config": {"ids": [1, 2]},
+}
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{{ record.id }}",
+        "{{ record['name'] }}",
+        "{{ record.tags[1] }}",
+        "{{ record.nested }}",
+        "{{ record.empty }}",
+        "{{ record.nested.updated_at > stream_state['updated_at'] }}",
+        "{{ record['id'] == 2 }}",
+        "{{ record.id != 2 }}",
+        "{{ 1 < record.id <= 2 }}",
+        "{{ record.id in config.ids }}",
+        "{{ record.name not in ['a', 'b'] }}",
+        "{{ record.id in (3, 4) }}",
+        "{{ record.id > 1 and record.name }}",
+        "{{ record.empty or record.id }}",
+        "{{ not record.empty }}",
+        "{{ true }}",
+    ],
+)
+def test_expression_is_rendered_like_jinja(template):
+    expression = compile_expression(environment.parse(template))
+    assert expression is not None
+    assert expression(CONTEXT) == environment.from_string(template).render(CONTEXT)
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        pytest.param("hello {{ record.name }}", id="test_text_around_the_expression"),
+        pytest.param("{{ record.id }}{{ record.name }}", id="test_several_expressions"),
+        pytest.param("{% if record.id %}1{% endif %}", id="test_statement"),
+        pytest.param("{{ record.id + 1 }}", id="test_arithmetic"),
+        pytest.param("{{ record.name | upper }}", id="test_filter"),
+        pytest.param("{{ now_utc() }}", id="test_call"),
+        pytest.param("{{ record.items }}", id="test_dict_attribute"),
+    ],
+)
+def test_unsupported_templates_are_not_compiled(template):
+    assert compile_expression(environment.parse(template)) is None
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        pytest.param("{{ record.missing == 1 }}", id="test_missing_key"),
+        pytest.param("{{ record.tags[5] }}", id="test_index_out_of_range"),
+        pytest.param("{{ record.name.missing }}", id="test_attribute_of_a_string"),
+        pytest.param("{{ next_page_token['id'] }}", id="test_undefined_name"),
+        pytest.param("{{ record.empty < 1 }}", id="test_error"),
+    ],
+)
+def test_expressions_which_need_jinja_are_not_evaluated(template):
+    expression = compile_expression(environment.parse(template))
+    with pytest.raises(ExpressionNotEvaluated):
+        expression(CONTEXT)
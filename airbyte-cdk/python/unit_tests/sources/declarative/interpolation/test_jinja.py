@@ -78,3 +78,66 @@ def test_macros(test_name, s, expected_value):
     config = {}
     val = interpolation.eval(s, config)
     assert val == expected_value
+
+
+@pytest.mark.parametrize(
+    "test_name, s, expected_value",
+    [
+        ("test_static_string", "hello world", "hello world"),
+        ("test_static_literal", "[1, 2]", [1, 2]),
+        ("test_static_with_single_brace", "{key}", "{key}"),
+        ("test_trailing_newline", "hello\n", "hello"),
+        ("test_carriage_return", "hello\r\nworld", "hello\nworld"),
+        ("test_template", "hello {{ config['name'] }}", "hello airbyte"),
+    ],
+)
+def test_cached_evaluation_is_the_same_as_jinja(test_name, s, expected_value):
+    interpolation = JinjaInterpolation()
+    assert interpolation.eval(s, {"name": "airbyte"}) == expected_value
+    assert interpolation.eval(s, {"name": "airbyte"}) == expected_value
+
+
+def test_templates_are_compiled_once(mocker):
+    interpolation = JinjaInterpolation()
+    from_string = mocker.spy(interpolation._environment, "from_string")
+
+    for i in range(3):
+        assert interpolation.eval("{{ config['id'] }}", {"id": i}) == i
+        assert interpolation.eval("static", {}) == "static"
+
+    from_string.assert_called_once_with("{{ config['id'] }}")
+    cache_info = interpolation.cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.size) == (4, 2, 2)
+    assert cache_info.hit_rate == 4 / 6
+
+
+@pytest.mark.parametrize(
+    "test_name, s",
+    [
+        ("test_comparison", "{{ record['updated_at'] > stream_state['updated_at'] }}"),
+        ("test_lookup", "{{ record.id }}"),
+        ("test_template", "{{ record.id * 2 }}"),
+        ("test_static", "static"),
+    ],
+)
+def test_eval_records_is_the_same_as_eval(test_name, s):
+    interpolation = JinjaInterpolation()
+    records = [{"id": 1, "updated_at": 1}, {"id": "2", "updated_at": 3}, {"updated_at": 5}, {"id": [1, 2]}]
+    kwargs = {"stream_state": {"updated_at": 2}}
+
+    values = interpolation.eval_records(s, {}, records, default="default", **kwargs)
+
+    assert values == [interpolation.eval(s, {}, "default", record=record, **kwargs) for record in records]
+
+
+@pytest.mark.parametrize(
+    "s, expected_variables",
+    [
+        ("static string", set()),
+        ("{{ response[config['cursor_key']] }}", {"response", "config"}),
+        ("{{ now_utc() }} {% if headers.next %}{{ headers.next }}{% endif %}", {"headers"}),
+        ("{% for record in last_records %}{{ record.id }}{% endfor %}", {"last_records"}),
+    ],
+)
+def test_variables(s, expected_variables):
+    assert JinjaInterpolation().variables(s) == expected_variables
@@ -10,7 +10,7 @@ from airbyte_cdk.sources.declarative.auth.token import BasicHttpAuthenticator, B
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.models import CartesianProductStreamSlicer as CartesianProductStreamSlicerModel
@@ -519,6 +519,26 @@ def test_create_record_selector(test_name, record_selector, expected_runtime_sel
     assert selector.record_filter.condition == "{{ record['id'] > stream_state['id'] }}"
 
 
+def test_create_record_selector_with_streaming_json_decoder():
+    content = """
+    selector:
+      type: RecordSelector
+      extractor:
+        type: DpathExtractor
+        field_pointer: ["data"]
+        decoder:
+          type: StreamingJsonDecoder
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    selector_manifest = transformer.propagate_types_and_options("", resolved_manifest["selector"], {})
+
+    selector = factory.create_component(model_type=RecordSelectorModel, component_definition=selector_manifest, config=input_config)
+
+    assert isinstance(selector.extractor, DpathExtractor)
+    assert isinstance(selector.extractor.decoder, StreamingJsonDecoder)
+
+
 @pytest.mark.parametrize(
     "test_name, error_handler, expected_backoff_strategy_type",
     [
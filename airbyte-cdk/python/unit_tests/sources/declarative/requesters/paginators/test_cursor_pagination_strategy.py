@@ -57,3 +57,25 @@ def test_cursor_pagination_strategy(test_name, template_string, stop_condition,
     token = strategy.next_page_token(response, last_records)
     assert expected_token == token
     assert page_size == strategy.get_page_size()
+
+
+@pytest.mark.parametrize(
+    "cursor_value, stop_condition, expected_reads_response_body",
+    [
+        ("{{ response._metadata.next }}", None, True),
+        ("{{ headers.next }}", None, False),
+        ("{{ last_records[-1].id }}", "{{ not response.has_more }}", True),
+        ("{{ last_records[-1].id }}", "{{ not headers.has_more }}", False),
+        ("token", None, False),
+    ],
+)
+def test_reads_response_body(mocker, cursor_value, stop_condition, expected_reads_response_body):
+    decoder = mocker.Mock(spec=JsonDecoder)
+    decoder.decode.return_value = {"_metadata": {"next": "next_token"}, "has_more": True}
+    strategy = CursorPaginationStrategy(cursor_value=cursor_value, stop_condition=stop_condition, config={}, decoder=decoder, options={})
+    response = requests.Response()
+    response.headers = {"has_more": True}
+
+    assert strategy.reads_response_body == expected_reads_response_body
+    strategy.next_page_token(response, [{"id": 1}])
+    assert decoder.decode.called == expected_reads_response_body
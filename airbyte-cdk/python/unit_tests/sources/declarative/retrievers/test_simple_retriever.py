@@ -8,9 +8,13 @@ import airbyte_cdk.sources.declarative.requesters.error_handlers.response_status
 import pytest
 import requests
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode, Type
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, StreamingJsonDecoder
 from airbyte_cdk.sources.declarative.exceptions import ReadException
+from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordSelector
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_action import ResponseAction
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_status import ResponseStatus
+from airbyte_cdk.sources.declarative.requesters.paginators import DefaultPaginator, PaginatorTestReadDecorator
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies import CursorPaginationStrategy
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOptionType
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import (
@@ -123,7 +127,14 @@ def test_simple_retriever_with_request_response_logs(mock_http_stream):
     paginator = MagicMock()
     record_selector = MagicMock()
     iterator = DatetimeStreamSlicer(
-        start_datetime="", end_datetime="", step="P1D", cursor_field="id", datetime_format="", cursor_granularity="P1D", config={}, options={}
+        start_datetime="",
+        end_datetime="",
+        step="P1D",
+        cursor_field="id",
+        datetime_format="",
+        cursor_granularity="P1D",
+        config={},
+        options={},
     )
 
     retriever = SimpleRetriever(
@@ -154,7 +165,14 @@ def test_simple_retriever_with_request_response_log_last_records(mock_http_strea
     record_selector.select_records.return_value = request_response_logs
     response = requests.Response()
     iterator = DatetimeStreamSlicer(
-        start_datetime="", end_datetime="", step="P1D", cursor_field="id", datetime_format="", cursor_granularity="P1D", config={}, options={}
+        start_datetime="",
+        end_datetime="",
+        step="P1D",
+        cursor_field="id",
+        datetime_format="",
+        cursor_granularity="P1D",
+        config={},
+        options={},
     )
 
     retriever = SimpleRetriever(
@@ -240,6 +258,86 @@ def test_parse_response(test_name, status_code, response_status, len_expected_re
         assert len(records) == len_expected_records
 
 
+def test_parse_lazily_selected_records():
+    requester = MagicMock(use_cache=False)
+    requester.interpret_response_status.return_value = response_status.SUCCESS
+    record_selector = MagicMock()
+    record_selector.select_records.return_value = iter([{"id": 1}, {"id": 2}, {"id": 3}])
+    paginator = MagicMock()
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        record_selector=record_selector,
+        paginator=paginator,
+        options={},
+        config={},
+    )
+    response = requests.Response()
+
+    assert list(retriever.parse_response(response, stream_state={})) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    retriever.next_page_token(response)
+    last_records = paginator.next_page_token.call_args.args[1]
+    assert len(last_records) == 3
+    assert last_records[-1] == {"id": 3}
+
+
+@pytest.mark.parametrize("decoder, expected_kwargs", [(JsonDecoder(options={}), {}), (StreamingJsonDecoder(options={}), {"stream": True})])
+def test_request_kwargs_stream_the_response_with_a_streaming_decoder(decoder, expected_kwargs):
+    requester = MagicMock(use_cache=False)
+    requester.request_kwargs.return_value = {}
+    extractor = DpathExtractor(field_pointer=["data"], config={}, decoder=decoder, options={})
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        record_selector=RecordSelector(extractor=extractor, options={}),
+        options={},
+        config={},
+    )
+
+    assert retriever.request_kwargs(stream_state={}) == expected_kwargs
+
+
+@pytest.mark.parametrize(
+    "cursor_value, decoder, test_read, valid",
+    [
+        ("{{ headers.link.next.url }}", StreamingJsonDecoder(options={}), False, True),
+        ("{{ response.next }}", JsonDecoder(options={}), False, True),
+        ("{{ response.next }}", StreamingJsonDecoder(options={}), False, False),
+        ("{{ response.next }}", StreamingJsonDecoder(options={}), True, False),
+    ],
+)
+def test_streaming_decoder_rejects_paginators_reading_the_response_body(cursor_value, decoder, test_read, valid):
+    paginator = DefaultPaginator(
+        pagination_strategy=CursorPaginationStrategy(cursor_value=cursor_value, config={}, options={}),
+        url_base="https://airbyte.io",
+        config={},
+        options={},
+    )
+    if test_read:
+        paginator = PaginatorTestReadDecorator(paginator)
+    extractor = DpathExtractor(field_pointer=["data"], config={}, decoder=decoder, options={})
+
+    def create_retriever():
+        return SimpleRetriever(
+            name="stream_name",
+            primary_key=primary_key,
+            requester=MagicMock(use_cache=False),
+            record_selector=RecordSelector(extractor=extractor, options={}),
+            paginator=paginator,
+            options={},
+            config={},
+        )
+
+    if valid:
+        create_retriever()
+    else:
+        with pytest.raises(ValueError):
+            create_retriever()
+
+
 @pytest.mark.parametrize(
     "test_name, response_action, retry_in, expected_backoff_time",
     [
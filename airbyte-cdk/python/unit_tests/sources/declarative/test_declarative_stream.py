@@ -3,11 +3,18 @@
 #
 
 from unittest import mock
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 
+import airbyte_cdk.sources.declarative.requesters.error_handlers.response_status as response_status
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteTraceMessage, Level, SyncMode, TraceType
+from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.transformations import RecordTransformation
+from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
+from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
+from airbyte_cdk.sources.declarative.stream_slicers import DatetimeStreamSlicer
+from airbyte_cdk.sources.declarative.transformations import RecordTransformation, RemoveFields
+from airbyte_cdk.sources.streams.http.auth import NoAuth
+from airbyte_cdk.sources.streams.http.http import HttpStream
 
 
 def test_declarative_stream():
@@ -71,3 +78,63 @@ def test_declarative_stream():
             call(record, config=config, stream_slice=input_slice, stream_state=state) for record in records if isinstance(record, dict)
         ]
         transformation.transform.assert_has_calls(expected_calls, any_order=False)
+
+
+def _read_pages(pages):
+    def read_pages(records_generator_fn, stream_slice, stream_state):
+        for _ in pages:
+            yield from records_generator_fn(MagicMock(), MagicMock(), stream_slice, stream_state)
+
+    return read_pages
+
+
+def test_state_advances_when_a_transformation_removes_the_cursor_field():
+    pages = [
+        [{"id": 1, "updated_at": "2021-01-01T00:00:00.000000+0000"}, {"id": 2, "updated_at": "2021-01-02T00:00:00.000000+0000"}],
+        [{"id": 3, "updated_at": "2021-01-03T00:00:00.000000+0000"}],
+    ]
+    requester = MagicMock(use_cache=False)
+    requester.get_authenticator.return_value = NoAuth()
+    requester.interpret_response_status.return_value = response_status.SUCCESS
+    record_selector = MagicMock()
+    record_selector.select_records.side_effect = pages
+    stream_slicer = DatetimeStreamSlicer(
+        start_datetime=MinMaxDatetime(datetime="2021-01-01T00:00:00.000000+0000", options={}),
+        end_datetime=MinMaxDatetime(datetime="2021-01-10T00:00:00.000000+0000", options={}),
+        step="P1D",
+        cursor_field=InterpolatedString(string="updated_at", options={}),
+        datetime_format="%Y-%m-%dT%H:%M:%S.%f%z",
+        cursor_granularity="PT0.000001S",
+        config={},
+        options={},
+    )
+    retriever = SimpleRetriever(
+        name="stream",
+        primary_key="id",
+        requester=requester,
+        record_selector=record_selector,
+        stream_slicer=stream_slicer,
+        options={},
+        config={},
+    )
+    stream = DeclarativeStream(
+        name="stream",
+        primary_key="id",
+        schema_loader=MagicMock(),
+        retriever=retriever,
+        config={},
+        transformations=[RemoveFields(field_pointers=[["updated_at"]], options={})],
+        options={},
+    )
+
+    records_and_states = []
+    with patch.object(HttpStream, "_read_pages", side_effect=_read_pages(pages)):
+        for record in stream.read_records(SyncMode.incremental, stream_slice={}, stream_state={}):
+            records_and_states.append((record, stream.state))
+
+    # The cursor is updated from each record before it is transformed, and never runs ahead of the records read
+    assert records_and_states == [
+        ({"id": 1}, {"updated_at": "2021-01-01T00:00:00.000000+0000"}),
+        ({"id": 2}, {"updated_at": "2021-01-02T00:00:00.000000+0000"}),
+        ({"id": 3}, {"updated_at": "2021-01-03T00:00:00.000000+0000"}),
+    ]
@@ -108,3 +108,22 @@ def test_add_fields(
 ):
     inputs = [AddedFieldDefinition(path=v[0], value=v[1], options={}) for v in field]
     assert AddFields(fields=inputs, options={"alas": "i live"}).transform(input_record, **kwargs) == expected
+
+
+def test_add_fields_to_a_page_of_records():
+    fields = [
+        AddedFieldDefinition(path=["shop"], value="{{ config['shop'] }}", options={}),
+        AddedFieldDefinition(path=["parent", "id"], value="{{ record.id }}", options={}),
+        AddedFieldDefinition(path=["is_recent"], value="{{ record.updated_at > stream_state['updated_at'] }}", options={}),
+    ]
+    records = [{"id": 1, "updated_at": 1}, {"id": 2, "updated_at": 3}, {"updated_at": 5}]
+    config, stream_state = {"shop": "airbyte"}, {"updated_at": 2}
+
+    transformed = AddFields(fields=fields, options={}).transform_records(records, config=config, stream_state=stream_state)
+
+    expected = [
+        AddFields(fields=fields, options={}).transform(record, config=config, stream_state=stream_state)
+        for record in [{"id": 1, "updated_at": 1}, {"id": 2, "updated_at": 3}, {"updated_at": 5}]
+    ]
+    assert transformed == expected
+    assert transformed[2] == {"updated_at": 5, "shop": "airbyte", "parent": {"id": ""}, "is_recent": True}
@@ -0,0 +1,146 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import AsyncHttpStream
+from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, UserDefinedBackoffException
+
+
+class StubAsyncStream(AsyncHttpStream):
+    primary_key = "id"
+    retry_factor = 0
+
+    def __init__(self, url_base: str, **kwargs):
+        self._url_base = url_base
+        super().__init__(**kwargs)
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    def path(self, **kwargs) -> str:
+        return "records"
+
+    def request_params(
+        self, stream_state: Mapping[str, Any], next_page_token: Mapping[str, Any] = None, **kwargs
+    ) -> MutableMapping[str, Any]:
+        return {"page": next_page_token["page"]} if next_page_token else {}
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        next_page = response.json().get("next_page")
+        return {"page": next_page} if next_page else None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()["records"]
+
+
+def read_records_async(stream: AsyncHttpStream, stream_slice: Mapping[str, Any] = None) -> List[Mapping[str, Any]]:
+    async def read() -> List[Mapping[str, Any]]:
+        try:
+            return [record async for record in stream.read_records_async(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice)]
+        finally:
+            await stream.close_async_session()
+
+    return asyncio.run(read())
+
+
+def test_read_records_async_reads_the_same_pages_as_read_records(httpserver):
+    httpserver.expect_request("/records", query_string="").respond_with_json({"records": [{"id": 1}, {"id": 2}], "next_page": 2})
+    httpserver.expect_request("/records", query_string="page=2").respond_with_json({"records": [{"id": 3}]})
+    stream = StubAsyncStream(httpserver.url_for("/"))
+
+    assert read_records_async(stream) == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert list(stream.read_records(sync_mode=SyncMode.full_refresh)) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_transient_errors_are_retried(httpserver):
+    httpserver.expect_ordered_request("/records").respond_with_data("unavailable", status=503)
+    httpserver.expect_ordered_request("/records").respond_with_json({"records": [{"id": 1}]})
+
+    assert read_records_async(StubAsyncStream(httpserver.url_for("/"))) == [{"id": 1}]
+
+
+def test_user_defined_backoff(httpserver, mocker):
+    httpserver.expect_ordered_request("/records").respond_with_data("rate limited", status=429)
+    httpserver.expect_ordered_request("/records").respond_with_json({"records": [{"id": 1}]})
+    sleep = mocker.patch("asyncio.sleep", mocker.AsyncMock())
+
+    class BackoffStream(StubAsyncStream):
+        def backoff_time(self, response: requests.Response) -> Optional[float]:
+            return float(response.headers.get("Retry-After", 30))
+
+    assert read_records_async(BackoffStream(httpserver.url_for("/"))) == [{"id": 1}]
+    sleep.assert_awaited_once_with(31)
+
+
+@pytest.mark.parametrize(
+    "backoff_time, expected_exception",
+    [
+        pytest.param(None, DefaultBackoffException, id="test_default_backoff"),
+        pytest.param(1, UserDefinedBackoffException, id="test_user_defined"),
+    ],
+)
+def test_max_retries(httpserver, mocker, backoff_time, expected_exception):
+    httpserver.expect_request("/records").respond_with_data("unavailable", status=503)
+    mocker.patch("asyncio.sleep", mocker.AsyncMock())
+
+    class RetriedStream(StubAsyncStream):
+        max_retries = 2
+
+        def backoff_time(self, response: requests.Response) -> Optional[float]:
+            return backoff_time
+
+    with pytest.raises(expected_exception):
+        read_records_async(RetriedStream(httpserver.url_for("/")))
+    assert len(httpserver.log) == 3
+
+
+def test_client_errors_are_raised_without_retry(httpserver):
+    httpserver.expect_request("/records").respond_with_json({"message": "not found"}, status=404)
+
+    with pytest.raises(requests.HTTPError) as error:
+        read_records_async(StubAsyncStream(httpserver.url_for("/")))
+    assert error.value.response.status_code == 404
+    assert len(httpserver.log) == 1
+
+
+def test_errors_are_ignored_when_raise_on_http_errors_is_false(httpserver):
+    httpserver.expect_request("/records").respond_with_json({"records": []}, status=404)
+
+    class LenientStream(StubAsyncStream):
+        raise_on_http_errors = False
+
+    assert read_records_async(LenientStream(httpserver.url_for("/"))) == []
+
+
+class BearerAuth(requests.auth.AuthBase):
+    def __init__(self, token: str):
+        self.token = token
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        request.headers["Authorization"] = f"Bearer {self.token}"
+        return request
+
+
+def test_request_headers_and_authentication_are_sent(httpserver):
+    httpserver.expect_request(
+        "/records", method="POST", headers={"Authorization": "Bearer token", "X-Source": "airbyte"}, json={"ids": [1]}
+    ).respond_with_json({"records": [{"id": 1}]})
+
+    class PostStream(StubAsyncStream):
+        http_method = "POST"
+
+        def request_headers(self, **kwargs) -> Mapping[str, Any]:
+            return {"X-Source": "airbyte"}
+
+        def request_body_json(self, **kwargs) -> Optional[Mapping]:
+            return {"ids": [1]}
+
+    stream = PostStream(httpserver.url_for("/"), authenticator=BearerAuth("token"))
+    assert read_records_async(stream) == [{"id": 1}]
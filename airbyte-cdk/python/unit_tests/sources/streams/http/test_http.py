@@ -16,6 +16,7 @@ from airbyte_cdk.sources.streams.http.auth import NoAuth
 from airbyte_cdk.sources.streams.http.auth import TokenAuthenticator as HttpTokenAuthenticator
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
+from airbyte_cdk.utils.event_timing import EventTimer
 
 
 class StubBasicReadHttpStream(HttpStream):
@@ -122,6 +123,17 @@ def test_next_page_token_is_input_to_other_methods(mocker):
     assert expected == records
 
 
+def test_read_pages_records_request_and_parse_spans(mocker):
+    stream = StubNextPageTokenHttpStream(pages=2)
+    stream.event_timer = EventTimer("test")
+    mocker.patch.object(StubNextPageTokenHttpStream, "_send_request", return_value={})
+
+    records = list(stream.read_records(SyncMode.full_refresh))
+
+    assert len(records) == 3
+    assert {path: stats["count"] for path, stats in stream.event_timer.summary().items()} == {"parse": 3, "request": 3}
+
+
 class StubBadUrlHttpStream(StubBasicReadHttpStream):
     url_base = "bad_url"
 
@@ -0,0 +1,95 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+from typing import Any, Iterable, Mapping, Optional
+
+import requests
+from airbyte_cdk.sources.streams.http import ConnectionStats, HttpSessionRegistry, HttpStream, SessionPoolConfig
+
+
+class StubStream(HttpStream):
+    primary_key = "id"
+
+    def __init__(self, url_base: str, **kwargs):
+        self._url_base = url_base
+        super().__init__(**kwargs)
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    def path(self, **kwargs) -> str:
+        return "records"
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        yield from response.json()
+
+
+def test_sessions_share_the_connections_of_the_registry(httpserver):
+    httpserver.expect_request("/records").respond_with_json([{"id": 1}])
+    registry = HttpSessionRegistry()
+    sessions = [registry.create_session(), registry.create_session()]
+
+    for _ in range(3):
+        for session in sessions:
+            assert session.get(httpserver.url_for("/records")).json() == [{"id": 1}]
+
+    assert registry.connection_stats() == {httpserver.host: ConnectionStats(requests=6, new_connections=1)}
+    assert registry.connection_stats()[httpserver.host].reused_connections == 5
+
+
+def test_sessions_keep_their_own_authentication(httpserver):
+    httpserver.expect_request("/records", headers={"Authorization": "Bearer second"}).respond_with_json([])
+    registry = HttpSessionRegistry()
+    first_session, second_session = registry.create_session(), registry.create_session()
+    first_session.headers["Authorization"] = "Bearer first"
+    second_session.headers["Authorization"] = "Bearer second"
+
+    assert second_session.get(httpserver.url_for("/records")).status_code == 200
+    assert first_session.get(httpserver.url_for("/records")).status_code == 500
+
+
+def test_pool_config():
+    registry = HttpSessionRegistry(SessionPoolConfig(pool_connections=2, pool_maxsize=20))
+    adapter = registry.create_session().get_adapter("https://airbyte.io")
+    assert (adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block) == (2, 20, False)
+
+
+def test_max_connections_per_host_blocks_the_pool():
+    registry = HttpSessionRegistry(SessionPoolConfig(pool_maxsize=20, max_connections_per_host=4))
+    adapter = registry.create_session().get_adapter("https://airbyte.io")
+    assert (adapter._pool_maxsize, adapter._pool_block) == (4, True)
+
+
+def test_streams_with_a_session_registry_share_their_connections(httpserver):
+    httpserver.expect_request("/records").respond_with_json([{"id": 1}])
+
+    class SharingStream(StubStream):
+        session_registry = HttpSessionRegistry()
+
+    streams = [SharingStream(httpserver.url_for("/")), SharingStream(httpserver.url_for("/"))]
+    for stream in streams:
+        assert list(stream.read_records(sync_mode=None)) == [{"id": 1}]
+
+    assert SharingStream.session_registry.connection_stats() == {httpserver.host: ConnectionStats(requests=2, new_connections=1)}
+    assert StubStream.session_registry is None
+
+
+def test_log_connection_stats(httpserver, caplog):
+    httpserver.expect_request("/records").respond_with_json([])
+    registry = HttpSessionRegistry()
+    session = registry.create_session()
+    session.get(httpserver.url_for("/records"))
+    session.get(httpserver.url_for("/records"))
+
+    with caplog.at_level(logging.INFO):
+        registry.log_connection_stats(logging.getLogger("airbyte"))
+
+    assert [record.message for record in caplog.records if record.name == "airbyte"] == [
+        f"Sent 2 requests to {httpserver.host}: 1 new connections, 1 reused connections"
+    ]
@@ -2,13 +2,17 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import asyncio
 import copy
+import json
 import logging
+import threading
 from collections import defaultdict
-from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 from unittest.mock import call
 
 import pytest
+import requests
 from airbyte_cdk.models import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
@@ -32,6 +36,7 @@ from airbyte_cdk.models import (
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.streams import IncrementalMixin, Stream
+from airbyte_cdk.sources.streams.http import AsyncHttpStream, HttpStream
 from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -356,13 +361,63 @@ def test_read_full_refresh_with_slices_sends_slice_messages(mocker):
     assert 2 == len(list(filter(lambda message: message.log and message.log.message.startswith("slice:"), messages)))
 
 
+def test_read_with_profile_sends_profile_message(mocker):
+    """Given the logger is debug and the _profile internal config, a TRACE log message sums up the spans of each stream at the end of the sync"""
+    debug_logger = logging.getLogger("airbyte.debug")
+    debug_logger.setLevel(logging.DEBUG)
+    slices = [{"1": "1"}, {"2": "2"}]
+    stream = MockStream(
+        [({"sync_mode": SyncMode.full_refresh, "stream_slice": s}, [s]) for s in slices],
+        name="s1",
+    )
+
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh)])
+
+    messages = list(src.read(debug_logger, {"_profile": True}, catalog))
+
+    assert messages[-1].log.level == Level.TRACE
+    profile = json.loads(messages[-1].log.message)["profile"]
+    assert {path: stats["count"] for path, stats in profile["MockSource.s1"].items()} == {
+        # the slice messages are emitted before their slice is read
+        "consume": 2,
+        "slice": 2,
+        "slice/consume": 2,
+        "slice/transform": 2,
+    }
+    assert stream.event_timer is None
+    assert not any(message.log and message.log.level == Level.TRACE for message in src.read(debug_logger, {}, catalog))
+
+
+def test_read_without_profile_does_not_time_the_stream(mocker):
+    stream = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"id": 1}])], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    timers_while_reading = []
+    read_records = MockStream.read_records
+
+    def spy_read_records(self, **kwargs):
+        timers_while_reading.append(self.event_timer)
+        return read_records(self, **kwargs)
+
+    mocker.patch.object(MockStream, "read_records", spy_read_records)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh)])
+
+    list(MockSource(streams=[stream]).read(logger, {}, catalog))
+    list(MockSource(streams=[stream]).read(logger, {"_profile": True}, catalog))
+    assert timers_while_reading[0] is None
+    assert timers_while_reading[1] is not None
+
+
 def test_read_incremental_with_slices_sends_slice_messages(mocker):
     """Given the logger is debug and a incremental, AirbyteMessages are sent for slices"""
     debug_logger = logging.getLogger("airbyte.debug")
     debug_logger.setLevel(logging.DEBUG)
     slices = [{"1": "1"}, {"2": "2"}]
     stream = MockStream(
-        [({"sync_mode": SyncMode.incremental, "stream_slice": s, 'stream_state': {}}, [s]) for s in slices],
+        [({"sync_mode": SyncMode.incremental, "stream_slice": s, "stream_state": {}}, [s]) for s in slices],
         name="s1",
     )
 
@@ -989,3 +1044,293 @@ def test_checkpoint_state_from_stream_instance():
     assert actual_message == _as_state(
         {"teams": {"updated_at": "2022-09-11"}, "managers": {"updated": "expected_here"}}, "managers", {"updated": "expected_here"}
     )
+
+
+class MockConcurrentSource(MockSource):
+    @property
+    def max_concurrent_streams(self) -> int:
+        return 4
+
+
+def _messages_by_stream(messages: List[AirbyteMessage]) -> Mapping[str, List[AirbyteMessage]]:
+    messages_by_stream = defaultdict(list)
+    for message in messages:
+        if message.type == Type.RECORD:
+            messages_by_stream[message.record.stream].append(message)
+        elif message.type == Type.STATE:
+            messages_by_stream[message.state.stream.stream_descriptor.name].append(message)
+    return messages_by_stream
+
+
+def test_concurrent_full_refresh_read_keeps_the_order_of_each_stream(mocker):
+    slices = [{"1": "1"}, {"2": "2"}, {"3": "3"}]
+    streams = [
+        MockStream([({"sync_mode": SyncMode.full_refresh, "stream_slice": s}, [{**s, "stream": i}]) for s in slices], name=f"s{i}")
+        for i in range(6)
+    ]
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+
+    src = MockConcurrentSource(streams=streams)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh) for stream in streams])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog)))
+
+    assert len(messages) == len(streams) * len(slices)
+    assert _messages_by_stream(messages) == {
+        f"s{i}": _as_records(f"s{i}", [{**s, "stream": i} for s in slices]) for i in range(len(streams))
+    }
+
+
+def test_concurrent_incremental_read_emits_state_after_the_records_of_each_stream(mocker):
+    slices = [{"1": "1"}, {"2": "2"}]
+    stream_output = [{"k1": "v1"}, {"k2": "v2"}]
+    streams = [
+        MockStream(
+            [({"sync_mode": SyncMode.incremental, "stream_slice": s, "stream_state": mocker.ANY}, stream_output) for s in slices],
+            name=f"s{i}",
+        )
+        for i in range(3)
+    ]
+    state = {"cursor": "value"}
+    mocker.patch.object(MockStream, "get_updated_state", return_value=state)
+    mocker.patch.object(MockStream, "supports_incremental", return_value=True)
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(MockStream, "stream_slices", return_value=slices)
+
+    src = MockConcurrentSource(streams=streams)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental) for stream in streams])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=[])))
+
+    messages_by_stream = _messages_by_stream(messages)
+    assert len(messages) == sum(len(stream_messages) for stream_messages in messages_by_stream.values())
+    for stream in streams:
+        stream_messages = messages_by_stream[stream.name]
+        assert [message.type for message in stream_messages] == [Type.RECORD, Type.RECORD, Type.STATE] * len(slices)
+        assert all(message.state.stream.stream_state == AirbyteStateBlob.parse_obj(state) for message in stream_messages[2::3])
+    # state messages are output in the order the shared state manager was updated: their legacy data only ever covers more streams
+    legacy_states = [message.state.data for message in messages if message.type == Type.STATE]
+    assert all(set(previous) <= set(current) for previous, current in zip(legacy_states, legacy_states[1:]))
+    # the legacy data of the last state message covers every stream
+    assert messages[-1].state.data == {stream.name: state for stream in streams}
+
+
+def test_concurrent_read_raises_the_error_of_a_failing_stream(mocker):
+    failing_stream = MockStream(name="failing")
+    stream = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k1": "v1"}])], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(failing_stream, "read_records", side_effect=RuntimeError("oh no!"))
+    mocker.patch.object(MockStream, "get_error_display_message", return_value="my message")
+
+    src = MockConcurrentSource(streams=[failing_stream, stream])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(failing_stream, SyncMode.full_refresh), _configured_stream(stream, SyncMode.full_refresh)]
+    )
+
+    with pytest.raises(AirbyteTracedException, match="oh no!") as exc:
+        list(src.read(logger, {}, catalog))
+    assert exc.value.message == "my message"
+
+
+class StopReading(BaseException):
+    pass
+
+
+def test_concurrent_read_raises_a_base_exception_of_a_stream(mocker):
+    interrupted_stream = MockStream(name="interrupted")
+    stream = MockStream([({"sync_mode": SyncMode.full_refresh}, [{"k1": "v1"}])], name="s1")
+    mocker.patch.object(MockStream, "get_json_schema", return_value={})
+    mocker.patch.object(interrupted_stream, "read_records", side_effect=StopReading())
+
+    src = MockConcurrentSource(streams=[interrupted_stream, stream])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(interrupted_stream, SyncMode.full_refresh), _configured_stream(stream, SyncMode.full_refresh)]
+    )
+
+    # the stream still signals its end, the read would otherwise wait for it forever
+    with pytest.raises(StopReading):
+        list(src.read(logger, {}, catalog))
+
+
+class MockConcurrentSlicesHttpStream(HttpStream):
+    """Reads its slices concurrently, the first slice only completes once first_slice_released is set"""
+
+    url_base = "https://airbyte.io/"
+    primary_key = "id"
+    cursor_field = "cursor"
+    availability_strategy = None
+
+    def __init__(self, slices: List[Mapping[str, Any]], max_concurrent_slices: int = 2, **kwargs):
+        super().__init__(**kwargs)
+        self._slices = slices
+        self._max_concurrent_slices = max_concurrent_slices
+        self.first_slice_released = threading.Event()
+
+    @property
+    def max_concurrent_slices(self) -> int:
+        return self._max_concurrent_slices
+
+    def path(self, **kwargs) -> str:
+        return ""
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        return []
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        return self._slices
+
+    def read_records(self, sync_mode, cursor_field=None, stream_slice=None, stream_state=None) -> Iterable[Mapping[str, Any]]:
+        if stream_slice["cursor"] == 1:
+            assert self.first_slice_released.wait(timeout=5)
+        yield from [{"id": f"{stream_slice['cursor']}-{i}", "cursor": stream_slice["cursor"]} for i in range(2)]
+
+    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
+        return {"cursor": max(current_stream_state.get("cursor", 0), latest_record["cursor"])}
+
+
+def test_concurrent_slices_only_checkpoint_state_over_fully_read_slices():
+    stream = MockConcurrentSlicesHttpStream(slices=[{"cursor": 1}, {"cursor": 2}, {"cursor": 3}])
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+    output = src.read(logger, {}, catalog, state=[])
+    # the records of the second slice are emitted while the first slice is still being read
+    messages = [next(output) for _ in range(2)]
+    stream.first_slice_released.set()
+    messages = _fix_emitted_at(messages + list(output))
+
+    def records(cursor: int) -> List[AirbyteMessage]:
+        return _as_records(stream.name, [{"id": f"{cursor}-0", "cursor": cursor}, {"id": f"{cursor}-1", "cursor": cursor}])
+
+    def state(cursor: int) -> AirbyteMessage:
+        return _as_state({stream.name: {"cursor": cursor}}, stream.name, {"cursor": cursor})
+
+    assert messages == [
+        # the second slice completes first, but the state can't move past the first slice which is still being read
+        *records(2),
+        *records(1),
+        state(1),
+        state(2),
+        *records(3),
+        state(3),
+    ]
+
+
+def test_concurrent_slices_are_read_one_at_a_time_by_default():
+    stream = MockConcurrentSlicesHttpStream(slices=[{"cursor": 2}, {"cursor": 3}], max_concurrent_slices=1)
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=[])))
+
+    assert [message.type for message in messages] == [Type.RECORD, Type.RECORD, Type.STATE] * 2
+    assert messages[-1] == _as_state({stream.name: {"cursor": 3}}, stream.name, {"cursor": 3})
+
+
+class MockAsyncSlicesHttpStream(AsyncHttpStream):
+    """Reads its slices on the event loop of the source, the first slice only completes once the last slice started"""
+
+    url_base = "https://airbyte.io/"
+    primary_key = "id"
+    cursor_field = "cursor"
+    availability_strategy = None
+
+    def __init__(self, slices: List[Mapping[str, Any]], **kwargs):
+        super().__init__(**kwargs)
+        self._slices = slices
+        self.started_slices = []
+        self.threads = set()
+
+    def path(self, **kwargs) -> str:
+        return ""
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
+        return []
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+    def stream_slices(self, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        return self._slices
+
+    async def read_records_async(
+        self, sync_mode, cursor_field=None, stream_slice=None, stream_state=None
+    ) -> AsyncIterator[Mapping[str, Any]]:
+        self.threads.add(threading.current_thread().name)
+        self.started_slices.append(stream_slice["cursor"])
+        if stream_slice["cursor"] == 1:
+            await asyncio.wait_for(self._wait_for_slice(self._slices[-1]["cursor"]), timeout=5)
+        for i in range(2):
+            yield {"id": f"{stream_slice['cursor']}-{i}", "cursor": stream_slice["cursor"]}
+
+    async def _wait_for_slice(self, cursor: int):
+        while cursor not in self.started_slices:
+            await asyncio.sleep(0)
+
+    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
+        return {"cursor": max(current_stream_state.get("cursor", 0), latest_record["cursor"])}
+
+
+def _async_slice_record_ids(messages: List[AirbyteMessage]) -> Set[str]:
+    # slices read concurrently complete in any order, only the first slice is known to complete after the last one started
+    return {message.record.data["id"] for message in messages if message.type == Type.RECORD}
+
+
+def test_async_stream_slices_are_read_concurrently_on_the_event_loop_of_the_source():
+    stream = MockAsyncSlicesHttpStream(slices=[{"cursor": 1}, {"cursor": 2}, {"cursor": 3}])
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=[])))
+
+    # the first slice waits for the last one to start, it would time out if the slices were read one after the other
+    assert stream.started_slices == [1, 2, 3]
+    assert len(messages) == 6
+    assert _async_slice_record_ids(messages) == {"1-0", "1-1", "2-0", "2-1", "3-0", "3-1"}
+    assert stream.threads == {"MockSource-event-loop"}
+    assert src._event_loop is None
+
+
+def test_async_stream_incremental_state_is_checkpointed_in_slice_order():
+    stream = MockAsyncSlicesHttpStream(slices=[{"cursor": 1}, {"cursor": 2}, {"cursor": 3}])
+    src = MockSource(streams=[stream])
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental)])
+
+    messages = _fix_emitted_at(list(src.read(logger, {}, catalog, state=[])))
+
+    def state(cursor: int) -> AirbyteMessage:
+        return _as_state({stream.name: {"cursor": cursor}}, stream.name, {"cursor": cursor})
+
+    assert stream.started_slices == [1, 2, 3]
+    assert _async_slice_record_ids(messages) == {"1-0", "1-1", "2-0", "2-1", "3-0", "3-1"}
+    # the state only moves past a slice once the slices before it were fully read
+    assert [message for message in messages if message.type == Type.STATE] == [state(1), state(2), state(3)]
+    assert messages[-1] == state(3)
+
+
+def test_async_streams_read_concurrently_share_the_event_loop_of_the_source():
+    class OtherMockAsyncSlicesHttpStream(MockAsyncSlicesHttpStream):
+        pass
+
+    streams = [MockAsyncSlicesHttpStream(slices=[{"cursor": 1}, {"cursor": 2}]), OtherMockAsyncSlicesHttpStream(slices=[{"cursor": 1}])]
+
+    class ConcurrentSource(MockSource):
+        max_concurrent_streams = 2
+
+    src = ConcurrentSource(streams=streams)
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh) for stream in streams])
+
+    messages = list(src.read(logger, {}, catalog, state=[]))
+
+    assert len(messages) == 6
+    assert streams[0].threads == streams[1].threads == {"ConcurrentSource-event-loop"}
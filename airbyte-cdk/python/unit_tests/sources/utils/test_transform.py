@@ -2,10 +2,13 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
+from decimal import Decimal
 
 import pytest
-from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer, json_type_checks
+from jsonschema import RefResolutionError
 
 SIMPLE_SCHEMA = {"type": "object", "properties": {"value": {"type": "string"}}}
 COMPLEX_SCHEMA = {
@@ -205,8 +208,15 @@ VERY_NESTED_SCHEMA = {
         ),
     ],
 )
-def test_transform(schema, actual, expected, expected_warns, caplog):
-    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+@pytest.mark.parametrize(
+    "config",
+    [
+        TransformConfig.DefaultSchemaNormalization,
+        TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization,
+    ],
+)
+def test_transform(schema, actual, expected, expected_warns, config, caplog):
+    t = TypeTransformer(config)
     t.transform(actual, schema)
     assert json.dumps(actual) == json.dumps(expected)
     if expected_warns:
@@ -264,3 +274,138 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+def test_compiled_custom_transform_with_default_normalization():
+    class NotAStream:
+        transformer = TypeTransformer(
+            TransformConfig.CustomSchemaNormalization
+            | TransformConfig.DefaultSchemaNormalization
+            | TransformConfig.CompiledSchemaNormalization
+        )
+
+        @transformer.registerCustomTransform
+        def transform_cb(instance, schema):
+            # Check default conversion applied
+            assert instance == "12"
+            assert schema == SIMPLE_SCHEMA["properties"]["value"]
+            return "transformed"
+
+    s = NotAStream()
+    obj = {"value": 12}
+    s.transformer.transform(obj, SIMPLE_SCHEMA)
+    assert obj == {"value": "transformed"}
+
+
+RECURSIVE_SCHEMA = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}, "children": {"type": "array", "items": {"$ref": "#/definitions/node"}}},
+    "definitions": {
+        "node": {
+            "type": ["null", "object"],
+            "properties": {
+                "id": {"type": "integer"},
+                "labels": {"type": ["null", "array"], "items": {"type": ["null", "string"]}},
+                "children": {"type": "array", "items": {"$ref": "#/definitions/node"}},
+            },
+        }
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "schema, record",
+    [
+        (COMPLEX_SCHEMA, {"value": "true", "def": {}, "array": [1, None, {"a": 1}], "nested": {"a": 1}, "number_prop": "x"}),
+        (VERY_NESTED_SCHEMA, {"very_nested_value": {"very_nested_value": {"very_nested_value": "not an object"}}}),
+        (
+            RECURSIVE_SCHEMA,
+            {
+                "id": "1",
+                "children": [
+                    {"id": "2", "labels": [1, None, "a"], "children": [{"id": "not a number", "labels": "a", "children": [None]}]},
+                    None,
+                    "not a node",
+                ],
+            },
+        ),
+        # Tuple items are not supported by the compiled plan, the jsonschema path is used instead
+        ({"type": "object", "properties": {"value": {"type": "string"}, "other": {"items": [{"type": "string"}]}}}, {"value": 1}),
+    ],
+)
+def test_compiled_normalization_matches_default_normalization(schema, record, caplog):
+    expected = copy.deepcopy(record)
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(expected, schema)
+    expected_warnings = [log_record.message for log_record in caplog.records]
+    caplog.clear()
+
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization)
+    for _ in range(2):
+        actual = copy.deepcopy(record)
+        transformer.transform(actual, schema)
+        assert json.dumps(actual) == json.dumps(expected)
+        assert [log_record.message for log_record in caplog.records if log_record.levelname == "WARNING"] == expected_warnings
+        caplog.clear()
+
+
+@pytest.mark.parametrize(
+    "schema, compiled",
+    [
+        (COMPLEX_SCHEMA, True),
+        (RECURSIVE_SCHEMA, True),
+        ({"type": "object", "properties": {"other": {"items": [{"type": "string"}]}}}, False),
+        ({"type": "object", "properties": {"other": {"type": "unknown"}}}, False),
+        ({"$id": "http://example.com/schema", "type": "object"}, False),
+    ],
+)
+def test_schema_compilation_falls_back_to_jsonschema(schema, compiled):
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization)
+    assert (transformer._get_compiled_schema(schema) is not None) == compiled
+
+
+def test_schemas_are_compiled_once_per_content(mocker):
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization)
+    compile_schema = mocker.spy(transformer, "_compile_schema")
+    transformer.transform({"value": 1}, copy.deepcopy(SIMPLE_SCHEMA))
+    compile_calls = compile_schema.call_count
+    for _ in range(3):
+        # streams usually load a new but equal schema for every record
+        record = {"value": 1}
+        transformer.transform(record, copy.deepcopy(SIMPLE_SCHEMA))
+        assert record == {"value": "1"}
+    assert compile_schema.call_count == compile_calls
+
+    transformer.transform({"value": 1}, {**SIMPLE_SCHEMA, "description": "other schema"})
+    assert compile_schema.call_count > compile_calls
+
+
+def test_schemas_which_cant_be_serialized_are_compiled_once_per_object(mocker):
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization)
+    compile_schema = mocker.spy(transformer, "_compile_schema")
+    schema = {"type": "object", "properties": {"value": {"type": "string"}}}
+    schema["properties"]["child"] = schema
+    record = {"value": 1, "child": {"value": 2}}
+    transformer.transform(record, schema)
+    assert record == {"value": "1", "child": {"value": "2"}}
+    transformer.transform({"value": 1}, SIMPLE_SCHEMA)
+    compile_calls = compile_schema.call_count
+
+    record = {"value": 1, "child": {"value": 2}}
+    transformer.transform(record, schema)
+    assert record == {"value": "1", "child": {"value": "2"}}
+    assert compile_schema.call_count == compile_calls
+
+
+def test_compiled_normalization_fails_on_unresolvable_reference_like_jsonschema():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization | TransformConfig.CompiledSchemaNormalization)
+    transformer.transform({"def": {}}, COMPLEX_SCHEMA)
+    with pytest.raises(RefResolutionError):
+        transformer.transform({"def": {"dd": 1}}, COMPLEX_SCHEMA)
+
+
+@pytest.mark.parametrize("json_type", json_type_checks.keys())
+@pytest.mark.parametrize("value", [None, True, False, 0, 1, 1.0, 1.5, Decimal("1.5"), "1", [], {}, ()])
+def test_json_type_checks_match_the_normalizer_type_checker(json_type, value):
+    type_checker = TypeTransformer(TransformConfig.DefaultSchemaNormalization)._normalizer.TYPE_CHECKER
+    accepted = isinstance(value, json_type_checks[json_type]) and (json_type == "boolean" or not isinstance(value, bool))
+    assert accepted == type_checker.is_type(value, json_type)
@@ -2,10 +2,13 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
-
+import itertools
+import threading
+import time
 from unittest import mock
 
-from airbyte_cdk.utils.event_timing import create_timer
+import pytest
+from airbyte_cdk.utils.event_timing import SpanStats, create_timer
 
 
 def test_counter_init():
@@ -53,3 +56,77 @@ def test_double_finish_is_safely_ignored():
         timer.finish_event()
         timer.finish_event()
         assert timer.count == 1
+
+
+def test_finish_event_finishes_the_last_started_event():
+    with create_timer("Source Counter") as timer:
+        timer.start_event("outer")
+        timer.start_event("inner")
+        timer.finish_event()
+        assert timer.events["inner"].end is not None
+        assert timer.events["outer"].end is None
+
+
+def test_spans_are_aggregated_per_path():
+    with create_timer("Source Counter") as timer:
+        for _ in range(3):
+            with timer.span("slice"):
+                timer.add_span("transform", 10)
+                with timer.span("request"):
+                    pass
+                timer.add_span("transform", 20)
+        timer.add_span("transform", 30)
+
+        summary = timer.summary()
+        assert list(summary) == ["slice", "slice/request", "slice/transform", "transform"]
+        assert summary["slice"]["count"] == 3
+        assert summary["slice/request"]["count"] == 3
+        assert summary["slice/transform"]["count"] == 6
+        assert summary["slice/transform"]["total_seconds"] == 90e-9
+        assert summary["transform"]["count"] == 1
+        assert timer.report().endswith("\n".join(["Source Counter spans:"] + [f"{path} {timer.spans[path]}" for path in summary]))
+
+
+def test_spans_nest_per_thread():
+    with create_timer("Source Counter") as timer:
+        timer.start_span("slice")
+        thread = threading.Thread(target=timer.add_span, args=("request", 10))
+        thread.start()
+        thread.join()
+        timer.finish_span()
+
+        assert set(timer.spans) == {"slice", "request"}
+
+
+def test_double_finish_span_is_safely_ignored():
+    with create_timer("Source Counter") as timer:
+        timer.start_span("test_span")
+        timer.finish_span()
+        timer.finish_span()
+        assert timer.spans["test_span"].count == 1
+
+
+def test_timed_excludes_the_time_spent_by_the_caller(mocker):
+    mocker.patch("airbyte_cdk.utils.event_timing.time.perf_counter_ns", side_effect=itertools.count(0, 10))
+    with create_timer("Source Counter") as timer:
+        for _ in timer.timed("parse", iter(range(3))):
+            # the clock keeps running while the caller handles the item
+            time.perf_counter_ns()
+
+        # one measure per item and one for the end of the iteration
+        assert timer.spans["parse"].count == 1
+        assert timer.spans["parse"].total_ns == 40
+
+
+@pytest.mark.parametrize("durations", [range(1, 10_001), [1_000_000] * 99 + [5_000_000_000], range(0, 8)])
+def test_span_stats_percentiles(durations):
+    stats = SpanStats()
+    for duration in durations:
+        stats.add(duration)
+
+    durations = sorted(durations)
+    assert stats.count == len(durations)
+    assert stats.total_ns == sum(durations)
+    for percentile in (50, 99):
+        expected = durations[max(0, round(percentile / 100 * len(durations)) - 1)] / 1e9
+        assert stats.percentile(percentile) == pytest.approx(expected, rel=0.125)
@@ -3,6 +3,9 @@
 #
 
 
+import io
+import json
+import logging
 from argparse import Namespace
 from copy import deepcopy
 from typing import Any, List, Mapping, MutableMapping, Union
@@ -11,6 +14,7 @@ from unittest.mock import MagicMock
 import pytest
 from airbyte_cdk import AirbyteEntrypoint
 from airbyte_cdk import entrypoint as entrypoint_module
+from airbyte_cdk.logger import AirbyteLogFormatter
 from airbyte_cdk.models import (
     AirbyteCatalog,
     AirbyteConnectionStatus,
@@ -23,6 +27,7 @@ from airbyte_cdk.models import (
     Type,
 )
 from airbyte_cdk.sources import Source
+from airbyte_cdk.utils.message_serializer import BufferedMessageWriter, SerializedMessages
 
 
 class MockSource(Source):
@@ -189,10 +194,49 @@ def test_run_read(entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock)
     mocker.patch.object(MockSource, "read_state", return_value={})
     mocker.patch.object(MockSource, "read_catalog", return_value={})
     mocker.patch.object(MockSource, "read", return_value=[AirbyteMessage(record=expected, type=Type.RECORD)])
-    assert [_wrap_message(expected)] == list(entrypoint.run(parsed_args))
+    # records may be serialized by orjson, whose output is compact, so the messages are compared once parsed
+    assert [json.loads(_wrap_message(expected))] == [json.loads(message) for message in entrypoint.run(parsed_args)]
     assert spec_mock.called
 
 
+def test_run_read_with_serialized_messages(entrypoint: AirbyteEntrypoint, mocker, spec_mock, config_mock):
+    parsed_args = Namespace(command="read", config="config_path", state="statepath", catalog="catalogpath")
+    records = [AirbyteRecordMessage(stream="stream", data={"id": i}, emitted_at=1) for i in range(2)]
+    serialized = SerializedMessages("\n".join(_wrap_message(record) for record in records))
+    mocker.patch.object(MockSource, "read_state", return_value={})
+    mocker.patch.object(MockSource, "read_catalog", return_value={})
+    mocker.patch.object(MockSource, "read", return_value=[serialized, AirbyteMessage(record=records[0], type=Type.RECORD)])
+    messages = list(entrypoint.run(parsed_args))
+    assert messages[0] == serialized
+    assert json.loads(messages[1]) == json.loads(_wrap_message(records[0]))
+
+
 def test_invalid_command(entrypoint: AirbyteEntrypoint, mocker, config_mock):
     with pytest.raises(Exception):
         list(entrypoint.run(Namespace(command="invalid", config="conf")))
+
+
+def test_launch_writes_logs_in_order_with_buffered_messages(mocker):
+    stdout = io.StringIO()
+    mocker.patch.object(entrypoint_module, "BufferedMessageWriter", side_effect=lambda: BufferedMessageWriter(stdout))
+    handler = logging.StreamHandler(stdout)
+    handler.setFormatter(AirbyteLogFormatter())
+    logger = logging.getLogger()
+    logger.addHandler(handler)
+    records = [_wrap_message(AirbyteRecordMessage(stream="stream", data={"id": i}, emitted_at=1)) for i in range(2)]
+
+    def run(parsed_args):
+        yield records[0]
+        logging.getLogger("airbyte").info("between the records")
+        yield records[1]
+
+    mocker.patch.object(AirbyteEntrypoint, "parse_args")
+    mocker.patch.object(AirbyteEntrypoint, "run", side_effect=run)
+    try:
+        entrypoint_module.launch(MockSource(), ["read"])
+    finally:
+        logger.removeHandler(handler)
+
+    messages = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert [message["type"] for message in messages] == ["RECORD", "LOG", "RECORD"]
+    assert messages[1]["log"]["message"] == "between the records"
@@ -0,0 +1,164 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+import io
+import json
+import logging
+import time
+from decimal import Decimal
+
+import pytest
+from airbyte_cdk.models import (
+    AirbyteLogMessage,
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
+    Level,
+    StreamDescriptor,
+    Type,
+)
+from airbyte_cdk.utils import message_serializer
+from airbyte_cdk.utils.message_serializer import BufferedMessageWriter, SerializedMessages, serialize_message
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def encoder(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(message_serializer, "orjson", None)
+    elif message_serializer.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1, "name": "a"}, emitted_at=1)),
+            id="test_record",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", namespace="public", data={"id": 1}, emitted_at=1)),
+            id="test_record_with_namespace",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD,
+                record=AirbyteRecordMessage(
+                    stream="users",
+                    data={"nested": {"list": [1, 2.5, None, True]}, "price": Decimal("1.5"), "at": datetime.date(2022, 1, 1)},
+                    emitted_at=1,
+                ),
+            ),
+            id="test_record_with_non_json_types",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={1: "int key"}, emitted_at=1)),
+            id="test_record_with_non_string_keys",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1}, emitted_at=1, extra_field="extra")
+            ),
+            id="test_record_with_extra_fields",
+        ),
+        pytest.param(AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="hello")), id="test_log"),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.STATE,
+                state=AirbyteStateMessage(
+                    type=AirbyteStateType.STREAM,
+                    stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name="users"), stream_state={"updated_at": 1}),
+                ),
+            ),
+            id="test_state",
+        ),
+    ],
+)
+def test_serialize_message_is_equivalent_to_pydantic(encoder, message):
+    assert json.loads(serialize_message(message)) == json.loads(message.json(exclude_unset=True))
+
+
+def test_serialize_record_with_stdlib_encoder_matches_pydantic_output(monkeypatch):
+    monkeypatch.setattr(message_serializer, "orjson", None)
+    message = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1, "name": "a"}, emitted_at=1))
+    assert serialize_message(message) == message.json(exclude_unset=True)
+
+
+def test_serialized_messages_are_returned_as_is():
+    messages = SerializedMessages(
+        '{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1}}\n{"type": "RECORD"}'
+    )
+    assert serialize_message(messages) is messages
+
+
+RECORD = '{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": 1}}'
+COMPACT_RECORD = '{"type":"RECORD","record":{"stream":"users","data":{"id":2},"emitted_at":1}}'
+STATE = '{"type": "STATE", "state": {"data": {"users": 2}}}'
+
+
+def test_buffered_writer_flushes_when_buffer_is_full():
+    stream = io.StringIO()
+    writer = BufferedMessageWriter(stream, max_buffer_size=len(RECORD) + len(COMPACT_RECORD) + 2, max_flush_interval=3600)
+
+    writer.write(RECORD)
+    assert stream.getvalue() == ""
+    writer.write(COMPACT_RECORD)
+    assert stream.getvalue() == f"{RECORD}\n{COMPACT_RECORD}\n"
+
+
+def test_buffered_writer_flushes_after_interval():
+    stream = io.StringIO()
+    writer = BufferedMessageWriter(stream, max_buffer_size=1024, max_flush_interval=0)
+
+    writer.write(RECORD)
+    assert stream.getvalue() == f"{RECORD}\n"
+
+
+def test_buffered_writer_flushes_non_record_messages():
+    stream = io.StringIO()
+    writer = BufferedMessageWriter(stream, max_buffer_size=1024, max_flush_interval=3600)
+
+    writer.write(RECORD)
+    assert stream.getvalue() == ""
+    writer.write(STATE)
+    assert stream.getvalue() == f"{RECORD}\n{STATE}\n"
+
+
+def test_buffered_writer_flushes_before_logging():
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    logger = logging.getLogger()
+    logger.addHandler(handler)
+    try:
+        with BufferedMessageWriter(stream, max_buffer_size=1024, max_flush_interval=3600) as writer:
+            writer.write(RECORD)
+            logger.warning("log message")
+            assert stream.getvalue() == f"{RECORD}\nlog message\n"
+        assert not handler.filters
+    finally:
+        logger.removeHandler(handler)
+
+
+def test_buffered_writer_flushes_periodically():
+    stream = io.StringIO()
+    with BufferedMessageWriter(stream, max_buffer_size=1024, max_flush_interval=0.01) as writer:
+        writer.write(RECORD)
+        deadline = time.monotonic() + 5
+        while not stream.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stream.getvalue() == f"{RECORD}\n"
+
+
+def test_buffered_writer_flushes_on_exit_even_if_an_error_is_raised():
+    stream = io.StringIO()
+    with pytest.raises(ValueError):
+        with BufferedMessageWriter(stream, max_buffer_size=1024, max_flush_interval=3600) as writer:
+            writer.write(RECORD)
+            writer.write(COMPACT_RECORD)
+            raise ValueError("error while reading")
+    assert stream.getvalue() == f"{RECORD}\n{COMPACT_RECORD}\n"
@@ -2,11 +2,12 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import json
 from typing import List, Mapping
 
 import pytest
 from airbyte_cdk.models.airbyte_protocol import AirbyteRecordMessage
-from airbyte_cdk.utils.schema_inferrer import SchemaInferrer
+from airbyte_cdk.utils.schema_inferrer import NoRequiredSchemaBuilder, SchemaInferrer, record_shape
 
 NOW = 1234567
 
@@ -89,3 +90,80 @@ def test_get_individual_schema():
         "properties": {"field_A": {"type": "number"}},
     }
     assert inferrer.get_stream_schema("another_stream") is None
+
+
+def generate_records(count: int) -> List[Mapping]:
+    values = [1, 1.5, "abc", None, True, {"nested": 1}, {"nested": "abc", "other": [1, "a"]}, [], [{"id": 1}, {"name": "a"}]]
+    return [{f"field_{i % 7}": values[i % len(values)], f"field_{i % 5}": values[(i * 3) % len(values)]} for i in range(count)]
+
+
+def infer_schema(records: List[Mapping], inferrer: SchemaInferrer = None) -> Mapping:
+    inferrer = inferrer or SchemaInferrer()
+    for data in records:
+        inferrer.accumulate(AirbyteRecordMessage(stream="my_stream", data=data, emitted_at=NOW))
+    return inferrer.get_stream_schema("my_stream")
+
+
+def test_records_of_known_shapes_are_skipped(mocker):
+    records = generate_records(3000)
+    builder = NoRequiredSchemaBuilder()
+    for data in records:
+        builder.add_object(data)
+
+    add_object = mocker.spy(NoRequiredSchemaBuilder, "add_object")
+    assert infer_schema(records) == builder.to_schema()
+    assert add_object.call_count == len({record_shape(data) for data in records}) < 500
+
+
+def test_record_shape_distinguishes_genson_types():
+    assert record_shape({"a": 1}) != record_shape({"a": True})
+    assert record_shape({"a": 1}) != record_shape({"a": 1.0})
+    assert record_shape({"a": [1, "b"]}) == record_shape({"a": ["c", 2, 3]})
+    assert record_shape({"a": 1, "b": None}) == record_shape({"a": 2, "b": None})
+
+
+def test_forgotten_shapes_do_not_change_the_schema():
+    records = generate_records(1000)
+    assert infer_schema(records, SchemaInferrer(max_shapes=3)) == infer_schema(records)
+
+
+def test_sampling_bounds_the_records_kept():
+    records = [{f"field_{i}": i} for i in range(1000)]
+    inferrer = SchemaInferrer(sample_size=10, seed=1)
+    schema = infer_schema(records, inferrer)
+
+    assert len(inferrer.stream_to_builder["my_stream"].reservoir) == 10
+    assert len(schema["properties"]) == 10
+    assert set(schema["properties"]) < {f"field_{i}" for i in range(1000)}
+    assert infer_schema(records, SchemaInferrer(sample_size=10, seed=1)) == schema
+
+
+def test_sampling_keeps_every_record_below_the_sample_size():
+    records = generate_records(1000)
+    assert infer_schema(records, SchemaInferrer(sample_size=1000)) == infer_schema(records)
+
+
+def sort_any_of(schema):
+    if isinstance(schema, dict):
+        return {
+            key: sorted(map(sort_any_of, value), key=json.dumps) if key == "anyOf" else sort_any_of(value) for key, value in schema.items()
+        }
+    return schema
+
+
+@pytest.mark.parametrize("sample_size", [None, 1000])
+def test_merge_schemas_inferred_in_parallel(sample_size):
+    records = generate_records(1000)
+    inferrers = [SchemaInferrer(sample_size=sample_size) for _ in range(3)]
+    for index, data in enumerate(records):
+        inferrers[index % 3].accumulate(AirbyteRecordMessage(stream="my_stream", data=data, emitted_at=NOW))
+    inferrers[1].accumulate(AirbyteRecordMessage(stream="my_stream2", data={"field_A": "abc"}, emitted_at=NOW))
+
+    merged = SchemaInferrer()
+    merged.merge(inferrers[0])
+    merged.merge(inferrers[1])
+    merged.merge_schemas(inferrers[2].get_inferred_schemas())
+
+    # the order of the anyOf alternatives depends on the order the schemas are merged in
+    assert sort_any_of(merged.get_stream_schema("my_stream")) == sort_any_of(infer_schema(records))
+    assert merged.get_stream_schema("my_stream2")["properties"] == {"field_A": {"type": "string"}}
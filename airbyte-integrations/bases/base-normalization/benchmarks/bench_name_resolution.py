@@ -0,0 +1,127 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the columns/s of naming the tables and columns of a synthetic catalog of 10k columns by default, spread over streams whose
+columns have long names (truncated by the destination), accents, spaces and reserved keywords, every tenth column being a nested
+array of objects (a nested stream with long colliding names):
+
+* normalize columns: every column name normalized as a column, in jinja and for lookups, as the StreamProcessor does
+* resolve table names: every stream and nested stream registered to a TableNameRegistry and their names resolved
+* process catalog: the dbt models of the whole catalog generated by a CatalogProcessor
+
+Usage: python benchmarks/bench_name_resolution.py [--streams 10] [--columns 1000] [--destination postgres]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict
+
+from normalization.destination_type import DestinationType
+from normalization.transform_catalog.catalog_processor import CatalogProcessor
+from normalization.transform_catalog.destination_name_transformer import NORMALIZED_NAMES, DestinationNameTransformer
+from normalization.transform_catalog.table_name_registry import TableNameRegistry
+
+COLUMN_NAMES = [
+    "id",
+    "select",
+    "Order Date",
+    "référence_client",
+    "a_very_long_column_name_describing_the_shipping_address_of_the_customer_{}",
+    "column_{}",
+    "Column {}",
+]
+
+
+def build_catalog(streams: int, columns: int) -> Dict[str, Any]:
+    catalog_streams = []
+    for stream in range(streams):
+        properties = {}
+        for column in range(columns):
+            name = COLUMN_NAMES[column % len(COLUMN_NAMES)].format(column)
+            if column % 10 == 9:
+                nested = {f"{name}_nested_field_{index}": {"type": ["null", "string"]} for index in range(3)}
+                properties[f"{name}_nested_records_with_a_long_name"] = {
+                    "type": ["null", "array"],
+                    "items": {"type": ["null", "object"], "properties": nested},
+                }
+            else:
+                properties[name] = {"type": ["null", "string"] if column % 2 else ["null", "integer"]}
+        catalog_streams.append(
+            {
+                "stream": {
+                    "name": f"benchmark_stream_with_a_rather_long_name_{stream}",
+                    "json_schema": {"type": ["null", "object"], "properties": properties},
+                    "supported_sync_modes": ["full_refresh", "incremental"],
+                },
+                "sync_mode": "full_refresh",
+                "destination_sync_mode": "append",
+            }
+        )
+    return {"streams": catalog_streams}
+
+
+def normalize_columns(destination_type: DestinationType, catalog: Dict[str, Any], _: str):
+    name_transformer = DestinationNameTransformer(destination_type)
+    for configured_stream in catalog["streams"]:
+        for column in configured_stream["stream"]["json_schema"]["properties"]:
+            name_transformer.normalize_column_name(column)
+            name_transformer.normalize_column_name(column, in_jinja=True)
+            name_transformer.normalize_column_identifier_case_for_lookup(name_transformer.normalize_column_name(column))
+
+
+def resolve_table_names(destination_type: DestinationType, catalog: Dict[str, Any], _: str):
+    tables_registry = TableNameRegistry(destination_type)
+    for configured_stream in catalog["streams"]:
+        stream_name = configured_stream["stream"]["name"]
+        tables_registry.register_table("_airbyte_schema", "schema", stream_name, [stream_name])
+        for column, definition in configured_stream["stream"]["json_schema"]["properties"].items():
+            if "items" in definition:
+                tables_registry.register_table("_airbyte_schema", "schema", column, [stream_name, column])
+    tables_registry.resolve_names()
+
+
+def process_catalog(destination_type: DestinationType, catalog: Dict[str, Any], temp_dir: str):
+    catalog_file = os.path.join(temp_dir, "catalog.json")
+    with open(catalog_file, "w") as file:
+        json.dump(catalog, file)
+    processor = CatalogProcessor(output_directory=os.path.join(temp_dir, "models"), destination_type=destination_type)
+    processor.process(catalog_file=catalog_file, json_column_name="_airbyte_data", default_schema="schema")
+
+
+def run(
+    name: str, phase: Callable[[DestinationType, Dict[str, Any], str], None], destination_type: DestinationType, catalog: Dict[str, Any]
+):
+    columns = sum(len(configured_stream["stream"]["json_schema"]["properties"]) for configured_stream in catalog["streams"])
+    # every phase starts without any name normalized yet, as a normalization run does
+    NORMALIZED_NAMES.clear()
+    with tempfile.TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        phase(destination_type, catalog, temp_dir)
+        elapsed = time.perf_counter() - start
+    print(f"{name:<20} {columns / elapsed:>14,.0f} columns/s {elapsed:>8.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, default=10)
+    parser.add_argument("--columns", type=int, default=1000)
+    parser.add_argument("--destination", type=str, default="postgres")
+    args = parser.parse_args()
+
+    destination_type = DestinationType.from_string(args.destination)
+    catalog = build_catalog(args.streams, args.columns)
+    print(f"{args.streams} streams, {args.columns} columns per stream, {destination_type.value}")
+    run("normalize columns", normalize_columns, destination_type, catalog)
+    run("resolve table names", resolve_table_names, destination_type, catalog)
+    run("process catalog", process_catalog, destination_type, catalog)
+
+
+if __name__ == "__main__":
+    main()
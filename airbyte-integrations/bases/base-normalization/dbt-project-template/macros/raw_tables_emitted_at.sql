@@ -0,0 +1,41 @@
+{#
+    This macro is run with `dbt run-operation log_raw_tables_emitted_at` before normalization models are run.
+    It logs the latest _airbyte_emitted_at of every raw table declared in sources.yml as a single JSON line, keyed by
+    'source_name.table_name', so that select-changed-streams can select the models of the streams whose raw tables changed since
+    they were last normalized. The value is null when the raw table does not exist (yet).
+#}
+
+{%- macro log_raw_tables_emitted_at() -%}
+    {%- set raw_tables_emitted_at = {} -%}
+    {%- for node in graph.sources.values() -%}
+        {%- set relation = adapter.get_relation(database=node.database, schema=node.schema, identifier=node.identifier) -%}
+        {%- set emitted_at = none -%}
+        {%- if relation is not none -%}
+            {%- set query -%}
+                select max({{ get_col_emitted_at() }}) from {{ relation }}
+            {%- endset -%}
+            {%- set latest = run_query(query).columns[0].values()[0] -%}
+            {%- if latest is not none -%}
+                {%- set emitted_at = latest | string -%}
+            {%- endif -%}
+        {%- endif -%}
+        {%- do raw_tables_emitted_at.update({node.source_name ~ '.' ~ node.name: emitted_at}) -%}
+    {%- endfor -%}
+    {%- do log('AIRBYTE_RAW_TABLES_EMITTED_AT=' ~ tojson(raw_tables_emitted_at), info=True) -%}
+{%- endmacro -%}
+
+{%- macro get_col_emitted_at() -%}
+  {{ adapter.dispatch('get_col_emitted_at')() }}
+{%- endmacro -%}
+
+{%- macro default__get_col_emitted_at() -%}
+    _airbyte_emitted_at
+{%- endmacro -%}
+
+{%- macro oracle__get_col_emitted_at() -%}
+    "_AIRBYTE_EMITTED_AT"
+{%- endmacro -%}
+
+{%- macro snowflake__get_col_emitted_at() -%}
+    _AIRBYTE_EMITTED_AT
+{%- endmacro -%}
@@ -24,6 +24,7 @@ function check_dbt_event_buffer_size() {
 }
 
 PROJECT_DIR=$(pwd)
+FINGERPRINTS_FILE="${NORMALIZATION_FINGERPRINTS_FILE}"
 
 # How many commits should be downloaded from git to view history of a branch
 GIT_HISTORY_DEPTH=5
@@ -80,6 +81,30 @@ function configuredbt() {
   fi
 }
 
+# When a fingerprints file is provided (NORMALIZATION_FINGERPRINTS_FILE), only the models of the streams whose raw tables changed
+# since they were last normalized are run: the latest _airbyte_emitted_at of every raw table is queried with dbt, compared to the
+# fingerprints recorded by the last successful run and the models of the changed streams are selected by the airbyte_changed_streams
+# selector. Every stream is normalized if they can't be selected.
+function selectchangedstreams() {
+  dbt_selector_args=""
+  echo "Running: dbt run-operation log_raw_tables_emitted_at --profiles-dir ${PROJECT_DIR} --project-dir ${PROJECT_DIR}"
+  dbt run-operation log_raw_tables_emitted_at --profiles-dir "${PROJECT_DIR}" --project-dir "${PROJECT_DIR}" > "${PROJECT_DIR}/raw_tables_emitted_at.log"
+  RUN_OPERATION_EXIT_CODE=$?
+  cat "${PROJECT_DIR}/raw_tables_emitted_at.log"
+  if [ ${RUN_OPERATION_EXIT_CODE} -ne 0 ]; then
+    echo -e "\nFailed to query raw tables (${RUN_OPERATION_EXIT_CODE}), normalizing every stream\n"
+    return
+  fi
+  echo "Running: select-changed-streams --integration-type ${INTEGRATION_TYPE} --profile-config-dir ${PROJECT_DIR} --catalog ${CATALOG_FILE} --json-column _airbyte_data --fingerprints ${FINGERPRINTS_FILE} --raw-tables-emitted-at ${PROJECT_DIR}/raw_tables_emitted_at.log"
+  select-changed-streams --integration-type "${INTEGRATION_TYPE}" --profile-config-dir "${PROJECT_DIR}" --catalog "${CATALOG_FILE}" --json-column "_airbyte_data" --fingerprints "${FINGERPRINTS_FILE}" --raw-tables-emitted-at "${PROJECT_DIR}/raw_tables_emitted_at.log"
+  SELECT_EXIT_CODE=$?
+  if [ ${SELECT_EXIT_CODE} -ne 0 ]; then
+    echo -e "\nFailed to select changed streams (${SELECT_EXIT_CODE}), normalizing every stream\n"
+    return
+  fi
+  dbt_selector_args="--selector airbyte_changed_streams"
+}
+
 ## todo: make it easy to select source or destination and validate based on selection by adding an integration type env variable.
 function main() {
   CMD="$1"
@@ -132,9 +157,18 @@ function main() {
       dbt_additional_args=""
     fi
 
+    dbt_selector_args=""
+    if [[ -n "${FINGERPRINTS_FILE}" && -z "${GIT_REPO}" && -n "${CATALOG_FILE}" ]]; then
+      selectchangedstreams
+    fi
+
     # Run dbt to compile and execute the generated normalization models
-    dbt ${dbt_additional_args} run --profiles-dir "${PROJECT_DIR}" --project-dir "${PROJECT_DIR}"
+    dbt ${dbt_additional_args} run ${dbt_selector_args} --profiles-dir "${PROJECT_DIR}" --project-dir "${PROJECT_DIR}"
     DBT_EXIT_CODE=$?
+    if [[ -n "${dbt_selector_args}" && ${DBT_EXIT_CODE} -eq 0 ]]; then
+      # the changed streams are normalized: record their fingerprints for the next run
+      mv "${FINGERPRINTS_FILE}.next" "${FINGERPRINTS_FILE}"
+    fi
     if [ ${DBT_EXIT_CODE} -ne 0 ]; then
       echo -e "\nDiagnosing dbt debug to check if destination is available for dbt and well configured (${DBT_EXIT_CODE}):\n"
       dbt debug --profiles-dir "${PROJECT_DIR}" --project-dir "${PROJECT_DIR}"
@@ -6,13 +6,15 @@
 import json
 import os
 import re
-from typing import Any, Dict, List, Set
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Set
 
 import yaml
 from airbyte_cdk.models.airbyte_protocol import DestinationSyncMode, SyncMode
 from normalization.destination_type import DestinationType
 from normalization.transform_catalog import dbt_macro
 from normalization.transform_catalog.destination_name_transformer import DestinationNameTransformer
+from normalization.transform_catalog.models_cache import ModelsCache, StreamModels
 from normalization.transform_catalog.stream_processor import StreamProcessor
 from normalization.transform_catalog.table_name_registry import TableNameRegistry
 
@@ -26,17 +28,28 @@ class CatalogProcessor:
     targeted destination schema.
 
     This is relying on a StreamProcessor to handle the conversion of a stream to a table one at a time.
+
+    Top-level streams, together with their nested streams, can be processed in parallel by a pool of processes: each process collects
+    the table names of a stream in its own TableNameRegistry, which are merged to resolve name collisions across the catalog, then
+    generates the models of the stream. Models are written in the same order as if the streams were processed one at a time.
     """
 
-    def __init__(self, output_directory: str, destination_type: DestinationType):
+    def __init__(
+        self, output_directory: str, destination_type: DestinationType, max_workers: int = 1, cache_directory: Optional[str] = None
+    ):
         """
         @param output_directory is the path to the directory where this processor should write the resulting SQL files (DBT models)
         @param destination_type is the destination type of warehouse
+        @param max_workers is the number of processes processing top-level streams in parallel, streams are processed in this process if 1
+        @param cache_directory is the path to the directory where the models generated for each stream are cached, to be reused by
+        the next runs as long as the stream does not change (see ModelsCache), nothing is cached if None
         """
         self.output_directory: str = output_directory
         self.destination_type: DestinationType = destination_type
         self.name_transformer: DestinationNameTransformer = DestinationNameTransformer(destination_type)
         self.models_to_source: Dict[str, str] = {}
+        self.max_workers: int = max_workers
+        self.models_cache: Optional[ModelsCache] = ModelsCache(cache_directory, destination_type) if cache_directory else None
 
     def process(self, catalog_file: str, json_column_name: str, default_schema: str):
         """
@@ -60,8 +73,15 @@ class CatalogProcessor:
             destination_type=self.destination_type,
             tables_registry=tables_registry,
         )
-        for stream_processor in stream_processors:
-            stream_processor.collect_table_names()
+        # streams are processed one at a time unless they are processed in parallel or cached
+        by_stream = self.max_workers > 1 or self.models_cache is not None
+        if not by_stream:
+            for stream_processor in stream_processors:
+                stream_processor.collect_table_names()
+        else:
+            stream_registries = self.collect_table_names(stream_processors)
+            for stream_registry in stream_registries:
+                tables_registry.merge(stream_registry)
         for conflict in tables_registry.resolve_names():
             print(
                 f"WARN: Resolving conflict: {conflict.schema}.{conflict.table_name_conflict} "
@@ -72,16 +92,76 @@ class CatalogProcessor:
             truncate = self.destination_type == DestinationType.MYSQL or self.destination_type == DestinationType.TIDB
             raw_table_name = self.name_transformer.normalize_table_name(f"_airbyte_raw_{stream_processor.stream_name}", truncate=truncate)
             add_table_to_sources(schema_to_source_tables, stream_processor.schema, raw_table_name)
+        if not by_stream:
+            for stream_processor in stream_processors:
+                nested_processors = stream_processor.process()
+                self.models_to_source.update(stream_processor.models_to_source)
 
-            nested_processors = stream_processor.process()
-            self.models_to_source.update(stream_processor.models_to_source)
+                if nested_processors and len(nested_processors) > 0:
+                    substreams += nested_processors
+                for file in stream_processor.sql_outputs:
+                    output_sql_file(os.path.join(self.output_directory, file), stream_processor.sql_outputs[file])
+            self.write_yaml_sources_file(schema_to_source_tables)
+            self.process_substreams(substreams, tables_registry)
+        else:
+            cache_keys = [
+                self.models_cache.get_key(stream_processor, tables_registry.get_resolved_names(stream_registry))
+                if self.models_cache
+                else None
+                for stream_processor, stream_registry in zip(stream_processors, stream_registries)
+            ]
+            self.output_stream_models(self.generate_stream_models(stream_processors, tables_registry, cache_keys))
+            self.write_yaml_sources_file(schema_to_source_tables)
+
+    def collect_table_names(self, stream_processors: List[StreamProcessor]) -> List[TableNameRegistry]:
+        """
+        Collect the table names of each top-level stream and its nested streams in a registry of their own
+        """
+        for stream_processor in stream_processors:
+            stream_processor.tables_registry = TableNameRegistry(self.destination_type)
+        if self.max_workers <= 1:
+            return [collect_stream_table_names(stream_processor) for stream_processor in stream_processors]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(collect_stream_table_names, stream_processors))
+
+    def generate_stream_models(
+        self, stream_processors: List[StreamProcessor], tables_registry: TableNameRegistry, cache_keys: List[Optional[str]]
+    ) -> List[StreamModels]:
+        """
+        Generate the models of each top-level stream and its nested streams, or get them from the cache if the stream did not change
+        """
+        result: List[Optional[StreamModels]] = [self.models_cache.get(key) if key else None for key in cache_keys]
+        missing = [index for index, stream_models in enumerate(result) if stream_models is None]
+        for stream_processor in stream_processors:
+            stream_processor.tables_registry = tables_registry
+        if self.max_workers <= 1 or len(missing) <= 1:
+            generated = [generate_stream_models(stream_processors[index]) for index in missing]
+        else:
+            for index in missing:
+                # the resolved registry is sent once to each process rather than with every stream
+                stream_processors[index].tables_registry = None
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=init_worker_tables_registry, initargs=(tables_registry,)
+            ) as executor:
+                generated = list(executor.map(generate_stream_models, [stream_processors[index] for index in missing]))
+            for index in missing:
+                stream_processors[index].tables_registry = tables_registry
+        for index, stream_models in zip(missing, generated):
+            result[index] = stream_models
+            if cache_keys[index]:
+                self.models_cache.put(cache_keys[index], stream_models)
+        return result
 
-            if nested_processors and len(nested_processors) > 0:
-                substreams += nested_processors
-            for file in stream_processor.sql_outputs:
-                output_sql_file(os.path.join(self.output_directory, file), stream_processor.sql_outputs[file])
-        self.write_yaml_sources_file(schema_to_source_tables)
-        self.process_substreams(substreams, tables_registry)
+    def output_stream_models(self, streams_models: List[StreamModels]):
+        """
+        Write the models of the streams, level of nesting by level of nesting as process() and process_substreams() do
+        """
+        for level in range(max([len(stream_models) for stream_models in streams_models], default=0)):
+            for stream_models in streams_models:
+                for sql_outputs, models_to_source in stream_models[level] if level < len(stream_models) else []:
+                    self.models_to_source.update(models_to_source)
+                    for file in sql_outputs:
+                        output_sql_file(os.path.join(self.output_directory, file), sql_outputs[file])
 
     @staticmethod
     def build_stream_processor(
@@ -203,8 +283,7 @@ class CatalogProcessor:
         output_dir = os.path.dirname(source_path)
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
-        with open(source_path, "w") as fh:
-            fh.write(yaml.dump(source_config, sort_keys=False))
+        output_file(source_path, yaml.dump(source_config, sort_keys=False))
 
 
 # Static Functions
@@ -281,11 +360,59 @@ def output_sql_file(file: str, sql: str):
     @param file is the path to filename to be written
     @param sql is the dbt sql content to be written in the generated model file
     """
+    output_file(file, "".join(line + "\n" for line in sql.splitlines() if line.strip()) + "\n")
+
+
+def output_file(file: str, content: str):
+    """
+    Write a file unless it already has this content: dbt partial parsing only parses again the files which changed since the
+    previous run, so files are not rewritten for nothing.
+    """
     output_dir = os.path.dirname(file)
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
+    if os.path.exists(file):
+        with open(file, "r") as f:
+            if f.read() == content:
+                return
     with open(file, "w") as f:
-        for line in sql.splitlines():
-            if line.strip():
-                f.write(line + "\n")
-        f.write("\n")
+        f.write(content)
+
+
+# Functions run by the processes processing streams in parallel
+
+_worker_tables_registry: Optional[TableNameRegistry] = None
+
+
+def init_worker_tables_registry(tables_registry: TableNameRegistry):
+    global _worker_tables_registry
+    _worker_tables_registry = tables_registry
+
+
+def collect_stream_table_names(stream_processor: StreamProcessor) -> TableNameRegistry:
+    """
+    Collect the table names of a top-level stream and its nested streams in the registry of the stream processor
+    """
+    stream_processor.collect_table_names()
+    return stream_processor.tables_registry
+
+
+def generate_stream_models(stream_processor: StreamProcessor) -> StreamModels:
+    """
+    Generate the models of a top-level stream and of its nested streams, breadth-first
+    """
+    if stream_processor.tables_registry is None:
+        stream_processor.tables_registry = _worker_tables_registry
+    result = []
+    processors = [stream_processor]
+    while processors:
+        level = []
+        children = []
+        for processor in processors:
+            nested_processors = processor.process()
+            if nested_processors:
+                children += nested_processors
+            level.append((processor.sql_outputs, processor.models_to_source))
+        result.append(level)
+        processors = children
+    return result
@@ -3,11 +3,14 @@
 #
 
 
+import functools
+import re
 import unicodedata as ud
-from re import match, sub
+from re import sub
+from typing import Any, Callable, Dict, FrozenSet, Tuple
 
 from normalization.destination_type import DestinationType
-from normalization.transform_catalog.reserved_keywords import is_reserved_keyword
+from normalization.transform_catalog.reserved_keywords import get_reserved_keywords
 from normalization.transform_catalog.utils import jinja_call
 
 DESTINATION_SIZE_LIMITS = {
@@ -37,6 +40,30 @@ TRUNCATE_DBT_RESERVED_SIZE = 12
 # we keep 4 characters for 1 underscore and 3 characters hash (of the schema)
 TRUNCATE_RESERVED_SIZE = 8
 
+DOESNT_START_WITH_ALPHAUNDERSCORE = re.compile("[^A-Za-z_]")
+CONTAINS_NON_ALPHANUMERIC = re.compile(".*[^A-Za-z0-9_].*")
+
+# Names normalized so far for each destination type, shared by all DestinationNameTransformer of this type: the same names are
+# normalized over and over by every stream processor of a catalog (and their nested streams)
+NORMALIZED_NAMES: Dict[DestinationType, Dict[Tuple, Any]] = {}
+
+
+def memoize(method: Callable) -> Callable:
+    """
+    Caches the results of a method of DestinationNameTransformer, which only depend on its arguments and the destination type
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(kwargs.items())) if kwargs else (method.__name__, args)
+        try:
+            return self.normalized_names[key]
+        except KeyError:
+            result = self.normalized_names[key] = method(self, *args, **kwargs)
+            return result
+
+    return wrapper
+
 
 class DestinationNameTransformer:
     """
@@ -51,23 +78,27 @@ class DestinationNameTransformer:
         @param destination_type is the destination type of warehouse
         """
         self.destination_type: DestinationType = destination_type
+        self.reserved_keywords: FrozenSet[str] = get_reserved_keywords(destination_type)
+        self.normalized_names: Dict[Tuple, Any] = NORMALIZED_NAMES.setdefault(destination_type, {})
 
     # Public methods
 
+    @memoize
     def needs_quotes(self, input_name: str) -> bool:
         """
         @param input_name to test if it needs to manipulated with quotes or not
         """
-        if is_reserved_keyword(input_name, self.destination_type):
+        if input_name.upper() in self.reserved_keywords:
             return True
         if self.destination_type.value == DestinationType.BIGQUERY.value:
             return False
         if self.destination_type.value == DestinationType.ORACLE.value and input_name.startswith("_"):
             return True
-        doesnt_start_with_alphaunderscore = match("[^A-Za-z_]", input_name[0]) is not None
-        contains_non_alphanumeric = match(".*[^A-Za-z0-9_].*", input_name) is not None
+        doesnt_start_with_alphaunderscore = DOESNT_START_WITH_ALPHAUNDERSCORE.match(input_name[0]) is not None
+        contains_non_alphanumeric = CONTAINS_NON_ALPHANUMERIC.match(input_name) is not None
         return doesnt_start_with_alphaunderscore or contains_non_alphanumeric
 
+    @memoize
     def normalize_schema_name(self, schema_name: str, in_jinja: bool = False, truncate: bool = True) -> str:
         """
         @param schema_name is the schema to normalize
@@ -79,6 +110,7 @@ class DestinationNameTransformer:
             schema_name = schema_name[1:]
         return self.__normalize_non_column_identifier_name(input_name=schema_name, in_jinja=in_jinja, truncate=truncate)
 
+    @memoize
     def normalize_table_name(
         self, table_name: str, in_jinja: bool = False, truncate: bool = True, conflict: bool = False, conflict_level: int = 0
     ) -> str:
@@ -96,6 +128,7 @@ class DestinationNameTransformer:
             input_name=table_name, in_jinja=in_jinja, truncate=truncate, conflict=conflict, conflict_level=conflict_level
         )
 
+    @memoize
     def normalize_column_name(
         self, column_name: str, in_jinja: bool = False, truncate: bool = True, conflict: bool = False, conflict_level: int = 0
     ) -> str:
@@ -205,7 +238,7 @@ class DestinationNameTransformer:
             # Can start with number: datasetId, table
             # Can not start with number: column
             result = transform_standard_naming(result)
-            doesnt_start_with_alphaunderscore = match("[^A-Za-z_]", result[0]) is not None
+            doesnt_start_with_alphaunderscore = DOESNT_START_WITH_ALPHAUNDERSCORE.match(result[0]) is not None
             if is_column and doesnt_start_with_alphaunderscore:
                 result = f"_{result}"
         return result
@@ -243,6 +276,7 @@ class DestinationNameTransformer:
             raise KeyError(f"Unknown destination type {self.destination_type}")
         return result
 
+    @memoize
     def normalize_column_identifier_case_for_lookup(self, input_name: str, is_quoted: bool = False) -> str:
         """
         This function adds an additional normalization regarding the column name casing to determine if multiple columns
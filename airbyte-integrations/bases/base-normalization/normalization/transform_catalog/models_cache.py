@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from normalization.destination_type import DestinationType
+from normalization.transform_catalog.stream_processor import StreamProcessor
+
+# dbt models generated by one StreamProcessor: (sql_outputs, models_to_source)
+ProcessorModels = Tuple[Dict[str, str], Dict[str, str]]
+# dbt models generated for a top-level stream and its nested streams, one list of processors per nesting level (breadth-first)
+StreamModels = List[List[ProcessorModels]]
+
+
+def generator_fingerprint() -> str:
+    """
+    Hash of the code of the transform_catalog package, so that models cached by another version of normalization are never reused
+    """
+    digest = hashlib.sha256()
+    package_directory = os.path.dirname(os.path.abspath(__file__))
+    for file_name in sorted(os.listdir(package_directory)):
+        if file_name.endswith(".py"):
+            with open(os.path.join(package_directory, file_name), "rb") as file:
+                digest.update(file.read())
+    return digest.hexdigest()
+
+
+def get_stream_definition(stream_processor: StreamProcessor) -> Dict[str, Any]:
+    """
+    Everything the models of a top-level stream and its nested streams are generated from, apart from the names resolved for them
+    """
+    return {
+        "stream_name": stream_processor.stream_name,
+        "raw_schema": stream_processor.raw_schema,
+        "default_schema": stream_processor.default_schema,
+        "schema": stream_processor.schema,
+        "source_sync_mode": stream_processor.source_sync_mode.value,
+        "destination_sync_mode": stream_processor.destination_sync_mode.value,
+        "cursor_field": stream_processor.cursor_field,
+        "primary_key": stream_processor.primary_key,
+        "json_column_name": stream_processor.json_column_name,
+        "properties": stream_processor.properties,
+        "from_table": str(stream_processor.from_table),
+    }
+
+
+def get_stream_hash(
+    fingerprint: str, destination_type: DestinationType, stream_processor: StreamProcessor, resolved_names: List[Any]
+) -> str:
+    """
+    @param fingerprint is the fingerprint of the code of normalization (see generator_fingerprint)
+    @param destination_type is the destination type of warehouse
+    @param stream_processor is the processor of a top-level stream
+    @param resolved_names are the names resolved by the TableNameRegistry for the stream and its nested streams
+    @return the hash of everything the models of the stream and its nested streams are generated from
+    """
+    content = {
+        "fingerprint": fingerprint,
+        "destination_type": destination_type.value,
+        **get_stream_definition(stream_processor),
+        "resolved_names": resolved_names,
+    }
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ModelsCache:
+    """
+    Content-addressed cache of the dbt models generated for each top-level stream and its nested streams.
+
+    A stream is cached under a hash of everything its models are generated from: its configuration and json schema, the destination
+    type, the table and file names resolved for it and its nested streams (which depend on the other streams of the catalog when
+    names collide) and the code of normalization itself. The models of streams which did not change since a previous run are then
+    reused instead of being generated again.
+    """
+
+    def __init__(self, cache_directory: str, destination_type: DestinationType):
+        """
+        @param cache_directory is the path to the directory where the cached models are stored, created if needed
+        @param destination_type is the destination type of warehouse
+        """
+        self.cache_directory: str = cache_directory
+        self.destination_type: DestinationType = destination_type
+        self.fingerprint: str = generator_fingerprint()
+
+    def get_key(self, stream_processor: StreamProcessor, resolved_names: List[Any]) -> str:
+        """
+        @param stream_processor is the processor of a top-level stream
+        @param resolved_names are the names resolved by the TableNameRegistry for the stream and its nested streams
+        """
+        return get_stream_hash(self.fingerprint, self.destination_type, stream_processor, resolved_names)
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.cache_directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[StreamModels]:
+        """
+        @return the models cached under this key, None if there are none or if they can't be read
+        """
+        try:
+            with open(self.get_path(key), "r") as file:
+                levels = json.load(file)["levels"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"WARN: Ignoring cached models {self.get_path(key)} which can't be read: {e!r}")
+            return None
+        return [[(processor["sql_outputs"], processor["models_to_source"]) for processor in level] for level in levels]
+
+    def put(self, key: str, stream_models: StreamModels):
+        """
+        Stores the models of a stream, the cache is only used to save time so failing to write it is reported and ignored
+        """
+        levels = [
+            [{"sql_outputs": sql_outputs, "models_to_source": models_to_source} for sql_outputs, models_to_source in level]
+            for level in stream_models
+        ]
+        try:
+            if not os.path.exists(self.cache_directory):
+                os.makedirs(self.cache_directory, exist_ok=True)
+            # write then rename so that a concurrent run never reads a partially written file
+            with tempfile.NamedTemporaryFile("w", dir=self.cache_directory, suffix=".tmp", delete=False) as file:
+                json.dump({"levels": levels}, file)
+            os.replace(file.name, self.get_path(key))
+        except OSError as e:
+            print(f"WARN: Failed to cache models in {self.cache_directory}: {e!r}")
@@ -3,7 +3,7 @@
 #
 
 
-from typing import Set
+from typing import Dict, FrozenSet, Set
 
 from normalization import DestinationType
 
@@ -3111,18 +3111,23 @@ TIDB = {
     "ZEROFILL",
 }
 
-RESERVED_KEYWORDS = {
-    DestinationType.BIGQUERY.value: BIGQUERY,
-    DestinationType.POSTGRES.value: POSTGRES,
-    DestinationType.REDSHIFT.value: REDSHIFT,
-    DestinationType.SNOWFLAKE.value: SNOWFLAKE,
-    DestinationType.MYSQL.value: MYSQL,
-    DestinationType.ORACLE.value: ORACLE,
-    DestinationType.MSSQL.value: MSSQL,
-    DestinationType.CLICKHOUSE.value: CLICKHOUSE,
-    DestinationType.TIDB.value: TIDB,
+# upper case keywords of each destination type, indexed in frozensets
+RESERVED_KEYWORDS: Dict[DestinationType, FrozenSet[str]] = {
+    DestinationType.BIGQUERY: frozenset(BIGQUERY),
+    DestinationType.POSTGRES: frozenset(POSTGRES),
+    DestinationType.REDSHIFT: frozenset(REDSHIFT),
+    DestinationType.SNOWFLAKE: frozenset(SNOWFLAKE),
+    DestinationType.MYSQL: frozenset(MYSQL),
+    DestinationType.ORACLE: frozenset(ORACLE),
+    DestinationType.MSSQL: frozenset(MSSQL),
+    DestinationType.CLICKHOUSE: frozenset(CLICKHOUSE),
+    DestinationType.TIDB: frozenset(TIDB),
 }
 
 
+def get_reserved_keywords(integration_type: DestinationType) -> FrozenSet[str]:
+    return RESERVED_KEYWORDS[integration_type]
+
+
 def is_reserved_keyword(token: str, integration_type: DestinationType) -> bool:
-    return token.upper() in RESERVED_KEYWORDS[integration_type.value]
+    return token.upper() in RESERVED_KEYWORDS[integration_type]
@@ -0,0 +1,223 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+
+import argparse
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional
+
+import yaml
+from normalization.destination_type import DestinationType
+from normalization.transform_catalog.catalog_processor import CatalogProcessor, collect_stream_table_names, read_json
+from normalization.transform_catalog.destination_name_transformer import DestinationNameTransformer
+from normalization.transform_catalog.models_cache import generator_fingerprint, get_stream_hash
+from normalization.transform_catalog.table_name_registry import TableNameRegistry
+from normalization.transform_catalog.transform import extract_schema, read_profiles_yml
+
+# name of the dbt selector of the models of the streams to normalize
+SELECTOR_NAME = "airbyte_changed_streams"
+# prefix of the line logged by the log_raw_tables_emitted_at macro
+RAW_TABLES_EMITTED_AT_MARKER = "AIRBYTE_RAW_TABLES_EMITTED_AT="
+
+# fingerprint of a stream: {"schema_hash": ..., "emitted_at": ...}, keyed by the dbt source of its raw table ('schema.table')
+Fingerprints = Dict[str, Dict[str, Optional[str]]]
+
+
+class StreamFingerprints:
+    """
+    Fingerprints of the streams normalized by a previous run: the hash of everything the models of a stream are generated from and
+    the latest _airbyte_emitted_at of its raw table at the time it was normalized.
+
+    The models of a stream only have to run again if its schema changed or if records were written to its raw table since.
+    """
+
+    VERSION = 1
+
+    def __init__(self, streams: Optional[Fingerprints] = None):
+        self.streams: Fingerprints = streams or {}
+
+    @staticmethod
+    def load(path: str) -> "StreamFingerprints":
+        """
+        @return the fingerprints stored in the file, none if the file does not exist or can't be read (every stream is then normalized)
+        """
+        try:
+            with open(path, "r") as file:
+                content = json.load(file)
+            if content.get("version") == StreamFingerprints.VERSION:
+                return StreamFingerprints(content["streams"])
+            print(f"WARN: Ignoring fingerprints {path} written by another version of normalization")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            print(f"WARN: Ignoring fingerprints {path} which can't be read: {e!r}")
+        return StreamFingerprints()
+
+    def save(self, path: str):
+        output_dir = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        # write then rename so that fingerprints are never partially written
+        with tempfile.NamedTemporaryFile("w", dir=output_dir, suffix=".tmp", delete=False) as file:
+            json.dump({"version": self.VERSION, "streams": self.streams}, file, indent=2, sort_keys=True)
+        os.replace(file.name, path)
+
+    def is_changed(self, source: str, schema_hash: str, emitted_at: Optional[str]) -> bool:
+        """
+        @param source is the dbt source of the raw table of the stream
+        @param schema_hash is the hash of the current definition of the stream
+        @param emitted_at is the latest _airbyte_emitted_at of the raw table, None if it is unknown or the raw table is empty
+        """
+        fingerprint = self.streams.get(source)
+        if not fingerprint or emitted_at is None:
+            return True
+        return fingerprint.get("schema_hash") != schema_hash or fingerprint.get("emitted_at") != emitted_at
+
+
+class SelectChangedStreams:
+    """
+To run this selection, after `dbt run-operation log_raw_tables_emitted_at > raw_tables_emitted_at.log`:
+```
+python3 main_dev_select_changed_streams.py \
+  --integration-type <postgres|bigquery|redshift|snowflake>
+  --profile-config-dir . \
+  --catalog integration_tests/catalog.json \
+  --json-column json_blob \
+  --fingerprints /data/normalization_fingerprints.json \
+  --raw-tables-emitted-at raw_tables_emitted_at.log
+```
+It writes the `airbyte_changed_streams` selector to the selectors.yml of the dbt project, to be run with
+`dbt run --selector airbyte_changed_streams`, and the fingerprints of the streams once normalized next to the fingerprints file
+(with a .next suffix), to replace it once dbt succeeded.
+    """
+
+    config: dict = {}
+    SELECTORS = "selectors.yml"
+    NEXT_SUFFIX = ".next"
+
+    def __init__(self):
+        self.config = {}
+
+    def run(self, args) -> None:
+        self.parse(args)
+        self.select_changed_streams()
+
+    def parse(self, args) -> None:
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument("--integration-type", type=str, required=True, help="type of integration dialect to use")
+        parser.add_argument("--profile-config-dir", type=str, required=True, help="path to directory containing DBT profiles.yml")
+        parser.add_argument("--catalog", nargs="+", type=str, required=True, help="path to Catalog (JSON Schema) file")
+        parser.add_argument("--json-column", type=str, required=True, help="name of the column containing the json blob")
+        parser.add_argument("--fingerprints", type=str, required=True, help="path to the fingerprints of the last normalized streams")
+        parser.add_argument(
+            "--raw-tables-emitted-at", type=str, required=True, help="path to the output of dbt run-operation log_raw_tables_emitted_at"
+        )
+        parsed_args = parser.parse_args(args)
+        profiles_yml = read_profiles_yml(parsed_args.profile_config_dir)
+        self.config = {
+            "integration_type": parsed_args.integration_type,
+            "schema": extract_schema(profiles_yml),
+            "catalog": parsed_args.catalog,
+            "json_column": parsed_args.json_column,
+            "profile_config_dir": parsed_args.profile_config_dir,
+            "fingerprints": parsed_args.fingerprints,
+            "raw_tables_emitted_at": parsed_args.raw_tables_emitted_at,
+        }
+
+    def select_changed_streams(self) -> None:
+        destination_type = DestinationType.from_string(self.config["integration_type"])
+        schema_hashes = get_schema_hashes(destination_type, self.config["catalog"], self.config["json_column"], self.config["schema"])
+        with open(self.config["raw_tables_emitted_at"], "r") as file:
+            raw_tables_emitted_at = parse_raw_tables_emitted_at(file.read())
+        if raw_tables_emitted_at is None:
+            print(f"WARN: No {RAW_TABLES_EMITTED_AT_MARKER} found in {self.config['raw_tables_emitted_at']}, normalizing every stream")
+            raw_tables_emitted_at = {}
+        previous_fingerprints = StreamFingerprints.load(self.config["fingerprints"])
+        next_fingerprints = StreamFingerprints()
+        changed_sources = []
+        for source, schema_hash in schema_hashes.items():
+            emitted_at = raw_tables_emitted_at.get(source)
+            if previous_fingerprints.is_changed(source, schema_hash, emitted_at):
+                changed_sources.append(source)
+            next_fingerprints.streams[source] = {"schema_hash": schema_hash, "emitted_at": emitted_at}
+        print(f"Normalizing {len(changed_sources)} out of {len(schema_hashes)} streams: {', '.join(changed_sources)}")
+        write_selectors_file(os.path.join(self.config["profile_config_dir"], self.SELECTORS), changed_sources)
+        next_fingerprints.save(self.config["fingerprints"] + self.NEXT_SUFFIX)
+
+
+def get_schema_hashes(
+    destination_type: DestinationType, catalog_files: List[str], json_column_name: str, default_schema: str
+) -> Dict[str, str]:
+    """
+    @return the hash of the definition of each top-level stream of the catalogs, keyed by the dbt source of its raw table
+
+    The names of the tables of a stream depend on the other streams of its catalog when they collide, so they are resolved as
+    CatalogProcessor does and hashed with the definition of the stream: a new stream renaming the models of another one changes
+    the hash of both.
+    """
+    name_transformer = DestinationNameTransformer(destination_type)
+    fingerprint = generator_fingerprint()
+    schema_hashes = {}
+    for catalog_file in catalog_files:
+        tables_registry = TableNameRegistry(destination_type)
+        stream_processors = CatalogProcessor.build_stream_processor(
+            catalog=read_json(catalog_file),
+            json_column_name=json_column_name,
+            default_schema=default_schema,
+            name_transformer=name_transformer,
+            destination_type=destination_type,
+            tables_registry=tables_registry,
+        )
+        stream_registries = []
+        for stream_processor in stream_processors:
+            stream_processor.tables_registry = TableNameRegistry(destination_type)
+            stream_registries.append(collect_stream_table_names(stream_processor))
+            tables_registry.merge(stream_registries[-1])
+        tables_registry.resolve_names()
+        for stream_processor, stream_registry in zip(stream_processors, stream_registries):
+            resolved_names = tables_registry.get_resolved_names(stream_registry)
+            schema_hashes[stream_processor.get_stream_source()] = get_stream_hash(
+                fingerprint, destination_type, stream_processor, resolved_names
+            )
+    return schema_hashes
+
+
+def parse_raw_tables_emitted_at(output: str) -> Optional[Dict[str, Optional[str]]]:
+    """
+    @param output is the output of dbt run-operation log_raw_tables_emitted_at
+    @return the latest _airbyte_emitted_at of each raw table, keyed by its dbt source, None if it was not logged
+    """
+    for line in reversed(output.splitlines()):
+        if RAW_TABLES_EMITTED_AT_MARKER in line:
+            return json.loads(line[line.index(RAW_TABLES_EMITTED_AT_MARKER) + len(RAW_TABLES_EMITTED_AT_MARKER) :])
+    return None
+
+
+def write_selectors_file(selectors_path: str, changed_sources: List[str]):
+    """
+    Generate the selectors.yml file as described in https://docs.getdbt.com/reference/node-selection/yaml-selectors
+    selecting the models built from the raw tables of the changed streams, including the models of their nested streams.
+    """
+    if changed_sources:
+        definition = {"union": [{"method": "source", "value": source, "children": True} for source in sorted(changed_sources)]}
+    else:
+        # dbt does not accept empty selectors: select a tag none of the models has instead
+        definition = {"method": "tag", "value": f"{SELECTOR_NAME}_none"}
+    selectors = {
+        "selectors": [
+            {
+                "name": SELECTOR_NAME,
+                "description": "models of the streams whose raw tables changed since they were last normalized",
+                "definition": definition,
+            }
+        ]
+    }
+    with open(selectors_path, "w") as file:
+        file.write(yaml.dump(selectors, sort_keys=False))
+
+
+def main(args=None):
+    SelectChangedStreams().run(args)
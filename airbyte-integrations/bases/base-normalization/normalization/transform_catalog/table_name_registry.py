@@ -147,6 +147,32 @@ class TableNameRegistry:
         table_name = self.get_simple_table_name(json_path)
         self.simple_table_registry.add(intermediate_schema, schema, json_path, stream_name, table_name)
 
+    def merge(self, other: "TableNameRegistry"):
+        """
+        Record the names collected by another registry, for example by the registry of a single stream collected in another process.
+
+        Registries should be merged in the order of their streams in the catalog, so that names are resolved as if they were
+        all collected by this registry.
+        """
+        for key, values in other.simple_table_registry.items():
+            if key not in self.simple_table_registry:
+                self.simple_table_registry[key] = []
+            self.simple_table_registry[key].extend(values)
+
+    def get_resolved_names(self, other: "TableNameRegistry") -> List[List[str]]:
+        """
+        Return the names resolved by this registry for the names collected by another registry merged into it (registry key, schema,
+        table name and file name)
+        """
+        result = []
+        for key in other.simple_table_registry:
+            for value in other.simple_table_registry[key]:
+                for schema in [value.intermediate_schema, value.schema]:
+                    registry_key = self.get_registry_key(schema, value.json_path, value.stream_name)
+                    resolved = self.registry[registry_key]
+                    result.append([registry_key, resolved.schema, resolved.table_name, resolved.file_name])
+        return result
+
     def get_simple_table_name(self, json_path: List[str]) -> str:
         """
         Generates a simple table name, possibly in collisions within this catalog because of truncation
@@ -168,9 +194,11 @@ class TableNameRegistry:
         table_count = 0
 
         for key in self.simple_table_registry:
+            # names are bucketed by their normalized schema and table name, collisions are found within a bucket only
+            has_collisions = self.simple_table_registry.has_collisions(key)
             for value in self.simple_table_registry[key]:
                 table_count += 1
-                if self.simple_table_registry.has_collisions(key):
+                if has_collisions:
                     # handle collisions with unique hashed names
                     table_name = self.get_hashed_table_name(value.schema, value.json_path, value.stream_name, value.table_name)
                     resolved_keys.append(ConflictedNameMetadata(value.schema, value.json_path, value.table_name, table_name))
@@ -200,9 +228,10 @@ class TableNameRegistry:
         # deal with file name collisions across schemas and update the file name to use in the registry when necessary
         file_count = 0
         for key in self.simple_file_registry:
+            has_collisions = self.simple_file_registry.has_collisions(key)
             for value in self.simple_file_registry[key]:
                 file_count += 1
-                if self.simple_file_registry.has_collisions(key):
+                if has_collisions:
                     # handle collisions with unique hashed names including schema
                     self.registry[
                         self.get_registry_key(value.intermediate_schema, value.json_path, value.stream_name)
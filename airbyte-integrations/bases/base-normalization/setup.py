@@ -19,6 +19,7 @@ setuptools.setup(
         "console_scripts": [
             "transform-config=normalization.transform_config.transform:main",
             "transform-catalog=normalization.transform_catalog.transform:main",
+            "select-changed-streams=normalization.transform_catalog.stream_fingerprints:main",
         ],
     },
     extras_require={
@@ -0,0 +1,89 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+
+import json
+import os
+from typing import Dict, Tuple
+
+import pytest
+from normalization.destination_type import DestinationType
+from normalization.transform_catalog.catalog_processor import CatalogProcessor
+from normalization.transform_catalog.stream_processor import StreamProcessor
+
+
+@pytest.fixture(scope="function", autouse=True)
+def before_tests(request):
+    # This makes the test run whether it is executed from the tests folder (with pytest/gradle)
+    # or from the base-normalization folder (through pycharm)
+    unit_tests_dir = os.path.join(request.fspath.dirname, "unit_tests")
+    if os.path.exists(unit_tests_dir):
+        os.chdir(unit_tests_dir)
+    else:
+        os.chdir(request.fspath.dirname)
+    yield
+    os.chdir(request.config.invocation_dir)
+
+
+def process_catalog(catalog_file: str, output_directory: str, **kwargs) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    @return the models_to_source of the processor and the content of the files it wrote
+    """
+    processor = CatalogProcessor(output_directory=output_directory, destination_type=DestinationType.POSTGRES, **kwargs)
+    processor.process(catalog_file=catalog_file, json_column_name="'json_column_name_test'", default_schema="schema_test")
+    files = {}
+    for root, _, file_names in os.walk(output_directory):
+        for file_name in file_names:
+            with open(os.path.join(root, file_name), "r") as file:
+                files[os.path.relpath(os.path.join(root, file_name), output_directory)] = file.read()
+    return processor.models_to_source, files
+
+
+@pytest.mark.parametrize(
+    "catalog_file",
+    [
+        "resources/un-nesting_collisions_catalog.json",
+        "resources/long_name_truncate_collisions_catalog.json",
+    ],
+)
+@pytest.mark.parametrize("max_workers, cached", [(2, False), (1, True), (2, True)])
+def test_process_by_stream_generates_the_same_models(tmp_path, catalog_file: str, max_workers: int, cached: bool):
+    cache_directory = str(tmp_path / "cache") if cached else None
+    expected_models_to_source, expected_files = process_catalog(catalog_file, str(tmp_path / "expected"))
+
+    models_to_source, files = process_catalog(catalog_file, str(tmp_path / "output"), max_workers=max_workers, cache_directory=cache_directory)
+
+    assert list(models_to_source.items()) == list(expected_models_to_source.items())
+    assert files == expected_files
+
+
+def test_cached_streams_are_not_generated_again(tmp_path, mocker):
+    cache_directory = str(tmp_path / "cache")
+    with open("resources/un-nesting_collisions_catalog.json", "r") as file:
+        catalog = json.load(file)
+    catalog_file = str(tmp_path / "catalog.json")
+    with open(catalog_file, "w") as file:
+        json.dump(catalog, file)
+    _, expected_files = process_catalog(catalog_file, str(tmp_path / "output"), cache_directory=cache_directory)
+    sql_files = [os.path.join(tmp_path, "output", file) for file in expected_files if file.endswith(".sql")]
+    for file in sql_files:
+        os.utime(file, ns=(0, 0))
+
+    process = mocker.patch.object(StreamProcessor, "process", side_effect=RuntimeError("stream processed again"))
+    _, files = process_catalog(catalog_file, str(tmp_path / "output"), cache_directory=cache_directory)
+
+    process.assert_not_called()
+    assert files == expected_files
+    # unchanged models are not written again
+    assert all(os.stat(file).st_mtime_ns == 0 for file in sql_files)
+
+    # only the stream whose schema changed is generated again
+    mocker.stopall()
+    catalog["streams"][0]["stream"]["json_schema"]["properties"]["new_column"] = {"type": ["null", "string"]}
+    with open(catalog_file, "w") as file:
+        json.dump(catalog, file)
+    process = mocker.patch.object(StreamProcessor, "process", autospec=True, side_effect=StreamProcessor.process)
+    process_catalog(catalog_file, str(tmp_path / "output"), cache_directory=cache_directory)
+    processed_streams = {call.args[0].stream_name for call in process.call_args_list if call.args[0].parent is None}
+    assert processed_streams == {catalog["streams"][0]["stream"]["name"]}
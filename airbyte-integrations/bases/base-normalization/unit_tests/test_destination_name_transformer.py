@@ -235,3 +235,20 @@ def test_normalize_name(input_str: str, destination_type: str, expected: str, ex
     assert DestinationNameTransformer(t).normalize_schema_name(input_str) == expected
     assert DestinationNameTransformer(t).normalize_table_name(input_str) == expected
     assert DestinationNameTransformer(t).normalize_column_name(input_str) == expected_column
+
+
+def test_normalized_names_are_memoized_per_destination_type(mocker):
+    postgres_name = DestinationNameTransformer(DestinationType.POSTGRES).normalize_table_name("Memoized Name", truncate=False)
+    snowflake_name = DestinationNameTransformer(DestinationType.SNOWFLAKE).normalize_table_name("Memoized Name", truncate=False)
+    standard_naming = mocker.patch(
+        "normalization.transform_catalog.destination_name_transformer.transform_standard_naming", side_effect=transform_standard_naming
+    )
+
+    # another transformer of the same destination type reuses the normalized name
+    assert DestinationNameTransformer(DestinationType.POSTGRES).normalize_table_name("Memoized Name", truncate=False) == postgres_name
+    assert DestinationNameTransformer(DestinationType.SNOWFLAKE).normalize_table_name("Memoized Name", truncate=False) == snowflake_name
+    standard_naming.assert_not_called()
+    # names normalized with other arguments are not
+    assert DestinationNameTransformer(DestinationType.POSTGRES).normalize_table_name("Memoized Name") == postgres_name
+    standard_naming.assert_called_once()
+    assert postgres_name != snowflake_name
@@ -0,0 +1,166 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+
+import json
+import os
+import shutil
+
+import pytest
+import yaml
+from normalization.destination_type import DestinationType
+from normalization.transform_catalog.stream_fingerprints import (
+    SELECTOR_NAME,
+    SelectChangedStreams,
+    StreamFingerprints,
+    get_schema_hashes,
+    parse_raw_tables_emitted_at,
+)
+
+CATALOG = "resources/un-nesting_collisions_catalog.json"
+
+
+@pytest.fixture(scope="function", autouse=True)
+def before_tests(request):
+    # This makes the test run whether it is executed from the tests folder (with pytest/gradle)
+    # or from the base-normalization folder (through pycharm)
+    unit_tests_dir = os.path.join(request.fspath.dirname, "unit_tests")
+    if os.path.exists(unit_tests_dir):
+        os.chdir(unit_tests_dir)
+    else:
+        os.chdir(request.fspath.dirname)
+    yield
+    os.chdir(request.config.invocation_dir)
+
+
+def select_changed_streams(project_dir: str, catalog_file: str, raw_tables_emitted_at: dict):
+    """
+    @return the definition of the selector written to the dbt project
+    """
+    with open(os.path.join(project_dir, "raw_tables_emitted_at.log"), "w") as file:
+        file.write("Running with dbt=1.0.0\n")
+        file.write(f"12:00:00  AIRBYTE_RAW_TABLES_EMITTED_AT={json.dumps(raw_tables_emitted_at)}\n")
+    SelectChangedStreams().run(
+        [
+            "--integration-type",
+            "postgres",
+            "--profile-config-dir",
+            project_dir,
+            "--catalog",
+            catalog_file,
+            "--json-column",
+            "_airbyte_data",
+            "--fingerprints",
+            os.path.join(project_dir, "fingerprints.json"),
+            "--raw-tables-emitted-at",
+            os.path.join(project_dir, "raw_tables_emitted_at.log"),
+        ]
+    )
+    with open(os.path.join(project_dir, "selectors.yml"), "r") as file:
+        selectors = yaml.safe_load(file)["selectors"]
+    assert [selector["name"] for selector in selectors] == [SELECTOR_NAME]
+    return selectors[0]["definition"]
+
+
+def selected_sources(definition: dict):
+    return {method["value"] for method in definition.get("union", [])}
+
+
+def commit_fingerprints(project_dir: str):
+    # as entrypoint.sh does once dbt succeeded
+    os.replace(os.path.join(project_dir, "fingerprints.json.next"), os.path.join(project_dir, "fingerprints.json"))
+
+
+def test_select_changed_streams(tmp_path):
+    project_dir = str(tmp_path)
+    with open(os.path.join(project_dir, "profiles.yml"), "w") as file:
+        yaml.dump({"normalize": {"outputs": {"prod": {"schema": "schema_test"}}}}, file)
+    catalog_file = os.path.join(project_dir, "catalog.json")
+    shutil.copy(CATALOG, catalog_file)
+    sources = list(get_schema_hashes(DestinationType.POSTGRES, [catalog_file], "_airbyte_data", "schema_test"))
+    assert len(sources) > 1
+    emitted_at = {source: "2022-01-01 00:00:00+00:00" for source in sources}
+
+    # every stream is normalized by the first run
+    definition = select_changed_streams(project_dir, catalog_file, emitted_at)
+    assert selected_sources(definition) == set(sources)
+    assert all(method["method"] == "source" and method["children"] for method in definition["union"])
+
+    # nothing is selected until the fingerprints of the normalized streams are committed
+    assert selected_sources(select_changed_streams(project_dir, catalog_file, emitted_at)) == set(sources)
+    commit_fingerprints(project_dir)
+    definition = select_changed_streams(project_dir, catalog_file, emitted_at)
+    assert selected_sources(definition) == set()
+    assert definition["method"] == "tag"
+
+    # new records in a raw table
+    emitted_at[sources[0]] = "2022-01-02 00:00:00+00:00"
+    assert selected_sources(select_changed_streams(project_dir, catalog_file, emitted_at)) == {sources[0]}
+    commit_fingerprints(project_dir)
+
+    # schema change
+    with open(catalog_file, "r") as file:
+        catalog = json.load(file)
+    catalog["streams"][1]["stream"]["json_schema"]["properties"]["new_column"] = {"type": ["null", "string"]}
+    with open(catalog_file, "w") as file:
+        json.dump(catalog, file)
+    assert selected_sources(select_changed_streams(project_dir, catalog_file, emitted_at)) == {sources[1]}
+    commit_fingerprints(project_dir)
+
+    # raw tables which are empty or could not be queried
+    del emitted_at[sources[0]]
+    assert selected_sources(select_changed_streams(project_dir, catalog_file, emitted_at)) == {sources[0]}
+
+
+def test_colliding_new_stream_selects_renamed_stream(tmp_path):
+    project_dir = str(tmp_path)
+    with open(os.path.join(project_dir, "profiles.yml"), "w") as file:
+        yaml.dump({"normalize": {"outputs": {"prod": {"schema": "schema_test"}}}}, file)
+    catalog_file = os.path.join(project_dir, "catalog.json")
+    with open(CATALOG, "r") as file:
+        catalog = json.load(file)
+    untouched_stream = catalog["streams"][0]
+    untouched_stream["stream"]["name"] = "a" * 35 + "X" + "a" * 35
+    catalog["streams"] = [untouched_stream]
+    with open(catalog_file, "w") as file:
+        json.dump(catalog, file)
+    sources = list(get_schema_hashes(DestinationType.POSTGRES, [catalog_file], "_airbyte_data", "schema_test"))
+    emitted_at = {source: "2022-01-01 00:00:00+00:00" for source in sources}
+    select_changed_streams(project_dir, catalog_file, emitted_at)
+    commit_fingerprints(project_dir)
+    assert selected_sources(select_changed_streams(project_dir, catalog_file, emitted_at)) == set()
+    commit_fingerprints(project_dir)
+
+    # the truncated table names of the new stream collide with the ones of the untouched stream, whose models are renamed
+    new_stream = json.loads(json.dumps(untouched_stream))
+    new_stream["stream"]["name"] = "a" * 35 + "Y" + "a" * 35
+    catalog["streams"] = [new_stream, untouched_stream]
+    with open(catalog_file, "w") as file:
+        json.dump(catalog, file)
+    new_sources = list(get_schema_hashes(DestinationType.POSTGRES, [catalog_file], "_airbyte_data", "schema_test"))
+    assert set(sources) < set(new_sources)
+    emitted_at.update({source: "2022-01-01 00:00:00+00:00" for source in new_sources})
+    assert selected_sources(select_changed_streams(project_dir, catalog_file, emitted_at)) == set(new_sources)
+
+
+def test_unreadable_fingerprints_select_every_stream(tmp_path):
+    path = str(tmp_path / "fingerprints.json")
+    with open(path, "w") as file:
+        file.write("{not json")
+    assert StreamFingerprints.load(path).is_changed("schema.table", "hash", "2022-01-01")
+
+    StreamFingerprints({"schema.table": {"schema_hash": "hash", "emitted_at": "2022-01-01"}}).save(path)
+    assert not StreamFingerprints.load(path).is_changed("schema.table", "hash", "2022-01-01")
+
+
+@pytest.mark.parametrize(
+    "output, expected",
+    [
+        ('AIRBYTE_RAW_TABLES_EMITTED_AT={"a.b": "2022-01-01", "a.c": null}', {"a.b": "2022-01-01", "a.c": None}),
+        ('12:00:00  AIRBYTE_RAW_TABLES_EMITTED_AT={}\n12:00:01  AIRBYTE_RAW_TABLES_EMITTED_AT={"a.b": "x"}\nDone.', {"a.b": "x"}),
+        ("Running with dbt=1.0.0\nEncountered an error", None),
+    ],
+)
+def test_parse_raw_tables_emitted_at(output, expected):
+    assert parse_raw_tables_emitted_at(output) == expected
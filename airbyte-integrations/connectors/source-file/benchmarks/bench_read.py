@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the records/s of reading a large CSV file down to serialized RECORD messages (20 columns by default: integers, floats with
+missing values, booleans and strings), as the entrypoint writes them:
+
+* records: every chunk converted to dicts with to_dict(orient="records"), each record then wrapped in an AirbyteMessage and serialized
+* serialized chunks: every chunk serialized to JSON lines a column at a time with serialize_dataframe
+
+Usage: python benchmarks/bench_read.py [--rows 500000] [--columns 20]
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Iterable
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+from airbyte_cdk.utils.message_serializer import serialize_message
+from source_file.client import Client
+from source_file.serializer import serialize_dataframe
+
+COLUMN_VALUES = [
+    ("integer", lambda row: row),
+    ("number", lambda row: "" if row % 10 == 0 else row / 3),
+    ("boolean", lambda row: row % 2 == 0),
+    ("string", lambda row: f"value-{row}"),
+]
+
+
+def write_csv_file(path: str, rows: int, columns: int):
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow([f"{COLUMN_VALUES[index % len(COLUMN_VALUES)][0]}_{index}" for index in range(columns)])
+        for row in range(rows):
+            writer.writerow([COLUMN_VALUES[index % len(COLUMN_VALUES)][1](row) for index in range(columns)])
+
+
+def records_path(client: Client) -> Iterable[str]:
+    for row in client.read():
+        record = AirbyteRecordMessage(stream=client.stream_name, data=row, emitted_at=int(datetime.now().timestamp()) * 1000)
+        yield serialize_message(AirbyteMessage(type=Type.RECORD, record=record))
+
+
+def serialized_chunks_path(client: Client) -> Iterable[str]:
+    for df in client.read_chunks():
+        yield serialize_dataframe(df, client.stream_name, int(datetime.now().timestamp()) * 1000)
+
+
+def run(name: str, path: Callable[[Client], Iterable[str]], client: Client, rows: int):
+    with open(os.devnull, "w") as out:
+        start = time.perf_counter()
+        for message in path(client):
+            out.write(message)
+            out.write("\n")
+        elapsed = time.perf_counter() - start
+    print(f"{name:<20} {rows / elapsed:>14,.0f} records/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--columns", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "benchmark.csv")
+        write_csv_file(path, args.rows, args.columns)
+        print(f"{args.rows} rows, {args.columns} columns, {os.path.getsize(path) / 1024 / 1024:.1f} MiB")
+        client = Client(dataset_name="benchmark", url=path, provider={"storage": "local"}, format="csv")
+        run("records", records_path, client, args.rows)
+        run("serialized chunks", serialized_chunks_path, client, args.rows)
+
+
+if __name__ == "__main__":
+    main()
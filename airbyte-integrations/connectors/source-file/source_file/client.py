@@ -3,12 +3,17 @@
 #
 
 
+import hashlib
+import io
+import itertools
 import json
+import os
+import shutil
 import tempfile
 import traceback
 import urllib
 from os import environ
-from typing import Iterable
+from typing import Iterable, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 
 import backoff
@@ -17,6 +22,9 @@ import botocore
 import google
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.orc as orc
+import pyarrow.parquet as pq
 import smart_open
 from airbyte_cdk.entrypoint import logger
 from airbyte_cdk.models import AirbyteStream, SyncMode
@@ -86,6 +94,38 @@ class URLFile:
             self._file.close()
             self._file = None
 
+    @property
+    def validator(self) -> Optional[str]:
+        """Version of the opened file as reported by its storage: its ETag, last modified date or modification time. None if the storage
+        doesn't report any, e.g. web servers sending neither an ETag nor a Last-Modified header, or WebHDFS.
+        """
+        if self._file is None:
+            return None
+        storage = self.storage_scheme
+        # the binary stream under text files
+        file = getattr(self._file, "buffer", self._file)
+        try:
+            if storage == "file://":
+                stat = os.stat(os.path.expanduser(self.url))
+                return f"mtime:{stat.st_mtime_ns},size:{stat.st_size}"
+            elif storage in ("ssh://", "scp://", "sftp://"):
+                stat = file.stat()
+                return f"mtime:{stat.st_mtime},size:{stat.st_size}"
+            elif storage in ("https://", "http://"):
+                headers = file.response.headers
+                return headers.get("ETag") or headers.get("Last-Modified")
+            bucket, _, key = self.url.partition("/")
+            if storage == "s3://":
+                return self._aws_client().head_object(Bucket=bucket, Key=key)["ETag"]
+            elif storage == "gs://":
+                return self._gcs_client().bucket(bucket).get_blob(key).etag
+            elif storage == "azure://":
+                return self._azblob_client().get_blob_client(bucket, key).get_blob_properties().etag
+        except Exception as err:
+            # the validator only allows caching what is read from the file, the file is read again when it is missing
+            logger.warning(f"Failed to get the version of {self.full_url}: {repr(err)}")
+        return None
+
     def open(self):
         self.close()
         try:
@@ -179,6 +219,11 @@ class URLFile:
         return ""
 
     def _open_gcs_url(self) -> object:
+        file_to_close = smart_open.open(self.full_url, transport_params={"client": self._gcs_client()}, **self.args)
+
+        return file_to_close
+
+    def _gcs_client(self) -> GCSClient:
         service_account_json = self._provider.get("service_account_json")
         credentials = None
         if service_account_json:
@@ -191,12 +236,8 @@ class URLFile:
 
         if credentials:
             credentials = service_account.Credentials.from_service_account_info(credentials)
-            client = GCSClient(credentials=credentials, project=credentials._project_id)
-        else:
-            client = GCSClient.create_anonymous_client()
-        file_to_close = smart_open.open(self.full_url, transport_params={"client": client}, **self.args)
-
-        return file_to_close
+            return GCSClient(credentials=credentials, project=credentials._project_id)
+        return GCSClient.create_anonymous_client()
 
     def _open_aws_url(self):
         aws_access_key_id = self._provider.get("aws_access_key_id")
@@ -214,7 +255,18 @@ class URLFile:
             result = smart_open.open(self.full_url, transport_params=params, **self.args)
         return result
 
+    def _aws_client(self):
+        aws_access_key_id = self._provider.get("aws_access_key_id")
+        aws_secret_access_key = self._provider.get("aws_secret_access_key")
+        if aws_access_key_id and aws_secret_access_key:
+            return boto3.client("s3", aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key)
+        return boto3.client("s3", config=botocore.client.Config(signature_version=botocore.UNSIGNED))
+
     def _open_azblob_url(self):
+        url = f"{self.storage_scheme}{self.url}"
+        return smart_open.open(url, transport_params=dict(client=self._azblob_client()), **self.args)
+
+    def _azblob_client(self) -> BlobServiceClient:
         storage_account = self._provider.get("storage_account")
         storage_acc_url = f"https://{storage_account}.blob.core.windows.net"
         sas_token = self._provider.get("sas_token", None)
@@ -223,28 +275,41 @@ class URLFile:
         credential = shared_key or sas_token
 
         if credential:
-            client = BlobServiceClient(account_url=storage_acc_url, credential=credential)
-        else:
-            # assuming anonymous public read access given no credential
-            client = BlobServiceClient(account_url=storage_acc_url)
-
-        url = f"{self.storage_scheme}{self.url}"
-        return smart_open.open(url, transport_params=dict(client=client), **self.args)
+            return BlobServiceClient(account_url=storage_acc_url, credential=credential)
+        # assuming anonymous public read access given no credential
+        return BlobServiceClient(account_url=storage_acc_url)
 
 
 class Client:
     """Class that manages reading and parsing data from streams"""
 
     CSV_CHUNK_SIZE = 10_000
+    # number of rows of the dataframes read from parquet, feather and orc files, so that a file of any size is read in bounded memory
+    BATCH_SIZE = 10_000
+    # size of the blocks copied when caching remote binary files to a temporary file
+    CACHE_BLOCK_SIZE = 1024 * 1024
     reader_class = URLFile
     binary_formats = {"excel", "excel_binary", "feather", "parquet", "orc", "pickle"}
-
-    def __init__(self, dataset_name: str, url: str, provider: dict, format: str = None, reader_options: dict = None):
+    # provider options identifying the location of a file along with its URL, the credentials are left out
+    location_provider_options = ("storage", "host", "port", "storage_account")
+
+    def __init__(
+        self,
+        dataset_name: str,
+        url: str,
+        provider: dict,
+        format: str = None,
+        reader_options: dict = None,
+        schema_discovery: dict = None,
+    ):
         self._dataset_name = dataset_name
         self._url = url
         self._provider = provider
         self._reader_format = format or "csv"
         self._reader_options = reader_options or {}
+        self._schema_discovery = schema_discovery or {}
+        # directory of the schemas discovered from each file, so that a file is read once to discover its schema until it changes
+        self.schema_cache_dir: Optional[str] = self._schema_discovery.get("cache_dir")
         self.binary_source = self._reader_format in self.binary_formats
         self.encoding = self._reader_options.get("encoding")
 
@@ -254,12 +319,20 @@ class Client:
             return self._dataset_name
         return f"file_{self._provider['storage']}.{self._reader_format}"
 
-    def load_nested_json_schema(self, fp) -> dict:
+    @property
+    def sampling(self) -> bool:
+        return bool(self._schema_discovery.get("sample_rows") or self._schema_discovery.get("sample_bytes"))
+
+    def load_nested_json_schema(self, fp, sample: bool = False) -> dict:
         # Use Genson Library to take JSON objects and generate schemas that describe them,
         builder = SchemaBuilder()
         if self._reader_format == "jsonl":
-            for o in self.read():
-                builder.add_object(o)
+            if sample:
+                fp = self._sample_text(fp)
+            lines = iter(fp.readline, "")
+            sample_rows = self._schema_discovery.get("sample_rows") if sample else None
+            for line in itertools.islice(lines, sample_rows):
+                builder.add_object(json.loads(line))
         else:
             builder.add_object(json.load(fp))
 
@@ -288,11 +361,12 @@ class Client:
         if self._reader_format == "yaml":
             return pd.DataFrame(safe_load(fp))
 
-    def load_dataframes(self, fp, skip_data=False) -> Iterable:
+    def load_dataframes(self, fp, skip_data=False, nrows: int = None) -> Iterable:
         """load and return the appropriate pandas dataframe.
 
         :param fp: file-like object to read from
         :param skip_data: limit reading data
+        :param nrows: read the first rows of csv files only, so that the types of the columns are inferred from these rows
         :return: a list of dataframe loaded from files described in the configuration
         """
         readers = {
@@ -325,10 +399,14 @@ class Client:
                 if skip_data:
                     reader_options["nrows"] = 0
                     reader_options["index_col"] = 0
+                elif nrows:
+                    reader_options["nrows"] = min(nrows, reader_options.get("nrows") or nrows)
                 yield from reader(fp, **reader_options)
             elif self._reader_options == "excel_binary":
                 reader_options["engine"] = "pyxlsb"
                 yield from reader(fp, **reader_options)
+            elif self._reader_format in self.batch_readers and set(reader_options) <= {"columns"}:
+                yield from self.batch_readers[self._reader_format](self, fp, columns=reader_options.get("columns"))
             else:
                 yield reader(fp, **reader_options)
         except UnicodeDecodeError as err:
@@ -336,6 +414,39 @@ class Client:
             logger.error(error_msg)
             raise ConfigurationError(error_msg) from err
 
+    def read_parquet_batches(self, fp, columns: List[str] = None) -> Iterable[pd.DataFrame]:
+        """Same as pd.read_parquet, BATCH_SIZE rows at a time"""
+        for batch in pq.ParquetFile(fp).iter_batches(batch_size=self.BATCH_SIZE, columns=columns):
+            yield batch.to_pandas()
+
+    def read_feather_batches(self, fp, columns: List[str] = None) -> Iterable[pd.DataFrame]:
+        """Same as pd.read_feather, one record batch of the file at a time (64K rows by default for files written by pandas)"""
+        try:
+            reader = pa.ipc.open_file(fp)
+        except pa.ArrowInvalid:
+            # feather V1 files are not Arrow IPC files, they are read at once
+            if hasattr(fp, "seek"):
+                fp.seek(0)
+            yield pd.read_feather(fp, columns=columns)
+            return
+        for index in range(reader.num_record_batches):
+            table = pa.Table.from_batches([reader.get_batch(index)])
+            yield (table.select(columns) if columns else table).to_pandas()
+
+    def read_orc_batches(self, fp, columns: List[str] = None) -> Iterable[pd.DataFrame]:
+        """Same as pd.read_orc, one stripe of the file at a time"""
+        orc_file = orc.ORCFile(fp)
+        for stripe in range(orc_file.nstripes):
+            yield orc_file.read_stripe(stripe, columns=columns).to_pandas()
+
+    # formats read by batches of rows rather than at once, unless reader options other than "columns" are passed
+    # excel and pickle files can't be read partially, they are still loaded at once
+    batch_readers = {
+        "parquet": read_parquet_batches,
+        "feather": read_feather_batches,
+        "orc": read_orc_batches,
+    }
+
     @staticmethod
     def dtype_to_json_type(current_type: str, dtype) -> str:
         """Convert Pandas Dataframe types to Airbyte Types.
@@ -363,6 +474,16 @@ class Client:
     @backoff.on_exception(backoff.expo, ConnectionResetError, on_backoff=backoff_handler, max_tries=5, max_time=60)
     def read(self, fields: Iterable = None) -> Iterable[dict]:
         """Read data from the stream"""
+        for chunk in self.read_chunks(fields=fields):
+            if isinstance(chunk, pd.DataFrame):
+                yield from self.dataframe_to_records(chunk)
+            else:
+                yield chunk
+
+    @backoff.on_exception(backoff.expo, ConnectionResetError, on_backoff=backoff_handler, max_tries=5, max_time=60)
+    def read_chunks(self, fields: Iterable = None) -> Iterable[Union[dict, pd.DataFrame]]:
+        """Read data from the stream, a dataframe holding the selected columns at a time for tabular formats, a record at a time
+        for the other ones"""
         with self.reader.open() as fp:
             try:
                 if self._reader_format in ["json", "jsonl"]:
@@ -379,27 +500,36 @@ class Client:
                         fp = self._cache_stream(fp)
                     for df in self.load_dataframes(fp):
                         columns = fields.intersection(set(df.columns)) if fields else df.columns
-                        df.replace({np.nan: None}, inplace=True)
-                        yield from df[list(columns)].to_dict(orient="records")
+                        yield df[list(columns)]
             except ConnectionResetError:
                 logger.info(f"Catched `connection reset error - 104`, stream: {self.stream_name} ({self.reader.full_url})")
                 raise ConnectionResetError
 
+    @staticmethod
+    def dataframe_to_records(df: pd.DataFrame) -> List[dict]:
+        """Convert the rows of a dataframe to records, NaN values being converted to None"""
+        return df.replace({np.nan: None}).to_dict(orient="records")
+
     def _cache_stream(self, fp):
-        """cache stream to file"""
+        """cache stream to file, block by block so that the file is never held in memory"""
         fp_tmp = tempfile.TemporaryFile(mode="w+b")
-        fp_tmp.write(fp.read())
+        shutil.copyfileobj(fp, fp_tmp, self.CACHE_BLOCK_SIZE)
         fp_tmp.seek(0)
         fp.close()
         return fp_tmp
 
-    def _stream_properties(self, fp):
+    def _stream_properties(self, fp, sample: bool = False):
+        sample_rows = self._schema_discovery.get("sample_rows") if sample else None
         if self._reader_format == "yaml":
             df_list = [self.load_yaml(fp)]
         else:
             if self.binary_source:
                 fp = self._cache_stream(fp)
-            df_list = self.load_dataframes(fp, skip_data=False)
+            elif sample and self._reader_format == "csv":
+                fp = self._sample_text(fp)
+            df_list = self.load_dataframes(fp, skip_data=False, nrows=sample_rows)
+        if sample_rows:
+            df_list = self._head(df_list, sample_rows)
         fields = {}
         for df in df_list:
             for col in df.columns:
@@ -408,17 +538,99 @@ class Client:
                 fields[col] = self.dtype_to_json_type(prev_frame_column_type, df[col].dtype)
         return {field: {"type": [fields[field], "null"]} for field in fields}
 
+    def _sample_text(self, fp):
+        """first sample_bytes of a text file, up to the end of the last line, the whole file if no sample_bytes is set"""
+        sample_bytes = self._schema_discovery.get("sample_bytes")
+        if not sample_bytes:
+            return fp
+        content = fp.read(sample_bytes)
+        if content and not content.endswith("\n"):
+            content += fp.readline()
+        return io.StringIO(content)
+
+    @staticmethod
+    def _head(df_list: Iterable[pd.DataFrame], rows: int) -> Iterator[pd.DataFrame]:
+        """first rows of the dataframes, the following dataframes are not read. The columns keep the types inferred by the
+        readers from whole dataframes, csv files are sampled with nrows to infer types from the sample only"""
+        for df in df_list:
+            if rows <= 0:
+                return
+            yield df.head(rows)
+            rows -= len(df)
+
+    def _infer_schema(self, fp, sample: bool = False) -> dict:
+        if self._reader_format in ["json", "jsonl"]:
+            return self.load_nested_json_schema(fp, sample=sample)
+        return {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": self._stream_properties(fp, sample=sample),
+        }
+
+    def _discover_schema(self, reader: URLFile, fp) -> dict:
+        """schema of the file opened by the reader, read from the cache if it is enabled and this version of the file was already
+        discovered with the same options. Files whose storage doesn't report their version are not cached.
+        """
+        cache_path = self._schema_cache_path() if self.schema_cache_dir else None
+        validator = reader.validator if cache_path else None
+        cached = self._load_cached_schema(cache_path) if validator is not None else None
+        if cached and cached.get("validator") == validator:
+            logger.info(f"Using the schema discovered previously from {reader.full_url} ({validator})")
+            return cached["schema"]
+
+        json_schema = self._infer_schema(fp, sample=self.sampling)
+        if self.sampling and self._schema_discovery.get("verify_with_full_scan"):
+            with self.reader.open() as fp:
+                full_json_schema = self._infer_schema(fp)
+            sampled_properties, properties = json_schema.get("properties", {}), full_json_schema.get("properties", {})
+            differences = [field for field in properties if sampled_properties.get(field) != properties[field]]
+            if differences:
+                logger.warning(f"The schema inferred from the sample of {reader.full_url} differs from the whole file for: {differences}")
+            json_schema = full_json_schema
+
+        if validator is not None:
+            self._save_cached_schema(cache_path, {"validator": validator, "schema": json_schema})
+        return json_schema
+
+    def _schema_cache_path(self) -> str:
+        scope = {
+            "url": self._url,
+            "provider": {key: value for key, value in self._provider.items() if key in self.location_provider_options},
+            "format": self._reader_format,
+            "reader_options": self._reader_options,
+            "schema_discovery": {key: value for key, value in self._schema_discovery.items() if key != "cache_dir"},
+        }
+        scope_hash = hashlib.sha256(json.dumps(scope, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return os.path.join(self.schema_cache_dir, f"{scope_hash}.json")
+
+    @staticmethod
+    def _load_cached_schema(path: str) -> Optional[dict]:
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            logger.warning(f"Ignoring the cached schema {path} which can't be read: {repr(err)}")
+            return None
+
+    @staticmethod
+    def _save_cached_schema(path: str, content: dict):
+        """the cache only saves time, failing to write it is logged and ignored"""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write then rename so that a concurrent discover never reads a partially written file
+            with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(path), suffix=".tmp", delete=False) as file:
+                json.dump(content, file)
+            os.replace(file.name, path)
+        except OSError as err:
+            logger.warning(f"Failed to save the discovered schema to {path}: {repr(err)}")
+
     @property
     def streams(self) -> Iterable:
         """Discovers available streams"""
         # TODO handle discovery of directories of multiple files instead
-        with self.reader.open() as fp:
-            if self._reader_format in ["json", "jsonl"]:
-                json_schema = self.load_nested_json_schema(fp)
-            else:
-                json_schema = {
-                    "$schema": "http://json-schema.org/draft-07/schema#",
-                    "type": "object",
-                    "properties": self._stream_properties(fp),
-                }
+        reader = self.reader
+        with reader.open() as fp:
+            json_schema = self._discover_schema(reader, fp)
         yield AirbyteStream(name=self.stream_name, json_schema=json_schema, supported_sync_modes=[SyncMode.full_refresh])
@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+from json.encoder import encode_basestring
+from numbers import Integral
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def serialize_column(column: pd.Series) -> Optional[np.ndarray]:
+    """Serialize every value of a column to JSON at once, null values (NaN, None) being serialized to null.
+
+    :param column: column of a dataframe
+    :return: array of the JSON fragments of the values, None if the values of the column can't be serialized this way,
+    e.g. dates or extension types
+    """
+    dtype = column.dtype
+    if not isinstance(dtype, np.dtype):
+        return None
+    values = column.to_numpy()
+    if dtype.kind in ("i", "u"):
+        return values.astype(str).astype(object)
+    if dtype.kind == "b":
+        return np.where(values, "true", "false").astype(object)
+    if dtype == np.float64:
+        if np.isinf(values).any():
+            return None
+        # numpy formats floats with their shortest repr, as json.dumps does
+        fragments = values.astype(str).astype(object)
+        fragments[np.isnan(values)] = "null"
+        return fragments
+    if dtype == object and pd.api.types.infer_dtype(column, skipna=True) in ("string", "empty"):
+        not_null = ~pd.isna(values)
+        fragments = np.full(len(values), "null", dtype=object)
+        fragments[not_null] = [encode_basestring(value) for value in values[not_null]]
+        return fragments
+    return None
+
+
+def serialize_dataframe(df: pd.DataFrame, stream: str, emitted_at: int) -> Optional[str]:
+    """Serialize the rows of a dataframe to RECORD messages, one JSON line per row, a column at a time rather than a row at a time.
+
+    The data of each record is the same as df.replace({np.nan: None}).to_dict(orient="records") serialized to JSON.
+
+    :param df: dataframe holding the selected columns only
+    :param stream: name of the stream of the records
+    :param emitted_at: emitted_at of the records
+    :return: the messages separated by newlines, None if a column can't be serialized at once, the rows then have to be
+    serialized one by one
+    """
+    if df.empty or not df.columns.is_unique:
+        return None
+    fields, fragments = [], []
+    for name, column in df.items():
+        if isinstance(name, bool) or not isinstance(name, (str, Integral)):
+            return None
+        column_fragments = serialize_column(column)
+        if column_fragments is None:
+            return None
+        # literal "%" are escaped as the fragments of each row are inserted with the % operator
+        fields.append(encode_basestring(str(name)).replace("%", "%%") + ":%s")
+        fragments.append(column_fragments)
+    stream = encode_basestring(stream).replace("%", "%%")
+    template = f'{{"type":"RECORD","record":{{"stream":{stream},"data":{{{",".join(fields)}}},"emitted_at":{emitted_at}}}}}'
+    return "\n".join(template % row for row in zip(*fragments))
@@ -7,9 +7,10 @@ import json
 import logging
 import traceback
 from datetime import datetime
-from typing import Any, Iterable, Iterator, Mapping, MutableMapping
+from typing import Any, Iterable, Iterator, Mapping, MutableMapping, Union
 from urllib.parse import urlparse
 
+import pandas as pd
 from airbyte_cdk import AirbyteLogger
 from airbyte_cdk.models import (
     AirbyteCatalog,
@@ -21,8 +22,10 @@ from airbyte_cdk.models import (
     Type,
 )
 from airbyte_cdk.sources import Source
+from airbyte_cdk.utils.message_serializer import SerializedMessages
 
 from .client import Client, ConfigurationError
+from .serializer import serialize_dataframe
 from .utils import dropbox_force_download
 
 
@@ -147,7 +150,7 @@ class SourceFile(Source):
         config: Mapping[str, Any],
         catalog: ConfiguredAirbyteCatalog,
         state: MutableMapping[str, Any] = None,
-    ) -> Iterator[AirbyteMessage]:
+    ) -> Iterator[Union[AirbyteMessage, SerializedMessages]]:
         """Returns a generator of the AirbyteMessages generated by reading the source with the given configuration, catalog, and state."""
         config = self._validate_and_transform(config)
         client = self._get_client(config)
@@ -156,9 +159,20 @@ class SourceFile(Source):
 
         logger.info(f"Reading {name} ({client.reader.full_url})...")
         try:
-            for row in client.read(fields=fields):
-                record = AirbyteRecordMessage(stream=name, data=row, emitted_at=int(datetime.now().timestamp()) * 1000)
-                yield AirbyteMessage(type=Type.RECORD, record=record)
+            for chunk in client.read_chunks(fields=fields):
+                emitted_at = int(datetime.now().timestamp()) * 1000
+                if isinstance(chunk, pd.DataFrame):
+                    # the records of a dataframe are serialized at once rather than converted to dicts then serialized one by one
+                    messages = serialize_dataframe(chunk, name, emitted_at)
+                    if messages is not None:
+                        yield SerializedMessages(messages)
+                        continue
+                    rows = client.dataframe_to_records(chunk)
+                else:
+                    rows = [chunk]
+                for row in rows:
+                    record = AirbyteRecordMessage(stream=name, data=row, emitted_at=emitted_at)
+                    yield AirbyteMessage(type=Type.RECORD, record=record)
         except Exception as err:
             reason = f"Failed to read data of {name} at {client.reader.full_url}: {repr(err)}\n{traceback.format_exc()}"
             logger.error(reason)
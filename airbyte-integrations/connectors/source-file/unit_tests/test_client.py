@@ -2,9 +2,15 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
-
-from unittest.mock import patch
-
+import gzip
+import json
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.orc as orc
 import pytest
 from pandas import read_csv, read_excel
 from source_file.client import Client, ConfigurationError, URLFile
@@ -77,6 +83,32 @@ def test_load_dataframes_xlsb(config, absolute_path, test_files):
     assert read_file.equals(expected)
 
 
+@pytest.mark.parametrize(
+    "file_format, write_file, reader_options",
+    [
+        ("parquet", lambda df, path: df.to_parquet(path, row_group_size=4), {}),
+        ("parquet", lambda df, path: df.to_parquet(path, row_group_size=4), {"columns": ["id", "name"]}),
+        ("feather", lambda df, path: df.to_feather(path, chunksize=4), {}),
+        ("feather", lambda df, path: feather.write_feather(df, path, version=1), {"columns": ["id"]}),
+        ("orc", lambda df, path: orc.write_table(pa.Table.from_pandas(df), path, stripe_size=1, batch_size=4), {}),
+    ],
+    ids=["parquet", "parquet_columns", "feather", "feather_v1", "orc"],
+)
+def test_load_dataframes_by_batches(tmp_path, file_format, write_file, reader_options):
+    df = pd.DataFrame({"id": range(10), "name": [f"name_{i}" if i % 3 else None for i in range(10)], "value": [i / 2 for i in range(10)]})
+    path = str(tmp_path / f"test.{file_format}")
+    write_file(df, path)
+    client = Client(dataset_name="test", url=path, provider={"storage": "local"}, format=file_format, reader_options=reader_options)
+    client.BATCH_SIZE = 4
+
+    with open(path, "rb") as fp:
+        dataframes = list(client.load_dataframes(fp))
+
+    if file_format != "feather" or "columns" not in reader_options:
+        assert len(dataframes) > 1
+    assert pd.concat(dataframes, ignore_index=True).equals(getattr(pd, f"read_{file_format}")(path, **reader_options))
+
+
 def test_load_nested_json(client, absolute_path, test_files):
     f = f"{absolute_path}/{test_files}/formats/json/demo.json"
     with open(f, mode="rb") as file:
@@ -103,6 +135,111 @@ def test_cache_stream(client, absolute_path, test_files):
         assert client._cache_stream(file)
 
 
+def test_cache_stream_by_blocks(client):
+    content = bytes(range(256)) * 100
+    fp = BytesIO(content)
+    client.CACHE_BLOCK_SIZE = 1000
+    with patch.object(fp, "read", wraps=fp.read) as read:
+        assert client._cache_stream(fp).read() == content
+    assert all(call.args == (1000,) for call in read.call_args_list)
+
+
+@pytest.fixture
+def mixed_types_files(tmp_path):
+    """csv and jsonl files whose "value" column holds numbers in the first 4 rows and a string in the last one"""
+    values = [1, 2, 3, 4, "five"]
+    csv_path, jsonl_path = tmp_path / "mixed.csv", tmp_path / "mixed.jsonl"
+    csv_path.write_text("id,value\n" + "".join(f"{i},{value}\n" for i, value in enumerate(values)))
+    jsonl_path.write_text("".join(json.dumps({"id": i, "value": value}) + "\n" for i, value in enumerate(values)))
+    return {"csv": str(csv_path), "jsonl": str(jsonl_path)}
+
+
+def discover_value_type(path: str, file_format: str, schema_discovery: dict = None) -> set:
+    client = Client(dataset_name="test", url=path, provider={"storage": "local"}, format=file_format, schema_discovery=schema_discovery)
+    value_type = next(client.streams).json_schema["properties"]["value"]["type"]
+    return {value_type} if isinstance(value_type, str) else set(value_type) - {"null"}
+
+
+@pytest.mark.parametrize(
+    "file_format, sampled_type, full_type", [("csv", {"number"}, {"string"}), ("jsonl", {"integer"}, {"integer", "string"})]
+)
+@pytest.mark.parametrize(
+    "schema_discovery, sampled",
+    [
+        pytest.param(None, False, id="test_full_scan"),
+        pytest.param({"sample_rows": 4}, True, id="test_sample_rows"),
+        pytest.param({"sample_rows": 5}, False, id="test_sample_rows_larger_than_the_file"),
+        pytest.param({"sample_bytes": 12}, True, id="test_sample_bytes"),
+        pytest.param({"sample_rows": 4, "verify_with_full_scan": True}, False, id="test_verify_with_full_scan"),
+    ],
+)
+def test_discover_schema_from_sample(mixed_types_files, file_format, sampled_type, full_type, schema_discovery, sampled):
+    expected = sampled_type if sampled else full_type
+    assert discover_value_type(mixed_types_files[file_format], file_format, schema_discovery) == expected
+
+
+def test_verify_with_full_scan_logs_the_differences(mixed_types_files):
+    with patch("source_file.client.logger") as logger:
+        discover_value_type(mixed_types_files["csv"], "csv", {"sample_rows": 4, "verify_with_full_scan": True})
+    assert "differs from the whole file for: ['value']" in logger.warning.call_args.args[0]
+
+
+def test_discovered_schema_is_cached_per_url_and_version(tmp_path, mixed_types_files):
+    path = mixed_types_files["csv"]
+    cache_dir = str(tmp_path / "schema_cache")
+    with patch.object(Client, "_infer_schema", side_effect=Client._infer_schema, autospec=True) as infer_schema:
+        # the cache is disabled by default
+        assert discover_value_type(path, "csv") == {"string"}
+        assert discover_value_type(path, "csv") == {"string"}
+        assert infer_schema.call_count == 2
+
+        assert discover_value_type(path, "csv", {"cache_dir": cache_dir}) == {"string"}
+        assert discover_value_type(path, "csv", {"cache_dir": cache_dir}) == {"string"}
+        assert infer_schema.call_count == 3
+
+        # the sampling options are part of the cache key
+        assert discover_value_type(path, "csv", {"sample_rows": 4, "cache_dir": cache_dir}) == {"number"}
+        assert infer_schema.call_count == 4
+
+        with open(path, "w") as file:
+            file.write("id,value\n1,2\n")
+        assert discover_value_type(path, "csv", {"cache_dir": cache_dir}) == {"number"}
+        assert infer_schema.call_count == 5
+
+        # files whose storage doesn't report their version are not cached
+        with patch.object(URLFile, "validator", None):
+            assert discover_value_type(path, "csv", {"cache_dir": cache_dir}) == {"number"}
+            assert discover_value_type(path, "csv", {"cache_dir": cache_dir}) == {"number"}
+        assert infer_schema.call_count == 7
+
+
+def test_url_file_validator(tmp_path):
+    path = tmp_path / "file.csv.gz"
+    path.write_bytes(gzip.compress(b"a,b\n1,2\n"))
+    reader = URLFile(url=str(path), provider={"storage": "local"})
+    assert reader.validator is None
+    with reader.open():
+        validator = reader.validator
+        assert validator.startswith("mtime:")
+    path.write_bytes(gzip.compress(b"a,b\n1,2\n3,4\n"))
+    with reader.open():
+        assert reader.validator != validator
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"ETag": '"abc"', "Last-Modified": "Wed, 04 Jan 2023 00:00:00 GMT"}, '"abc"'),
+        ({"Last-Modified": "Wed, 04 Jan 2023"}, "Wed, 04 Jan 2023"),
+        ({}, None),
+    ],
+)
+def test_url_file_validator_of_web_servers(headers, expected):
+    reader = URLFile(url="https://airbyte.com/file.csv", provider={"storage": "HTTPS"})
+    reader._file = MagicMock(buffer=MagicMock(response=MagicMock(headers=headers)))
+    assert reader.validator == expected
+
+
 def test_open_aws_url():
     url = "s3://my_bucket/my_key"
     provider = {"storage": "S3"}
@@ -0,0 +1,55 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+from source_file.client import Client
+from source_file.serializer import serialize_dataframe
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pytest.param(
+            pd.DataFrame(
+                {
+                    "int": [1, -2, 2**62],
+                    "float": [1.11, np.nan, 1e16],
+                    "bool": [True, False, True],
+                    "string": ["a", None, 'quote " backslash \\ newline \n unicode é'],
+                }
+            ),
+            id="test_scalar_types_and_nulls",
+        ),
+        pytest.param(pd.DataFrame({"empty": [None, np.nan], "100%": ["%s", "%d"]}), id="test_null_column_and_percent_signs"),
+        pytest.param(pd.DataFrame([["a", 0.5], ["b", 2.0]]), id="test_integer_column_names"),
+    ],
+)
+def test_serialize_dataframe_is_equivalent_to_records(df):
+    serialized = serialize_dataframe(df, "stream 100%", 1)
+
+    expected = [
+        AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream 100%", data=row, emitted_at=1)).json(exclude_unset=True)
+        for row in Client.dataframe_to_records(df)
+    ]
+    assert [json.loads(line) for line in serialized.split("\n")] == [json.loads(message) for message in expected]
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pytest.param(pd.DataFrame({"date": pd.to_datetime(["2022-01-01", None])}), id="test_datetime_column"),
+        pytest.param(pd.DataFrame({"mixed": ["a", 1]}), id="test_mixed_object_column"),
+        pytest.param(pd.DataFrame({"float": [1.0, np.inf]}), id="test_infinite_float"),
+        pytest.param(pd.DataFrame({"nullable": pd.array([1, None], dtype="Int64")}), id="test_extension_type"),
+        pytest.param(pd.DataFrame([[1, 2]], columns=["a", "a"]), id="test_duplicated_columns"),
+        pytest.param(pd.DataFrame({"a": []}), id="test_empty_dataframe"),
+    ],
+)
+def test_serialize_dataframe_falls_back_to_records(df):
+    assert serialize_dataframe(df, "stream", 1) is None
@@ -21,11 +21,22 @@ from airbyte_cdk.models import (
     SyncMode,
     Type,
 )
+from airbyte_cdk.utils.message_serializer import SerializedMessages
 from source_file.source import SourceFile
 
 logger = logging.getLogger("airbyte")
 
 
+def read_records(source, config, catalog):
+    records = []
+    for message in source.read(logger=logger, config=config, catalog=catalog):
+        if isinstance(message, SerializedMessages):
+            records.extend(json.loads(line)["record"]["data"] for line in message.split("\n"))
+        else:
+            records.append(message.record.data)
+    return records
+
+
 @pytest.fixture
 def source():
     return SourceFile()
@@ -93,8 +104,7 @@ def test_nan_to_null(absolute_path, test_files):
     )
 
     source = SourceFile()
-    records = source.read(logger=logger, config=deepcopy(config), catalog=catalog)
-    records = [r.record.data for r in records]
+    records = read_records(source, config=deepcopy(config), catalog=catalog)
     assert records == [
         {"col1": "key1", "col2": 1.11, "col3": None},
         {"col1": "key2", "col2": None, "col3": 2.22},
@@ -103,8 +113,7 @@ def test_nan_to_null(absolute_path, test_files):
     ]
 
     config.update({"format": "yaml", "url": f"{absolute_path}/{test_files}/formats/yaml/demo.yaml"})
-    records = source.read(logger=logger, config=deepcopy(config), catalog=catalog)
-    records = [r.record.data for r in records]
+    records = read_records(source, config=deepcopy(config), catalog=catalog)
     assert records == []
 
     config.update({"provider": {"storage": "SSH", "user": "user", "host": "host"}})
@@ -174,8 +183,7 @@ def test_pandas_header_not_none(absolute_path, test_files):
     catalog = get_catalog({"text11": {"type": ["string", "null"]}, "text12": {"type": ["string", "null"]}})
 
     source = SourceFile()
-    records = source.read(logger=logger, config=deepcopy(config), catalog=catalog)
-    records = [r.record.data for r in records]
+    records = read_records(source, config=deepcopy(config), catalog=catalog)
     assert records == [
         {"text11": "text21", "text12": "text22"},
     ]
@@ -193,8 +201,7 @@ def test_pandas_header_none(absolute_path, test_files):
     catalog = get_catalog({"0": {"type": ["string", "null"]}, "1": {"type": ["string", "null"]}})
 
     source = SourceFile()
-    records = source.read(logger=logger, config=deepcopy(config), catalog=catalog)
-    records = [r.record.data for r in records]
+    records = read_records(source, config=deepcopy(config), catalog=catalog)
     assert records == [
         {"0": "text11", "1": "text12"},
         {"0": "text21", "1": "text22"},
@@ -0,0 +1,84 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the records/s of ParquetParser.stream_records on a wide Parquet file (100 columns by default: integers, doubles, strings and
+timestamps), compared to building every record row by row from batch.to_pydict() and converting its values one at a time.
+
+Usage: python benchmarks/bench_parquet_parser.py [--rows 100000] [--columns 100]
+"""
+
+import argparse
+import datetime
+import tempfile
+import time
+from typing import Any, Callable, Iterator, Mapping
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from source_s3.source_files_abstract.file_info import FileInfo
+from source_s3.source_files_abstract.formats.parquet_parser import ParquetParser
+
+COLUMN_TYPES = [
+    ("integer", pa.int64(), lambda row: row),
+    ("number", pa.float64(), lambda row: row / 3),
+    ("string", pa.string(), lambda row: f"value-{row}"),
+    ("timestamp", pa.timestamp("us"), lambda row: datetime.datetime(2022, 1, 1) + datetime.timedelta(seconds=row)),
+]
+
+
+def write_parquet_file(path: str, rows: int, columns: int) -> Mapping[str, str]:
+    arrays, names, schema = [], [], {}
+    for index in range(columns):
+        json_type, arrow_type, value = COLUMN_TYPES[index % len(COLUMN_TYPES)]
+        name = f"{json_type}_{index}"
+        arrays.append(pa.array([None if row % 10 == 0 else value(row) for row in range(rows)], type=arrow_type))
+        names.append(name)
+        schema[name] = "string" if json_type == "timestamp" else json_type
+    pq.write_table(pa.Table.from_arrays(arrays, names=names), path)
+    return schema
+
+
+def stream_records_row_wise(parser: ParquetParser, file: Any, file_info: FileInfo) -> Iterator[Mapping[str, Any]]:
+    """Builds every record from batch.to_pydict() and converts its values one at a time"""
+    reader = parser._init_reader(file)
+    logical_types = {
+        field.name: parser.parse_field_type(field.logical_type.type.lower(), field.physical_type)[1] for field in reader.schema
+    }
+    for num_row_group in range(reader.num_row_groups):
+        for batch in reader.iter_batches(row_groups=[num_row_group], batch_size=parser._format["batch_size"]):
+            batch_dict = batch.to_pydict()
+            batch_columns = list(batch_dict.keys())
+            for record_values in zip(*[batch_dict[column] for column in batch_columns]):
+                yield {
+                    batch_columns[i]: parser.convert_field_data(logical_types[batch_columns[i]], record_values[i])
+                    for i in range(len(batch_columns))
+                }
+
+
+def run(name: str, stream_records: Callable, parser: ParquetParser, path: str, file_info: FileInfo):
+    with open(path, "rb") as file:
+        start = time.perf_counter()
+        records = sum(1 for _ in stream_records(parser, file, file_info))
+        elapsed = time.perf_counter() - start
+    print(f"  {name:<10} {records / elapsed:>12,.0f} records/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--columns", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile(suffix=".parquet") as parquet_file:
+        schema = write_parquet_file(parquet_file.name, args.rows, args.columns)
+        file_info = FileInfo(key=parquet_file.name, size=0, last_modified=datetime.datetime.now())
+        parquet_parser = ParquetParser({"filetype": "parquet"}, master_schema=schema)
+        print(f"{args.rows} rows, {args.columns} columns")
+        run("row-wise", stream_records_row_wise, parquet_parser, parquet_file.name, file_info)
+        run("columnar", ParquetParser.stream_records, parquet_parser, parquet_file.name, file_info)
+
+
+if __name__ == "__main__":
+    main()
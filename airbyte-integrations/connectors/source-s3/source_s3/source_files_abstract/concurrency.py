@@ -0,0 +1,185 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Empty, Full, Queue
+from typing import Callable, Deque, Iterable, Iterator, Optional, TypeVar
+
+from .file_info import FileInfo
+from .storagefile import StorageFile
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_in_order(fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> Iterator[R]:
+    """
+    Applies fn to the items on a pool of max_workers threads and yields the results in the order of the items.
+    At most max_workers items are processed ahead of the result being consumed, the pending ones are cancelled if the caller stops early.
+    """
+    if max_workers <= 1:
+        yield from map(fn, items)
+        return
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="file-reader")
+    futures: Deque[Future] = deque()
+    try:
+        for item in items:
+            futures.append(executor.submit(fn, item))
+            if len(futures) >= max_workers:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _RecordsBuffer(Iterable[R]):
+    """
+    Hands the records of a file read by a thread of the pool over to the reader of the file, through a queue holding at most max_records
+    records. The thread blocks once the queue is full, until the records are consumed or the buffer is closed.
+    """
+
+    _END = object()
+    # seconds between two checks of whether the buffer was closed while waiting on the queue
+    _POLL_INTERVAL = 0.1
+
+    def __init__(self, max_records: int):
+        self._queue: Queue = Queue(maxsize=max_records)
+        self._closed = threading.Event()
+
+    def fill(self, read_records: Callable[[], Iterable[R]]):
+        """Puts the records in the buffer, called by the thread reading the file"""
+        if self._closed.is_set():
+            # the file is not read anymore
+            return
+        try:
+            for record in read_records():
+                if not self._put(record):
+                    return
+        except BaseException as e:
+            self._put(_ReadError(e))
+        else:
+            self._put(self._END)
+
+    def _put(self, item) -> bool:
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=self._POLL_INTERVAL)
+                return True
+            except Full:
+                pass
+        return False
+
+    def close(self):
+        """Stops the thread filling the buffer, e.g. once the reader stopped reading the file"""
+        self._closed.set()
+
+    def __iter__(self) -> Iterator[R]:
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self._POLL_INTERVAL)
+                except Empty:
+                    if self._closed.is_set():
+                        raise RuntimeError("The read ahead of the file was closed before all its records were read")
+                    continue
+                if item is self._END:
+                    return
+                if isinstance(item, _ReadError):
+                    raise item.error
+                yield item
+        finally:
+            self.close()
+
+
+class _ReadError:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class FileReadAhead:
+    """
+    Downloads and parses the next files of a sync on a bounded thread pool while the records of the current file are emitted, so that
+    the time spent waiting on the network overlaps across files instead of adding up.
+
+    Files must be read in the order of the file_infos passed in. The records of the files read ahead are handed over through a buffer
+    holding at most max_buffered_records records per file, the pool stops reading a file once its buffer is full, so that the memory used
+    doesn't depend on the size of the files once decoded. Files bigger than max_file_size are not read ahead, since only their first
+    records would be, they are read lazily when requested. Files which are not part of file_infos are read lazily as well.
+    """
+
+    def __init__(
+        self,
+        file_infos: Iterable[FileInfo],
+        storage_file_factory: Callable[[FileInfo], StorageFile],
+        max_workers: int,
+        max_file_size: int,
+        max_buffered_records: int,
+    ):
+        """
+        :param file_infos: the files to read, in the order they are read
+        :param storage_file_factory: creates the StorageFile opened by the pool to read a file
+        :param max_workers: number of files read at the same time, and read ahead of the file currently emitted
+        :param max_file_size: size in bytes above which files are not read ahead
+        :param max_buffered_records: number of records of a file read ahead of the records emitted
+        """
+        self._upcoming: Deque[FileInfo] = deque(file_infos)
+        self._keys = {file_info.key for file_info in self._upcoming}
+        self._storage_file_factory = storage_file_factory
+        self._max_workers = max_workers
+        self._max_file_size = max_file_size
+        self._max_buffered_records = max_buffered_records
+        # key -> buffer of the records of the files read ahead, or None for the files to read lazily, in reading order
+        self._reading: "OrderedDict[str, Optional[_RecordsBuffer]]" = OrderedDict()
+        # buffer of the file being read, closed along with the read ahead if its records are not all read
+        self._current: Optional[_RecordsBuffer] = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="file-reader")
+
+    def read(self, storage_file: StorageFile, read_file: Callable[[StorageFile], Iterable[R]]) -> Iterable[R]:
+        """
+        :param storage_file: the file to read
+        :param read_file: reads the records of a file, called by the pool for the next files
+        :return: the records of the file
+        """
+        key = storage_file.url
+        if key not in self._keys:
+            return read_file(storage_file)
+        while True:
+            self._schedule(read_file)
+            reading_key, records_buffer = self._reading.popitem(last=False)
+            self._keys.discard(reading_key)
+            if reading_key == key:
+                break
+            # the file was not requested, e.g. it was skipped by the caller
+            if records_buffer is not None:
+                records_buffer.close()
+        # keep the pool busy with the next files while the records of this one are emitted
+        self._schedule(read_file)
+        if not self._reading:
+            self._executor.shutdown(wait=False)
+        self._current = records_buffer
+        return read_file(storage_file) if records_buffer is None else records_buffer
+
+    def close(self):
+        # the threads waiting to read a file, or blocked on a full buffer, stop once the buffers are closed
+        for records_buffer in [self._current, *self._reading.values()]:
+            if records_buffer is not None:
+                records_buffer.close()
+        self._reading.clear()
+        self._executor.shutdown(wait=False)
+
+    def _schedule(self, read_file: Callable[[StorageFile], Iterable[R]]):
+        while self._upcoming and len(self._reading) < self._max_workers:
+            file_info = self._upcoming.popleft()
+            if file_info.size > self._max_file_size:
+                self._reading[file_info.key] = None
+            else:
+                records_buffer = _RecordsBuffer(self._max_buffered_records)
+                self._executor.submit(self._read_ahead, read_file, file_info, records_buffer)
+                self._reading[file_info.key] = records_buffer
+
+    def _read_ahead(self, read_file: Callable[[StorageFile], Iterable[R]], file_info: FileInfo, records_buffer: _RecordsBuffer):
+        records_buffer.fill(lambda: read_file(self._storage_file_factory(file_info)))
@@ -0,0 +1,189 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import base64
+import hashlib
+import math
+import zlib
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Mapping, Set, Tuple, Union
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+class BloomFilter:
+    """
+    Fixed size set of strings answering membership tests with no false negatives and a bounded rate of false positives,
+    whatever the length of the strings, in about 29 bits per string for a false positive rate of one in a million.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, bits: bytearray = None, count: int = 0):
+        """
+        :param capacity: number of strings the filter holds before its false positive rate exceeds error_rate
+        :param error_rate: false positive rate once capacity strings are added
+        :param bits: the bits of a serialized filter, empty bits by default
+        :param count: number of strings added to the serialized filter
+        """
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        num_bits = math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_bits = num_bits + (-num_bits % 8)
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray(self.num_bits // 8)
+        self.count = count
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+    @staticmethod
+    def hash(value: str) -> Tuple[int, int]:
+        """
+        Two independent 64 bits hashes of the value from which the positions of the k hash functions are derived (double hashing),
+        they can be computed once to check a value against many filters.
+        """
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def add(self, value: str):
+        hash_1, hash_2 = self.hash(value)
+        bits, num_bits = self.bits, self.num_bits
+        for i in range(self.num_hashes):
+            position = (hash_1 + i * hash_2) % num_bits
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return self.contains_hash(self.hash(value))
+
+    def contains_hash(self, value_hash: Tuple[int, int]) -> bool:
+        hash_1, hash_2 = value_hash
+        bits, num_bits = self.bits, self.num_bits
+        for i in range(self.num_hashes):
+            position = (hash_1 + i * hash_2) % num_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def to_state(self) -> Mapping[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "count": self.count,
+            "bits": base64.b64encode(zlib.compress(bytes(self.bits))).decode("ascii"),
+        }
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, Any]) -> "BloomFilter":
+        bits = bytearray(zlib.decompress(base64.b64decode(state["bits"])))
+        return cls(state["capacity"], state["error_rate"], bits=bits, count=state["count"])
+
+
+class FileHistory(Dict[str, Union[Set[str], Dict[str, Any]]]):
+    """
+    Keys of the files synced in the last days, grouped by the date of their last modification, as kept in the "history" of the state.
+
+    Each date maps to the set of its keys, until the keys of all the dates exceed a given size: the keys of the biggest dates are then
+    compacted into Bloom filters, so that the history stays bounded even for buckets with millions of files. A compacted date maps to
+    {"filters": [serialized Bloom filters], "keys": [keys added since the last compaction]}.
+
+    As a dict the history is serialized in the state as is, contains_file() answers in constant time thanks to an index of the keys.
+    """
+
+    error_rate = 1e-6
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # keys which are not compacted -> number of dates they are listed under
+        self._key_counts: Dict[str, int] = {}
+        self._filters: Dict[str, List[BloomFilter]] = {}
+        self._keys_size = 0
+        for history_date, value in self.items():
+            if isinstance(value, dict):
+                value = {"filters": value["filters"], "keys": set(value["keys"])}
+                self._filters[history_date] = [BloomFilter.from_state(state) for state in value["filters"]]
+                keys = value["keys"]
+            else:
+                value = keys = set(value)
+            super().__setitem__(history_date, value)
+            self._index(keys)
+
+    @classmethod
+    def from_state(cls, history: Mapping[str, Any]) -> "FileHistory":
+        """
+        :param history: history of a state, e.g. {"2022-07-01": ["file_1.csv", "file_2.csv"]}
+        :return: the history itself if it is already a FileHistory, so that it is parsed once per sync
+        """
+        if isinstance(history, cls):
+            return history
+        return cls(history or {})
+
+    def contains_file(self, key: str) -> bool:
+        if key in self._key_counts:
+            return True
+        if not self._filters:
+            return False
+        key_hash = BloomFilter.hash(key)
+        return any(bloom_filter.contains_hash(key_hash) for filters in self._filters.values() for bloom_filter in filters)
+
+    def add_file(self, history_date: date, key: str):
+        history_date = history_date.strftime(DATE_FORMAT)
+        if history_date not in self:
+            super().__setitem__(history_date, set())
+        value = self[history_date]
+        keys = value["keys"] if isinstance(value, dict) else value
+        if key not in keys:
+            keys.add(key)
+            self._index([key])
+
+    def remove_dates_before(self, min_date: date):
+        for history_date in [history_date for history_date in self if datetime.strptime(history_date, DATE_FORMAT).date() < min_date]:
+            value = self.pop(history_date)
+            self._filters.pop(history_date, None)
+            self._unindex(value["keys"] if isinstance(value, dict) else value)
+
+    def compact(self, max_keys_size: int):
+        """
+        Compacts the keys of the dates with the most keys into Bloom filters until the size of the keys left is below max_keys_size
+        """
+        if self._keys_size <= max_keys_size:
+            return
+        keys_by_date = {history_date: value["keys"] if isinstance(value, dict) else value for history_date, value in self.items()}
+        for history_date in sorted(keys_by_date, key=lambda history_date: len(keys_by_date[history_date]), reverse=True):
+            if self._keys_size <= max_keys_size:
+                break
+            keys = keys_by_date[history_date]
+            if keys:
+                self._compact_date(history_date, keys)
+
+    def _compact_date(self, history_date: str, keys: Set[str]):
+        filters = self._filters.setdefault(history_date, [])
+        value = self[history_date]
+        filter_states = value["filters"] if isinstance(value, dict) else []
+        # only the last filter and the new ones are changed, the other ones keep their serialized state
+        unchanged_filters = max(len(filters) - 1, 0)
+        for key in keys:
+            if not filters or filters[-1].is_full:
+                # each new filter holds at least as many keys as the previous ones, so that a date holds a few filters at most
+                capacity = max([len(keys)] + [bloom_filter.capacity * 2 for bloom_filter in filters])
+                filters.append(BloomFilter(capacity, self.error_rate))
+            filters[-1].add(key)
+        self._unindex(keys)
+        filter_states = filter_states[:unchanged_filters] + [bloom_filter.to_state() for bloom_filter in filters[unchanged_filters:]]
+        super().__setitem__(history_date, {"filters": filter_states, "keys": set()})
+
+    def _index(self, keys: Iterable[str]):
+        for key in keys:
+            count = self._key_counts.get(key, 0)
+            if not count:
+                self._keys_size += len(key)
+            self._key_counts[key] = count + 1
+
+    def _unindex(self, keys: Iterable[str]):
+        for key in keys:
+            count = self._key_counts.pop(key)
+            if count > 1:
+                self._key_counts[key] = count - 1
+            else:
+                self._keys_size -= len(key)
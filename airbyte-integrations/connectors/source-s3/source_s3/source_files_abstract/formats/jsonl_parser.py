@@ -2,6 +2,7 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import io
 import logging
 from typing import Any, BinaryIO, Iterator, Mapping, TextIO, Union
 
@@ -83,6 +84,18 @@ class JsonlParser(AbstractFileParser):
             logger.warning(message)
             raise ValueError(message) from e
 
+    def _sample(self, file: Union[TextIO, BinaryIO]) -> Union[TextIO, BinaryIO]:
+        """
+        Reads the first infer_schema_sample_size bytes of the file and the rest of the last line, if sampling is enabled.
+        The lines can't be split when newlines are allowed in values so the whole file is read then.
+        """
+        if not self.format.infer_schema_sample_size or self.format.newlines_in_values:
+            return file
+        sample = file.read(self.format.infer_schema_sample_size)
+        if sample and not sample.endswith(b"\n"):
+            sample += file.readline()
+        return io.BytesIO(sample)
+
     def get_inferred_schema(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> Mapping[str, Any]:
         """
         https://arrow.apache.org/docs/python/generated/pyarrow.json.read_json.html
@@ -99,7 +112,7 @@ class JsonlParser(AbstractFileParser):
                 return str(type_)
             raise Exception(f"Unknown PyArrow Type: {type_}")
 
-        table = self._read_table(file)
+        table = self._read_table(self._sample(file))
         schema_dict = {field.name: field_type_to_str(field.type) for field in table.schema}
         return self.json_schema_to_pyarrow_schema(schema_dict, reverse=True)
 
@@ -109,4 +122,5 @@ class JsonlParser(AbstractFileParser):
 
         """
         table = self._read_table(file, self._master_schema)
-        yield from table.to_pylist()
+        for batch in table.to_batches():
+            yield from self.records_from_batch(batch)
@@ -44,3 +44,9 @@ class JsonlFormat(BaseModel):
         description="The chunk size in bytes to process at a time in memory from each file. If your data is particularly wide and failing during schema detection, increasing this should solve it. Beware of raising this too high as you could hit OOM errors.",
         order=2,
     )
+    infer_schema_sample_size: int = Field(
+        title="Schema Inference Sample Size",
+        default=0,
+        description="Number of bytes read from the start of each file to infer its schema, rounded up to the end of the last line. Set it to 0 to infer the schema from the whole file. Not used when newlines in values are allowed.",
+        order=3,
+    )
@@ -88,6 +88,16 @@ class ParquetParser(AbstractFileParser):
             return func(field_value) if func else field_value
         raise TypeError(f"unsupported field type: {logical_type}, value: {field_value}")
 
+    @classmethod
+    def convert_column_data(cls, logical_type: str, column_values: List[Any]) -> List[Any]:
+        """Converts all the values of a column at once, the values of the types without conversion are returned as is"""
+        if logical_type not in PARQUET_TYPES:
+            return [cls.convert_field_data(logical_type, field_value) for field_value in column_values]
+        _, _, func = PARQUET_TYPES[logical_type]
+        if func is None:
+            return column_values
+        return [None if field_value is None else func(field_value) for field_value in column_values]
+
     def get_inferred_schema(self, file: Union[TextIO, BinaryIO], file_info: FileInfo) -> dict:
         """
         https://arrow.apache.org/docs/python/parquet.html#finer-grained-reading-and-writing
@@ -128,18 +138,16 @@ class ParquetParser(AbstractFileParser):
         for num_row_group in range(reader.num_row_groups):
             args["row_groups"] = [num_row_group]
             for batch in reader.iter_batches(**args):
-                # this gives us a dist of lists where each nested list holds ordered values for a single column
-                # {'number': [1.0, 2.0, 3.0], 'name': ['foo', None, 'bar'], 'flag': [True, False, True], 'delta': [-1.0, 2.5, 0.1]}
-                batch_dict = batch.to_pydict()
                 # sometimes the batch file has more columns than master_schema declares, like:
                 # master schema: ['number', 'name', 'flag', 'delta'],
                 # batch_file_schema: ['number', 'name', 'flag', 'delta', 'EXTRA_COL_NAME'].
                 # we need to check wether batch_file_schema == master_schema and reject extra columns, otherwise "KeyError" raises.
-                batch_columns = [column for column in batch_dict.keys() if column in self._master_schema]
-                columnwise_record_values = [batch_dict[column] for column in batch_columns if column in self._master_schema]
-                # we zip this to get row-by-row
-                for record_values in zip(*columnwise_record_values):
-                    yield {
-                        batch_columns[i]: self.convert_field_data(logical_types[batch_columns[i]], record_values[i])
-                        for i in range(len(batch_columns))
-                    }
+                batch_columns = [column for column in batch.schema.names if column in self._master_schema]
+                # this gives us a list of lists where each nested list holds the converted values of a single column
+                # [[1.0, 2.0, 3.0], ['foo', None, 'bar'], [True, False, True], ['2022-01-01T00:00:00', None, '2022-01-02T00:00:00']]
+                columnwise_record_values = [
+                    self.convert_column_data(logical_types[column], self.column_to_pylist(batch.column(index)))
+                    for index, column in enumerate(batch.schema.names)
+                    if column in self._master_schema
+                ]
+                yield from self.records_from_columns(batch_columns, columnwise_record_values)
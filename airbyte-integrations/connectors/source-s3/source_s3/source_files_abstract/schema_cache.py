@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import os
+import tempfile
+from threading import Lock
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from airbyte_cdk.logger import AirbyteLogger
+
+from .file_info import FileInfo
+
+LOGGER = AirbyteLogger()
+
+
+class SchemaInferenceCache:
+    """
+    Sidecar file keeping the schema inferred from each file, so that the master schema is only inferred from the files added or changed
+    since the previous discover, check or read instead of downloading the whole bucket again every time the connector starts.
+
+    A file is identified by its key and its fingerprint, i.e. its ETag when the storage provides one, else its last modified date and size.
+    Every stream has its own sidecar file, named after a hash of the scope passed in (e.g. the location of the files and the format
+    options), so that changing the format options invalidates the schemas inferred with the previous ones.
+    """
+
+    version = 1
+
+    def __init__(self, cache_dir: str, scope: Mapping[str, Any]):
+        """
+        :param cache_dir: directory holding the sidecar files, created if needed
+        :param scope: anything the inferred schemas depend on apart from the files themselves, must be JSON serializable
+        """
+        scope_hash = hashlib.sha256(json.dumps(scope, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        self.path = os.path.join(cache_dir, f"{scope_hash}.json")
+        self._lock = Lock()
+        # key -> {"fingerprint": ..., "schema": {column: json_type}}
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._changed = False
+
+    @staticmethod
+    def fingerprint(file_info: FileInfo) -> str:
+        if file_info.etag:
+            return f"etag:{file_info.etag}"
+        return f"last_modified:{file_info.last_modified.isoformat()},size:{file_info.size}"
+
+    def get(self, file_info: FileInfo) -> Optional[Dict[str, Any]]:
+        """
+        :return: the schema previously inferred from this version of the file, None if the file is new or was changed since
+        """
+        with self._lock:
+            entry = self._entries.get(file_info.key)
+        if entry is None or entry["fingerprint"] != self.fingerprint(file_info):
+            return None
+        return dict(entry["schema"])
+
+    def put(self, file_info: FileInfo, schema: Mapping[str, Any]):
+        with self._lock:
+            self._entries[file_info.key] = {"fingerprint": self.fingerprint(file_info), "schema": dict(schema)}
+            self._changed = True
+
+    def save(self, keep_keys: Iterable[str] = None):
+        """
+        Writes the cache to its sidecar file, the cache is only used to save time so failing to write it is logged and ignored.
+
+        :param keep_keys: if passed, the entries of the other keys are dropped, e.g. the files deleted from the bucket
+        """
+        with self._lock:
+            if keep_keys is not None:
+                keep_keys = set(keep_keys)
+                removed_keys = [key for key in self._entries if key not in keep_keys]
+                for key in removed_keys:
+                    del self._entries[key]
+                self._changed = self._changed or bool(removed_keys)
+            if not self._changed:
+                return
+            content = {"version": self.version, "files": self._entries}
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                # write then rename so that a reader never sees a partially written file
+                with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(self.path), suffix=".tmp", delete=False) as file:
+                    json.dump(content, file)
+                os.replace(file.name, self.path)
+            except OSError as e:
+                LOGGER.warn(f"Failed to save the schema inference cache to {self.path}: {e!r}")
+                return
+            self._changed = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path) as file:
+                content = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            LOGGER.warn(f"Ignoring the schema inference cache {self.path} which can't be read: {e!r}")
+            return {}
+        if not isinstance(content, dict) or content.get("version") != self.version:
+            return {}
+        return content.get("files", {})
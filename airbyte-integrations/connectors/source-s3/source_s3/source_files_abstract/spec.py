@@ -5,7 +5,7 @@
 
 import json
 import re
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
 from jsonschema import RefResolver
 from pydantic import BaseModel, Field
@@ -77,6 +77,15 @@ class SourceFilesAbstractSpec(BaseModel):
         order=30,
     )
 
+    schema_cache_dir: Optional[str] = Field(
+        title="Schema Inference Cache Directory",
+        default=None,
+        description="Optionally provide a directory where the schema inferred from each file is kept between runs, so that only new "
+        "or changed files are downloaded to infer the schema. It must be a durable path, e.g. under the <strong>/local</strong> "
+        "mount, for the cache to outlive the connector container. Leave empty to disable the cache, which is the default.",
+        order=40,
+    )
+
     @staticmethod
     def change_format_to_oneOf(schema: dict) -> dict:
         props_to_change = ["format"]
@@ -7,9 +7,9 @@ import json
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from datetime import datetime, timedelta
-from functools import lru_cache
+from functools import lru_cache, partial
 from traceback import format_exc
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.logger import AirbyteLogger
 from airbyte_cdk.models import FailureType
@@ -18,12 +18,15 @@ from airbyte_cdk.sources.streams import Stream
 from wcmatch.glob import GLOBSTAR, SPLIT, globmatch
 
 from ..exceptions import S3Exception
+from .concurrency import FileReadAhead, map_in_order
+from .file_history import FileHistory
 from .file_info import FileInfo
 from .formats.abstract_file_parser import AbstractFileParser
 from .formats.avro_parser import AvroParser
 from .formats.csv_parser import CsvParser
 from .formats.jsonl_parser import JsonlParser
 from .formats.parquet_parser import ParquetParser
+from .schema_cache import SchemaInferenceCache
 from .storagefile import StorageFile
 
 JSON_TYPES = ["string", "number", "integer", "object", "array", "boolean", "null"]
@@ -52,14 +55,24 @@ class FileStream(Stream, ABC):
     ab_file_name_col = "_ab_source_file_url"
     airbyte_columns = [ab_additional_col, ab_last_mod_col, ab_file_name_col]
     datetime_format_string = "%Y-%m-%dT%H:%M:%S%z"
+    # number of files downloaded and parsed at the same time, when reading records and when inferring the master schema
+    max_concurrent_files = 8
+    # files bigger than this size in bytes are only read when their records are emitted, instead of being read ahead
+    max_read_ahead_file_size = 16 * 1024**2
+    # number of records of each file read ahead which are held in memory until they are emitted
+    max_read_ahead_records = 1000
+    # directory of the sidecar files caching the schema inferred from each file across runs, the cache is disabled unless it is set
+    schema_cache_dir: Optional[str] = None
 
-    def __init__(self, dataset: str, provider: dict, format: dict, path_pattern: str, schema: str = None):
+    def __init__(self, dataset: str, provider: dict, format: dict, path_pattern: str, schema: str = None, schema_cache_dir: str = None):
         """
         :param dataset: table name for this stream
         :param provider: provider specific mapping as described in spec.json
         :param format: file format specific mapping as described in spec.json
         :param path_pattern: glob-style pattern for file-matching (https://facelessuser.github.io/wcmatch/glob/)
         :param schema: JSON-syntax user provided schema, defaults to None
+        :param schema_cache_dir: durable directory where the schema inferred from each file is kept across runs, defaults to None
+            (the schema inference cache is disabled)
         """
         self.dataset = dataset
         self._path_pattern = path_pattern
@@ -68,7 +81,10 @@ class FileStream(Stream, ABC):
         self._schema: Dict[str, Any] = {}
         if schema:
             self._schema = self._parse_user_input_schema(schema)
+        if schema_cache_dir:
+            self.schema_cache_dir = schema_cache_dir
         self.master_schema: Dict[str, Any] = None
+        self._read_ahead: Optional[FileReadAhead] = None
         LOGGER.info(f"initialised stream with format: {format}")
 
     @staticmethod
@@ -210,6 +226,8 @@ class FileStream(Stream, ABC):
             to build up this superset schema (master_schema).
         This runs datatype checks to Warn or Error if we find incompatible schemas (e.g. same column is 'date' in one file but 'float' in another).
         This caches the master_schema after first run in order to avoid repeated compute and network calls to infer schema on all files.
+        If schema_cache_dir is set, the schema inferred from each file is also kept across runs in a SchemaInferenceCache so that
+            only new or changed files are downloaded.
 
         :param min_datetime: if passed, will only use files with last_modified >= this to determine master schema
 
@@ -222,20 +240,35 @@ class FileStream(Stream, ABC):
             master_schema = deepcopy(self._schema)
 
             file_reader = self.fileformatparser_class(self._format)
+            schema_cache = self._get_schema_cache()
 
-            processed_files = []
-            for file_info in self.get_time_ordered_file_infos():
-                # skip this file if it's earlier than min_datetime
-                if (min_datetime is not None) and (file_info.last_modified < min_datetime):
-                    continue
-
+            def infer_schema(file_info: FileInfo) -> Optional[Dict[str, Any]]:
+                if schema_cache is not None:
+                    cached_schema = schema_cache.get(file_info)
+                    if cached_schema is not None:
+                        return cached_schema
                 storagefile = self.storagefile_class(file_info, self._provider)
                 try:
                     with storagefile.open(file_reader.is_binary) as f:
-                        this_schema = file_reader.get_inferred_schema(f, file_info)
-                        processed_files.append(file_info)
+                        inferred_schema = file_reader.get_inferred_schema(f, file_info)
                 except OSError:
+                    return None
+                if schema_cache is not None:
+                    schema_cache.put(file_info, inferred_schema)
+                return inferred_schema
+
+            # skip the files earlier than min_datetime
+            file_infos = [
+                file_info
+                for file_info in self.get_time_ordered_file_infos()
+                if (min_datetime is None) or (file_info.last_modified >= min_datetime)
+            ]
+            processed_files = []
+            # schemas are inferred concurrently but merged in the order of the files
+            for file_info, this_schema in zip(file_infos, map_in_order(infer_schema, file_infos, self.max_concurrent_files)):
+                if this_schema is None:
                     continue
+                processed_files.append(file_info)
 
                 if this_schema == master_schema:
                     continue  # exact schema match so go to next file
@@ -277,11 +310,27 @@ class FileStream(Stream, ABC):
                     if col not in master_schema.keys():
                         master_schema[col] = datatype
 
+            if schema_cache is not None:
+                schema_cache.save(keep_keys=[file_info.key for file_info in self.get_time_ordered_file_infos()])
             LOGGER.info(f"determined master schema: {master_schema}")
             self.master_schema = master_schema
 
         return self.master_schema
 
+    def schema_cache_scope(self) -> Mapping[str, Any]:
+        """
+        Override this to leave out of the scope of the schema inference cache the provider options which don't change the files read,
+        e.g. credentials, so that rotating them doesn't invalidate the cache.
+
+        :return: everything the schema inferred from a file depends on, apart from the file itself
+        """
+        return {"provider": self._provider, "format": self._format}
+
+    def _get_schema_cache(self) -> Optional[SchemaInferenceCache]:
+        if self.schema_cache_dir is None:
+            return None
+        return SchemaInferenceCache(self.schema_cache_dir, self.schema_cache_scope())
+
     def stream_slices(
         self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Dict[str, Any]]]:
@@ -293,12 +342,28 @@ class FileStream(Stream, ABC):
         Incremental stream_slices are implemented in the IncrementalFileStream child class.
         """
 
-        # TODO: this could be optimised via concurrent reads, however we'd lose chronology and need to deal with knock-ons of that
-        # we could do this concurrently both full and incremental by running batches in parallel
-        # and then incrementing the cursor per each complete batch
-        for file_info in self.get_time_ordered_file_infos():
+        file_infos = self.get_time_ordered_file_infos()
+        self._start_read_ahead(file_infos)
+        for file_info in file_infos:
             yield {"files": [{"storage_file": self.storagefile_class(file_info, self._provider)}]}
 
+    def _start_read_ahead(self, file_infos: List[FileInfo]):
+        """
+        Starts downloading and parsing the files of the slices about to be read on a pool of max_concurrent_files threads.
+        Records are still emitted file by file, in the order of the slices, so the state keeps following the last modified order.
+        """
+        if self._read_ahead is not None:
+            self._read_ahead.close()
+            self._read_ahead = None
+        if self.max_concurrent_files > 1:
+            self._read_ahead = FileReadAhead(
+                file_infos,
+                lambda file_info: self.storagefile_class(file_info, self._provider),
+                max_workers=self.max_concurrent_files,
+                max_file_size=self.max_read_ahead_file_size,
+                max_buffered_records=self.max_read_ahead_records,
+            )
+
     def _match_target_schema(self, record: Dict[str, Any], target_columns: List) -> Dict[str, Any]:
         """
         This method handles missing or additional fields in each record, according to the provided target_columns.
@@ -348,26 +413,35 @@ class FileStream(Stream, ABC):
         Uses provider-relevant StorageFile to open file and then iterates through stream_records() using format-relevant AbstractFileParser.
         Records are mutated on the fly using _match_target_schema() and _add_extra_fields_from_map() to achieve desired final schema.
         Since this is called per stream_slice, this method works for both full_refresh and incremental.
+        The files of the upcoming slices are read ahead concurrently if the slices come from stream_slices().
         """
+        read_file = partial(self._read_file, file_reader)
         for file_item in stream_slice["files"]:
             storage_file: StorageFile = file_item["storage_file"]
-            try:
-                with storage_file.open(file_reader.is_binary) as f:
-                    # TODO: make this more efficient than mutating every record one-by-one as they stream
-                    for record in file_reader.stream_records(f, storage_file.file_info):
-                        schema_matched_record = self._match_target_schema(record, list(self._get_schema_map().keys()))
-                        complete_record = self._add_extra_fields_from_map(
-                            schema_matched_record,
-                            {
-                                self.ab_last_mod_col: datetime.strftime(storage_file.last_modified, self.datetime_format_string),
-                                self.ab_file_name_col: storage_file.url,
-                            },
-                        )
-                        yield complete_record
-            except OSError:
-                continue
+            if self._read_ahead is not None:
+                yield from self._read_ahead.read(storage_file, read_file)
+            else:
+                yield from read_file(storage_file)
         LOGGER.info("finished reading a stream slice")
 
+    def _read_file(self, file_reader: AbstractFileParser, storage_file: StorageFile) -> Iterator[Mapping[str, Any]]:
+        """
+        Reads the records of a single file, the file is skipped from the first OSError raised while reading it
+        """
+        target_columns = list(self._get_schema_map().keys())
+        extra_fields = {
+            self.ab_last_mod_col: datetime.strftime(storage_file.last_modified, self.datetime_format_string),
+            self.ab_file_name_col: storage_file.url,
+        }
+        try:
+            with storage_file.open(file_reader.is_binary) as f:
+                # TODO: make this more efficient than mutating every record one-by-one as they stream
+                for record in file_reader.stream_records(f, storage_file.file_info):
+                    schema_matched_record = self._match_target_schema(record, target_columns)
+                    yield self._add_extra_fields_from_map(schema_matched_record, extra_fields)
+        except OSError:
+            return
+
     def read_records(
         self,
         sync_mode: SyncMode,
@@ -388,7 +462,10 @@ class IncrementalFileStream(FileStream, ABC):
     state_checkpoint_interval = None
     buffer_days = 3  # keeping track of all files synced in the last N days
     sync_all_files_always = False
-    max_history_size = 1000000000
+    # total length of the file names kept as is in the history, above it the file names are compacted in Bloom filters
+    max_history_size = 1024**2
+    # history of the state of the sync -> its FileHistory
+    _parsed_history: Optional[Tuple[Mapping[str, Any], FileHistory]] = None
 
     @property
     def cursor_field(self) -> str:
@@ -399,10 +476,18 @@ class IncrementalFileStream(FileStream, ABC):
 
     @staticmethod
     def file_in_history(file_info: FileInfo, history: dict) -> bool:
-        for slot in history.values():
-            if file_info.key in slot:
-                return file_info.key in slot
-        return False
+        return FileHistory.from_state(history).contains_file(file_info.key)
+
+    def _get_file_history(self, stream_state: Mapping[str, Any] = None) -> FileHistory:
+        """
+        Parses the history of the state once, rather than for every file checked against it
+        """
+        history = (stream_state or {}).get("history", {})
+        if isinstance(history, FileHistory):
+            return history
+        if self._parsed_history is None or self._parsed_history[0] is not history:
+            self._parsed_history = (history, FileHistory.from_state(history))
+        return self._parsed_history[1]
 
     def _get_datetime_from_stream_state(self, stream_state: Mapping[str, Any] = None) -> datetime:
         """if no state, we default to 1970-01-01 in order to pick up all files present."""
@@ -413,40 +498,30 @@ class IncrementalFileStream(FileStream, ABC):
 
     def get_updated_history(self, current_stream_state, latest_record_datetime, latest_record, current_parsed_datetime, state_date):
         """
-        History is dict which basically groups files by their modified_at date.
+        History is dict which basically groups files by their modified_at date, see FileHistory.
         After reading each record we add its file to the history set if it wasn't already there.
         Then we drop from the history set any entries whose key is less than now - buffer_days
+        The history is parsed from the state on the first record, then updated in place for the next records of the sync.
         """
 
-        history = current_stream_state.get("history", {})
-
-        file_modification_date = latest_record_datetime.strftime("%Y-%m-%d")
+        history = FileHistory.from_state(current_stream_state.get("history", {}))
 
         # add record to history if record modified date in range delta start from state
         if latest_record_datetime.date() + timedelta(days=self.buffer_days) >= state_date:
-            history_item = set(history.setdefault(file_modification_date, set()))
-            history_item.add(latest_record[self.ab_file_name_col])
-            history[file_modification_date] = history_item
+            history.add_file(latest_record_datetime.date(), latest_record[self.ab_file_name_col])
 
         # reset history to new date state
         if current_parsed_datetime.date() != state_date:
-            history = {
-                date: history[date]
-                for date in history
-                if datetime.strptime(date, "%Y-%m-%d").date() + timedelta(days=self.buffer_days) >= state_date
-            }
+            history.remove_dates_before(state_date - timedelta(days=self.buffer_days))
 
         return history
 
     def size_history_balancer(self, state_dict):
         """
-        Delete history if state size limit reached
+        Compacts the file names of the history once they exceed max_history_size, so that the history stays bounded without being dropped
         """
-        history = state_dict["history"]
-
-        if history.__sizeof__() > self.max_history_size:
-            self.sync_all_files_always = True
-            state_dict.pop("history")
+        if "history" in state_dict:
+            state_dict["history"].compact(self.max_history_size)
 
         return state_dict
 
@@ -487,12 +562,12 @@ class IncrementalFileStream(FileStream, ABC):
             stream_state is not None
             and self.cursor_field in stream_state.keys()
             and file_info.last_modified <= self._get_datetime_from_stream_state(stream_state)
-            and self.file_in_history(file_info, stream_state.get("history", {}))
+            and self._get_file_history(stream_state).contains_file(file_info.key)
         )
 
         file_is_not_in_history_and_last_modified_plus_buffer_days_is_earlier_than_cursor_value = file_info.last_modified + timedelta(
             days=self.buffer_days
-        ) < self._get_datetime_from_stream_state(stream_state) and not self.file_in_history(file_info, stream_state.get("history", {}))
+        ) < self._get_datetime_from_stream_state(stream_state) and not self._get_file_history(stream_state).contains_file(file_info.key)
 
         return (
             file_in_history_and_last_modified_is_earlier_than_cursor_value
@@ -520,13 +595,15 @@ class IncrementalFileStream(FileStream, ABC):
             if self._schema == {} and stream_state is not None and "schema" in stream_state.keys():
                 self._schema = stream_state["schema"]
 
+            file_infos = [
+                file_info for file_info in self.get_time_ordered_file_infos() if not self.need_to_skip_file(stream_state, file_info)
+            ]
+            self._start_read_ahead(file_infos)
+
             # logic here is to bundle all files with exact same last modified timestamp together in each slice
             prev_file_last_mod: datetime = None  # init variable to hold previous iterations last modified
             grouped_files_by_time: List[Dict[str, Any]] = []
-            for file_info in self.get_time_ordered_file_infos():
-                if self.need_to_skip_file(stream_state, file_info):
-                    continue
-
+            for file_info in file_infos:
                 # check if this file belongs in the next slice, if so yield the current slice before this file
                 if (prev_file_last_mod is not None) and (file_info.last_modified != prev_file_last_mod):
                     yield {"files": grouped_files_by_time}
@@ -3,7 +3,7 @@
 #
 
 
-from typing import Callable, Iterator
+from typing import Any, Callable, Iterator, Mapping
 
 from boto3 import session as boto3session
 from botocore import UNSIGNED
@@ -20,6 +20,13 @@ class IncrementalFileStreamS3(IncrementalFileStream):
     def storagefile_class(self) -> type:
         return S3File
 
+    def schema_cache_scope(self) -> Mapping[str, Any]:
+        """
+        The credentials are left out, the same objects are read whichever credentials are used
+        """
+        provider = {key: value for key, value in self._provider.items() if key not in ("aws_access_key_id", "aws_secret_access_key")}
+        return {"provider": provider, "format": self._format}
+
     def _list_bucket(self, accept_key: Callable = lambda k: True) -> Iterator[FileInfo]:
         """
         Wrapper for boto3's list_objects_v2 so we can handle pagination, filter by lambda func and operate with or without credentials
@@ -56,7 +63,7 @@ class IncrementalFileStreamS3(IncrementalFileStream):
                 for c in content:
                     key = c["Key"]
                     if accept_key(key):
-                        yield FileInfo(key=key, last_modified=c["LastModified"], size=c["Size"])
+                        yield FileInfo(key=key, last_modified=c["LastModified"], size=c["Size"], etag=c.get("ETag"))
             ctoken = response.get("NextContinuationToken", None)
             if not ctoken:
                 break
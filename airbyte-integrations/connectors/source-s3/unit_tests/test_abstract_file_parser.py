@@ -2,6 +2,7 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import datetime
 from typing import Any, Mapping, Tuple
 
 import pyarrow as pa
@@ -111,3 +112,29 @@ class TestAbstractFileParserStatics:
             with pytest.raises(Exception) as e_info:
                 AbstractFileParser.json_schema_to_pyarrow_schema(pyarrow_schema, reverse=True)
                 LOGGER.debug(str(e_info))
+
+    @pytest.mark.parametrize(
+        "array",
+        [
+            pa.array([datetime.datetime(2022, 1, 1, 12, 30, 15, 123456), None, datetime.datetime(1, 1, 1)], type=pa.timestamp("us")),
+            pa.array([datetime.datetime(2022, 1, 1, 12, 30, 15), None], type=pa.timestamp("s")),
+            pa.array([datetime.datetime(2022, 1, 1, 12, 30, 15), None], type=pa.timestamp("ns")),
+            pa.array([datetime.datetime(2022, 1, 1, 12, 30, 15), None], type=pa.timestamp("ms", tz="Europe/Paris")),
+            pa.array([datetime.date(2022, 1, 1), None, datetime.date(9999, 12, 31)], type=pa.date32()),
+            pa.array([1, None, 3], type=pa.int64()),
+            pa.array(["a", None, "c"], type=pa.string()),
+        ],
+    )
+    def test_column_to_pylist(self, array: pa.Array) -> None:
+        assert AbstractFileParser.column_to_pylist(array) == array.to_pylist()
+        assert AbstractFileParser.column_to_pylist(pa.chunked_array([array, array])) == array.to_pylist() * 2
+
+    def test_records_from_batch(self) -> None:
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array([1, 2]), pa.array(["a", None]), pa.array([datetime.date(2022, 1, 1), None], type=pa.date32())],
+            names=["id", "name", "day"],
+        )
+        assert list(AbstractFileParser.records_from_batch(batch)) == [
+            {"id": 1, "name": "a", "day": datetime.date(2022, 1, 1)},
+            {"id": 2, "name": None, "day": None},
+        ]
@@ -3,6 +3,7 @@
 #
 
 import os
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -33,6 +34,23 @@ class TestJsonlParser(AbstractTestParser):
                 "line_checks": {},
                 "fails": [],
             },
+            "infer_schema_from_sample_test": {
+                # the sample ends in the middle of the first line
+                "AbstractFileParser": JsonlParser(format={"filetype": "jsonl", "infer_schema_sample_size": 50}),
+                "filepath": os.path.join(SAMPLE_DIRECTORY, "jsonl/test_file_1.jsonl"),
+                "num_records": 8,
+                "inferred_schema": {
+                    "id": "integer",
+                    "name": "string",
+                    "valid": "boolean",
+                    "code": "integer",
+                    "degrees": "number",
+                    "birthday": "string",
+                    "last_seen": "string",
+                },
+                "line_checks": {},
+                "fails": [],
+            },
             "master_schema_test": {
                 "AbstractFileParser": JsonlParser(
                     format={"filetype": "jsonl"},
@@ -177,3 +195,10 @@ class TestJsonlParser(AbstractTestParser):
                 "fails": [],
             },
         }
+
+
+def test_infer_schema_from_the_first_lines():
+    file = BytesIO(b'{"id": 1}\n{"id": 2}\n{"id": 3, "name": "later"}\n')
+    assert JsonlParser(format={"filetype": "jsonl", "infer_schema_sample_size": 12}).get_inferred_schema(file, None) == {"id": "integer"}
+    file.seek(0)
+    assert JsonlParser(format={"filetype": "jsonl"}).get_inferred_schema(file, None) == {"id": "integer", "name": "string"}
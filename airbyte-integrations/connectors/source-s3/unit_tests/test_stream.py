@@ -2,13 +2,18 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
-from datetime import datetime
-from typing import Any, Dict, List, Mapping
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from io import BytesIO
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping
 from unittest.mock import MagicMock, patch
 
 import pytest
 from airbyte_cdk import AirbyteLogger
 from airbyte_cdk.models import SyncMode
+from pydantic.json import pydantic_encoder
 from source_s3.exceptions import S3Exception
 from source_s3.source_files_abstract.file_info import FileInfo
 from source_s3.source_files_abstract.storagefile import StorageFile
@@ -20,10 +25,10 @@ from .abstract_test_parser import create_by_local_file, memory_limit
 LOGGER = AirbyteLogger()
 
 
-def mock_big_size_object():
-    mock = MagicMock()
-    mock.__sizeof__.return_value = 1000000001
-    return mock
+class MemoryStorageFile(StorageFile):
+    @contextmanager
+    def open(self, binary: bool) -> Iterator[BinaryIO]:
+        yield BytesIO()
 
 
 class TestIncrementalFileStream:
@@ -355,24 +360,59 @@ class TestIncrementalFileStream:
                 {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": {"2022-07-01": {"old_test_file.csv"}}},
                 {"2022-07-01": {"old_test_file.csv"}, "2022-07-03": {"new_test_file.csv"}},
             ),
-            (  # history size limit reached
-                {"_ab_source_file_url": "test.csv"},
-                {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": mock_big_size_object()},
-                None,
-            ),
         ],
-        ids=["overwrite_history_file", "add_file_to_same_day ", "add_new_day_to_history", "history_size_limit_reached"],
+        ids=["overwrite_history_file", "add_file_to_same_day ", "add_new_day_to_history"],
     )
     @patch(
         "source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set()
     )  # patching abstractmethods to empty set so we can instantiate ABC to test
-    def test_get_updated_history(self, latest_record, current_stream_state, expected, request) -> None:
+    def test_get_updated_history(self, latest_record, current_stream_state, expected) -> None:
         fs = IncrementalFileStream(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**/prefix*.csv")
         fs._get_schema_map = MagicMock(return_value={})
         assert fs.get_updated_state(current_stream_state, latest_record).get("history") == expected
 
-        if request.node.callspec.id == "history_size_limit_reached":
-            assert fs.sync_all_files_always
+    @patch(
+        "source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set()
+    )  # patching abstractmethods to empty set so we can instantiate ABC to test
+    @patch.object(IncrementalFileStream, "max_history_size", 1000)
+    def test_history_size_limit_reached(self) -> None:
+        fs = IncrementalFileStream(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**/prefix*.csv")
+        fs._get_schema_map = MagicMock(return_value={})
+        old_files = [f"old/file_{i}.csv" for i in range(1000)]
+        state = {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": {"2022-07-01": old_files}}
+        for i in range(1000):
+            record = {"_ab_source_file_last_modified": "2022-07-02T00:00:00+0000", "_ab_source_file_url": f"new/file_{i}.csv"}
+            state = fs.get_updated_state(state, record)
+        state = fs.get_updated_state(
+            state, {"_ab_source_file_last_modified": "2022-07-02T00:00:00+0000", "_ab_source_file_url": "last.csv"}
+        )
+
+        # the history is compacted rather than dropped and is parsed back from its serialized state
+        assert not fs.sync_all_files_always
+        history = json.loads(json.dumps(state["history"], default=pydantic_encoder))
+        assert len(json.dumps(history)) < 20000
+        assert sorted(history["2022-07-01"]) == sorted(history["2022-07-02"]) == ["filters", "keys"]
+        for key in old_files + [f"new/file_{i}.csv" for i in range(1000)] + ["last.csv"]:
+            assert fs.file_in_history(FileInfo(key=key, size=1, last_modified=datetime(2022, 7, 1)), history)
+        false_positives = sum(
+            fs.file_in_history(FileInfo(key=f"other_{i}.csv", size=1, last_modified=datetime.now()), history) for i in range(1000)
+        )
+        assert false_positives <= 1
+
+    @patch(
+        "source_s3.source_files_abstract.stream.IncrementalFileStream.__abstractmethods__", set()
+    )  # patching abstractmethods to empty set so we can instantiate ABC to test
+    def test_history_is_updated_in_place(self) -> None:
+        fs = IncrementalFileStream(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**/prefix*.csv")
+        fs._get_schema_map = MagicMock(return_value={})
+        state = {"_ab_source_file_last_modified": "2022-07-01T00:00:00+0000", "history": {"2022-07-01": ["old_test_file.csv"]}}
+        record = {"_ab_source_file_last_modified": "2022-07-01T10:00:00+0000", "_ab_source_file_url": "new_test_file.csv"}
+        first_state = fs.get_updated_state(state, record)
+        second_state = fs.get_updated_state(first_state, record)
+
+        assert second_state["history"] is first_state["history"]
+        assert second_state["history"] == {"2022-07-01": {"old_test_file.csv", "new_test_file.csv"}}
+        assert state["history"] == {"2022-07-01": ["old_test_file.csv"]}
 
     @pytest.mark.parametrize(  # set expected_return_record to None for an expected fail
         "stream_state, expected_error",
@@ -633,6 +673,8 @@ class TestIncrementalFileStream:
         ),
     )
     @patch("source_s3.stream.IncrementalFileStreamS3.storagefile_class", MagicMock())
+    # the schemas of the mocked parser are returned in the order of the calls
+    @patch.object(IncrementalFileStreamS3, "max_concurrent_files", 1)
     def test_master_schema(
         self, capsys, user_schema, min_datetime, ordered_file_infos, file_schemas, expected_schema, log_expected, error_expected
     ):
@@ -720,3 +762,126 @@ class TestIncrementalFileStream:
             },
             "type": "object",
         }
+
+    @patch.object(IncrementalFileStreamS3, "storagefile_class", MemoryStorageFile)
+    def test_master_schema_is_inferred_concurrently_in_file_order(self):
+        file_infos = [FileInfo(last_modified=datetime(2022, 1, i), key=f"file_{i}", size=128) for i in range(1, 4)]
+        schemas = {"file_1": {"a": "integer"}, "file_2": {"b": "string"}, "file_3": {"a": "number", "c": "boolean"}}
+        all_files_opened = threading.Barrier(len(file_infos), timeout=5)
+
+        def get_inferred_schema(file, file_info: FileInfo) -> Dict[str, Any]:
+            # only returns once the schemas of all the files are being inferred at the same time
+            all_files_opened.wait()
+            return schemas[file_info.key]
+
+        file_format_parser_mock = MagicMock(return_value=MagicMock(get_inferred_schema=get_inferred_schema))
+        with patch.object(IncrementalFileStreamS3, "fileformatparser_class", file_format_parser_mock):
+            with patch.object(IncrementalFileStreamS3, "get_time_ordered_file_infos", MagicMock(return_value=file_infos)):
+                stream_instance = IncrementalFileStreamS3(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**")
+                master_schema = stream_instance._get_master_schema()
+
+        assert list(master_schema.items()) == [("a", "number"), ("b", "string"), ("c", "boolean")]
+
+    @pytest.mark.parametrize("sync_mode", [SyncMode.full_refresh, SyncMode.incremental])
+    @patch.object(IncrementalFileStreamS3, "storagefile_class", MemoryStorageFile)
+    @patch.object(IncrementalFileStreamS3, "_get_master_schema", MagicMock(return_value={"id": "string"}))
+    @patch.object(IncrementalFileStreamS3, "max_read_ahead_file_size", 1024)
+    def test_files_are_read_concurrently_and_emitted_in_order(self, sync_mode):
+        file_infos = [FileInfo(last_modified=datetime(2022, 1, i, tzinfo=timezone.utc), key=f"file_{i}", size=128) for i in range(1, 4)]
+        file_infos.append(FileInfo(last_modified=datetime(2022, 1, 4, tzinfo=timezone.utc), key="big_file", size=2048))
+        small_files_opened = threading.Barrier(3, timeout=5)
+        reading_threads = {}
+
+        def stream_records(file, file_info: FileInfo) -> Iterator[Mapping[str, Any]]:
+            reading_threads[file_info.key] = threading.current_thread()
+            if file_info.key != "big_file":
+                # only returns once the small files are being read at the same time
+                small_files_opened.wait()
+            yield from ({"id": f"{file_info.key}-{i}"} for i in range(2))
+
+        file_format_parser_mock = MagicMock(return_value=MagicMock(stream_records=stream_records))
+        with patch.object(IncrementalFileStreamS3, "fileformatparser_class", file_format_parser_mock):
+            with patch.object(IncrementalFileStreamS3, "get_time_ordered_file_infos", MagicMock(return_value=file_infos)):
+                stream_instance = IncrementalFileStreamS3(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**")
+                records = [
+                    record
+                    for stream_slice in stream_instance.stream_slices(sync_mode=sync_mode, stream_state={})
+                    for record in stream_instance.read_records(sync_mode=sync_mode, stream_slice=stream_slice, stream_state={})
+                ]
+
+        assert [record["id"] for record in records] == [f"{file_info.key}-{i}" for file_info in file_infos for i in range(2)]
+        # files bigger than max_read_ahead_file_size are streamed
+        assert reading_threads["big_file"] is threading.main_thread()
+        assert reading_threads["file_1"] is not threading.main_thread()
+
+    @patch.object(IncrementalFileStreamS3, "storagefile_class", MemoryStorageFile)
+    @patch.object(IncrementalFileStreamS3, "_get_master_schema", MagicMock(return_value={"id": "string"}))
+    @patch.object(IncrementalFileStreamS3, "max_read_ahead_records", 10)
+    def test_files_are_read_ahead_up_to_a_bounded_number_of_records(self):
+        file_infos = [FileInfo(last_modified=datetime(2022, 1, i, tzinfo=timezone.utc), key=f"file_{i}", size=128) for i in range(1, 3)]
+        file_2_records_read = []
+        file_2_blocked = threading.Event()
+
+        def stream_records(file, file_info: FileInfo) -> Iterator[Mapping[str, Any]]:
+            for i in range(100):
+                if file_info.key == "file_2":
+                    file_2_records_read.append(i)
+                    if len(file_2_records_read) > 11:
+                        file_2_blocked.set()
+                yield {"id": f"{file_info.key}-{i}"}
+
+        file_format_parser_mock = MagicMock(return_value=MagicMock(stream_records=stream_records))
+        with patch.object(IncrementalFileStreamS3, "fileformatparser_class", file_format_parser_mock):
+            with patch.object(IncrementalFileStreamS3, "get_time_ordered_file_infos", MagicMock(return_value=file_infos)):
+                stream_instance = IncrementalFileStreamS3(dataset="dummy", provider={}, format={"filetype": "csv"}, path_pattern="**")
+                stream_slices = list(stream_instance.stream_slices(sync_mode=SyncMode.full_refresh, stream_state={}))
+                records = stream_instance.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slices[0], stream_state={})
+                assert next(records)["id"] == "file_1-0"
+                # file_2 is read ahead while file_1 is emitted, until its buffer of 10 records is full
+                assert not file_2_blocked.wait(0.5)
+                assert 10 <= len(file_2_records_read) <= 11
+                assert len(list(records)) == 99
+                records = stream_instance.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slices[1], stream_state={})
+                assert [record["id"] for record in records] == [f"file_2-{i}" for i in range(100)]
+
+    @patch.object(IncrementalFileStreamS3, "storagefile_class", MemoryStorageFile)
+    def test_master_schema_is_only_inferred_from_new_or_changed_files(self, tmp_path):
+        schemas = {"file_1": {"a": "integer"}, "file_2": {"b": "string"}, "file_3": {"c": "boolean"}}
+        inferred_keys = []
+
+        def get_inferred_schema(file, file_info: FileInfo) -> Dict[str, Any]:
+            inferred_keys.append(file_info.key)
+            return schemas[file_info.key]
+
+        def get_master_schema(file_infos: List[FileInfo], format: Mapping[str, Any]) -> Dict[str, Any]:
+            inferred_keys.clear()
+            file_format_parser_mock = MagicMock(return_value=MagicMock(get_inferred_schema=get_inferred_schema))
+            with patch.object(IncrementalFileStreamS3, "fileformatparser_class", file_format_parser_mock):
+                with patch.object(IncrementalFileStreamS3, "get_time_ordered_file_infos", MagicMock(return_value=file_infos)):
+                    stream_instance = IncrementalFileStreamS3(
+                        dataset="dummy", provider={"bucket": "b"}, format=format, path_pattern="**", schema_cache_dir=str(tmp_path)
+                    )
+                    return stream_instance._get_master_schema()
+
+        csv_format = {"filetype": "csv"}
+        file_1 = FileInfo(last_modified=datetime(2022, 1, 1), key="file_1", size=128, etag='"1"')
+        file_2 = FileInfo(last_modified=datetime(2022, 1, 2), key="file_2", size=128, etag='"2"')
+        assert get_master_schema([file_1, file_2], csv_format) == {"a": "integer", "b": "string"}
+        assert sorted(inferred_keys) == ["file_1", "file_2"]
+
+        schemas["file_2"] = {"b": "number"}
+        changed_file_2 = FileInfo(last_modified=datetime(2022, 1, 5), key="file_2", size=256, etag='"2-changed"')
+        file_3 = FileInfo(last_modified=datetime(2022, 1, 3), key="file_3", size=128)
+        assert get_master_schema([file_1, file_3, changed_file_2], csv_format) == {"a": "integer", "c": "boolean", "b": "number"}
+        assert sorted(inferred_keys) == ["file_2", "file_3"]
+
+        assert get_master_schema([file_1, file_3, changed_file_2], csv_format) == {"a": "integer", "c": "boolean", "b": "number"}
+        assert inferred_keys == []
+
+        # the schemas inferred with other format options are not reused
+        assert get_master_schema([file_1], {"filetype": "csv", "delimiter": ";"}) == {"a": "integer"}
+        assert inferred_keys == ["file_1"]
+
+    def test_schema_cache_is_disabled_by_default(self):
+        stream_instance = IncrementalFileStreamS3(dataset="dummy", provider={"bucket": "b"}, format={"filetype": "csv"}, path_pattern="**")
+        assert stream_instance._get_schema_cache() is None
@@ -3,7 +3,7 @@
 #
 
 import json
-from typing import List, Type, Union
+from typing import List, Optional, Type, Union
 
 import airbyte_api_client
 import click
@@ -18,6 +18,7 @@ from octavia_cli.get.resources import Source as UnmanagedSource
 from octavia_cli.list.listings import Connections as UnmanagedConnections
 from octavia_cli.list.listings import Destinations as UnmanagedDestinations
 from octavia_cli.list.listings import Sources as UnmanagedSources
+from octavia_cli.workspace_snapshot import WorkspaceSnapshot
 
 
 class MissingResourceDependencyError(click.UsageError):
@@ -39,6 +40,7 @@ def import_source_or_destination(
     workspace_id: str,
     ResourceClass: Type[Union[UnmanagedSource, UnmanagedDestination]],
     resource_to_get: str,
+    workspace_snapshot: Optional[WorkspaceSnapshot] = None,
 ) -> str:
     """Helper function to import sources & destinations.
 
@@ -47,11 +49,12 @@ def import_source_or_destination(
         workspace_id (str): current Airbyte workspace id.
         ResourceClass (Union[UnmanagedSource, UnmanagedDestination]): the Airbyte Resource Class.
         resource_to_get (str): the name or ID of the resource in the current Airbyte workspace id.
+        workspace_snapshot (Optional[WorkspaceSnapshot], optional): Snapshot of the workspace resources to find resources by name in.
 
     Returns:
         str: The generated import message.
     """
-    remote_configuration = json.loads(get_json_representation(api_client, workspace_id, ResourceClass, resource_to_get))
+    remote_configuration = json.loads(get_json_representation(api_client, workspace_id, ResourceClass, resource_to_get, workspace_snapshot))
 
     resource_type = ResourceClass.__name__.lower()
 
@@ -73,6 +76,7 @@ def import_connection(
     api_client: airbyte_api_client.ApiClient,
     workspace_id: str,
     resource_to_get: str,
+    workspace_snapshot: Optional[WorkspaceSnapshot] = None,
 ) -> str:
     """Helper function to import connection.
 
@@ -80,11 +84,14 @@ def import_connection(
         api_client (airbyte_api_client.ApiClient): the Airbyte API client.
         workspace_id (str): current Airbyte workspace id.
         resource_to_get (str): the name or ID of the resource in the current Airbyte workspace id.
+        workspace_snapshot (Optional[WorkspaceSnapshot], optional): Snapshot of the workspace resources to find resources by name in.
 
     Returns:
         str: The generated import message.
     """
-    remote_configuration = json.loads(get_json_representation(api_client, workspace_id, UnmanagedConnection, resource_to_get))
+    remote_configuration = json.loads(
+        get_json_representation(api_client, workspace_id, UnmanagedConnection, resource_to_get, workspace_snapshot)
+    )
     # Since #15253 "schedule" is deprecated
     remote_configuration.pop("schedule", None)
     source_name, destination_name = remote_configuration["source"]["name"], remote_configuration["destination"]["name"]
@@ -137,7 +144,11 @@ def _import(ctx: click.Context):  # pragma: no cover
 @click.pass_context
 @requires_init
 def source(ctx: click.Context, resource: str):
-    click.echo(import_source_or_destination(ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], UnmanagedSource, resource))
+    click.echo(
+        import_source_or_destination(
+            ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], UnmanagedSource, resource, ctx.obj["WORKSPACE_SNAPSHOT"]
+        )
+    )
 
 
 @_import.command(cls=OctaviaCommand, name="destination", help=build_help_message("destination"))
@@ -145,7 +156,11 @@ def source(ctx: click.Context, resource: str):
 @click.pass_context
 @requires_init
 def destination(ctx: click.Context, resource: str):
-    click.echo(import_source_or_destination(ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], UnmanagedDestination, resource))
+    click.echo(
+        import_source_or_destination(
+            ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], UnmanagedDestination, resource, ctx.obj["WORKSPACE_SNAPSHOT"]
+        )
+    )
 
 
 @_import.command(cls=OctaviaCommand, name="connection", help=build_help_message("connection"))
@@ -153,20 +168,20 @@ def destination(ctx: click.Context, resource: str):
 @click.pass_context
 @requires_init
 def connection(ctx: click.Context, resource: str):
-    click.echo(import_connection(ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], resource))
+    click.echo(import_connection(ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], resource, ctx.obj["WORKSPACE_SNAPSHOT"]))
 
 
 @_import.command(cls=OctaviaCommand, name="all", help=build_help_message("all"))
 @click.pass_context
 @requires_init
 def all(ctx: click.Context):
-    api_client, workspace_id = ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"]
-    for _, _, resource_id in UnmanagedSources(api_client, workspace_id).get_listing():
-        import_source_or_destination(api_client, workspace_id, UnmanagedSource, resource_id)
-    for _, _, resource_id in UnmanagedDestinations(api_client, workspace_id).get_listing():
-        import_source_or_destination(api_client, workspace_id, UnmanagedDestination, resource_id)
-    for _, resource_id, _, _, _ in UnmanagedConnections(api_client, workspace_id).get_listing():
-        import_connection(api_client, workspace_id, resource_id)
+    api_client, workspace_id, workspace_snapshot = ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], ctx.obj["WORKSPACE_SNAPSHOT"]
+    for _, _, resource_id in UnmanagedSources(api_client, workspace_id, workspace_snapshot).get_listing():
+        import_source_or_destination(api_client, workspace_id, UnmanagedSource, resource_id, workspace_snapshot)
+    for _, _, resource_id in UnmanagedDestinations(api_client, workspace_id, workspace_snapshot).get_listing():
+        import_source_or_destination(api_client, workspace_id, UnmanagedDestination, resource_id, workspace_snapshot)
+    for _, resource_id, _, _, _ in UnmanagedConnections(api_client, workspace_id, workspace_snapshot).get_listing():
+        import_connection(api_client, workspace_id, resource_id, workspace_snapshot)
 
 
 AVAILABLE_COMMANDS: List[click.Command] = [source, destination, connection]
@@ -2,8 +2,10 @@
 # Copyright (c) 2022 Airbyte, Inc., all rights reserved.
 #
 
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from glob import glob
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import airbyte_api_client
 import click
@@ -18,15 +20,29 @@ from .resources import factory as resource_factory
 @click.command(cls=OctaviaCommand, name="apply", help="Create or update Airbyte remote resources according local YAML configurations.")
 @click.option("--file", "-f", "configurations_files", type=click.Path(), multiple=True)
 @click.option("--force", is_flag=True, default=False, help="Does not display the diff and updates without user prompt.")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of resources applied concurrently. Connections are applied after their source and destination, "
+    "diffs are prompted for validation once the other resources are applied.",
+)
 @click.pass_context
 @requires_init
-def apply(ctx: click.Context, configurations_files: List[click.Path], force: bool):
+def apply(ctx: click.Context, configurations_files: List[click.Path], force: bool, workers: int):
     if not configurations_files:
         configurations_files = find_local_configuration_files()
 
     resources = get_resources_to_apply(configurations_files, ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"])
-    for resource in resources:
-        apply_single_resource(resource, force)
+    try:
+        if workers > 1:
+            apply_resources_concurrently(resources, force, workers)
+        else:
+            for resource in resources:
+                apply_single_resource(resource, force)
+    finally:
+        # The cached listings of the workspace are outdated once resources are created or updated.
+        ctx.obj["WORKSPACE_SNAPSHOT"].invalidate()
 
 
 def get_resources_to_apply(
@@ -67,6 +83,142 @@ def apply_single_resource(resource: BaseResource, force: bool) -> None:
     click.echo("\n".join(messages))
 
 
+def get_resources_dependencies(resources: List[BaseResource]) -> Dict[BaseResource, List[BaseResource]]:
+    """Build the dependency graph of the resources to apply: a resource depends on the resources it uses (e.g. the source and
+    destination of a connection) when they are applied too, and on the previous resource sharing its state directory so that
+    state files are written one at a time.
+
+    Args:
+        resources (List[BaseResource]): Resources sorted according to their apply priority.
+
+    Returns:
+        Dict[BaseResource, List[BaseResource]]: The resources each resource depends on, all preceding it in the list of resources.
+    """
+    resources_by_configuration_path = {}
+    resources_by_state_directory = {}
+    dependencies = {}
+    for resource in resources:
+        configuration_path = os.path.abspath(resource.configuration_path)
+        state_directory = os.path.dirname(configuration_path)
+        dependencies[resource] = [
+            resources_by_configuration_path[os.path.abspath(path)]
+            for path in resource.dependencies_configuration_paths
+            if os.path.abspath(path) in resources_by_configuration_path
+        ]
+        if state_directory in resources_by_state_directory:
+            dependencies[resource].append(resources_by_state_directory[state_directory])
+        resources_by_configuration_path[configuration_path] = resource
+        resources_by_state_directory[state_directory] = resource
+    return dependencies
+
+
+def run_resources_graph(
+    resources: List[BaseResource],
+    dependencies: Dict[BaseResource, List[BaseResource]],
+    apply_function: Callable[[BaseResource], List[str]],
+    workers: int,
+) -> None:
+    """Run a function on every resource with a pool of threads, a resource being submitted once all its dependencies were processed.
+    Messages returned by the function are displayed as resources are processed, so that outputs are not interleaved.
+    If the function fails for a resource, no other resource is submitted and the error is raised once the running ones are done.
+
+    Args:
+        resources (List[BaseResource]): Resources sorted according to their apply priority.
+        dependencies (Dict[BaseResource, List[BaseResource]]): The resources each resource depends on.
+        apply_function (Callable[[BaseResource], List[str]]): Function to run on each resource, returning messages to display.
+        workers (int): Number of resources processed concurrently.
+    """
+    remaining_resources = list(resources)
+    processed_resources: Set[BaseResource] = set()
+    running: Dict[Future, BaseResource] = {}
+    error = None
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while running or (remaining_resources and error is None):
+            if error is None:
+                for resource in [r for r in remaining_resources if all(d in processed_resources for d in dependencies[r])]:
+                    remaining_resources.remove(resource)
+                    running[executor.submit(apply_function, resource)] = resource
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                resource = running.pop(future)
+                try:
+                    messages = future.result()
+                except Exception as e:
+                    error = error or e
+                    continue
+                processed_resources.add(resource)
+                click.echo("\n".join(messages))
+    if error is not None:
+        raise error
+
+
+def apply_resources_concurrently(resources: List[BaseResource], force: bool, workers: int) -> None:
+    """Apply resources concurrently, following their dependency graph.
+    Updates requiring a user validation are postponed: their diffs are prompted once all the other resources are applied,
+    then the validated updates are run.
+
+    Args:
+        resources (List[BaseResource]): Resources sorted according to their apply priority.
+        force (bool): Whether force mode is on.
+        workers (int): Number of resources applied concurrently.
+    """
+    diffs_to_validate: Dict[BaseResource, str] = {}
+
+    def apply_resource(resource: BaseResource) -> List[str]:
+        messages, diff = apply_single_resource_without_prompt(resource, force)
+        if diff:
+            diffs_to_validate[resource] = diff
+        return messages
+
+    run_resources_graph(resources, get_resources_dependencies(resources), apply_resource, workers)
+
+    resources_to_update = []
+    for resource in resources:
+        if resource in diffs_to_validate:
+            user_validation = prompt_for_diff_validation(resource.resource_name, diffs_to_validate[resource])
+            should_update, update_reason = should_update_resource(force, user_validation, resource.local_file_changed)
+            click.echo(update_reason)
+            if should_update:
+                resources_to_update.append(resource)
+    run_resources_graph(resources_to_update, get_resources_dependencies(resources_to_update), run_update, workers)
+
+
+def apply_single_resource_without_prompt(resource: BaseResource, force: bool) -> Tuple[List[str], Optional[str]]:
+    """Runs resource creation if it was not created, update it otherwise unless the diff has to be validated by the user first.
+    Messages are returned instead of being displayed, as resources might be applied concurrently.
+
+    Args:
+        resource (BaseResource): The resource to apply.
+        force (bool): Whether force mode is on.
+
+    Returns:
+        Tuple[List[str], Optional[str]]: Messages to display and the diff to prompt for validation if the update was postponed.
+    """
+    if not resource.was_created:
+        messages = [click.style(f"🐙 - {resource.resource_name} does not exists on your Airbyte instance, let's create it!", fg="green")]
+        return messages + create_resource(resource), None
+    messages = [
+        click.style(
+            f"🐙 - {resource.resource_name} exists on your Airbyte instance according to your state file, let's check if we need to update it!",
+            fg="yellow",
+        )
+    ]
+    diff = resource.get_diff_with_remote_resource()
+    if not force and diff:
+        messages.append(
+            click.style(
+                f"⏳ - {resource.resource_name} changed, the diff will be prompted for validation once the other resources are applied.",
+                fg="yellow",
+            )
+        )
+        return messages, diff
+    should_update, update_reason = should_update_resource(force, None, resource.local_file_changed)
+    messages.append(update_reason)
+    if should_update:
+        messages += run_update(resource)
+    return messages, None
+
+
 def should_update_resource(force: bool, user_validation: Optional[bool], local_file_changed: bool) -> Tuple[bool, str]:
     """Function to decide if the resource needs an update or not.
 
@@ -150,14 +302,26 @@ def update_resource(resource: BaseResource, force: bool) -> List[str]:
     click.echo(update_reason)
 
     if should_update:
-        updated_resource, state = resource.update()
-        output_messages.append(
-            click.style(f"🎉 - Successfully updated {updated_resource.name} on your Airbyte instance!", fg="green", bold=True)
-        )
-        output_messages.append(click.style(f"💾 - New state for {updated_resource.name} stored at {state.path}.", fg="yellow"))
+        output_messages += run_update(resource)
     return output_messages
 
 
+def run_update(resource: BaseResource) -> List[str]:
+    """Run a resource update.
+
+    Args:
+        resource (BaseResource): Resource to update
+
+    Returns:
+        List[str]: Post update messages to display to standard output.
+    """
+    updated_resource, state = resource.update()
+    return [
+        click.style(f"🎉 - Successfully updated {updated_resource.name} on your Airbyte instance!", fg="green", bold=True),
+        click.style(f"💾 - New state for {updated_resource.name} stored at {state.path}.", fg="yellow"),
+    ]
+
+
 def find_local_configuration_files() -> List[str]:
     """Discover local configuration files.
 
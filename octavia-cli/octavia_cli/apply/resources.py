@@ -280,6 +280,7 @@ class BaseResource(abc.ABC):
         self.api_client = api_client
         self.api_instance = self.api(api_client)
         self.resource_name = raw_configuration["resource_name"]
+        self._remote_resource, self._remote_resource_state = None, None
 
     def _deserialize_raw_configuration(self):
         """Deserialize a raw configuration into another object and perform extra validation if needed.
@@ -303,9 +304,25 @@ class BaseResource(abc.ABC):
         if invalid_keys:
             raise InvalidConfigurationError(f"Invalid configuration keys: {', '.join(invalid_keys)}. {error_message}. ")
 
+    @property
+    def dependencies_configuration_paths(self) -> List[str]:
+        """Paths to the configurations of the resources this resource depends on, which have to be applied before it.
+        Returns:
+            List[str]: Paths to YAML configuration files.
+        """
+        return []
+
     @property
     def remote_resource(self):
-        return self._get_remote_resource() if self.state else None
+        """The remote resource is read once per state: checking if it was created, computing its diff
+        and comparing its configuration don't call the API again.
+        """
+        if not self.state:
+            return None
+        if self._remote_resource_state is not self.state:
+            self._remote_resource = self._get_remote_resource()
+            self._remote_resource_state = self.state
+        return self._remote_resource
 
     def _get_local_comparable_configuration(self) -> dict:
         return self.raw_configuration["configuration"]
@@ -437,7 +454,6 @@ class BaseResource(abc.ABC):
 
 
 class SourceAndDestination(BaseResource):
-
     @property
     @abc.abstractmethod
     def definition(
@@ -650,6 +666,14 @@ class Connection(BaseResource):
         configuration["status"] = ConnectionStatus(configuration["status"])
         return configuration
 
+    @property
+    def dependencies_configuration_paths(self) -> List[str]:
+        """A connection depends on its source and destination.
+        Returns:
+            List[str]: Paths to the YAML configuration files of the source and destination.
+        """
+        return [self.raw_configuration["source_configuration_path"], self.raw_configuration["destination_configuration_path"]]
+
     @property
     def source_id(self):
         """Retrieve the source id from the source state file of the current workspace.
@@ -19,6 +19,7 @@ from .get import commands as get_commands
 from .init import commands as init_commands
 from .list import commands as list_commands
 from .telemetry import TelemetryClient, build_user_agent
+from .workspace_snapshot import WorkspaceSnapshot
 
 AVAILABLE_COMMANDS: List[click.Command] = [
     list_commands._list,
@@ -39,6 +40,8 @@ def set_context_object(
     enable_telemetry: bool,
     option_based_api_http_headers: Optional[List[Tuple[str, str]]],
     api_http_headers_file_path: Optional[str],
+    workspace_cache_dir: Optional[str] = None,
+    workspace_cache_ttl: int = 0,
 ) -> click.Context:
     """Fill the context object with resources that will be reused by other commands.
     Performs check and telemetry sending in case of error.
@@ -52,6 +55,8 @@ def set_context_object(
         enable_telemetry (bool): Whether the telemetry should send data.
         option_based_api_http_headers (Optional[List[Tuple[str, str]]]): Option based headers.
         api_http_headers_file_path (Optional[str]): Path to the YAML file with http headers.
+        workspace_cache_dir (Optional[str], optional): Directory where the snapshot of the workspace resources is cached. Defaults to None.
+        workspace_cache_ttl (int, optional): Number of seconds during which the cached snapshot is used without calling the API.
 
     Raises:
         e: Raise whatever error that might happen during the execution.
@@ -71,6 +76,7 @@ def set_context_object(
         ctx.obj["WORKSPACE_ID"] = get_workspace_id(api_client, workspace_id)
         ctx.obj["ANONYMOUS_DATA_COLLECTION"] = get_anonymous_data_collection(api_client, ctx.obj["WORKSPACE_ID"])
         ctx.obj["API_CLIENT"] = api_client
+        ctx.obj["WORKSPACE_SNAPSHOT"] = WorkspaceSnapshot(ctx.obj["WORKSPACE_ID"], workspace_cache_dir, workspace_cache_ttl)
         ctx.obj["PROJECT_IS_INITIALIZED"] = check_is_initialized()
     except Exception as e:
         telemetry_client.send_command_telemetry(ctx, error=e)
@@ -109,6 +115,20 @@ def set_context_object(
     help=f"Path to the Yaml file with API HTTP headers. Please check the {init_commands.API_HTTP_HEADERS_TARGET_PATH} file.",
     type=click.Path(exists=True, readable=True),
 )
+@click.option(
+    "--workspace-cache-dir",
+    envvar="OCTAVIA_WORKSPACE_CACHE_DIR",
+    default=None,
+    help="Directory where the listings of the workspace sources, destinations and connections are cached between commands.",
+    type=click.Path(file_okay=False, writable=True),
+)
+@click.option(
+    "--workspace-cache-ttl",
+    envvar="OCTAVIA_WORKSPACE_CACHE_TTL",
+    default=300,
+    help="Number of seconds during which the cached listings are used without calling the API.",
+    type=click.IntRange(min=0),
+)
 @click.pass_context
 def octavia(
     ctx: click.Context,
@@ -119,6 +139,8 @@ def octavia(
     enable_telemetry: bool,
     option_based_api_http_headers: Optional[List[Tuple[str, str]]] = None,
     api_http_headers_file_path: Optional[str] = None,
+    workspace_cache_dir: Optional[str] = None,
+    workspace_cache_ttl: int = 300,
 ) -> None:
 
     ctx = set_context_object(
@@ -130,6 +152,8 @@ def octavia(
         enable_telemetry,
         option_based_api_http_headers,
         api_http_headers_file_path,
+        workspace_cache_dir,
+        workspace_cache_ttl,
     )
 
     click.echo(
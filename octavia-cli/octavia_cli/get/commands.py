@@ -8,6 +8,7 @@ from typing import List, Optional, Tuple, Type, Union
 import airbyte_api_client
 import click
 from octavia_cli.base_commands import OctaviaCommand
+from octavia_cli.workspace_snapshot import WorkspaceSnapshot
 
 from .resources import Connection, Destination, Source
 
@@ -49,6 +50,7 @@ def get_json_representation(
     workspace_id: str,
     ResourceClass: Type[Union[Source, Destination, Connection]],
     resource_to_get: str,
+    workspace_snapshot: Optional[WorkspaceSnapshot] = None,
 ) -> str:
     """Helper function to retrieve a resource json representation and avoid repeating the same logic for Source/Destination and connection.
 
@@ -58,12 +60,15 @@ def get_json_representation(
         workspace_id (str): Current workspace id.
         ResourceClass (Type[Union[Source, Destination, Connection]]): Resource class to use
         resource_to_get (str): resource name or id to get JSON representation for.
+        workspace_snapshot (Optional[WorkspaceSnapshot], optional): Snapshot of the workspace resources to find resources by name in.
 
     Returns:
         str: The resource's JSON representation.
     """
     resource_id, resource_name = get_resource_id_or_name(resource_to_get)
-    resource = ResourceClass(api_client, workspace_id, resource_id=resource_id, resource_name=resource_name)
+    resource = ResourceClass(
+        api_client, workspace_id, resource_id=resource_id, resource_name=resource_name, workspace_snapshot=workspace_snapshot
+    )
     return resource.to_json()
 
 
@@ -80,21 +85,23 @@ def get(ctx: click.Context):  # pragma: no cover
 @click.argument("resource", type=click.STRING)
 @click.pass_context
 def source(ctx: click.Context, resource: str):
-    click.echo(get_json_representation(ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], Source, resource))
+    click.echo(get_json_representation(ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], Source, resource, ctx.obj["WORKSPACE_SNAPSHOT"]))
 
 
 @get.command(cls=OctaviaCommand, name="destination", help=build_help_message("destination"))
 @click.argument("resource", type=click.STRING)
 @click.pass_context
 def destination(ctx: click.Context, resource: str):
-    click.echo(get_json_representation(ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], Destination, resource))
+    click.echo(
+        get_json_representation(ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], Destination, resource, ctx.obj["WORKSPACE_SNAPSHOT"])
+    )
 
 
 @get.command(cls=OctaviaCommand, name="connection", help=build_help_message("connection"))
 @click.argument("resource", type=click.STRING)
 @click.pass_context
 def connection(ctx: click.Context, resource: str):
-    click.echo(get_json_representation(ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], Connection, resource))
+    click.echo(get_json_representation(ctx.obj["API_CLIENT"], ctx.obj["WORKSPACE_ID"], Connection, resource, ctx.obj["WORKSPACE_SNAPSHOT"]))
 
 
 AVAILABLE_COMMANDS: List[click.Command] = [source, destination, connection]
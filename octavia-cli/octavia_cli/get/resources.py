@@ -4,18 +4,20 @@
 
 import abc
 import json
-from typing import Optional, Union
+from typing import Optional, Type, Union
 
 import airbyte_api_client
 import click
 from airbyte_api_client.api import destination_api, source_api, web_backend_api
+from airbyte_api_client.exceptions import ApiException
 from airbyte_api_client.model.destination_id_request_body import DestinationIdRequestBody
 from airbyte_api_client.model.destination_read import DestinationRead
 from airbyte_api_client.model.source_id_request_body import SourceIdRequestBody
 from airbyte_api_client.model.source_read import SourceRead
 from airbyte_api_client.model.web_backend_connection_read import WebBackendConnectionRead
 from airbyte_api_client.model.web_backend_connection_request_body import WebBackendConnectionRequestBody
-from airbyte_api_client.model.workspace_id_request_body import WorkspaceIdRequestBody
+from octavia_cli.list.listings import Connections, Destinations, Sources, WorkspaceListing
+from octavia_cli.workspace_snapshot import WorkspaceSnapshot
 
 
 class DuplicateResourceError(click.ClickException):
@@ -52,29 +54,24 @@ class BaseResource(abc.ABC):
     def _get_fn(self):
         return getattr(self.api, self.get_function_name)
 
-    @property
     @abc.abstractmethod
-    def get_payload(
-        self,
-    ):  # pragma: no cover
+    def build_get_payload(
+        self, resource_id: str
+    ) -> Union[WebBackendConnectionRequestBody, SourceIdRequestBody, DestinationIdRequestBody]:  # pragma: no cover
         pass
 
     @property
-    @abc.abstractmethod
-    def list_for_workspace_function_name(
+    def get_payload(
         self,
-    ) -> str:  # pragma: no cover
-        pass
-
-    @property
-    def _list_for_workspace_fn(self):
-        return getattr(self.api, self.list_for_workspace_function_name)
+    ) -> Union[WebBackendConnectionRequestBody, SourceIdRequestBody, DestinationIdRequestBody]:
+        return self.build_get_payload(self.resource_id)
 
     @property
-    def list_for_workspace_payload(
+    @abc.abstractmethod
+    def listing_class(
         self,
-    ):
-        return WorkspaceIdRequestBody(workspace_id=self.workspace_id)
+    ) -> Type[WorkspaceListing]:  # pragma: no cover
+        pass
 
     def __init__(
         self,
@@ -82,6 +79,7 @@ class BaseResource(abc.ABC):
         workspace_id: str,
         resource_id: Optional[str] = None,
         resource_name: Optional[str] = None,
+        workspace_snapshot: Optional[WorkspaceSnapshot] = None,
     ):
         if resource_id is None and resource_name is None:
             raise ValueError("resource_id and resource_name keyword arguments can't be both None.")
@@ -91,11 +89,14 @@ class BaseResource(abc.ABC):
         self.resource_name = resource_name
         self.api_instance = self.api(api_client)
         self.workspace_id = workspace_id
+        self.listing = self.listing_class(api_client, workspace_id, workspace_snapshot)
 
     def _find_by_resource_name(
         self,
     ) -> Union[WebBackendConnectionRead, SourceRead, DestinationRead]:
-        """Retrieve a remote resource from its name by listing the available resources on the Airbyte instance.
+        """Retrieve a remote resource from its name: its id is looked up in the snapshot of the workspace resources,
+        then the resource is read with the get endpoint of the resource type.
+        The snapshot is revalidated once if the lookup fails, as it might have been loaded from an outdated cache.
 
         Raises:
             ResourceNotFoundError: Raised if no resource was found with the current resource_name.
@@ -104,19 +105,33 @@ class BaseResource(abc.ABC):
         Returns:
             Union[WebBackendConnectionRead, SourceRead, DestinationRead]: The remote resource model instance.
         """
-
-        api_response = self._list_for_workspace_fn(self.api_instance, self.list_for_workspace_payload)
-        matching_resources = []
-        for resource in getattr(api_response, f"{self.name}s"):
-            if resource.name == self.resource_name:
-                matching_resources.append(resource)
+        try:
+            return self._find_in_workspace_snapshot()
+        except (ResourceNotFoundError, DuplicateResourceError):
+            if not self.listing.revalidate():
+                raise
+            return self._find_in_workspace_snapshot()
+
+    def _find_in_workspace_snapshot(
+        self,
+    ) -> Union[WebBackendConnectionRead, SourceRead, DestinationRead]:
+        matching_resources = self.listing.find_by_name(self.resource_name)
         if not matching_resources:
             raise ResourceNotFoundError(f"The {self.name} {self.resource_name} was not found in your current Airbyte workspace.")
         if len(matching_resources) > 1:
             raise DuplicateResourceError(
                 f"{len(matching_resources)} {self.name}s with the name {self.resource_name} were found in your current Airbyte workspace."
             )
-        return matching_resources[0]
+        try:
+            remote_resource = self._get_fn(self.api_instance, self.build_get_payload(matching_resources[0][self.listing.resource_id_field]))
+        except ApiException as e:
+            if e.status == 404:
+                raise ResourceNotFoundError(f"The {self.name} {self.resource_name} was not found in your current Airbyte workspace.")
+            raise e
+        # The resource was renamed since the snapshot was cached.
+        if remote_resource.name != self.resource_name:
+            raise ResourceNotFoundError(f"The {self.name} {self.resource_name} was not found in your current Airbyte workspace.")
+        return remote_resource
 
     def _find_by_resource_id(
         self,
@@ -152,42 +167,39 @@ class Source(BaseResource):
     name = "source"
     api = source_api.SourceApi
     get_function_name = "get_source"
-    list_for_workspace_function_name = "list_sources_for_workspace"
+    listing_class = Sources
 
-    @property
-    def get_payload(self) -> Optional[SourceIdRequestBody]:
-        """Defines the payload to retrieve the remote source according to its resource_id.
+    def build_get_payload(self, resource_id: str) -> SourceIdRequestBody:
+        """Defines the payload to retrieve a remote source according to its id.
         Returns:
             SourceIdRequestBody: The SourceIdRequestBody payload.
         """
-        return SourceIdRequestBody(self.resource_id)
+        return SourceIdRequestBody(resource_id)
 
 
 class Destination(BaseResource):
     name = "destination"
     api = destination_api.DestinationApi
     get_function_name = "get_destination"
-    list_for_workspace_function_name = "list_destinations_for_workspace"
+    listing_class = Destinations
 
-    @property
-    def get_payload(self) -> Optional[DestinationIdRequestBody]:
-        """Defines the payload to retrieve the remote destination according to its resource_id.
+    def build_get_payload(self, resource_id: str) -> DestinationIdRequestBody:
+        """Defines the payload to retrieve a remote destination according to its id.
         Returns:
             DestinationIdRequestBody: The DestinationIdRequestBody payload.
         """
-        return DestinationIdRequestBody(self.resource_id)
+        return DestinationIdRequestBody(resource_id)
 
 
 class Connection(BaseResource):
     name = "connection"
     api = web_backend_api.WebBackendApi
     get_function_name = "web_backend_get_connection"
-    list_for_workspace_function_name = "web_backend_list_connections_for_workspace"
+    listing_class = Connections
 
-    @property
-    def get_payload(self) -> Optional[WebBackendConnectionRequestBody]:
-        """Defines the payload to retrieve the remote connection according to its resource_id.
+    def build_get_payload(self, resource_id: str) -> WebBackendConnectionRequestBody:
+        """Defines the payload to retrieve a remote connection according to its id.
         Returns:
             WebBackendConnectionRequestBody: The WebBackendConnectionRequestBody payload.
         """
-        return WebBackendConnectionRequestBody(with_refreshed_catalog=False, connection_id=self.resource_id)
+        return WebBackendConnectionRequestBody(with_refreshed_catalog=False, connection_id=resource_id)
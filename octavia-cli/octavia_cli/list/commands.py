@@ -51,7 +51,7 @@ def destinations_connectors(ctx: click.Context):
 def sources(ctx: click.Context):
     api_client = ctx.obj["API_CLIENT"]
     workspace_id = ctx.obj["WORKSPACE_ID"]
-    sources = Sources(api_client, workspace_id)
+    sources = Sources(api_client, workspace_id, ctx.obj["WORKSPACE_SNAPSHOT"])
     click.echo(sources)
 
 
@@ -60,7 +60,7 @@ def sources(ctx: click.Context):
 def destinations(ctx: click.Context):
     api_client = ctx.obj["API_CLIENT"]
     workspace_id = ctx.obj["WORKSPACE_ID"]
-    destinations = Destinations(api_client, workspace_id)
+    destinations = Destinations(api_client, workspace_id, ctx.obj["WORKSPACE_SNAPSHOT"])
     click.echo(destinations)
 
 
@@ -69,7 +69,7 @@ def destinations(ctx: click.Context):
 def connections(ctx: click.Context):
     api_client = ctx.obj["API_CLIENT"]
     workspace_id = ctx.obj["WORKSPACE_ID"]
-    connections = Connections(api_client, workspace_id)
+    connections = Connections(api_client, workspace_id, ctx.obj["WORKSPACE_SNAPSHOT"])
     click.echo(connections)
 
 
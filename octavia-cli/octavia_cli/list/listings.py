@@ -3,12 +3,13 @@
 #
 
 import abc
-from typing import List
+from typing import List, Optional
 
 import airbyte_api_client
 import octavia_cli.list.formatting as formatting
 from airbyte_api_client.api import connection_api, destination_api, destination_definition_api, source_api, source_definition_api
 from airbyte_api_client.model.workspace_id_request_body import WorkspaceIdRequestBody
+from octavia_cli.workspace_snapshot import WorkspaceSnapshot
 
 
 class BaseListing(abc.ABC):
@@ -81,20 +82,47 @@ class DestinationConnectorsDefinitions(BaseListing):
 
 
 class WorkspaceListing(BaseListing, abc.ABC):
-    def __init__(self, api_client: airbyte_api_client.ApiClient, workspace_id: str):
+    @property
+    @abc.abstractmethod
+    def resource_id_field(
+        self,
+    ) -> str:  # pragma: no cover
+        pass
+
+    def __init__(self, api_client: airbyte_api_client.ApiClient, workspace_id: str, workspace_snapshot: Optional[WorkspaceSnapshot] = None):
         self.workspace_id = workspace_id
+        self.workspace_snapshot = workspace_snapshot if workspace_snapshot is not None else WorkspaceSnapshot(workspace_id)
         super().__init__(api_client)
 
     @property
     def list_function_kwargs(self) -> dict:
         return {"workspace_id_request_body": WorkspaceIdRequestBody(workspace_id=self.workspace_id)}
 
+    def list_resources(self) -> List[dict]:
+        """List the resources of the workspace with the API.
+
+        Returns:
+            List[dict]: The listed resources.
+        """
+        api_response = self._list_fn(self.api_instance, **self.list_function_kwargs, **self.COMMON_LIST_FUNCTION_KWARGS)
+        return api_response[self.list_field_in_response]
+
+    def get_listing(self) -> List[List[str]]:
+        return self._parse_response({self.list_field_in_response: self.workspace_snapshot.get_resources(self)})
+
+    def find_by_name(self, resource_name: str) -> List[dict]:
+        return self.workspace_snapshot.find_by_name(self, resource_name)
+
+    def revalidate(self) -> bool:
+        return self.workspace_snapshot.revalidate(self)
+
 
 class Sources(WorkspaceListing):
     api = source_api.SourceApi
     fields_to_display = ["name", "sourceName", "sourceId"]
     list_field_in_response = "sources"
     list_function_name = "list_sources_for_workspace"
+    resource_id_field = "sourceId"
 
 
 class Destinations(WorkspaceListing):
@@ -102,6 +130,7 @@ class Destinations(WorkspaceListing):
     fields_to_display = ["name", "destinationName", "destinationId"]
     list_field_in_response = "destinations"
     list_function_name = "list_destinations_for_workspace"
+    resource_id_field = "destinationId"
 
 
 class Connections(WorkspaceListing):
@@ -109,3 +138,4 @@ class Connections(WorkspaceListing):
     fields_to_display = ["name", "connectionId", "status", "sourceId", "destinationId"]
     list_field_in_response = "connections"
     list_function_name = "list_connections_for_workspace"
+    resource_id_field = "connectionId"
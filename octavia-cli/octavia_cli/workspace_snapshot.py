@@ -0,0 +1,162 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+def compute_etag(resources: List[dict]) -> str:
+    """Compute a hash of a listing to detect if the listed resources changed since it was cached.
+
+    Args:
+        resources (List[dict]): The listed resources.
+
+    Returns:
+        str: The hash of the listing.
+    """
+    return hashlib.sha256(json.dumps(resources, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class WorkspaceSnapshot:
+    """Listings of the sources, destinations and connections of a workspace, fetched once per octavia invocation and indexed by name.
+
+    The snapshot can be persisted in a cache directory to be reused by the next invocations: listings younger than the TTL are used
+    without calling the API. Older listings are revalidated by listing the resources again. The Airbyte API has no conditional requests,
+    so the hash of a listing plays the role of an ETag: an unchanged listing keeps its cached indexes and is only marked as fresh.
+    """
+
+    VERSION = 1
+
+    def __init__(self, workspace_id: str, cache_dir: Optional[str] = None, ttl: int = 0):
+        """Create a WorkspaceSnapshot object.
+
+        Args:
+            workspace_id (str): The workspace id.
+            cache_dir (Optional[str], optional): Directory where the snapshot is persisted. Defaults to None: the snapshot is not persisted.
+            ttl (int, optional): Number of seconds during which a persisted listing is used without calling the API. Defaults to 0.
+        """
+        self.workspace_id = workspace_id
+        self.cache_path = os.path.join(cache_dir, f"workspace_{workspace_id}.json") if cache_dir else None
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._listings: Dict[str, dict] = self._load()
+        self._names_indexes: Dict[str, Dict[str, List[dict]]] = {}
+        self._listed_during_invocation = set()
+
+    def _load(self) -> Dict[str, dict]:
+        """Load the persisted listings of the workspace. A missing or unreadable cache is ignored: the resources are listed again.
+
+        Returns:
+            Dict[str, dict]: The persisted listings, keyed by the listing field in the API responses.
+        """
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, "r") as cache_file:
+                content = json.load(cache_file)
+            if content.get("version") == self.VERSION and content.get("workspace_id") == self.workspace_id:
+                return content["listings"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+
+    def _save(self):
+        if self.cache_path is None:
+            return
+        cache_dir = os.path.dirname(self.cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write then rename so that a concurrent invocation never reads a partially written cache.
+        with tempfile.NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp", delete=False) as cache_file:
+            json.dump({"version": self.VERSION, "workspace_id": self.workspace_id, "listings": self._listings}, cache_file, default=str)
+        os.replace(cache_file.name, self.cache_path)
+
+    def _list(self, listing) -> bool:
+        """List the resources with the API and store the listing in the snapshot.
+
+        Args:
+            listing (WorkspaceListing): The listing of the resources.
+
+        Returns:
+            bool: Whether the listed resources changed since they were cached.
+        """
+        key = listing.list_field_in_response
+        resources = listing.list_resources()
+        etag = compute_etag(resources)
+        changed = key not in self._listings or self._listings[key].get("etag") != etag
+        if changed:
+            self._listings[key] = {"etag": etag, "resources": resources}
+            self._names_indexes.pop(key, None)
+        self._listings[key]["listed_at"] = time.time()
+        self._listed_during_invocation.add(key)
+        self._save()
+        return changed
+
+    def _is_fresh(self, key: str) -> bool:
+        if key in self._listed_during_invocation:
+            return True
+        return key in self._listings and time.time() - self._listings[key].get("listed_at", 0) < self.ttl
+
+    def get_resources(self, listing) -> List[dict]:
+        """Get the resources of a listing, listing them with the API only if they are not in the snapshot or their listing expired.
+
+        Args:
+            listing (WorkspaceListing): The listing of the resources.
+
+        Returns:
+            List[dict]: The listed resources.
+        """
+        key = listing.list_field_in_response
+        with self._lock:
+            if not self._is_fresh(key):
+                self._list(listing)
+            return self._listings[key]["resources"]
+
+    def find_by_name(self, listing, resource_name: str) -> List[dict]:
+        """Find the resources of a listing with a given name.
+
+        Args:
+            listing (WorkspaceListing): The listing of the resources.
+            resource_name (str): The name of the resources to find.
+
+        Returns:
+            List[dict]: The resources with this name.
+        """
+        key = listing.list_field_in_response
+        with self._lock:
+            resources = self.get_resources(listing)
+            if key not in self._names_indexes:
+                names_index = {}
+                for resource in resources:
+                    names_index.setdefault(resource["name"], []).append(resource)
+                self._names_indexes[key] = names_index
+            return self._names_indexes[key].get(resource_name, [])
+
+    def revalidate(self, listing) -> bool:
+        """List the resources of a listing again, unless they were already listed during this invocation.
+        Meant to be called when a lookup fails on a listing which may be outdated.
+
+        Args:
+            listing (WorkspaceListing): The listing of the resources.
+
+        Returns:
+            bool: Whether the listed resources changed, in which case the lookup can be retried.
+        """
+        with self._lock:
+            if listing.list_field_in_response in self._listed_during_invocation:
+                return False
+            return self._list(listing)
+
+    def invalidate(self):
+        """Drop the listings of the snapshot and its cache, to be called once resources were created or updated on the workspace."""
+        with self._lock:
+            self._listings = {}
+            self._names_indexes = {}
+            self._listed_during_invocation = set()
+            if self.cache_path is not None and os.path.exists(self.cache_path):
+                os.remove(self.cache_path)
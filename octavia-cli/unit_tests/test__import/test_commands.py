@@ -19,6 +19,7 @@ def context_object(mock_api_client, mock_telemetry_client):
         "API_CLIENT": mock_api_client,
         "WORKSPACE_ID": "workspace_id",
         "TELEMETRY_CLIENT": mock_telemetry_client,
+        "WORKSPACE_SNAPSHOT": "workspace_snapshot",
     }
 
 
@@ -52,9 +53,11 @@ def test_import_source_or_destination(mocker, context_object, ResourceClass):
         "factory",
         mocker.Mock(return_value=mocker.Mock(manage=mocker.Mock(return_value=(expected_managed_resource, expected_state)))),
     )
-    commands.import_source_or_destination(context_object["API_CLIENT"], context_object["WORKSPACE_ID"], ResourceClass, "resource_to_get")
+    commands.import_source_or_destination(
+        context_object["API_CLIENT"], context_object["WORKSPACE_ID"], ResourceClass, "resource_to_get", context_object["WORKSPACE_SNAPSHOT"]
+    )
     commands.get_json_representation.assert_called_with(
-        context_object["API_CLIENT"], context_object["WORKSPACE_ID"], ResourceClass, "resource_to_get"
+        context_object["API_CLIENT"], context_object["WORKSPACE_ID"], ResourceClass, "resource_to_get", context_object["WORKSPACE_SNAPSHOT"]
     )
     commands.json.loads.assert_called_with(commands.get_json_representation.return_value)
     remote_configuration = commands.json.loads.return_value
@@ -127,9 +130,15 @@ def test_import_connection(mocker, context_object, source_exists, source_was_cre
     )
     if all([source_exists, destination_exists, source_was_created, destination_was_created]):
 
-        commands.import_connection(context_object["API_CLIENT"], context_object["WORKSPACE_ID"], "resource_to_get")
+        commands.import_connection(
+            context_object["API_CLIENT"], context_object["WORKSPACE_ID"], "resource_to_get", context_object["WORKSPACE_SNAPSHOT"]
+        )
         commands.get_json_representation.assert_called_with(
-            context_object["API_CLIENT"], context_object["WORKSPACE_ID"], commands.UnmanagedConnection, "resource_to_get"
+            context_object["API_CLIENT"],
+            context_object["WORKSPACE_ID"],
+            commands.UnmanagedConnection,
+            "resource_to_get",
+            context_object["WORKSPACE_SNAPSHOT"],
         )
         commands.renderers.ConnectorSpecificationRenderer.get_output_path.assert_has_calls(
             [
@@ -191,10 +200,16 @@ def test_import_commands(mocker, context_object, ResourceClass, command, import_
     result = runner.invoke(command, ["resource_to_import"], obj=context_object)
     if import_function == "import_source_or_destination":
         mock_import_function.assert_called_with(
-            context_object["API_CLIENT"], context_object["WORKSPACE_ID"], ResourceClass, "resource_to_import"
+            context_object["API_CLIENT"],
+            context_object["WORKSPACE_ID"],
+            ResourceClass,
+            "resource_to_import",
+            context_object["WORKSPACE_SNAPSHOT"],
         )
     else:
-        mock_import_function.assert_called_with(context_object["API_CLIENT"], context_object["WORKSPACE_ID"], "resource_to_import")
+        mock_import_function.assert_called_with(
+            context_object["API_CLIENT"], context_object["WORKSPACE_ID"], "resource_to_import", context_object["WORKSPACE_SNAPSHOT"]
+        )
     assert result.exit_code == 0
 
 
@@ -218,16 +233,18 @@ def test_import_all(mocker, context_object):
     )
     result = runner.invoke(commands.all, obj=context_object)
 
+    for listing_class in [commands.UnmanagedSources, commands.UnmanagedDestinations, commands.UnmanagedConnections]:
+        listing_class.assert_called_with(context_object["API_CLIENT"], "workspace_id", "workspace_snapshot")
     commands.UnmanagedSources.return_value.get_listing.assert_called_once()
     commands.UnmanagedDestinations.return_value.get_listing.assert_called_once()
     commands.UnmanagedConnections.return_value.get_listing.assert_called_once()
     assert result.exit_code == 0
     assert mock_manager.mock_calls[0] == mocker.call.import_source_or_destination(
-        context_object["API_CLIENT"], "workspace_id", commands.UnmanagedSource, "source_resource_id"
+        context_object["API_CLIENT"], "workspace_id", commands.UnmanagedSource, "source_resource_id", "workspace_snapshot"
     )
     assert mock_manager.mock_calls[1] == mocker.call.import_source_or_destination(
-        context_object["API_CLIENT"], "workspace_id", commands.UnmanagedDestination, "destination_resource_id"
+        context_object["API_CLIENT"], "workspace_id", commands.UnmanagedDestination, "destination_resource_id", "workspace_snapshot"
     )
     assert mock_manager.mock_calls[2] == mocker.call.import_connection(
-        context_object["API_CLIENT"], "workspace_id", "connection_resource_id"
+        context_object["API_CLIENT"], "workspace_id", "connection_resource_id", "workspace_snapshot"
     )
@@ -13,12 +13,13 @@ def patch_click(mocker):
 
 
 @pytest.fixture
-def context_object(mock_api_client, mock_telemetry_client):
+def context_object(mocker, mock_api_client, mock_telemetry_client):
     return {
         "PROJECT_IS_INITIALIZED": True,
         "API_CLIENT": mock_api_client,
         "WORKSPACE_ID": "workspace_id",
         "TELEMETRY_CLIENT": mock_telemetry_client,
+        "WORKSPACE_SNAPSHOT": mocker.Mock(),
     }
 
 
@@ -40,6 +41,7 @@ def test_apply_without_custom_configuration_file(mocker, context_object):
     commands.find_local_configuration_files.assert_called_once()
     commands.get_resources_to_apply.assert_called_once_with(local_files, context_object["API_CLIENT"], context_object["WORKSPACE_ID"])
     commands.apply_single_resource([mocker.call(r, False) for r in commands.get_resources_to_apply.return_value])
+    context_object["WORKSPACE_SNAPSHOT"].invalidate.assert_called_once()
 
 
 def test_apply_with_custom_configuration_file(mocker, context_object):
@@ -298,3 +300,138 @@ def test_find_local_configuration_files_no_file_found(patch_click, mocker):
     configuration_files = commands.find_local_configuration_files()
     assert not configuration_files
     commands.click.style.assert_called_once_with("😒 - No YAML file found to run apply.", fg="red")
+
+
+def test_apply_with_workers(mocker, context_object):
+    runner = CliRunner()
+    mocker.patch.object(commands, "find_local_configuration_files")
+    mocker.patch.object(commands, "get_resources_to_apply", mocker.Mock(return_value=[mocker.Mock()]))
+    mocker.patch.object(commands, "apply_single_resource")
+    mocker.patch.object(commands, "apply_resources_concurrently")
+    result = runner.invoke(commands.apply, ["--file", "foo", "--workers", "4"], obj=context_object)
+    assert result.exit_code == 0
+    commands.apply_single_resource.assert_not_called()
+    commands.apply_resources_concurrently.assert_called_with(commands.get_resources_to_apply.return_value, False, 4)
+    context_object["WORKSPACE_SNAPSHOT"].invalidate.assert_called_once()
+
+
+def test_apply_invalidates_workspace_snapshot_on_error(mocker, context_object):
+    runner = CliRunner()
+    mocker.patch.object(commands, "find_local_configuration_files")
+    mocker.patch.object(commands, "get_resources_to_apply", mocker.Mock(return_value=[mocker.Mock()]))
+    mocker.patch.object(commands, "apply_single_resource", mocker.Mock(side_effect=commands.click.ClickException("error")))
+    result = runner.invoke(commands.apply, ["--file", "foo"], obj=context_object)
+    assert result.exit_code == 1
+    context_object["WORKSPACE_SNAPSHOT"].invalidate.assert_called_once()
+
+
+def test_get_resources_dependencies(mocker):
+    source = mocker.Mock(configuration_path="./sources/my_source/configuration.yaml", dependencies_configuration_paths=[])
+    destination = mocker.Mock(configuration_path="destinations/my_destination/configuration.yaml", dependencies_configuration_paths=[])
+    connection = mocker.Mock(
+        configuration_path="connections/my_connection/configuration.yaml",
+        dependencies_configuration_paths=["sources/my_source/configuration.yaml", "destinations/my_destination/configuration.yaml"],
+    )
+    other_connection = mocker.Mock(
+        configuration_path="connections/my_connection/other_configuration.yaml",
+        dependencies_configuration_paths=["sources/not_applied/configuration.yaml", "destinations/my_destination/configuration.yaml"],
+    )
+    assert commands.get_resources_dependencies([source, destination, connection, other_connection]) == {
+        source: [],
+        destination: [],
+        connection: [source, destination],
+        # resources sharing a state directory are applied one at a time
+        other_connection: [destination, connection],
+    }
+
+
+def test_run_resources_graph(patch_click, mocker):
+    resources = [mocker.Mock(resource_name=name) for name in ["source", "destination", "connection"]]
+    source, destination, connection = resources
+    dependencies = {source: [], destination: [], connection: [source, destination]}
+    processed = []
+
+    def apply_function(resource):
+        if resource is connection:
+            assert set(processed) == {source, destination}
+        processed.append(resource)
+        return [resource.resource_name]
+
+    commands.run_resources_graph(resources, dependencies, apply_function, 2)
+    assert processed[-1] is connection
+    assert sorted(call.args[0] for call in commands.click.echo.call_args_list) == ["connection", "destination", "source"]
+
+
+def test_run_resources_graph_error(patch_click, mocker):
+    resources = [mocker.Mock(resource_name=name) for name in ["source", "destination", "connection"]]
+    source, destination, connection = resources
+    dependencies = {source: [], destination: [], connection: [source, destination]}
+    apply_function = mocker.Mock(side_effect=lambda resource: 1 / 0 if resource is source else [resource.resource_name])
+
+    with pytest.raises(ZeroDivisionError):
+        commands.run_resources_graph(resources, dependencies, apply_function, 2)
+    assert connection not in [call.args[0] for call in apply_function.call_args_list]
+
+
+@pytest.mark.parametrize("resource_was_created", [True, False])
+@pytest.mark.parametrize("force", [True, False])
+@pytest.mark.parametrize("diff", ["", "diff"])
+def test_apply_single_resource_without_prompt(patch_click, mocker, resource_was_created, force, diff):
+    mocker.patch.object(commands, "create_resource", mocker.Mock(return_value=["created"]))
+    mocker.patch.object(commands, "run_update", mocker.Mock(return_value=["updated"]))
+    mocker.patch.object(commands, "prompt_for_diff_validation")
+    resource = mocker.Mock(
+        was_created=resource_was_created,
+        resource_name="my_resource_name",
+        local_file_changed=False,
+        get_diff_with_remote_resource=mocker.Mock(return_value=diff),
+    )
+
+    messages, diff_to_validate = commands.apply_single_resource_without_prompt(resource, force)
+
+    commands.prompt_for_diff_validation.assert_not_called()
+    commands.click.echo.assert_not_called()
+    if not resource_was_created:
+        commands.create_resource.assert_called_once_with(resource)
+        assert messages[-1] == "created"
+        assert diff_to_validate is None
+    elif diff and not force:
+        commands.run_update.assert_not_called()
+        assert diff_to_validate == diff
+    else:
+        assert diff_to_validate is None
+        if force:
+            commands.run_update.assert_called_once_with(resource)
+            assert messages[-1] == "updated"
+        else:
+            commands.run_update.assert_not_called()
+
+
+@pytest.mark.parametrize("user_validation", [True, False])
+def test_apply_resources_concurrently(patch_click, mocker, user_validation):
+    source = mocker.Mock(
+        configuration_path="sources/my_source/configuration.yaml", dependencies_configuration_paths=[], local_file_changed=False
+    )
+    source.resource_name = "source"
+    connection = mocker.Mock(
+        configuration_path="connections/my_connection/configuration.yaml",
+        dependencies_configuration_paths=["sources/my_source/configuration.yaml"],
+        local_file_changed=False,
+    )
+    connection.resource_name = "connection"
+    mocker.patch.object(
+        commands,
+        "apply_single_resource_without_prompt",
+        mocker.Mock(side_effect=lambda resource, force: ([resource.resource_name], "diff" if resource is connection else None)),
+    )
+    mocker.patch.object(commands, "prompt_for_diff_validation", mocker.Mock(return_value=user_validation))
+    mocker.patch.object(commands, "run_update", mocker.Mock(return_value=["updated"]))
+
+    commands.apply_resources_concurrently([source, connection], False, 2)
+
+    commands.apply_single_resource_without_prompt.assert_has_calls([mocker.call(source, False), mocker.call(connection, False)])
+    commands.prompt_for_diff_validation.assert_called_once_with("connection", "diff")
+    if user_validation:
+        commands.run_update.assert_called_once_with(connection)
+    else:
+        commands.run_update.assert_not_called()
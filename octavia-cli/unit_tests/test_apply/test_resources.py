@@ -197,6 +197,17 @@ class TestBaseResource:
         assert remote_resource == resource._get_fn.return_value
         resource._get_fn.assert_called_with(resource.api_instance, resource.get_payload)
 
+    def test_remote_resource_read_once_per_state(self, mocker, patch_base_class, mock_api_client, local_configuration):
+        mocker.patch.object(resources.BaseResource, "_get_state_from_file", mocker.Mock(return_value=mocker.Mock()))
+        mocker.patch.object(resources.BaseResource, "_get_remote_resource", mocker.Mock(side_effect=["remote_resource", "new_remote"]))
+        resource = resources.BaseResource(mock_api_client, "workspace_id", local_configuration, "bar.yaml")
+        assert resource.was_created is True
+        assert resource.remote_resource == "remote_resource"
+        resource._get_remote_resource.assert_called_once()
+        resource.state = mocker.Mock()
+        assert resource.remote_resource == "new_remote"
+        assert resource._get_remote_resource.call_count == 2
+
     @pytest.mark.parametrize(
         "state_path_is_file, legacy_state_path_is_file, confirm_migration",
         [(True, False, False), (False, True, True), (False, True, False), (False, False, False)],
@@ -640,6 +651,11 @@ class TestConnection:
                 connection_id=state.resource_id, with_refreshed_catalog=False
             )
 
+    def test_dependencies_configuration_paths(self, mocker, mock_api_client, connection_configuration):
+        mocker.patch.object(resources.Connection, "resource_id", "foo")
+        connection = resources.Connection(mock_api_client, "workspace_id", connection_configuration, "bar.yaml")
+        assert connection.dependencies_configuration_paths == ["my_source_configuration_path", "my_destination_configuration_path"]
+
     @pytest.mark.parametrize("file_not_found_error", [False, True])
     def test_source_id(self, mocker, mock_api_client, connection_configuration, file_not_found_error):
         assert resources.Connection.__base__ == resources.BaseResource
@@ -35,6 +35,7 @@ def test_set_context_object(mocker, option_based_api_http_headers, api_http_head
     mocker.patch.object(entrypoint, "get_workspace_id")
     mocker.patch.object(entrypoint, "check_is_initialized")
     mocker.patch.object(entrypoint, "get_anonymous_data_collection")
+    mocker.patch.object(entrypoint, "WorkspaceSnapshot")
     mock_ctx = mocker.Mock(obj={})
     built_context = entrypoint.set_context_object(
         mock_ctx,
@@ -45,6 +46,8 @@ def test_set_context_object(mocker, option_based_api_http_headers, api_http_head
         "enable_telemetry",
         option_based_api_http_headers,
         api_http_headers_file_path,
+        "my_workspace_cache_dir",
+        60,
     )
     entrypoint.TelemetryClient.assert_called_with("enable_telemetry")
     mock_ctx.ensure_object.assert_called_with(dict)
@@ -55,7 +58,9 @@ def test_set_context_object(mocker, option_based_api_http_headers, api_http_head
         "API_CLIENT": entrypoint.get_api_client.return_value,
         "PROJECT_IS_INITIALIZED": entrypoint.check_is_initialized.return_value,
         "ANONYMOUS_DATA_COLLECTION": entrypoint.get_anonymous_data_collection.return_value,
+        "WORKSPACE_SNAPSHOT": entrypoint.WorkspaceSnapshot.return_value,
     }
+    entrypoint.WorkspaceSnapshot.assert_called_with(entrypoint.get_workspace_id.return_value, "my_workspace_cache_dir", 60)
     entrypoint.build_user_agent.assert_called_with(built_context.obj["OCTAVIA_VERSION"])
     entrypoint.merge_api_headers.assert_called_with(option_based_api_http_headers, api_http_headers_file_path)
     entrypoint.get_api_client.assert_called_with(
@@ -97,6 +102,8 @@ def test_set_context_object_error(mocker):
         (["--airbyte-url", "test-airbyte-url", "--api-http-headers-file-path", "path-does-not-exist"], 2),
         (["--airbyte-url", "test-airbyte-url", "--api-http-headers-file-path", "path-exists"], 0),
         (["--airbyte-url", "test-airbyte-url", "--api-http-header", "Content-Type", "application/json"], 0),
+        (["--airbyte-url", "test-airbyte-url", "--workspace-cache-dir", "cache-dir", "--workspace-cache-ttl", "60"], 0),
+        (["--airbyte-url", "test-airbyte-url", "--workspace-cache-ttl", "-1"], 2),
         (
             [
                 "--airbyte-url",
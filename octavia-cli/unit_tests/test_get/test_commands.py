@@ -20,6 +20,7 @@ def context_object(mock_api_client, mock_telemetry_client):
         "WORKSPACE_ID": "my_workspace_id",
         "resource_id": "my_resource_id",
         "TELEMETRY_CLIENT": mock_telemetry_client,
+        "WORKSPACE_SNAPSHOT": "workspace_snapshot",
     }
 
 
@@ -44,10 +45,16 @@ def test_get_json_representation(mocker, context_object):
     mock_resource_id = mocker.Mock()
     mock_resource_name = mocker.Mock()
     mocker.patch.object(commands, "get_resource_id_or_name", mocker.Mock(return_value=(mock_resource_id, mock_resource_name)))
-    json_repr = commands.get_json_representation(context_object["API_CLIENT"], context_object["WORKSPACE_ID"], mock_cls, "resource_to_get")
+    json_repr = commands.get_json_representation(
+        context_object["API_CLIENT"], context_object["WORKSPACE_ID"], mock_cls, "resource_to_get", context_object["WORKSPACE_SNAPSHOT"]
+    )
     commands.get_resource_id_or_name.assert_called_with("resource_to_get")
     mock_cls.assert_called_with(
-        context_object["API_CLIENT"], context_object["WORKSPACE_ID"], resource_id=mock_resource_id, resource_name=mock_resource_name
+        context_object["API_CLIENT"],
+        context_object["WORKSPACE_ID"],
+        resource_id=mock_resource_id,
+        resource_name=mock_resource_name,
+        workspace_snapshot=context_object["WORKSPACE_SNAPSHOT"],
     )
     assert json_repr == mock_cls.return_value.to_json.return_value
 
@@ -65,7 +72,7 @@ def test_commands(context_object, mocker, command, resource_cls, resource):
     runner = CliRunner()
     result = runner.invoke(command, [resource], obj=context_object)
     commands.get_json_representation.assert_called_once_with(
-        context_object["API_CLIENT"], context_object["WORKSPACE_ID"], resource_cls, resource
+        context_object["API_CLIENT"], context_object["WORKSPACE_ID"], resource_cls, resource, context_object["WORKSPACE_SNAPSHOT"]
     )
     assert result.exit_code == 0
 
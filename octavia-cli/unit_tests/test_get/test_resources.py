@@ -3,11 +3,13 @@
 #
 
 import pytest
+from airbyte_api_client import ApiException
 from airbyte_api_client.api import destination_api, source_api, web_backend_api
 from airbyte_api_client.model.destination_id_request_body import DestinationIdRequestBody
 from airbyte_api_client.model.source_id_request_body import SourceIdRequestBody
 from airbyte_api_client.model.web_backend_connection_request_body import WebBackendConnectionRequestBody
 from octavia_cli.get.resources import BaseResource, Connection, Destination, DuplicateResourceError, ResourceNotFoundError, Source
+from octavia_cli.list.listings import Connections, Destinations, Sources
 
 
 class TestBaseResource:
@@ -17,8 +19,8 @@ class TestBaseResource:
         mocker.patch.object(BaseResource, "__abstractmethods__", set())
         mocker.patch.object(BaseResource, "api", mocker.Mock())
         mocker.patch.object(BaseResource, "get_function_name", "get_function_name")
-        mocker.patch.object(BaseResource, "get_payload", "get_payload")
-        mocker.patch.object(BaseResource, "list_for_workspace_function_name", "list_for_workspace_function_name")
+        mocker.patch.object(BaseResource, "build_get_payload", mocker.Mock(side_effect=lambda resource_id: f"payload_{resource_id}"))
+        mocker.patch.object(BaseResource, "listing_class", mocker.Mock(return_value=mocker.Mock(resource_id_field="fakeResourceId")))
         mocker.patch.object(BaseResource, "name", "fake_resource")
 
     @pytest.mark.parametrize(
@@ -35,20 +37,28 @@ class TestBaseResource:
             with pytest.raises(expected_error, match=expected_error_message):
                 base_resource = BaseResource(mock_api_client, "workspace_id", resource_id=resource_id, resource_name=resource_name)
         else:
-            base_resource = BaseResource(mock_api_client, "workspace_id", resource_id=resource_id, resource_name=resource_name)
+            base_resource = BaseResource(
+                mock_api_client,
+                "workspace_id",
+                resource_id=resource_id,
+                resource_name=resource_name,
+                workspace_snapshot="workspace_snapshot",
+            )
             base_resource.api.assert_called_with(mock_api_client)
             assert base_resource.api_instance == base_resource.api.return_value
             assert base_resource.workspace_id == "workspace_id"
             assert base_resource._get_fn == getattr(base_resource.api, base_resource.get_function_name)
-            assert base_resource._list_for_workspace_fn == getattr(base_resource.api, base_resource.list_for_workspace_function_name)
+            assert base_resource.get_payload == f"payload_{resource_id}"
+            base_resource.listing_class.assert_called_with(mock_api_client, "workspace_id", "workspace_snapshot")
+            assert base_resource.listing == base_resource.listing_class.return_value
             assert base_resource.resource_id == resource_id
             assert base_resource.resource_name == resource_name
 
     @pytest.mark.parametrize(
-        "resource_name, api_response_resources_names, expected_error, expected_error_message",
+        "resource_name, snapshot_resources_names, expected_error, expected_error_message",
         [
-            ("foo", ["foo", "bar"], None, None),
-            ("foo", ["bar", "fooo"], ResourceNotFoundError, "The fake_resource foo was not found in your current Airbyte workspace."),
+            ("foo", ["foo"], None, None),
+            ("foo", [], ResourceNotFoundError, "The fake_resource foo was not found in your current Airbyte workspace."),
             (
                 "foo",
                 ["foo", "foo"],
@@ -57,25 +67,73 @@ class TestBaseResource:
             ),
         ],
     )
-    def test__find_by_resource_name(
-        self, mocker, patch_base_class, mock_api_client, resource_name, api_response_resources_names, expected_error, expected_error_message
+    def test__find_in_workspace_snapshot(
+        self, mocker, patch_base_class, mock_api_client, resource_name, snapshot_resources_names, expected_error, expected_error_message
     ):
-        mock_api_response_records = []
-        for fake_resource_name in api_response_resources_names:
-            mock_api_response_record = mocker.Mock()  # We can't set the mock name on creation as it's a reserved attribute
-            mock_api_response_record.name = fake_resource_name
-            mock_api_response_records.append(mock_api_response_record)
-
-        mocker.patch.object(
-            BaseResource, "_list_for_workspace_fn", mocker.Mock(return_value=mocker.Mock(fake_resources=mock_api_response_records))
-        )
+        mocker.patch.object(BaseResource, "_get_fn")
+        BaseResource._get_fn.return_value.name = resource_name
         base_resource = BaseResource(mock_api_client, "workspace_id", resource_id=None, resource_name=resource_name)
+        base_resource.listing.find_by_name.return_value = [
+            {"name": name, "fakeResourceId": f"id_{i}"} for i, name in enumerate(snapshot_resources_names)
+        ]
         if not expected_error:
-            found_resource = base_resource._find_by_resource_name()
-            assert found_resource.name == resource_name
-        if expected_error:
+            found_resource = base_resource._find_in_workspace_snapshot()
+            assert found_resource == base_resource._get_fn.return_value
+            base_resource._get_fn.assert_called_with(base_resource.api_instance, "payload_id_0")
+        else:
             with pytest.raises(expected_error, match=expected_error_message):
+                base_resource._find_in_workspace_snapshot()
+            base_resource._get_fn.assert_not_called()
+        base_resource.listing.find_by_name.assert_called_with(resource_name)
+
+    @pytest.mark.parametrize(
+        "remote_resource_name, get_status, expected_error",
+        [
+            ("foo", None, None),
+            ("renamed_foo", None, ResourceNotFoundError),
+            ("foo", 404, ResourceNotFoundError),
+            ("foo", 500, ApiException),
+        ],
+    )
+    def test__find_in_workspace_snapshot_outdated(
+        self, mocker, patch_base_class, mock_api_client, remote_resource_name, get_status, expected_error
+    ):
+        mocker.patch.object(BaseResource, "_get_fn", mocker.Mock(side_effect=ApiException(status=get_status) if get_status else None))
+        BaseResource._get_fn.return_value.name = remote_resource_name
+        base_resource = BaseResource(mock_api_client, "workspace_id", resource_name="foo")
+        base_resource.listing.find_by_name.return_value = [{"name": "foo", "fakeResourceId": "foo_id"}]
+        if not expected_error:
+            assert base_resource._find_in_workspace_snapshot() == base_resource._get_fn.return_value
+        else:
+            with pytest.raises(expected_error):
+                base_resource._find_in_workspace_snapshot()
+
+    @pytest.mark.parametrize(
+        "lookup_side_effect, revalidated, expected_error, expected_lookups",
+        [
+            (["remote_resource"], False, None, 1),
+            ([ResourceNotFoundError("not found"), "remote_resource"], True, None, 2),
+            ([DuplicateResourceError("duplicate"), "remote_resource"], True, None, 2),
+            ([ResourceNotFoundError("not found"), "remote_resource"], False, ResourceNotFoundError, 1),
+            ([ResourceNotFoundError("not found"), ResourceNotFoundError("not found")], True, ResourceNotFoundError, 2),
+        ],
+    )
+    def test__find_by_resource_name(
+        self, mocker, patch_base_class, mock_api_client, lookup_side_effect, revalidated, expected_error, expected_lookups
+    ):
+        mocker.patch.object(BaseResource, "_find_in_workspace_snapshot", mocker.Mock(side_effect=lookup_side_effect))
+        base_resource = BaseResource(mock_api_client, "workspace_id", resource_name="foo")
+        base_resource.listing.revalidate.return_value = revalidated
+        if not expected_error:
+            assert base_resource._find_by_resource_name() == "remote_resource"
+        else:
+            with pytest.raises(expected_error):
                 base_resource._find_by_resource_name()
+        assert base_resource._find_in_workspace_snapshot.call_count == expected_lookups
+        if expected_lookups > 1 or expected_error:
+            base_resource.listing.revalidate.assert_called_once()
+        else:
+            base_resource.listing.revalidate.assert_not_called()
 
     def test__find_by_id(self, mocker, patch_base_class, mock_api_client):
         mocker.patch.object(BaseResource, "_get_fn")
@@ -113,8 +171,10 @@ class TestSource:
         source = Source(mock_api_client, "workspace_id", "resource_id")
         assert source.api == source_api.SourceApi
         assert source.get_function_name == "get_source"
-        assert source.list_for_workspace_function_name == "list_sources_for_workspace"
+        assert source.listing_class == Sources
+        assert isinstance(source.listing, Sources)
         assert source.get_payload == SourceIdRequestBody("resource_id")
+        assert source.build_get_payload("other_resource_id") == SourceIdRequestBody("other_resource_id")
 
 
 class TestDestination:
@@ -123,8 +183,10 @@ class TestDestination:
         destination = Destination(mock_api_client, "workspace_id", "resource_id")
         assert destination.api == destination_api.DestinationApi
         assert destination.get_function_name == "get_destination"
-        assert destination.list_for_workspace_function_name == "list_destinations_for_workspace"
+        assert destination.listing_class == Destinations
+        assert isinstance(destination.listing, Destinations)
         assert destination.get_payload == DestinationIdRequestBody("resource_id")
+        assert destination.build_get_payload("other_resource_id") == DestinationIdRequestBody("other_resource_id")
 
 
 class TestConnection:
@@ -133,5 +195,9 @@ class TestConnection:
         connection = Connection(mock_api_client, "workspace_id", "resource_id")
         assert connection.api == web_backend_api.WebBackendApi
         assert connection.get_function_name == "web_backend_get_connection"
-        assert connection.list_for_workspace_function_name == "web_backend_list_connections_for_workspace"
+        assert connection.listing_class == Connections
+        assert isinstance(connection.listing, Connections)
         assert connection.get_payload == WebBackendConnectionRequestBody(with_refreshed_catalog=False, connection_id=connection.resource_id)
+        assert connection.build_get_payload("other_resource_id") == WebBackendConnectionRequestBody(
+            with_refreshed_catalog=False, connection_id="other_resource_id"
+        )
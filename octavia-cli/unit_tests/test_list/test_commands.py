@@ -9,7 +9,12 @@ from octavia_cli.list import commands
 
 @pytest.fixture
 def context_object(mock_api_client, mock_telemetry_client):
-    return {"API_CLIENT": mock_api_client, "WORKSPACE_ID": "my_workspace_id", "TELEMETRY_CLIENT": mock_telemetry_client}
+    return {
+        "API_CLIENT": mock_api_client,
+        "WORKSPACE_ID": "my_workspace_id",
+        "TELEMETRY_CLIENT": mock_telemetry_client,
+        "WORKSPACE_SNAPSHOT": "workspace_snapshot",
+    }
 
 
 def test_available_commands():
@@ -42,7 +47,9 @@ def test_sources(mocker, context_object):
     mocker.patch.object(commands, "Sources", mocker.Mock(return_value="SourcesRepr"))
     runner = CliRunner()
     result = runner.invoke(commands.sources, obj=context_object)
-    commands.Sources.assert_called_with(context_object["API_CLIENT"], context_object["WORKSPACE_ID"])
+    commands.Sources.assert_called_with(
+        context_object["API_CLIENT"], context_object["WORKSPACE_ID"], context_object["WORKSPACE_SNAPSHOT"]
+    )
     assert result.output == "SourcesRepr\n"
 
 
@@ -50,7 +57,9 @@ def test_destinations(mocker, context_object):
     mocker.patch.object(commands, "Destinations", mocker.Mock(return_value="DestinationsRepr"))
     runner = CliRunner()
     result = runner.invoke(commands.destinations, obj=context_object)
-    commands.Destinations.assert_called_with(context_object["API_CLIENT"], context_object["WORKSPACE_ID"])
+    commands.Destinations.assert_called_with(
+        context_object["API_CLIENT"], context_object["WORKSPACE_ID"], context_object["WORKSPACE_SNAPSHOT"]
+    )
     assert result.output == "DestinationsRepr\n"
 
 
@@ -58,5 +67,7 @@ def test_connections(mocker, context_object):
     mocker.patch.object(commands, "Connections", mocker.Mock(return_value="ConnectionsRepr"))
     runner = CliRunner()
     result = runner.invoke(commands.connections, obj=context_object)
-    commands.Connections.assert_called_with(context_object["API_CLIENT"], context_object["WORKSPACE_ID"])
+    commands.Connections.assert_called_with(
+        context_object["API_CLIENT"], context_object["WORKSPACE_ID"], context_object["WORKSPACE_SNAPSHOT"]
+    )
     assert result.output == "ConnectionsRepr\n"
@@ -112,9 +112,13 @@ class TestWorkspaceListing:
         mocker.patch.object(listings, "WorkspaceIdRequestBody")
         mocker.patch.object(BaseListing, "__init__")
         assert WorkspaceListing.__base__ == BaseListing
+        mocker.patch.object(listings, "WorkspaceSnapshot")
         sources_and_destinations = WorkspaceListing(mock_api_client, "my_workspace_id")
 
         assert sources_and_destinations.workspace_id == "my_workspace_id"
+        listings.WorkspaceSnapshot.assert_called_with("my_workspace_id")
+        assert sources_and_destinations.workspace_snapshot == listings.WorkspaceSnapshot.return_value
+        assert WorkspaceListing(mock_api_client, "my_workspace_id", "workspace_snapshot").workspace_snapshot == "workspace_snapshot"
         assert sources_and_destinations.list_function_kwargs == {"workspace_id_request_body": listings.WorkspaceIdRequestBody.return_value}
         listings.WorkspaceIdRequestBody.assert_called_with(workspace_id="my_workspace_id")
         BaseListing.__init__.assert_called_with(mock_api_client)
@@ -123,6 +127,31 @@ class TestWorkspaceListing:
         with pytest.raises(TypeError):
             WorkspaceListing(mock_api_client)
 
+    def test_list_resources(self, patch_base_class, mocker, mock_api_client):
+        mocker.patch.object(WorkspaceListing, "list_field_in_response", "resources")
+        mocker.patch.object(WorkspaceListing, "_list_fn", mocker.Mock(return_value={"resources": [{"name": "foo"}]}))
+        workspace_listing = WorkspaceListing(mock_api_client, "my_workspace_id")
+        assert workspace_listing.list_resources() == [{"name": "foo"}]
+        workspace_listing._list_fn.assert_called_with(
+            workspace_listing.api_instance, **workspace_listing.list_function_kwargs, **workspace_listing.COMMON_LIST_FUNCTION_KWARGS
+        )
+
+    def test_get_listing(self, patch_base_class, mocker, mock_api_client):
+        mocker.patch.object(WorkspaceListing, "list_field_in_response", "resources")
+        mocker.patch.object(WorkspaceListing, "fields_to_display", ["name", "resourceId"])
+        mock_snapshot = mocker.Mock(get_resources=mocker.Mock(return_value=[{"name": "foo", "resourceId": "foo_id", "other": "bar"}]))
+        workspace_listing = WorkspaceListing(mock_api_client, "my_workspace_id", mock_snapshot)
+        assert workspace_listing.get_listing() == [["foo", "foo_id"]]
+        mock_snapshot.get_resources.assert_called_with(workspace_listing)
+
+    def test_find_by_name_and_revalidate(self, patch_base_class, mocker, mock_api_client):
+        mock_snapshot = mocker.Mock()
+        workspace_listing = WorkspaceListing(mock_api_client, "my_workspace_id", mock_snapshot)
+        assert workspace_listing.find_by_name("foo") == mock_snapshot.find_by_name.return_value
+        mock_snapshot.find_by_name.assert_called_with(workspace_listing, "foo")
+        assert workspace_listing.revalidate() == mock_snapshot.revalidate.return_value
+        mock_snapshot.revalidate.assert_called_with(workspace_listing)
+
 
 class TestSources:
     def test_init(self, mock_api_client):
@@ -131,6 +160,7 @@ class TestSources:
         assert sources.api == source_api.SourceApi
         assert sources.fields_to_display == ["name", "sourceName", "sourceId"]
         assert sources.list_field_in_response == "sources"
+        assert sources.resource_id_field == "sourceId"
         assert sources.list_function_name == "list_sources_for_workspace"
 
 
@@ -141,6 +171,7 @@ class TestDestinations:
         assert destinations.api == destination_api.DestinationApi
         assert destinations.fields_to_display == ["name", "destinationName", "destinationId"]
         assert destinations.list_field_in_response == "destinations"
+        assert destinations.resource_id_field == "destinationId"
         assert destinations.list_function_name == "list_destinations_for_workspace"
 
 
@@ -151,4 +182,5 @@ class TestConnections:
         assert connections.api == connection_api.ConnectionApi
         assert connections.fields_to_display == ["name", "connectionId", "status", "sourceId", "destinationId"]
         assert connections.list_field_in_response == "connections"
+        assert connections.resource_id_field == "connectionId"
         assert connections.list_function_name == "list_connections_for_workspace"
@@ -0,0 +1,117 @@
+#
+# Copyright (c) 2022 Airbyte, Inc., all rights reserved.
+#
+
+import json
+
+import pytest
+from octavia_cli import workspace_snapshot
+from octavia_cli.workspace_snapshot import WorkspaceSnapshot, compute_etag
+
+RESOURCES = [{"name": "foo", "sourceId": "foo_id"}, {"name": "bar", "sourceId": "bar_id"}, {"name": "bar", "sourceId": "other_bar_id"}]
+
+
+@pytest.fixture
+def listing(mocker):
+    return mocker.Mock(list_field_in_response="sources", resource_id_field="sourceId", list_resources=mocker.Mock(return_value=RESOURCES))
+
+
+@pytest.fixture
+def mock_time(mocker):
+    mocker.patch.object(workspace_snapshot.time, "time", mocker.Mock(return_value=1000))
+    return workspace_snapshot.time.time
+
+
+def test_compute_etag():
+    assert compute_etag(RESOURCES) == compute_etag([dict(reversed(resource.items())) for resource in RESOURCES])
+    assert compute_etag(RESOURCES) != compute_etag(RESOURCES[:1])
+
+
+def test_get_resources_lists_once(listing):
+    snapshot = WorkspaceSnapshot("workspace_id")
+    assert snapshot.cache_path is None
+    assert snapshot.get_resources(listing) == RESOURCES
+    assert snapshot.get_resources(listing) == RESOURCES
+    listing.list_resources.assert_called_once()
+
+
+def test_find_by_name(listing):
+    snapshot = WorkspaceSnapshot("workspace_id")
+    assert snapshot.find_by_name(listing, "foo") == [RESOURCES[0]]
+    assert snapshot.find_by_name(listing, "bar") == RESOURCES[1:]
+    assert snapshot.find_by_name(listing, "baz") == []
+    listing.list_resources.assert_called_once()
+
+
+def test_revalidate(listing):
+    snapshot = WorkspaceSnapshot("workspace_id")
+    assert snapshot.revalidate(listing)
+    # Resources listed during the invocation are not listed again.
+    assert not snapshot.revalidate(listing)
+    listing.list_resources.assert_called_once()
+
+
+def test_persisted_snapshot(tmp_path, listing, mock_time):
+    snapshot = WorkspaceSnapshot("workspace_id", str(tmp_path), ttl=60)
+    assert snapshot.cache_path == str(tmp_path / "workspace_workspace_id.json")
+    snapshot.get_resources(listing)
+    with open(snapshot.cache_path) as cache_file:
+        content = json.load(cache_file)
+    assert content == {
+        "version": WorkspaceSnapshot.VERSION,
+        "workspace_id": "workspace_id",
+        "listings": {"sources": {"etag": compute_etag(RESOURCES), "resources": RESOURCES, "listed_at": 1000}},
+    }
+
+    # The next invocations use the cached listing until it expires.
+    mock_time.return_value = 1059
+    assert WorkspaceSnapshot("workspace_id", str(tmp_path), ttl=60).find_by_name(listing, "foo") == [RESOURCES[0]]
+    listing.list_resources.assert_called_once()
+
+    mock_time.return_value = 1060
+    assert WorkspaceSnapshot("workspace_id", str(tmp_path), ttl=60).find_by_name(listing, "foo") == [RESOURCES[0]]
+    assert listing.list_resources.call_count == 2
+    with open(snapshot.cache_path) as cache_file:
+        assert json.load(cache_file)["listings"]["sources"]["listed_at"] == 1060
+
+    # The cache of another workspace is not used.
+    WorkspaceSnapshot("other_workspace_id", str(tmp_path), ttl=60).get_resources(listing)
+    assert listing.list_resources.call_count == 3
+
+
+def test_revalidate_persisted_snapshot(tmp_path, listing, mock_time):
+    WorkspaceSnapshot("workspace_id", str(tmp_path), ttl=60).get_resources(listing)
+    # The listing did not change: the lookup can't be retried.
+    assert not WorkspaceSnapshot("workspace_id", str(tmp_path), ttl=60).revalidate(listing)
+
+    snapshot = WorkspaceSnapshot("workspace_id", str(tmp_path), ttl=60)
+    assert snapshot.find_by_name(listing, "baz") == []
+    listing.list_resources.return_value = RESOURCES + [{"name": "baz", "sourceId": "baz_id"}]
+    assert snapshot.revalidate(listing)
+    assert snapshot.find_by_name(listing, "baz") == [{"name": "baz", "sourceId": "baz_id"}]
+    assert listing.list_resources.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "cache_content",
+    [
+        "{not json",
+        json.dumps({"version": WorkspaceSnapshot.VERSION + 1, "workspace_id": "workspace_id", "listings": {}}),
+        json.dumps({"version": WorkspaceSnapshot.VERSION, "workspace_id": "workspace_id"}),
+        json.dumps([]),
+    ],
+)
+def test_unreadable_cache(tmp_path, listing, cache_content):
+    (tmp_path / "workspace_workspace_id.json").write_text(cache_content)
+    assert WorkspaceSnapshot("workspace_id", str(tmp_path), ttl=60).get_resources(listing) == RESOURCES
+    listing.list_resources.assert_called_once()
+
+
+def test_invalidate(tmp_path, listing):
+    snapshot = WorkspaceSnapshot("workspace_id", str(tmp_path), ttl=60)
+    snapshot.find_by_name(listing, "foo")
+    snapshot.invalidate()
+    assert not (tmp_path / "workspace_workspace_id.json").exists()
+    snapshot.find_by_name(listing, "foo")
+    assert listing.list_resources.call_count == 2
+    WorkspaceSnapshot("workspace_id").invalidate()